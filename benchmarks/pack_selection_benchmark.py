@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""Compare pack selection strategies by the context they fit in a budget.
+
+Usage:
+    python benchmarks/pack_selection_benchmark.py [REPO] [--budgets 32000 ...] [--json]
+
+Packs REPO (default: this repository) with the previous directory-order
+selection (important file names, then ``**/*.py`` under src/lib/app/core/utils
+until the budget runs out) and with the importance-ranked knapsack, at each
+budget. Coverage is reported as:
+
+- importance: share of the repository's total importance score included
+- entry reach: share of files within two import hops of an entry point
+  included
+- closed deps: share of included Python/JS files whose internal imports are
+  all included too
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "src"))
+
+from meta_mcp.services.repo_packing_service import RepoPackingService  # noqa: E402
+from meta_mcp.tools.pack_selection import (  # noqa: E402
+    build_import_graph,
+    entry_point_distances,
+    find_entry_points,
+    git_churn,
+    score_files,
+    select_files,
+)
+
+DEFAULT_BUDGETS = [32_000, 100_000, 200_000]
+
+LEGACY_IMPORTANT_FILES = [
+    "README.md",
+    "package.json",
+    "pyproject.toml",
+    "Cargo.toml",
+    "main.py",
+    "index.js",
+    "app.py",
+    "server.py",
+]
+LEGACY_DIRS = ["src", "lib", "app", "core", "utils"]
+
+
+def legacy_select(repo, files_data, token_counts, budget):
+    """The selection RepoPackingService used before the knapsack."""
+    index = {Path(f["path"]).as_posix(): i for i, f in enumerate(files_data)}
+    selected = [index[name] for name in LEGACY_IMPORTANT_FILES if name in index]
+    used = sum(token_counts[i] for i in selected)
+    for dir_name in LEGACY_DIRS:
+        for file_path in (repo / dir_name).glob("**/*.py"):
+            i = index.get(file_path.relative_to(repo).as_posix())
+            if i is None or i in selected or used >= budget:
+                continue
+            if used + token_counts[i] <= budget:
+                selected.append(i)
+                used += token_counts[i]
+    return sorted(selected)
+
+
+def coverage(files_data, selected, token_counts, scores, graph, near_entry):
+    paths = [Path(files_data[i]["path"]).as_posix() for i in selected]
+    chosen = set(paths)
+    code = [p for p in paths if graph.get(p)]
+    closed = sum(1 for p in code if graph[p] <= chosen)
+    return {
+        "files": len(selected),
+        "tokens": sum(token_counts[i] for i in selected),
+        "importance_pct": round(
+            100
+            * sum(scores[p]["score"] for p in paths)
+            / max(1e-9, sum(s["score"] for s in scores.values())),
+            1,
+        ),
+        "entry_reach_pct": round(
+            100 * len(near_entry & chosen) / max(1, len(near_entry)), 1
+        ),
+        "closed_deps_pct": round(100 * closed / max(1, len(code)), 1),
+    }
+
+
+async def run(repo, budgets):
+    service = RepoPackingService()
+    files_data = await service._collect_files(repo)
+    token_counts = await service._count_tokens_batch([f["content"] for f in files_data])
+    churn = git_churn(str(repo))
+    graph = build_import_graph(files_data)
+    scores = score_files(files_data, churn)
+    distances = entry_point_distances(graph, find_entry_points(files_data, graph))
+    near_entry = {p for p, d in distances.items() if d <= 2}
+
+    report = {
+        "repository": str(repo),
+        "files": len(files_data),
+        "total_tokens": sum(token_counts),
+        "import_edges": sum(len(targets) for targets in graph.values()),
+        "budgets": {},
+    }
+    for budget in budgets:
+        legacy = legacy_select(repo, files_data, token_counts, budget)
+        start = time.perf_counter()
+        ranked, _ = select_files(files_data, token_counts, budget, churn)
+        select_s = time.perf_counter() - start
+        report["budgets"][budget] = {
+            "legacy": coverage(
+                files_data, legacy, token_counts, scores, graph, near_entry
+            ),
+            "knapsack": {
+                **coverage(files_data, ranked, token_counts, scores, graph, near_entry),
+                "select_s": round(select_s, 3),
+            },
+        }
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("repo", nargs="?", default=str(ROOT))
+    parser.add_argument("--budgets", nargs="+", type=int, default=DEFAULT_BUDGETS)
+    parser.add_argument("--json", action="store_true", help="Print JSON only")
+    args = parser.parse_args()
+
+    report = asyncio.run(run(Path(args.repo).resolve(), args.budgets))
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return
+
+    print(
+        f"{report['repository']}: {report['files']} files, "
+        f"{report['total_tokens']} tokens, {report['import_edges']} import edges"
+    )
+    print(
+        f"{'budget':>8}  {'strategy':<9}{'files':>7}{'tokens':>9}"
+        f"{'importance %':>14}{'entry reach %':>15}{'closed deps %':>15}"
+    )
+    for budget, rows in report["budgets"].items():
+        for name, row in rows.items():
+            print(
+                f"{budget:>8}  {name:<9}{row['files']:>7}{row['tokens']:>9}"
+                f"{row['importance_pct']:>14}{row['entry_reach_pct']:>15}"
+                f"{row['closed_deps_pct']:>15}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""Measure MCP server import (startup) time against a regression budget.
+
+Usage:
+    python benchmarks/startup_benchmark.py [--runs 5] [--budget-ms 400] [--top 15] [--json]
+
+Imports ``meta_mcp.mcp_server`` (which also registers every tool suite) in
+fresh interpreters under ``python -X importtime``, and the same for the
+FastMCP baseline (``from fastmcp import FastMCP``), which no server built on
+FastMCP can avoid. The budget applies to the difference: what MetaMCP itself
+adds to startup, median over the runs, so it is comparable across machines
+of different speeds. Exits with status 1 when the budget is exceeded.
+
+Also lists the modules with the most self time in the median run, which is
+where a regression shows up first (e.g. a suite importing its service
+eagerly again).
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+ROOT = Path(__file__).resolve().parent.parent
+
+TARGET = "import meta_mcp.mcp_server"
+BASELINE = "from fastmcp import FastMCP"
+DEFAULT_BUDGET_MS = 400.0
+
+
+def parse_importtime(stderr: str) -> List[Tuple[str, int, float, float]]:
+    """(module, depth, self_ms, cumulative_ms) for each ``-X importtime`` line."""
+    entries = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+        if not self_us.strip().isdigit():  # Header line
+            continue
+        depth = (len(name) - len(name.lstrip())) // 2
+        entries.append((name.strip(), depth, int(self_us) / 1000, int(cumulative_us) / 1000))
+    return entries
+
+
+def measure(statement: str) -> Tuple[float, List[Tuple[str, int, float, float]]]:
+    """Total import time (ms) of statement in a fresh interpreter, and its entries."""
+    env = dict(os.environ, PYTHONPATH=str(ROOT / "src"))
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        env=env,
+        cwd=ROOT,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"{statement!r} failed:\n{proc.stderr[-2000:]}")
+    entries = parse_importtime(proc.stderr)
+    total = sum(cumulative for _, depth, _, cumulative in entries if depth == 0)
+    return total, entries
+
+
+def run(runs: int, top: int) -> Dict:
+    # Warm the filesystem cache and .pyc files so the first run is not an outlier
+    measure(TARGET)
+
+    target_runs = [measure(TARGET) for _ in range(runs)]
+    baseline_totals = [measure(BASELINE)[0] for _ in range(runs)]
+
+    target_totals = [total for total, _ in target_runs]
+    target_ms = statistics.median(target_totals)
+    baseline_ms = statistics.median(baseline_totals)
+    _, median_entries = min(target_runs, key=lambda r: abs(r[0] - target_ms))
+
+    slowest = sorted(median_entries, key=lambda e: e[2], reverse=True)[:top]
+    own = [e for e in median_entries if e[0].split(".")[0] == "meta_mcp"]
+    return {
+        "runs": runs,
+        "target_ms": round(target_ms, 1),
+        "baseline_ms": round(baseline_ms, 1),
+        "overhead_ms": round(target_ms - baseline_ms, 1),
+        "modules_imported": len(median_entries),
+        "meta_mcp_modules": len(own),
+        "meta_mcp_self_ms": round(sum(e[2] for e in own), 1),
+        "slowest_self_ms": [{"module": name, "self_ms": round(self_ms, 1),
+                             "cumulative_ms": round(cumulative, 1)}
+                            for name, _, self_ms, cumulative in slowest],
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS,
+                        help="Allowed startup time on top of the FastMCP baseline")
+    parser.add_argument("--top", type=int, default=15)
+    parser.add_argument("--json", action="store_true")
+    args = parser.parse_args()
+
+    report = run(args.runs, args.top)
+    report["budget_ms"] = args.budget_ms
+    report["within_budget"] = report["overhead_ms"] <= args.budget_ms
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print(f"{TARGET}: {report['target_ms']:.1f} ms (median of {args.runs})")
+        print(f"{BASELINE}: {report['baseline_ms']:.1f} ms")
+        print(f"overhead: {report['overhead_ms']:.1f} ms (budget {args.budget_ms:.0f} ms)"
+              f" -> {'OK' if report['within_budget'] else 'OVER BUDGET'}")
+        print(f"modules: {report['modules_imported']} "
+              f"({report['meta_mcp_modules']} meta_mcp, {report['meta_mcp_self_ms']:.1f} ms self)")
+        print()
+        print(f"{'module':<55} {'self ms':>9} {'cum ms':>9}")
+        for entry in report["slowest_self_ms"]:
+            print(f"{entry['module']:<55} {entry['self_ms']:>9.1f} {entry['cumulative_ms']:>9.1f}")
+
+    return 0 if report["within_budget"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""Compare token counting engines on accuracy and throughput.
+
+Usage:
+    python benchmarks/tokenizer_benchmark.py [PATH ...] [--json]
+
+Counts every source file under PATH (default: this repository's src/) with
+the bundled BPE engine and the heuristic. Accuracy is reported as the
+relative error of each engine's total against tiktoken's cl100k_base counts.
+Without tiktoken (or its encoding) the corpus has no reference and its error
+columns are left empty; an engine is never used as its own reference. The
+engines are always also checked against the committed cl100k fixture,
+tests/data/cl100k_counts.json.
+"""
+
+import argparse
+import json
+import sys
+import time
+from collections import defaultdict
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "src"))
+
+from meta_mcp.tools.repo_walker import walk_repo  # noqa: E402
+from meta_mcp.tools.tokenizer import (  # noqa: E402
+    MERGES_PATH,
+    BPETokenizer,
+    HeuristicTokenizer,
+)
+
+SOURCE_EXTENSIONS = {".py", ".js", ".ts", ".tsx", ".md", ".json", ".toml", ".yaml"}
+# Sample texts with their cl100k_base token counts
+FIXTURE_PATH = ROOT / "tests" / "data" / "cl100k_counts.json"
+
+
+class TiktokenReference:
+    """cl100k_base counts, if tiktoken is available."""
+
+    name = "tiktoken-cl100k"
+
+    def __init__(self):
+        import tiktoken
+
+        self.encoding = tiktoken.get_encoding("cl100k_base")
+
+    def count_batch(self, texts):
+        return [len(tokens) for tokens in self.encoding.encode_ordinary_batch(texts)]
+
+
+def load_corpus(paths):
+    texts = defaultdict(list)
+    for path in paths:
+        for item in walk_repo(Path(path)):
+            if item.suffix.lower() not in SOURCE_EXTENSIONS:
+                continue
+            try:
+                texts[item.suffix.lower()].append(item.read_text())
+            except (OSError, UnicodeDecodeError):
+                continue
+    return texts
+
+
+def error_pct(total, reference_total):
+    if reference_total is None:
+        return None
+    return round(100 * (total - reference_total) / max(1, reference_total), 1)
+
+
+def fixture_accuracy(engines):
+    """Each engine's error on the committed cl100k fixture, in percent."""
+    with open(FIXTURE_PATH, encoding="utf-8") as f:
+        samples = json.load(f)["samples"]
+    texts = [sample["text"] for sample in samples]
+    reference_total = sum(sample["cl100k_tokens"] for sample in samples)
+    return {
+        "samples": len(samples),
+        "reference_tokens": reference_total,
+        **{
+            f"{engine.name}_error_pct": error_pct(sum(engine.count_batch(texts)), reference_total)
+            for engine in engines
+        },
+    }
+
+
+def measure(engine, texts):
+    """Total tokens and MB/s for one pass over texts."""
+    size_mb = sum(len(t.encode("utf-8")) for t in texts) / 1024 / 1024
+    start = time.perf_counter()
+    total = sum(engine.count_batch(texts))
+    elapsed = time.perf_counter() - start
+    return total, size_mb / max(elapsed, 1e-9)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("paths", nargs="*", default=[str(ROOT / "src")])
+    parser.add_argument("--json", action="store_true", help="Print JSON only")
+    args = parser.parse_args()
+
+    corpus = load_corpus(args.paths)
+    all_texts = [t for texts in corpus.values() for t in texts]
+
+    start = time.perf_counter()
+    bpe = BPETokenizer.from_file(MERGES_PATH)
+    load_s = time.perf_counter() - start
+    heuristic = HeuristicTokenizer()
+    try:
+        reference = TiktokenReference()
+    except Exception as e:  # Not installed, or the encoding cannot be downloaded
+        reference = None
+        print(
+            f"tiktoken cl100k_base unavailable ({type(e).__name__}): corpus accuracy "
+            f"is not measured, only accuracy on {FIXTURE_PATH.relative_to(ROOT)}",
+            file=sys.stderr,
+        )
+
+    report = {
+        "files": len(all_texts),
+        "size_mb": round(
+            sum(len(t.encode("utf-8")) for t in all_texts) / 1024 / 1024, 2
+        ),
+        "reference": reference.name if reference else None,
+        "bpe_vocab_size": bpe.vocab_size,
+        "bpe_load_s": round(load_s, 3),
+        "engines": {},
+        "by_extension": {},
+        "fixture": fixture_accuracy((bpe, heuristic)),
+    }
+
+    reference_total = sum(reference.count_batch(all_texts)) if reference else None
+    for engine in (bpe, heuristic):
+        cold_total, cold_mbps = measure(engine, all_texts)
+        _, warm_mbps = measure(engine, all_texts)
+        report["engines"][engine.name] = {
+            "total_tokens": cold_total,
+            "error_pct": error_pct(cold_total, reference_total),
+            "cold_mb_per_s": round(cold_mbps, 2),
+            "warm_mb_per_s": round(warm_mbps, 2),
+        }
+
+    for ext, texts in sorted(corpus.items()):
+        ref = sum(reference.count_batch(texts)) if reference else None
+        report["by_extension"][ext] = {
+            "files": len(texts),
+            "reference_tokens": ref,
+            **{
+                f"{engine.name}_error_pct": error_pct(sum(engine.count_batch(texts)), ref)
+                for engine in (bpe, heuristic)
+            },
+        }
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return
+
+    print(
+        f"{report['files']} files, {report['size_mb']} MB, "
+        f"reference: {report['reference'] or 'none (tiktoken unavailable)'}"
+    )
+    print(f"BPE vocab {report['bpe_vocab_size']}, loaded in {report['bpe_load_s']}s")
+    print(
+        f"{'engine':<12}{'tokens':>10}{'error %':>10}{'cold MB/s':>12}{'warm MB/s':>12}"
+    )
+    for name, row in report["engines"].items():
+        print(
+            f"{name:<12}{row['total_tokens']:>10}{_cell(row['error_pct']):>10}"
+            f"{row['cold_mb_per_s']:>12}{row['warm_mb_per_s']:>12}"
+        )
+    print()
+    print(
+        f"{'ext':<8}{'files':>7}{'ref tokens':>12}{'bpe err %':>11}{'heur err %':>12}"
+    )
+    for ext, row in report["by_extension"].items():
+        print(
+            f"{ext:<8}{row['files']:>7}{_cell(row['reference_tokens']):>12}"
+            f"{_cell(row['bpe_error_pct']):>11}{_cell(row['heuristic_error_pct']):>12}"
+        )
+    fixture = report["fixture"]
+    print()
+    print(
+        f"cl100k fixture ({fixture['samples']} samples, {fixture['reference_tokens']} tokens): "
+        f"bpe {fixture['bpe_error_pct']}%, heuristic {fixture['heuristic_error_pct']}%"
+    )
+
+
+def _cell(value):
+    return "n/a" if value is None else value
+
+
+if __name__ == "__main__":
+    main()
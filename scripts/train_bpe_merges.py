@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""Train the bundled BPE merge table used by meta_mcp.tools.tokenizer.
+
+Usage:
+    python scripts/train_bpe_merges.py CORPUS_DIR [CORPUS_DIR ...]
+        [--merges 32000] [--max-mb 64] [--output PATH]
+
+Corpus directories are walked for source and documentation files; the
+default output is the merge table bundled with the package.
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from meta_mcp.tools.repo_walker import walk_repo  # noqa: E402
+from meta_mcp.tools.tokenizer import (  # noqa: E402
+    MERGES_PATH,
+    save_merges,
+    train_merges,
+)
+
+CORPUS_EXTENSIONS = {
+    ".py",
+    ".js",
+    ".ts",
+    ".tsx",
+    ".jsx",
+    ".md",
+    ".json",
+    ".toml",
+    ".yaml",
+    ".yml",
+    ".html",
+    ".css",
+    ".sh",
+    ".ps1",
+    ".rs",
+    ".go",
+    ".java",
+    ".c",
+    ".h",
+}
+
+
+def iter_corpus(dirs, max_bytes):
+    """Yield file contents round-robin across corpus dirs, up to max_bytes."""
+    walkers = [iter(walk_repo(Path(d))) for d in dirs]
+    total = 0
+    while walkers and total < max_bytes:
+        for walker in list(walkers):
+            item = next(walker, None)
+            if item is None:
+                walkers.remove(walker)
+                continue
+            if item.suffix.lower() not in CORPUS_EXTENSIONS:
+                continue
+            try:
+                text = item.read_text()
+            except (OSError, UnicodeDecodeError):
+                continue
+            total += len(text)
+            yield text
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("corpus", nargs="+", help="Directories to train on")
+    parser.add_argument("--merges", type=int, default=32000)
+    parser.add_argument("--max-mb", type=float, default=64)
+    parser.add_argument("--output", type=Path, default=MERGES_PATH)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    texts = list(iter_corpus(args.corpus, int(args.max_mb * 1024 * 1024)))
+    size_mb = sum(len(t) for t in texts) / 1024 / 1024
+    print(f"Corpus: {len(texts)} files, {size_mb:.1f} MB")
+
+    merges = train_merges(texts, args.merges)
+    save_merges(merges, args.output)
+    print(
+        f"Wrote {len(merges)} merges to {args.output} "
+        f"in {time.perf_counter() - start:.1f}s"
+    )
+
+
+if __name__ == "__main__":
+    main()
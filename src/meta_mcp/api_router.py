@@ -5,8 +5,11 @@ MetaMCP REST API Router - Exposes MCP tools via HTTP endpoints.
 Provides webapp-accessible REST API for all MCP tool operations.
 """
 
+import json
+from pathlib import Path
 from typing import Any, Dict, List, Optional
 from fastapi import APIRouter, HTTPException, BackgroundTasks
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 
 # Import service classes
@@ -14,23 +17,25 @@ from meta_mcp.services.diagnostics_service import DiagnosticsService
 from meta_mcp.services.analysis_service import AnalysisService
 from meta_mcp.services.discovery_service import DiscoveryService
 from meta_mcp.services.scaffolding_service import ScaffoldingService
-from meta_mcp.services.server_service import ServerService
+from meta_mcp.services.server_service import get_server_service
 from meta_mcp.services.tool_service import ToolService
 from meta_mcp.services.repo_scanner_service import RepoScannerService
 from meta_mcp.services.client_settings_manager import ClientSettingsManager
 from meta_mcp.services.token_analysis_service import TokenAnalysisService
 from meta_mcp.services.repo_packing_service import RepoPackingService
+from meta_mcp.services.repo_watcher_service import RepoWatcherService
 
 # Create router
 router = APIRouter(prefix="/api/v1", tags=["mcp-tools"])
 
 # Initialize services
 diagnostics = DiagnosticsService()
-analysis = AnalysisService()
+repo_watcher = RepoWatcherService()
+analysis = AnalysisService(watcher=repo_watcher)
 discovery = DiscoveryService()
 scaffolding = ScaffoldingService()
-server_service = ServerService()
-tool_service = ToolService()
+server_service = get_server_service()
+tool_service = ToolService(server_service)
 repo_scanner = RepoScannerService()
 client_manager = ClientSettingsManager()
 token_analyzer = TokenAnalysisService()
@@ -67,6 +72,18 @@ class RuntAnalyzerRequest(ToolRequest):
 
     scan_mode: str = Field("comprehensive", description="Analysis depth")
     include_dependencies: bool = Field(True, description="Include dependency analysis")
+    max_workers: Optional[int] = Field(
+        None, description="Worker processes for concurrent repo scans"
+    )
+
+
+class RuntAnalyzerStreamRequest(RuntAnalyzerRequest):
+    """Request model for streaming Runt Analyzer scans."""
+
+    operation: str = Field("analyze", description="Tool operation to perform")
+    stream_format: str = Field(
+        "ndjson", description="Stream format: ndjson or sse (Server-Sent Events)"
+    )
 
 
 class DiscoveryRequest(BaseModel):
@@ -141,12 +158,44 @@ async def run_runt_analyzer(request: RuntAnalyzerRequest):
             repo_path=request.repo_path or ".",
             scan_mode=request.scan_mode,
             include_dependencies=request.include_dependencies,
+            max_workers=request.max_workers,
         )
         return result
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Runt analyzer failed: {str(e)}")
 
 
+@router.post(
+    "/analysis/runt-analyzer/stream", summary="Stream Repository Health Analysis"
+)
+async def stream_runt_analyzer(request: RuntAnalyzerStreamRequest):
+    """Stream each repository's analysis as it finishes, then the summary."""
+    if request.stream_format not in ("ndjson", "sse"):
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unsupported stream format: {request.stream_format}",
+        )
+
+    events = analysis.stream_repositories(
+        scan_path=request.repo_path or ".", max_workers=request.max_workers
+    )
+
+    async def encode():
+        async for event in events:
+            if request.stream_format == "sse":
+                payload = json.dumps(event["data"], default=str)
+                yield f"event: {event['event']}\ndata: {payload}\n\n"
+            else:
+                yield json.dumps(event, default=str) + "\n"
+
+    media_type = (
+        "text/event-stream"
+        if request.stream_format == "sse"
+        else "application/x-ndjson"
+    )
+    return StreamingResponse(encode(), media_type=media_type)
+
+
 @router.post("/analysis/repo-status", summary="Get Detailed Repository Status")
 async def get_repo_status(request: ToolRequest):
     """Get comprehensive repository health and status information."""
@@ -226,6 +275,7 @@ async def get_detailed_health():
             "client_management": await client_manager.get_health_status(),
             "token_analysis": await token_analyzer.get_health_status(),
             "repo_packing": await repo_packer.get_health_status(),
+            "repo_watcher": await repo_watcher.get_health_status(),
         }
 
         # Determine overall status
@@ -311,7 +361,12 @@ async def list_available_tools():
                 "start_server": {
                     "description": "Start MCP server processes",
                     "operations": ["start"],
-                    "parameters": ["server_path", "server_type"],
+                    "parameters": [
+                        "server_path",
+                        "server_type",
+                        "restart_policy",
+                        "max_restarts",
+                    ],
                 },
                 "stop_server": {
                     "description": "Stop running MCP servers",
@@ -416,12 +471,48 @@ async def list_available_tools():
                         "output_format",
                         "include_patterns",
                         "exclude_patterns",
+                        "compress",
                     ],
                 },
                 "pack_repository_for_ai": {
                     "description": "Pack repository optimized for AI consumption",
                     "operations": ["pack"],
-                    "parameters": ["repo_path", "max_tokens"],
+                    "parameters": ["repo_path", "max_tokens", "compress"],
+                },
+                "pack_repository_to_file": {
+                    "description": "Stream a packed repository into a file",
+                    "operations": ["pack"],
+                    "parameters": [
+                        "repo_path",
+                        "output_path",
+                        "output_format",
+                        "include_patterns",
+                        "exclude_patterns",
+                        "compress",
+                    ],
+                },
+                "pack_repositories_to_store": {
+                    "description": "Pack repositories into the deduplicated blob store",
+                    "operations": ["pack"],
+                    "parameters": [
+                        "repo_paths",
+                        "manifest_path",
+                        "include_patterns",
+                        "exclude_patterns",
+                        "compress",
+                        "store_path",
+                    ],
+                },
+                "unpack_manifest": {
+                    "description": "Render a repository pack from a blob store manifest",
+                    "operations": ["unpack"],
+                    "parameters": [
+                        "manifest_path",
+                        "output_format",
+                        "repository",
+                        "output_path",
+                        "store_path",
+                    ],
                 },
             },
         }
@@ -437,9 +528,16 @@ async def list_available_tools():
 
 # Server Management Endpoints
 @router.post("/servers/start", summary="Start MCP Server")
-async def start_server(server_path: str, server_type: str = "python"):
-    """Start an MCP server process."""
-    result = await server_service.start_server(server_path, server_type)
+async def start_server(
+    server_path: str,
+    server_type: str = "python",
+    restart_policy: str = "on-failure",
+    max_restarts: int = 5,
+):
+    """Start an MCP server process under supervision."""
+    result = await server_service.start_server(
+        server_path, server_type, restart_policy, max_restarts
+    )
     if not result.get("success"):
         raise HTTPException(status_code=500, detail=result.get("message"))
     return result
@@ -460,9 +558,14 @@ async def list_running_servers():
     return await server_service.list_running_servers()
 
 
-@router.get("/servers/{server_id}/status", summary="Get Server Status")
+@router.get("/servers/{server_id:path}/status", summary="Get Server Status")
 async def get_server_status(server_id: str):
-    """Get detailed status of a specific server."""
+    """Get detailed status of a specific server.
+
+    Server ids contain the server path, so the id may span several path
+    segments. Includes restart history, the latest CPU/RSS/open-FD sample
+    and the tails of the server's output.
+    """
     result = await server_service.get_server_status(server_id)
     if not result.get("success"):
         raise HTTPException(status_code=404, detail=result.get("message"))
@@ -481,7 +584,7 @@ async def execute_tool(
     return result
 
 
-@router.get("/servers/{server_id}/tools", summary="List Server Tools")
+@router.get("/servers/{server_id:path}/tools", summary="List Server Tools")
 async def list_server_tools(server_id: str):
     """List all tools available on a specific server."""
     result = await tool_service.list_server_tools(server_id)
@@ -608,16 +711,51 @@ async def estimate_context_limits(token_count: int):
 
 
 # Repository Packing Endpoints
+PACK_MEDIA_TYPES = {
+    "xml": "application/xml",
+    "markdown": "text/markdown",
+    "json": "application/json",
+}
+PACK_FILE_EXTENSIONS = {"xml": "xml", "markdown": "md", "json": "json"}
+
+
 @router.post("/repos/pack", summary="Pack Repository")
 async def pack_repository(
     repo_path: str,
     output_format: str = "xml",
     include_patterns: Optional[List[str]] = None,
     exclude_patterns: Optional[List[str]] = None,
+    stream: bool = False,
+    compress: bool = False,
 ):
-    """Pack repository contents into AI-friendly format."""
+    """Pack repository contents into AI-friendly format.
+
+    With ``stream=true`` the packed content itself is streamed as the
+    response body, with memory bounded regardless of repository size.
+    With ``compress=true`` Python files are packed as signatures only.
+    """
+    if stream:
+        if not Path(repo_path).exists():
+            raise HTTPException(
+                status_code=404, detail=f"Repository path not found: {repo_path}"
+            )
+        media_type = PACK_MEDIA_TYPES.get(output_format.lower(), "text/plain")
+        extension = PACK_FILE_EXTENSIONS.get(output_format.lower(), "txt")
+        filename = f"{Path(repo_path).resolve().name}.{extension}"
+        return StreamingResponse(
+            repo_packer.stream_pack(
+                repo_path,
+                output_format,
+                include_patterns,
+                exclude_patterns,
+                compress=compress,
+            ),
+            media_type=f"{media_type}; charset=utf-8",
+            headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+        )
+
     result = await repo_packer.pack_repository(
-        repo_path, output_format, include_patterns, exclude_patterns
+        repo_path, output_format, include_patterns, exclude_patterns, compress
     )
     if not result.get("success"):
         raise HTTPException(status_code=500, detail=result.get("message"))
@@ -625,9 +763,11 @@ async def pack_repository(
 
 
 @router.post("/repos/pack-for-ai", summary="Pack Repository for AI")
-async def pack_repository_for_ai(repo_path: str, max_tokens: int = 100000):
+async def pack_repository_for_ai(
+    repo_path: str, max_tokens: int = 100000, compress: bool = False
+):
     """Pack repository optimized for AI consumption with token limits."""
-    result = await repo_packer.pack_for_ai_consumption(repo_path, max_tokens)
+    result = await repo_packer.pack_for_ai_consumption(repo_path, max_tokens, compress)
     if not result.get("success"):
         raise HTTPException(status_code=500, detail=result.get("message"))
     return result
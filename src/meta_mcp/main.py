@@ -9,25 +9,47 @@ import uvicorn
 import logging
 import os
 import sys
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
+from fastapi.responses import Response
 from fastapi.staticfiles import StaticFiles
 from fastapi.middleware.cors import CORSMiddleware
 
 # Import MCP server components
 from meta_mcp.mcp_server import app as mcp_app
-from meta_mcp.api_router import router as api_router
+from meta_mcp.api_router import router as api_router, repo_watcher, server_service
+from meta_mcp.tools.client_pool import stdio_client_pool
+from meta_mcp.tools.metrics import (
+    PROMETHEUS_CONTENT_TYPE,
+    MetricsMiddleware,
+    metrics_registry,
+)
 
 # Setup logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Run the repos watcher for the lifetime of the app."""
+    await repo_watcher.start()
+    try:
+        yield
+    finally:
+        await repo_watcher.stop()
+        # Stop warm MCP server processes started by the server tools
+        await stdio_client_pool.close_all()
+        await server_service.stop_all_servers()
+
+
 def create_fastapi_app():
     """Create and configure the FastAPI application."""
     app = FastAPI(
         title="MetaMCP",
         description="Meta MCP - The Ultimate 'Argh-Coding' Bloat-Buster",
         version="0.2.1-beta",
+        lifespan=lifespan,
     )
 
     # Add CORS middleware
@@ -39,9 +61,17 @@ def create_fastapi_app():
         allow_headers=["*"],
     )
 
+    # Request counts, latency and concurrency per route, served at /metrics
+    app.add_middleware(MetricsMiddleware)
+
     # Include API routes
     app.include_router(api_router)
 
+    @app.get("/metrics", include_in_schema=False)
+    async def metrics():
+        """Prometheus scrape endpoint (tool and HTTP metrics)."""
+        return Response(metrics_registry.render(), media_type=PROMETHEUS_CONTENT_TYPE)
+
     # Mount MCP routes
     app.mount("/mcp", mcp_app)
 
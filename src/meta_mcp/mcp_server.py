@@ -9,12 +9,13 @@ SOTA FastMCP 2.14.1+ compliant with decentralized tool registration.
 import sys
 import os
 import logging
-import msvcrt
 import structlog
 from fastmcp import FastMCP
 
 # Core Infrastructure
 from meta_mcp.registry import MetaMCPRegistry
+from meta_mcp.tools.metrics import ToolMetricsMiddleware
+from meta_mcp.tools.resilience import ClientContextMiddleware
 
 # Tool Registries
 from meta_mcp.tools.registries.diagnostics import register_diagnostics_tools
@@ -33,6 +34,8 @@ from meta_mcp.tools.registries.repo_packing import register_repo_packing_tools
 # 1. Force Binary Mode (Prevent CRLF corruption on Windows)
 if os.name == "nt":
     try:
+        import msvcrt
+
         msvcrt.setmode(sys.stdin.fileno(), os.O_BINARY)
         msvcrt.setmode(sys.stdout.fileno(), os.O_BINARY)
     except (ImportError, OSError, AttributeError):
@@ -158,9 +161,19 @@ Version: 2.0.0 (Enterprise)
     version="1.3.0",
 )
 
+# Per-tool latency histograms and call counters, served at /metrics
+app.add_middleware(ToolMetricsMiddleware())
+# Calling client per tool call, used to key rate limits
+app.add_middleware(ClientContextMiddleware())
+
 
 def initialize_tools(mcp: FastMCP):
-    """Dynamically load and register all tool suites."""
+    """Dynamically load and register all tool suites.
+
+    Suites register their tool schemas only; each suite's service module is
+    imported on its first tool call (see ``registry.lazy_service``), which
+    keeps stdio startup fast.
+    """
     registry = MetaMCPRegistry(mcp)
 
     registry.register_suite("diagnostics", register_diagnostics_tools)
@@ -177,6 +190,7 @@ def initialize_tools(mcp: FastMCP):
     logger.info(
         "MetaMCP Modular Suites Loaded Successfully",
         suites=registry.get_registered_suites(),
+        registration_ms=registry.get_suite_timings(),
     )
 
 
@@ -1,10 +1,49 @@
-from typing import Dict, List, Callable
+import importlib
+import time
+from typing import Any, Dict, List, Callable
 import structlog
 from fastmcp import FastMCP
 
 logger = structlog.get_logger(__name__)
 
 
+def lazy_service(module: str, factory: str) -> Callable[[], Any]:
+    """Return an accessor that builds a suite's service on first use.
+
+    Registering tools only needs their signatures, so suites hand their
+    tools this accessor instead of a service instance: the service module
+    (and everything it imports), and any probes its constructor runs, are
+    deferred until the first tool call.
+
+    Args:
+        module: Module defining the service
+        factory: Class or factory function in that module
+
+    Example:
+        ```python
+        service = lazy_service("meta_mcp.services.discovery_service", "DiscoveryService")
+
+        @mcp.tool(name="discover_servers")
+        async def discover_servers_tool():
+            return await service().discover_servers()
+        ```
+    """
+    instance = None
+
+    def get() -> Any:
+        nonlocal instance
+        if instance is None:
+            start = time.perf_counter()
+            instance = getattr(importlib.import_module(module), factory)()
+            logger.info(
+                f"Loaded service {module}.{factory}",
+                load_ms=round((time.perf_counter() - start) * 1000, 1),
+            )
+        return instance
+
+    return get
+
+
 class MetaMCPRegistry:
     """
     Decentralized registry for Meta MCP tool suites.
@@ -14,13 +53,20 @@ class MetaMCPRegistry:
     def __init__(self, mcp: FastMCP):
         self.mcp = mcp
         self._suites: Dict[str, List[Callable]] = {}
+        self._timings: Dict[str, float] = {}
 
     def register_suite(self, name: str, registration_func: Callable[[FastMCP], None]):
         """Register a suite of tools using a provided registration function."""
         logger.info(f"Registering tool suite: {name}")
+        start = time.perf_counter()
         registration_func(self.mcp)
+        self._timings[name] = (time.perf_counter() - start) * 1000
         self._suites[name] = registration_func
 
     def get_registered_suites(self) -> List[str]:
         """Return a list of all registered suites."""
         return list(self._suites.keys())
+
+    def get_suite_timings(self) -> Dict[str, float]:
+        """Milliseconds each suite took to register."""
+        return {name: round(ms, 2) for name, ms in self._timings.items()}
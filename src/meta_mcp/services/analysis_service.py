@@ -1,6 +1,12 @@
-from typing import Any, Dict, Optional, Union
+import time
+from typing import Any, AsyncIterator, Dict, Optional, Union
 from meta_mcp.services.base import MetaMCPService
-from meta_mcp.tools.mcp_repo_analyzer import analyze_runts, get_repo_status
+from meta_mcp.services.repo_watcher_service import RepoWatcherService
+from meta_mcp.tools.mcp_repo_analyzer import (
+    analyze_runts,
+    analyze_runts_stream,
+    get_repo_status,
+)
 
 
 class AnalysisService(MetaMCPService):
@@ -8,11 +14,51 @@ class AnalysisService(MetaMCPService):
     Service for analyzing repositories and identifying SOTA "runts".
     """
 
+    def __init__(self, watcher: Optional[RepoWatcherService] = None):
+        super().__init__()
+        self.watcher = watcher
+
     async def analyze_repositories(
-        self, scan_path: Optional[str] = None, format: str = "json"
+        self,
+        scan_path: Optional[str] = None,
+        format: str = "json",
+        max_workers: Optional[int] = None,
     ) -> Union[Dict[str, Any], str]:
         """Analyze broad paths for MCP repositories."""
-        return await analyze_runts(scan_path=scan_path, format=format)
+        # Serve live results instantly when the watcher covers this path
+        if format == "json" and self.watcher and self.watcher.covers(scan_path):
+            return self.watcher.get_scan_result()
+
+        return await analyze_runts(
+            scan_path=scan_path, format=format, max_workers=max_workers
+        )
+
+    async def stream_repositories(
+        self,
+        scan_path: Optional[str] = None,
+        max_workers: Optional[int] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Stream per-repo analyses as they finish, ending with the summary."""
+        if self.watcher and self.watcher.covers(scan_path):
+            result = self.watcher.get_scan_result()
+            for repo_info in result["runts"] + result["sota_repos"]:
+                yield {"event": "repo", "data": repo_info}
+            yield {
+                "event": "summary",
+                "data": {
+                    "success": True,
+                    "summary": result["summary"],
+                    "scan_path": result["scan_path"],
+                    "timestamp": time.time(),
+                    "live": True,
+                },
+            }
+            return
+
+        async for event in analyze_runts_stream(
+            scan_path=scan_path, max_workers=max_workers
+        ):
+            yield event
 
     async def analyze_single_repo(
         self, repo_path: str, format: str = "json"
@@ -25,7 +71,9 @@ class AnalysisService(MetaMCPService):
     ) -> Dict[str, Any]:
         """Run runt analyzer operations."""
         if operation == "analyze":
-            result = await self.analyze_repositories(scan_path=repo_path)
+            result = await self.analyze_repositories(
+                scan_path=repo_path, max_workers=kwargs.get("max_workers")
+            )
             if isinstance(result, dict):
                 return self.create_response(
                     True, "Repository analysis completed", result
@@ -1,4 +1,5 @@
 import abc
+from datetime import datetime, timezone
 from typing import Any, Dict, Optional
 import structlog
 
@@ -33,6 +34,10 @@ class MetaMCPService(abc.ABC):
             },
         }
 
+    def get_timestamp(self) -> str:
+        """Current UTC time as an ISO 8601 string."""
+        return datetime.now(timezone.utc).isoformat()
+
     async def get_health_status(self) -> Dict[str, Any]:
         """Get basic health status for this service."""
         return {
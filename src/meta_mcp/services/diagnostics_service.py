@@ -1,8 +1,9 @@
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 from meta_mcp.services.base import MetaMCPService
 from meta_mcp.services.emoji_buster import EmojiBuster
 from meta_mcp.services.powershell_validator import PowerShellSyntaxValidator
 from meta_mcp.services.powershell_profile_manager import PowerShellProfileManager
+from meta_mcp.tools.load_test import compare_load_tests, load_test_server
 
 
 class DiagnosticsService(MetaMCPService):
@@ -46,3 +47,40 @@ class DiagnosticsService(MetaMCPService):
                 obscure_location=True,
             )
         return self.create_response(False, f"Unsupported operation: {operation}")
+
+    async def run_load_test(
+        self,
+        server_path: str,
+        sessions: int = 4,
+        duration: float = 10.0,
+        tool_mix: Optional[List[Dict[str, Any]]] = None,
+        seed: Optional[int] = None,
+        output_path: Optional[str] = None,
+        baseline_path: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Load test a server, optionally comparing against a saved baseline run."""
+        result = await load_test_server(
+            server_path,
+            sessions=sessions,
+            duration=duration,
+            tool_mix=tool_mix,
+            seed=seed,
+            output_path=output_path,
+        )
+        if not result["success"]:
+            return self.create_response(
+                False, "Load test failed", result, errors=result["errors"]
+            )
+
+        if baseline_path:
+            try:
+                result["comparison"] = compare_load_tests(baseline_path, result)
+            except (OSError, ValueError, KeyError) as e:
+                result["errors"].append(f"Baseline comparison failed: {e}")
+
+        return self.create_response(
+            True,
+            f"{result['total_calls']} calls at {result['throughput_per_s']}/s "
+            f"over {result['sessions_started']} sessions",
+            result,
+        )
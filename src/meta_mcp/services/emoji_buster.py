@@ -6,6 +6,7 @@ import re
 from pathlib import Path
 from typing import Any, Dict
 from meta_mcp.services.base import MetaMCPService
+from meta_mcp.tools.pattern_set import PatternSet
 
 # Unsafe Unicode patterns that cause logging crashes (using escape sequences)
 UNSAFE_UNICODE_PATTERNS = [
@@ -76,6 +77,12 @@ UNICODE_REPLACEMENTS = {
     "\U0001f30a": "Wave",  # Water wave
 }
 
+NON_ASCII_PATTERN = re.compile(r"[^\x00-\x7F]")
+LOGGING_CALL_PATTERN = re.compile(r"(logger\.[a-z_]+|print)\s*\(")
+
+# Prefilter: only lines containing non-ASCII characters are inspected
+NON_ASCII_LINES = PatternSet({"non_ascii": NON_ASCII_PATTERN.pattern})
+
 
 class EmojiBuster(MetaMCPService):
     """Unicode logging crash prevention specialist."""
@@ -103,11 +110,10 @@ class EmojiBuster(MetaMCPService):
                 # Basic scan for demonstration - logic ported from tools/emojibuster.py
                 with open(file_path, "r", encoding="utf-8") as f:
                     content = f.read()
-                    lines = content.split("\n")
 
                 file_issues = []
-                for line_num, line in enumerate(lines, 1):
-                    for match in re.finditer(r"[^\x00-\x7F]", line):
+                for line_num, line in NON_ASCII_LINES.matching_lines(content):
+                    for match in NON_ASCII_PATTERN.finditer(line):
                         file_issues.append(
                             {
                                 "line_number": line_num,
@@ -115,7 +121,7 @@ class EmojiBuster(MetaMCPService):
                                 "unsafe_match": match.group(),
                                 "hex_match": hex(ord(match.group())),
                                 "risk_level": "critical"
-                                if re.search(r"(logger\.[a-z_]+|print)\s*\(", line)
+                                if LOGGING_CALL_PATTERN.search(line)
                                 else "advisory",
                             }
                         )
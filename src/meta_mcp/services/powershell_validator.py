@@ -6,6 +6,7 @@ import re
 from pathlib import Path
 from typing import Any, Dict
 from meta_mcp.services.base import MetaMCPService
+from meta_mcp.tools.pattern_set import PatternSet
 
 # Logic ported from tools/powershell_validator.py
 POWERSHELL_SYNTAX_ERRORS = [
@@ -42,6 +43,15 @@ SAFE_POWERSHELL_PATTERNS = {
     r"&&": ";",
 }
 
+# Precompiled once; the combined set prefilters lines that need checking
+COMPILED_SYNTAX_ERRORS = [
+    (pattern, re.compile(pattern, re.IGNORECASE))
+    for pattern in POWERSHELL_SYNTAX_ERRORS
+]
+SYNTAX_ERROR_LINES = PatternSet(
+    {"syntax_error": POWERSHELL_SYNTAX_ERRORS}, flags=re.IGNORECASE
+)
+
 
 class PowerShellSyntaxValidator(MetaMCPService):
     """PowerShell syntax validation and correction specialist."""
@@ -65,11 +75,10 @@ class PowerShellSyntaxValidator(MetaMCPService):
         for file_path in ps_files:
             try:
                 content = file_path.read_text(encoding="utf-8")
-                lines = content.split("\n")
                 file_issues = []
-                for line_num, line in enumerate(lines, 1):
-                    for pattern in POWERSHELL_SYNTAX_ERRORS:
-                        if re.search(pattern, line, re.IGNORECASE):
+                for line_num, line in SYNTAX_ERROR_LINES.matching_lines(content):
+                    for pattern, compiled in COMPILED_SYNTAX_ERRORS:
+                        if compiled.search(line):
                             file_issues.append(
                                 {
                                     "line_number": line_num,
@@ -1,9 +1,27 @@
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, Iterable, Iterator, List, Optional, Tuple
+import asyncio
 import json
 import os
+import queue
+import re
+import threading
 from pathlib import Path
 
 from meta_mcp.services.base import MetaMCPService
+from meta_mcp.tools.blob_store import BlobStore, build_manifest, load_manifest, save_manifest
+from meta_mcp.tools.code_compressor import compress_python
+from meta_mcp.tools.file_result_cache import FileResultCache
+from meta_mcp.tools.ignore_rules import IgnoreMatcher, translate_pattern
+from meta_mcp.tools.pack_selection import git_churn, select_files
+from meta_mcp.tools.repo_walker import RepoFile, walk_repo
+from meta_mcp.tools.tokenizer import get_tokenizer
+
+# Files with more characters than this are left out of packs
+MAX_FILE_CHARS = 1000000
+# Streamed packs are emitted in chunks of about this many bytes, with at most
+# STREAM_QUEUE_CHUNKS chunks buffered ahead of a slow consumer
+PACK_CHUNK_SIZE = 64 * 1024
+STREAM_QUEUE_CHUNKS = 4
 
 
 class RepoPackingService(MetaMCPService):
@@ -16,8 +34,14 @@ class RepoPackingService(MetaMCPService):
 
     async def pack_repository(self, repo_path: str, output_format: str = "xml",
                             include_patterns: Optional[List[str]] = None,
-                            exclude_patterns: Optional[List[str]] = None) -> Dict[str, Any]:
-        """Pack repository contents into a single AI-friendly file."""
+                            exclude_patterns: Optional[List[str]] = None,
+                            compress: bool = False) -> Dict[str, Any]:
+        """Pack repository contents into a single AI-friendly file.
+
+        With compress, Python files are reduced to signatures, docstrings and
+        declarations (see ``code_compressor``), each with a map from packed
+        lines back to the original line numbers.
+        """
         try:
             path = Path(repo_path).resolve()
 
@@ -25,76 +49,114 @@ class RepoPackingService(MetaMCPService):
                 return self.create_response(False, f"Repository path not found: {repo_path}")
 
             # Collect files based on patterns
-            files_data = await self._collect_files(path, include_patterns, exclude_patterns)
+            files_data = await self._collect_files(path, include_patterns, exclude_patterns, compress)
 
             if not files_data:
                 return self.create_response(False, "No files found matching criteria")
 
-            # Generate packed content based on format
-            if output_format.lower() == "xml":
-                packed_content = self._generate_xml_output(files_data, path.name)
-            elif output_format.lower() == "markdown":
-                packed_content = self._generate_markdown_output(files_data, path.name)
-            elif output_format.lower() == "json":
-                packed_content = self._generate_json_output(files_data, path.name)
-            else:
-                packed_content = self._generate_plain_output(files_data, path.name)
-
-            # Calculate token count (using our token analysis service)
-            from meta_mcp.services.token_analysis_service import TokenAnalysisService
-            token_service = TokenAnalysisService()
-
-            # Estimate total tokens
-            total_tokens = sum(await token_service._estimate_tokens_async(content)
-                             for content in [f["content"] for f in files_data])
-
-            result = {
-                "repository_name": path.name,
-                "repository_path": str(path),
-                "output_format": output_format,
-                "total_files": len(files_data),
-                "total_tokens": total_tokens,
-                "packed_content": packed_content,
-                "file_summary": self._generate_file_summary(files_data),
-                "token_analysis": await self._analyze_token_usage(files_data)
-            }
+            # Count tokens for all files in one batch
+            token_counts = await self._count_tokens_batch([f["content"] for f in files_data])
+            result = self._build_pack_result(path, files_data, token_counts, output_format)
 
             return self.create_response(True, f"Repository packed successfully in {output_format} format", result)
 
         except Exception as e:
             return self.create_response(False, f"Repository packing failed: {str(e)}")
 
-    async def pack_for_ai_consumption(self, repo_path: str, max_tokens: int = 100000) -> Dict[str, Any]:
-        """Pack repository optimized for AI consumption with token limits."""
+    def _build_pack_result(self, path: Path, files_data: List[Dict[str, Any]],
+                           token_counts: List[int], output_format: str) -> Dict[str, Any]:
+        """Render collected files and summarize them."""
+        if output_format.lower() == "xml":
+            packed_content = self._generate_xml_output(files_data, path.name)
+        elif output_format.lower() == "markdown":
+            packed_content = self._generate_markdown_output(files_data, path.name)
+        elif output_format.lower() == "json":
+            packed_content = self._generate_json_output(files_data, path.name)
+        else:
+            packed_content = self._generate_plain_output(files_data, path.name)
+
+        return {
+            "repository_name": path.name,
+            "repository_path": str(path),
+            "output_format": output_format,
+            "total_files": len(files_data),
+            "total_tokens": sum(token_counts),
+            "packed_content": packed_content,
+            "file_summary": self._generate_file_summary(files_data),
+            "token_analysis": self._analyze_token_usage(files_data, token_counts),
+            "compression": self._compression_summary(files_data),
+            "tokenizer": get_tokenizer().name
+        }
+
+    def _compression_summary(self, files_data: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """Size reduction and line index of compressed files (None if none were)."""
+        compressed = [f for f in files_data if f.get("compressed")]
+        if not compressed:
+            return None
+        original_size = sum(f["original_size"] for f in compressed)
+        size = sum(f["size"] for f in compressed)
+        return {
+            "mode": "signatures",
+            "files_compressed": len(compressed),
+            "original_size": original_size,
+            "compressed_size": size,
+            "size_reduction": round(1 - size / max(1, original_size), 4),
+            # path -> [[packed_start, original_start, length], ...]
+            "line_index": {f["path"]: f["line_map"] for f in compressed}
+        }
+
+    async def pack_for_ai_consumption(self, repo_path: str, max_tokens: int = 100000,
+                                      compress: bool = False) -> Dict[str, Any]:
+        """Pack repository optimized for AI consumption with token limits.
+
+        When the repository exceeds max_tokens, files are ranked by importance
+        (import-graph centrality, entry-point proximity, recent git churn) and
+        the budget is filled by solving a knapsack over those scores. With
+        compress, Python files are packed as signatures only first, so far more
+        of the repository fits the budget.
+        """
         try:
-            # First, analyze the repository
-            analysis_result = await self.pack_repository(repo_path, "xml")
+            path = Path(repo_path).resolve()
 
-            if not analysis_result.get("success"):
-                return analysis_result
+            if not path.exists():
+                return self.create_response(False, f"Repository path not found: {repo_path}")
+
+            files_data = await self._collect_files(path, compress=compress)
+
+            if not files_data:
+                return self.create_response(False, "No files found matching criteria")
 
-            data = analysis_result.get("data", {})
-            total_tokens = data.get("total_tokens", 0)
+            token_counts = await self._count_tokens_batch([f["content"] for f in files_data])
+            total_tokens = sum(token_counts)
 
             if total_tokens <= max_tokens:
-                return analysis_result
+                result = self._build_pack_result(path, files_data, token_counts, "xml")
+                return self.create_response(True, "Repository packed successfully in xml format", result)
 
-            # If too large, create a filtered version
-            # Prioritize important files and truncate large ones
-            filtered_data = await self._optimize_for_tokens(repo_path, max_tokens)
+            selected, scores = await self._optimize_for_tokens(path, files_data, token_counts, max_tokens)
+            filtered_data = [files_data[i] for i in selected]
+            selected_tokens = sum(token_counts[i] for i in selected)
 
+            ranked = sorted(scores.items(), key=lambda item: item[1]["score"], reverse=True)
             optimized_result = {
-                "repository_name": data["repository_name"],
-                "repository_path": data["repository_path"],
+                "repository_name": path.name,
+                "repository_path": str(path),
                 "output_format": "xml",
                 "total_files": len(filtered_data),
-                "total_tokens": sum(await self._estimate_tokens_async(content)
-                                  for content in [f["content"] for f in filtered_data]),
-                "packed_content": self._generate_xml_output(filtered_data, data["repository_name"]),
+                "total_tokens": selected_tokens,
+                "packed_content": self._generate_xml_output(filtered_data, path.name),
                 "optimization_applied": True,
+                "selection_strategy": "importance_knapsack",
                 "original_token_count": total_tokens,
                 "max_tokens": max_tokens,
-                "compression_ratio": len(filtered_data) / max(1, data["total_files"])
+                "compression_ratio": len(filtered_data) / max(1, len(files_data)),
+                "importance_coverage": round(
+                    sum(scores[Path(f["path"]).as_posix()]["score"] for f in filtered_data)
+                    / max(1e-9, sum(s["score"] for s in scores.values())), 4
+                ),
+                "top_ranked_files": [dict(path=p, **s) for p, s in ranked[:10]],
+                "compression": self._compression_summary(filtered_data),
+                "tokenizer": get_tokenizer().name
             }
 
             return self.create_response(True, f"Repository optimized for AI consumption ({max_tokens} token limit)", optimized_result)
@@ -102,95 +164,421 @@ class RepoPackingService(MetaMCPService):
         except Exception as e:
             return self.create_response(False, f"AI-optimized packing failed: {str(e)}")
 
+    async def stream_pack(self, repo_path: str, output_format: str = "xml",
+                          include_patterns: Optional[List[str]] = None,
+                          exclude_patterns: Optional[List[str]] = None,
+                          chunk_size: int = PACK_CHUNK_SIZE,
+                          compress: bool = False) -> AsyncIterator[bytes]:
+        """Stream a packed repository as UTF-8 chunks with bounded memory.
+
+        Files are read, formatted and encoded one at a time in a worker
+        thread; at most a few chunks are buffered ahead of the consumer.
+        """
+        path = Path(repo_path).resolve()
+        if not path.exists():
+            raise FileNotFoundError(f"Repository path not found: {repo_path}")
+
+        chunks: queue.Queue = queue.Queue(maxsize=STREAM_QUEUE_CHUNKS)
+        cancelled = threading.Event()
+
+        def put(item) -> bool:
+            while not cancelled.is_set():
+                try:
+                    chunks.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def produce():
+            end = None
+            try:
+                for chunk in self._pack_chunks(path, output_format, include_patterns,
+                                               exclude_patterns, chunk_size, compress=compress):
+                    if not put(chunk):
+                        break
+            except Exception as e:
+                end = e
+            finally:
+                # Always end the stream, so a get() still waiting in a worker
+                # thread returns even when the consumer has gone away
+                if not put(end):
+                    try:
+                        chunks.put_nowait(end)
+                    except queue.Full:
+                        pass  # A waiting get() takes one of the buffered chunks
+
+        producer = asyncio.get_running_loop().run_in_executor(None, produce)
+        try:
+            while True:
+                chunk = await asyncio.to_thread(chunks.get)
+                if chunk is None:
+                    break
+                if isinstance(chunk, Exception):
+                    raise chunk
+                yield chunk
+        finally:
+            cancelled.set()
+            await producer
+
+    async def write_pack(self, repo_path: str, output_path: str, output_format: str = "xml",
+                         include_patterns: Optional[List[str]] = None,
+                         exclude_patterns: Optional[List[str]] = None,
+                         count_tokens: bool = True,
+                         compress: bool = False) -> Dict[str, Any]:
+        """Pack a repository straight into a file without building it in memory."""
+        try:
+            path = Path(repo_path).resolve()
+
+            if not path.exists():
+                return self.create_response(False, f"Repository path not found: {repo_path}")
+
+            stats = {"total_files": 0, "total_tokens": 0 if count_tokens else None}
+
+            def write():
+                target = Path(output_path)
+                target.parent.mkdir(parents=True, exist_ok=True)
+                written = 0
+                with open(target, 'wb') as f:
+                    for chunk in self._pack_chunks(path, output_format, include_patterns,
+                                                   exclude_patterns, stats=stats, compress=compress):
+                        f.write(chunk)
+                        written += len(chunk)
+                return written
+
+            bytes_written = await asyncio.to_thread(write)
+
+            if not stats["total_files"]:
+                return self.create_response(False, "No files found matching criteria")
+
+            return self.create_response(True, f"Repository packed to {output_path}", {
+                "repository_name": path.name,
+                "repository_path": str(path),
+                "output_path": str(Path(output_path).resolve()),
+                "output_format": output_format,
+                "bytes_written": bytes_written,
+                **stats,
+                "tokenizer": get_tokenizer().name if count_tokens else None
+            })
+
+        except Exception as e:
+            return self.create_response(False, f"Repository packing failed: {str(e)}")
+
+    async def pack_to_store(self, repo_paths: List[str], manifest_path: Optional[str] = None,
+                            include_patterns: Optional[List[str]] = None,
+                            exclude_patterns: Optional[List[str]] = None,
+                            compress: bool = False,
+                            store_path: Optional[str] = None) -> Dict[str, Any]:
+        """Pack repositories into the content-addressed blob store.
+
+        Each distinct file content is stored once (see ``blob_store``), and
+        the returned manifest lists every repository's files as blob
+        references. Files whose size and mtime are unchanged since the last
+        pack are not even re-read when their blob is already stored.
+
+        Args:
+            repo_paths: Repositories to pack into one manifest
+            manifest_path: Where to write the manifest (returned inline if None)
+            include_patterns: Glob patterns for files to include
+            exclude_patterns: Gitignore-style patterns for files to exclude
+            compress: Store Python files as signatures only
+            store_path: Blob store directory (default ~/.mcp-studio/blob-store)
+        """
+        try:
+            paths = [Path(repo_path).resolve() for repo_path in repo_paths]
+            missing = [str(path) for path in paths if not path.exists()]
+            if missing:
+                return self.create_response(False, f"Repository path not found: {', '.join(missing)}")
+
+            store = BlobStore(store_path)
+            counters = {"files_read": 0, "files_unchanged": 0}
+            repositories = []
+            for path in paths:
+                files = await asyncio.to_thread(
+                    self._store_files, store, path, include_patterns, exclude_patterns, compress, counters
+                )
+                repositories.append({"name": path.name, "path": str(path), "files": files})
+
+            manifest = build_manifest(repositories, compress=compress)
+            manifest["stats"].update({
+                **counters,
+                "blobs_written": store.blobs_written,
+                "blobs_reused": store.blobs_reused,
+                "bytes_written": store.bytes_written
+            })
+
+            result = {"store_path": str(store.root), "stats": manifest["stats"]}
+            if manifest_path:
+                await asyncio.to_thread(save_manifest, manifest, manifest_path)
+                result["manifest_path"] = str(Path(manifest_path).resolve())
+            else:
+                result["manifest"] = manifest
+
+            return self.create_response(
+                True, f"Packed {len(paths)} repositories into {manifest['stats']['unique_blobs']} blobs", result
+            )
+
+        except Exception as e:
+            return self.create_response(False, f"Repository packing failed: {str(e)}")
+
+    def _store_files(self, store: BlobStore, path: Path,
+                     include_patterns: Optional[List[str]], exclude_patterns: Optional[List[str]],
+                     compress: bool, counters: Dict[str, int]) -> List[Dict[str, Any]]:
+        """Store one repository's files as blobs and return their manifest entries."""
+        cache = FileResultCache(str(path), namespace=f"pack-blobs:{int(compress)}")
+        entries = []
+        for relative_path in self._list_files(path, include_patterns, exclude_patterns):
+            item = RepoFile(str(path / relative_path), relative_path.as_posix(), relative_path.name)
+            try:
+                st = os.stat(item.path)
+            except OSError:
+                continue
+
+            hit, entry = cache.lookup(item, st.st_size, st.st_mtime_ns)
+            if not hit or (entry is not None and not store.has(entry["blob"])):
+                counters["files_read"] += 1
+                file_data = self._read_file(path, relative_path, compress)
+                entry = None
+                if file_data is not None:
+                    data = file_data["content"].encode('utf-8')
+                    entry = {key: value for key, value in file_data.items()
+                             if key not in ("content", "name", "extension")}
+                    entry.update({"path": item.rel_path, "bytes": len(data), "blob": store.put(data)})
+                cache.store(item, st.st_size, st.st_mtime_ns, entry["blob"] if entry else "", entry)
+            else:
+                counters["files_unchanged"] += 1
+
+            if entry is not None:
+                entries.append(entry)
+
+        cache.save()
+        return entries
+
+    async def unpack_manifest(self, manifest_path: str, output_format: str = "xml",
+                              repository: Optional[str] = None,
+                              output_path: Optional[str] = None,
+                              store_path: Optional[str] = None) -> Dict[str, Any]:
+        """Render one repository of a pack manifest from the blob store.
+
+        The output is identical to packing the repository directly at the
+        time the manifest was written.
+
+        Args:
+            manifest_path: Manifest written by pack_to_store
+            output_format: Output format - "xml", "markdown", "json", or "plain"
+            repository: Name or path of the repository to render (default: the
+                first one)
+            output_path: Stream the pack to this file instead of returning it
+            store_path: Blob store directory (default ~/.mcp-studio/blob-store)
+        """
+        try:
+            manifest = await asyncio.to_thread(load_manifest, manifest_path)
+            repos = manifest["repositories"]
+            selected = next((repo for repo in repos
+                             if repository is None or repository in (repo["name"], repo["path"])), None)
+            if selected is None:
+                return self.create_response(False, f"Repository not in manifest: {repository}")
+
+            store = BlobStore(store_path)
+            pieces = self._formatter(output_format)(self._iter_stored_files(store, selected["files"]),
+                                                    selected["name"])
+
+            result = {
+                "repository_name": selected["name"],
+                "repository_path": selected["path"],
+                "output_format": output_format,
+                "total_files": len(selected["files"])
+            }
+            if output_path:
+                def write():
+                    target = Path(output_path)
+                    target.parent.mkdir(parents=True, exist_ok=True)
+                    written = 0
+                    with open(target, 'wb') as f:
+                        for chunk in self._encode_chunks(pieces):
+                            f.write(chunk)
+                            written += len(chunk)
+                    return written
+
+                result["output_path"] = str(Path(output_path).resolve())
+                result["bytes_written"] = await asyncio.to_thread(write)
+            else:
+                result["packed_content"] = await asyncio.to_thread(''.join, pieces)
+
+            return self.create_response(True, f"Unpacked {selected['name']} from manifest", result)
+
+        except Exception as e:
+            return self.create_response(False, f"Manifest unpacking failed: {str(e)}")
+
+    def _iter_stored_files(self, store: BlobStore, entries: List[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        """File records as _read_file builds them, with content read from blobs."""
+        for entry in entries:
+            relative_path = Path(entry["path"])
+            # Same key order as _read_file (the JSON format depends on it)
+            file_data = {
+                "path": str(relative_path),
+                "name": relative_path.name,
+                "extension": relative_path.suffix,
+                "size": entry["size"],
+                "content": store.get_text(entry["blob"]),
+                "language": entry["language"]
+            }
+            file_data.update((key, value) for key, value in entry.items()
+                             if key not in file_data and key not in ("bytes", "blob"))
+            yield file_data
+
+    def _pack_chunks(self, path: Path, output_format: str,
+                     include_patterns: Optional[List[str]] = None,
+                     exclude_patterns: Optional[List[str]] = None,
+                     chunk_size: int = PACK_CHUNK_SIZE,
+                     stats: Optional[Dict[str, Any]] = None,
+                     compress: bool = False) -> Iterator[bytes]:
+        """Walk, filter, format and encode a pack as chunks of about chunk_size bytes.
+
+        When stats is given, its total_files (and total_tokens, unless None)
+        are updated as files pass through.
+        """
+        files = self._iter_files(path, include_patterns, exclude_patterns, compress)
+        if stats is not None:
+            files = self._count_as_packed(files, stats)
+        return self._encode_chunks(self._formatter(output_format)(files, path.name), chunk_size)
+
+    def _encode_chunks(self, pieces: Iterable[str], chunk_size: int = PACK_CHUNK_SIZE) -> Iterator[bytes]:
+        """Encode formatter output as UTF-8 chunks of about chunk_size bytes."""
+        buffer: List[bytes] = []
+        buffered = 0
+        for piece in pieces:
+            data = piece.encode('utf-8')
+            buffer.append(data)
+            buffered += len(data)
+            if buffered >= chunk_size:
+                yield b''.join(buffer)
+                buffer, buffered = [], 0
+        if buffer:
+            yield b''.join(buffer)
+
+    def _count_as_packed(self, files: Iterable[Dict[str, Any]], stats: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+        tokenizer = get_tokenizer() if stats.get("total_tokens") is not None else None
+        for file_data in files:
+            stats["total_files"] += 1
+            if tokenizer is not None:
+                stats["total_tokens"] += tokenizer.count(file_data["content"])
+            yield file_data
+
     async def _collect_files(self, repo_path: Path, include_patterns: Optional[List[str]] = None,
-                           exclude_patterns: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+                           exclude_patterns: Optional[List[str]] = None,
+                           compress: bool = False) -> List[Dict[str, Any]]:
         """Collect files from repository based on patterns."""
-        files_data = []
-
+        return await asyncio.to_thread(
+            lambda: list(self._iter_files(repo_path, include_patterns, exclude_patterns, compress))
+        )
+
+    def _iter_files(self, repo_path: Path, include_patterns: Optional[List[str]] = None,
+                    exclude_patterns: Optional[List[str]] = None,
+                    compress: bool = False) -> Iterator[Dict[str, Any]]:
+        """Yield matching files one at a time, in path order.
+
+        Only the list of matching paths is held up front; each file's content
+        is read when it is reached.
+        """
+        for relative_path in self._list_files(repo_path, include_patterns, exclude_patterns):
+            file_data = self._read_file(repo_path, relative_path, compress)
+            if file_data is not None:
+                yield file_data
+
+    def _list_files(self, repo_path: Path, include_patterns: Optional[List[str]] = None,
+                    exclude_patterns: Optional[List[str]] = None) -> List[Path]:
+        """Relative paths of the files matching the patterns, sorted.
+
+        Excludes use gitignore syntax and are layered over the repository's
+        own (nested) .gitignore files; excluded directories are never listed.
+        Include patterns are globs relative to the repository root.
+        """
         # Default patterns
         if include_patterns is None:
             include_patterns = ["**/*"]
         if exclude_patterns is None:
             exclude_patterns = self._get_default_excludes()
 
-        # Read .gitignore if it exists
-        gitignore_patterns = []
-        gitignore_file = repo_path / ".gitignore"
-        if gitignore_file.exists():
-            try:
-                with open(gitignore_file, 'r', encoding='utf-8') as f:
-                    gitignore_patterns = [line.strip() for line in f if line.strip() and not line.startswith('#')]
-            except Exception:
-                pass
-
-        all_excludes = exclude_patterns + gitignore_patterns
-
-        for pattern in include_patterns:
-            for file_path in repo_path.glob(pattern):
-                if file_path.is_file():
-                    # Check if file should be excluded
-                    relative_path = file_path.relative_to(repo_path)
-                    should_exclude = any(self._matches_pattern(str(relative_path), excl) for excl in all_excludes)
-
-                    if not should_exclude:
-                        try:
-                            # Read file content
-                            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                                content = f.read()
-
-                            # Skip binary files or very large files
-                            if self._is_binary_file(content) or len(content) > 1000000:  # 1MB limit
-                                continue
-
-                            files_data.append({
-                                "path": str(relative_path),
-                                "name": file_path.name,
-                                "extension": file_path.suffix,
-                                "size": len(content),
-                                "content": content,
-                                "language": self._detect_language(file_path)
-                            })
-
-                        except Exception:
-                            # Skip files that can't be read
-                            continue
+        matcher = IgnoreMatcher(repo_path, exclude_patterns)
+        include = None
+        if "**/*" not in include_patterns and "**" not in include_patterns:
+            include = re.compile("|".join(
+                f"(?:{translate_pattern(pattern, anchored=True)})" for pattern in include_patterns
+            ) + r"\Z", re.DOTALL)
+
+        matched = [
+            Path(item.rel_path)
+            for item in walk_repo(repo_path, ignore_dirs=frozenset(), matcher=matcher)
+            if include is None or include.match(item.rel_path)
+        ]
 
         # Sort files by path for consistent output
-        files_data.sort(key=lambda x: x["path"])
+        return sorted(matched, key=str)
 
-        return files_data
+    def _read_file(self, repo_path: Path, relative_path: Path, compress: bool = False) -> Optional[Dict[str, Any]]:
+        """Read one file for packing; None for unreadable, binary or huge files."""
+        file_path = repo_path / relative_path
+        try:
+            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
+                content = f.read(MAX_FILE_CHARS + 1)
+        except Exception:
+            # Skip files that can't be read
+            return None
+
+        # Skip binary files or very large files
+        if self._is_binary_file(content) or len(content) > MAX_FILE_CHARS:
+            return None
+
+        file_data = {
+            "path": str(relative_path),
+            "name": file_path.name,
+            "extension": file_path.suffix,
+            "size": len(content),
+            "content": content,
+            "language": self._detect_language(file_path)
+        }
+
+        if compress and file_data["language"] == "python":
+            compressed = compress_python(content)
+            if compressed is not None:
+                file_data.update({
+                    "size": len(compressed.text),
+                    "content": compressed.text,
+                    "compressed": True,
+                    "original_size": len(content),
+                    "original_lines": compressed.original_lines,
+                    "line_map": [list(run) for run in compressed.runs()]
+                })
+
+        return file_data
 
     def _get_default_excludes(self) -> List[str]:
-        """Get default exclusion patterns."""
+        """Get default exclusion patterns (gitignore syntax)."""
         return [
-            "**/node_modules/**",
-            "**/.git/**",
-            "**/.svn/**",
-            "**/.hg/**",
-            "**/.DS_Store",
-            "**/Thumbs.db",
-            "**/*.log",
-            "**/*.tmp",
-            "**/*.swp",
-            "**/*.swo",
-            "**/dist/**",
-            "**/build/**",
-            "**/__pycache__/**",
-            "**/*.pyc",
-            "**/*.pyo",
-            "**/.next/**",
-            "**/.nuxt/**",
-            "**/.vite/**",
-            "**/coverage/**",
-            "**/.coverage",
-            "**/htmlcov/**"
+            "node_modules/",
+            ".git/",
+            ".svn/",
+            ".hg/",
+            ".DS_Store",
+            "Thumbs.db",
+            "*.log",
+            "*.tmp",
+            "*.swp",
+            "*.swo",
+            "dist/",
+            "build/",
+            "__pycache__/",
+            "*.pyc",
+            "*.pyo",
+            ".next/",
+            ".nuxt/",
+            ".vite/",
+            "coverage/",
+            ".coverage",
+            "htmlcov/"
         ]
 
-    def _matches_pattern(self, path: str, pattern: str) -> bool:
-        """Check if path matches glob pattern."""
-        import fnmatch
-        return fnmatch.fnmatch(path, pattern) or fnmatch.fnmatch(path, f"**/{pattern}")
-
     def _is_binary_file(self, content: str) -> bool:
         """Check if content appears to be binary."""
         # Simple heuristic: if many null bytes or high ratio of non-printable chars
@@ -241,65 +629,102 @@ class RepoPackingService(MetaMCPService):
 
     def _generate_xml_output(self, files_data: List[Dict[str, Any]], repo_name: str) -> str:
         """Generate XML output format."""
-        xml_parts = [f'<?xml version="1.0" encoding="UTF-8"?>']
-        xml_parts.append(f'<repository name="{repo_name}">')
-
-        for file_data in files_data:
-            xml_parts.append(f'  <file path="{file_data["path"]}" language="{file_data["language"]}">')
-            xml_parts.append(f'    <content><![CDATA[{file_data["content"]}]]></content>')
-            xml_parts.append('  </file>')
-
-        xml_parts.append('</repository>')
-
-        return '\n'.join(xml_parts)
+        return ''.join(self._format_xml(files_data, repo_name))
 
     def _generate_markdown_output(self, files_data: List[Dict[str, Any]], repo_name: str) -> str:
         """Generate Markdown output format."""
-        md_parts = [f'# {repo_name}']
-        md_parts.append('')
-        md_parts.append('Repository contents packed for AI consumption.')
-        md_parts.append('')
-
-        for file_data in files_data:
-            md_parts.append(f'## {file_data["path"]}')
-            md_parts.append('')
-            md_parts.append(f'**Language:** {file_data["language"]}')
-            md_parts.append(f'**Size:** {file_data["size"]} characters')
-            md_parts.append('')
-            md_parts.append('```' + file_data["language"])
-            md_parts.append(file_data["content"])
-            md_parts.append('```')
-            md_parts.append('')
-
-        return '\n'.join(md_parts)
+        return ''.join(self._format_markdown(files_data, repo_name))
 
     def _generate_json_output(self, files_data: List[Dict[str, Any]], repo_name: str) -> str:
         """Generate JSON output format."""
-        output_data = {
-            "repository": repo_name,
-            "description": "Repository contents packed for AI consumption",
-            "files": files_data
-        }
-
-        return json.dumps(output_data, indent=2, ensure_ascii=False)
+        return ''.join(self._format_json(files_data, repo_name))
 
     def _generate_plain_output(self, files_data: List[Dict[str, Any]], repo_name: str) -> str:
         """Generate plain text output format."""
-        plain_parts = [f'{repo_name} Repository Contents']
-        plain_parts.append('=' * 50)
-        plain_parts.append('')
+        return ''.join(self._format_plain(files_data, repo_name))
 
-        for file_data in files_data:
-            plain_parts.append(f'File: {file_data["path"]}')
-            plain_parts.append(f'Language: {file_data["language"]}')
-            plain_parts.append(f'Size: {file_data["size"]} characters')
-            plain_parts.append('-' * 40)
-            plain_parts.append(file_data["content"])
-            plain_parts.append('')
-            plain_parts.append('=' * 50)
-            plain_parts.append('')
-
-        return '\n'.join(plain_parts)
+    def _formatter(self, output_format: str):
+        """Incremental formatter for an output format (plain for unknown formats)."""
+        return {
+            "xml": self._format_xml,
+            "markdown": self._format_markdown,
+            "json": self._format_json,
+        }.get(output_format.lower(), self._format_plain)
+
+    # Formatters yield the output piece by piece: a header, one piece per file
+    # and a footer, so a pack can be written without holding it in memory.
+
+    def _line_map_text(self, file_data: Dict[str, Any]) -> str:
+        """Line map of a compressed file as "packed:original:length" runs."""
+        return ' '.join(f'{start}:{original}:{length}' for start, original, length in file_data["line_map"])
+
+    def _format_xml(self, files: Iterable[Dict[str, Any]], repo_name: str) -> Iterator[str]:
+        yield f'<?xml version="1.0" encoding="UTF-8"?>\n<repository name="{repo_name}">'
+        for file_data in files:
+            compressed = ''
+            if file_data.get("compressed"):
+                compressed = (
+                    f' compressed="signatures" original_lines="{file_data["original_lines"]}"'
+                    f' line_map="{self._line_map_text(file_data)}"'
+                )
+            yield (
+                f'\n  <file path="{file_data["path"]}" language="{file_data["language"]}"{compressed}>'
+                f'\n    <content><![CDATA[{file_data["content"]}]]></content>'
+                '\n  </file>'
+            )
+        yield '\n</repository>'
+
+    def _format_markdown(self, files: Iterable[Dict[str, Any]], repo_name: str) -> Iterator[str]:
+        yield f'# {repo_name}\n\nRepository contents packed for AI consumption.\n'
+        for file_data in files:
+            compressed = ''
+            if file_data.get("compressed"):
+                compressed = (
+                    f'\n**Compressed:** signatures only, {file_data["original_lines"]} original lines;'
+                    f' line map (packed:original:length) {self._line_map_text(file_data)}'
+                )
+            yield (
+                f'\n## {file_data["path"]}\n'
+                f'\n**Language:** {file_data["language"]}'
+                f'\n**Size:** {file_data["size"]} characters{compressed}\n'
+                f'\n```{file_data["language"]}'
+                f'\n{file_data["content"]}'
+                '\n```\n'
+            )
+
+    def _format_json(self, files: Iterable[Dict[str, Any]], repo_name: str) -> Iterator[str]:
+        # Same layout as json.dumps(..., indent=2) of the whole document
+        yield (
+            '{\n  "repository": ' + json.dumps(repo_name, ensure_ascii=False)
+            + ',\n  "description": "Repository contents packed for AI consumption"'
+            + ',\n  "files": ['
+        )
+        separator = '\n'
+        empty = True
+        for file_data in files:
+            body = json.dumps(file_data, indent=2, ensure_ascii=False)
+            yield separator + '    ' + body.replace('\n', '\n    ')
+            separator = ',\n'
+            empty = False
+        yield ']\n}' if empty else '\n  ]\n}'
+
+    def _format_plain(self, files: Iterable[Dict[str, Any]], repo_name: str) -> Iterator[str]:
+        yield f'{repo_name} Repository Contents\n' + '=' * 50 + '\n'
+        for file_data in files:
+            compressed = ''
+            if file_data.get("compressed"):
+                compressed = (
+                    f'\nCompressed: signatures only, {file_data["original_lines"]} original lines;'
+                    f' line map (packed:original:length) {self._line_map_text(file_data)}'
+                )
+            yield (
+                f'\nFile: {file_data["path"]}'
+                f'\nLanguage: {file_data["language"]}'
+                f'\nSize: {file_data["size"]} characters{compressed}\n'
+                + '-' * 40
+                + f'\n{file_data["content"]}\n\n'
+                + '=' * 50 + '\n'
+            )
 
     def _generate_file_summary(self, files_data: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Generate summary statistics for files."""
@@ -331,16 +756,12 @@ class RepoPackingService(MetaMCPService):
             "average_file_size": total_size / max(1, len(files_data))
         }
 
-    async def _analyze_token_usage(self, files_data: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def _analyze_token_usage(self, files_data: List[Dict[str, Any]], token_counts: List[int]) -> Dict[str, Any]:
         """Analyze token usage across packed content."""
-        from meta_mcp.services.token_analysis_service import TokenAnalysisService
-        token_service = TokenAnalysisService()
-
         total_tokens = 0
         file_tokens = []
 
-        for file_data in files_data:
-            tokens = await token_service._estimate_tokens_async(file_data["content"])
+        for file_data, tokens in zip(files_data, token_counts):
             total_tokens += tokens
             file_tokens.append({
                 "path": file_data["path"],
@@ -358,75 +779,23 @@ class RepoPackingService(MetaMCPService):
             "token_efficiency": total_tokens / max(1, sum(f["size"] for f in files_data))
         }
 
-    async def _optimize_for_tokens(self, repo_path: str, max_tokens: int) -> List[Dict[str, Any]]:
-        """Optimize file selection for token limits."""
-        # Simple optimization: prioritize smaller, important files
-        # In production, this would use more sophisticated heuristics
-
-        path = Path(repo_path)
-        important_files = [
-            "README.md", "package.json", "pyproject.toml", "Cargo.toml",
-            "main.py", "index.js", "app.py", "server.py"
-        ]
-
-        optimized_files = []
-
-        # First, add important files
-        for important_file in important_files:
-            file_path = path / important_file
-            if file_path.exists():
-                try:
-                    with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                        content = f.read()
-
-                    if not self._is_binary_file(content) and len(content) < 50000:  # Reasonable size limit
-                        optimized_files.append({
-                            "path": important_file,
-                            "name": file_path.name,
-                            "extension": file_path.suffix,
-                            "size": len(content),
-                            "content": content,
-                            "language": self._detect_language(file_path)
-                        })
-                except Exception:
-                    continue
-
-        # Then add other files until token limit
-        current_tokens = sum(await self._estimate_tokens_async(f["content"]) for f in optimized_files)
-
-        if current_tokens < max_tokens:
-            # Add more files from common directories
-            common_dirs = ["src", "lib", "app", "core", "utils"]
-
-            for dir_name in common_dirs:
-                dir_path = path / dir_name
-                if dir_path.exists():
-                    for file_path in dir_path.glob("**/*.py"):
-                        if file_path.is_file() and current_tokens < max_tokens:
-                            try:
-                                with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                                    content = f.read()
-
-                                if not self._is_binary_file(content):
-                                    tokens = await self._estimate_tokens_async(content)
-                                    if current_tokens + tokens <= max_tokens:
-                                        optimized_files.append({
-                                            "path": str(file_path.relative_to(path)),
-                                            "name": file_path.name,
-                                            "extension": file_path.suffix,
-                                            "size": len(content),
-                                            "content": content,
-                                            "language": self._detect_language(file_path)
-                                        })
-                                        current_tokens += tokens
-
-                            except Exception:
-                                continue
-
-        return optimized_files
-
-    async def _estimate_tokens_async(self, content: str) -> int:
-        """Async wrapper for token estimation."""
-        from meta_mcp.services.token_analysis_service import TokenAnalysisService
-        token_service = TokenAnalysisService()
-        return token_service._estimate_tokens(content)
\ No newline at end of file
+    async def _optimize_for_tokens(self, repo_path: Path, files_data: List[Dict[str, Any]],
+                                   token_counts: List[int], max_tokens: int) -> Tuple[List[int], Dict[str, Dict[str, float]]]:
+        """Select the most important files that fit in max_tokens.
+
+        Returns:
+            (indices into files_data, importance scores keyed by posix path)
+        """
+        churn = await asyncio.to_thread(git_churn, str(repo_path))
+        # Per-file cost of the XML wrapper around each file's content
+        overhead = await self._count_tokens_batch([
+            f'  <file path="{f["path"]}" language="{f["language"]}">\n    <content><![CDATA[]]></content>\n  </file>'
+            for f in files_data
+        ])
+        return await asyncio.to_thread(
+            select_files, files_data, [t + o for t, o in zip(token_counts, overhead)], max_tokens, churn
+        )
+
+    async def _count_tokens_batch(self, contents: List[str]) -> List[int]:
+        """Count tokens for many texts off the event loop."""
+        return await asyncio.to_thread(get_tokenizer().count_batch, contents)
\ No newline at end of file
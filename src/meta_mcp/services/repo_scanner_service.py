@@ -5,6 +5,7 @@ import toml
 from pathlib import Path
 
 from meta_mcp.services.base import MetaMCPService
+from meta_mcp.tools.tool_extractor import extract_tools
 
 
 class RepoScannerService(MetaMCPService):
@@ -153,6 +154,8 @@ class RepoScannerService(MetaMCPService):
             "fastmcp_version": None,
             "has_mcp_server": False,
             "has_tools": False,
+            "tool_count": 0,
+            "tools_with_docstrings": 0,
             "has_manifest": False,
             "version": None,
             # FastMCP 2.14+ features
@@ -176,8 +179,12 @@ class RepoScannerService(MetaMCPService):
                     if "from fastmcp import" in content or "import fastmcp" in content:
                         compliance["has_fastmcp"] = True
 
-                    if "@app.tool" in content or "@mcp.tool" in content:
+                    # Decorated tool functions (AST-based, cached per file hash)
+                    tools = extract_tools(content)
+                    if tools:
                         compliance["has_tools"] = True
+                        compliance["tool_count"] += len(tools)
+                        compliance["tools_with_docstrings"] += sum(1 for t in tools if t.has_docstring)
 
                     if "FastMCP(" in content:
                         compliance["has_mcp_server"] = True
@@ -0,0 +1,176 @@
+"""
+Repository watcher service - live runt analysis of the repos directory.
+
+Watches the repos root with watchfiles, debounces change events and
+re-analyzes only the repositories they touch. The latest analysis of every
+repository is kept in memory, so a whole-workspace runt scan can be served
+without walking the tree again.
+"""
+
+import asyncio
+import os
+from pathlib import Path
+from typing import Any, Dict, Optional, Set
+
+from watchfiles import DefaultFilter, awatch
+
+from meta_mcp.services.base import MetaMCPService
+from meta_mcp.tools.mcp_repo_analyzer import (
+    _analyze_repo_safe,
+    _analyze_repos_concurrently,
+    _build_scan_result,
+    _list_repo_dirs,
+)
+from meta_mcp.tools.repo_walker import DEFAULT_IGNORE_DIRS
+from meta_mcp.tools.scan_cache import cache_scan_result
+
+# Milliseconds of quiet before a batch of change events is processed
+DEFAULT_DEBOUNCE_MS = 1600
+
+
+class RepoWatcherService(MetaMCPService):
+    """Keeps runt analysis results for a repos root up to date."""
+
+    def __init__(
+        self,
+        repos_root: Optional[str] = None,
+        debounce_ms: int = DEFAULT_DEBOUNCE_MS,
+    ):
+        """
+        Args:
+            repos_root: Directory containing the repositories to watch
+                (default: REPOS_DIR environment variable; unset disables the
+                watcher)
+            debounce_ms: Quiet period before change events are processed
+        """
+        super().__init__()
+        repos_root = repos_root or os.getenv("REPOS_DIR")
+        self.repos_root = (
+            Path(repos_root).expanduser().resolve() if repos_root else None
+        )
+        self.debounce_ms = debounce_ms
+        self.ready = False
+        self._results: Dict[str, Optional[Dict[str, Any]]] = {}
+        self._task: Optional[asyncio.Task] = None
+        self._stop_event: Optional[asyncio.Event] = None
+        self._watch_filter = DefaultFilter(
+            ignore_dirs=tuple(set(DefaultFilter.ignore_dirs) | DEFAULT_IGNORE_DIRS)
+        )
+
+    async def start(self) -> bool:
+        """Start the initial scan and the watch loop in the background.
+
+        Returns:
+            True if the watcher is running
+        """
+        if self._task is not None:
+            return True
+        if self.repos_root is None:
+            self.logger.info("Repo watcher disabled: REPOS_DIR is not set")
+            return False
+        if not self.repos_root.is_dir():
+            self.logger.warning(f"Repo watcher disabled: {self.repos_root} not found")
+            return False
+
+        self._stop_event = asyncio.Event()
+        self._task = asyncio.create_task(self._run())
+        self.logger.info(f"Watching repos root {self.repos_root}")
+        return True
+
+    async def stop(self) -> None:
+        """Stop watching and wait for the background task to finish."""
+        if self._task is None:
+            return
+        self._stop_event.set()
+        self._task.cancel()
+        try:
+            await self._task
+        except (asyncio.CancelledError, Exception):
+            pass
+        self._task = None
+        self.ready = False
+
+    def covers(self, scan_path: Optional[str]) -> bool:
+        """Whether live results are available for scan_path."""
+        if not self.ready or not scan_path:
+            return False
+        return Path(scan_path).expanduser().resolve() == self.repos_root
+
+    def get_scan_result(self, include_sota: bool = True) -> Dict[str, Any]:
+        """Build an analyze_runts-shaped result from the in-memory analyses."""
+        result = _build_scan_result(
+            self._results.values(), str(self.repos_root), include_sota
+        )
+        result["live"] = True
+        return result
+
+    async def _run(self) -> None:
+        """Initial full scan, then incremental re-analysis on changes."""
+        try:
+            repo_dirs = _list_repo_dirs(self.repos_root)
+            results = await _analyze_repos_concurrently(repo_dirs)
+            self._results = {d.name: r for d, r in zip(repo_dirs, results)}
+            self.ready = True
+            await self._publish()
+            self.logger.info(f"Initial scan of {len(repo_dirs)} repos complete")
+
+            async for changes in awatch(
+                self.repos_root,
+                watch_filter=self._watch_filter,
+                debounce=self.debounce_ms,
+                stop_event=self._stop_event,
+            ):
+                repo_names = self._affected_repos(path for _, path in changes)
+                if repo_names:
+                    await self._reanalyze(repo_names)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self.ready = False
+            self.logger.error(f"Repo watcher stopped: {e}")
+
+    def _affected_repos(self, paths) -> Set[str]:
+        """Map changed paths to the top-level repository names they belong to."""
+        names = set()
+        for path in paths:
+            try:
+                rel = Path(path).relative_to(self.repos_root)
+            except ValueError:
+                continue
+            if rel.parts and not rel.parts[0].startswith("."):
+                names.add(rel.parts[0])
+        return names
+
+    async def _reanalyze(self, repo_names: Set[str]) -> None:
+        """Re-analyze the given repositories and publish the merged result."""
+        for name in sorted(repo_names):
+            repo_dir = self.repos_root / name
+            if not repo_dir.is_dir():
+                # Repository (or a stray top-level file) was removed
+                self._results.pop(name, None)
+                continue
+            # Unchanged files are served from the per-file result cache
+            self._results[name] = await asyncio.to_thread(_analyze_repo_safe, repo_dir)
+
+        await self._publish()
+        self.logger.info(f"Re-analyzed {len(repo_names)} changed repos")
+
+    async def _publish(self) -> None:
+        """Refresh the persisted scan cache so on-demand scans see live data."""
+        scan_path = str(self.repos_root)
+        result = _build_scan_result(self._results.values(), scan_path)
+        # SQLite write (and its eviction pass); keep it off the event loop
+        await asyncio.to_thread(cache_scan_result, scan_path, 1, result)
+
+    async def get_health_status(self) -> Dict[str, Any]:
+        """Get watcher health status."""
+        status = await super().get_health_status()
+        status.update(
+            {
+                "watching": self._task is not None and not self._task.done(),
+                "ready": self.ready,
+                "repos_root": str(self.repos_root) if self.repos_root else None,
+                "repo_count": len(self._results),
+            }
+        )
+        return status
@@ -1,10 +1,18 @@
 from typing import Any, Dict, List, Optional
 import asyncio
-import subprocess
 import sys
+import time
 from pathlib import Path
 
 from meta_mcp.services.base import MetaMCPService
+from meta_mcp.tools.jsonrpc_stdio import JsonRpcConnection, JsonRpcError
+from meta_mcp.tools.process_supervisor import RestartPolicy, SupervisedProcess
+
+DEFAULT_TOOL_TIMEOUT = 60.0
+# Lines of each output stream included in status reports
+STATUS_TAIL_LINES = 20
+# Supervisor states in which the server process is gone for good
+FINISHED_STATES = ("exited", "failed", "stopped")
 
 
 class ServerService(MetaMCPService):
@@ -12,15 +20,29 @@ class ServerService(MetaMCPService):
     Service for managing MCP server lifecycle and execution.
 
     Provides capabilities to start, stop, monitor, and execute tools
-    on MCP servers discovered in the system.
+    on MCP servers discovered in the system. Every started server runs under
+    a ``SupervisedProcess``: its output is drained into ring buffers, its
+    resource usage is sampled, and it is restarted per its restart policy.
+    Each server gets one JSON-RPC connection over its stdio pipes; concurrent
+    requests are multiplexed on it by id.
     """
 
     def __init__(self):
-        self.running_servers: Dict[str, subprocess.Popen] = {}
+        super().__init__()
+        self.supervisors: Dict[str, SupervisedProcess] = {}
         self.server_status: Dict[str, Dict[str, Any]] = {}
 
-    async def start_server(self, server_path: str, server_type: str = "python") -> Dict[str, Any]:
-        """Start an MCP server process."""
+    async def start_server(self, server_path: str, server_type: str = "python",
+                           restart_policy: str = "on-failure",
+                           max_restarts: int = 5) -> Dict[str, Any]:
+        """Start an MCP server process under supervision.
+
+        Args:
+            server_path: Server entry point
+            server_type: Only "python" is supported
+            restart_policy: "never", "on-failure" or "always"
+            max_restarts: Consecutive restarts before the server is left failed
+        """
         try:
             server_path_obj = Path(server_path)
 
@@ -32,28 +54,29 @@ class ServerService(MetaMCPService):
             else:
                 return self.create_response(False, f"Unsupported server type: {server_type}")
 
-            # Start the process
-            process = subprocess.Popen(
-                cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                cwd=server_path_obj.parent,
-                text=True
-            )
-
             server_id = f"{server_type}:{server_path}"
 
-            self.running_servers[server_id] = process
-            self.server_status[server_id] = {
-                "status": "starting",
-                "pid": process.pid,
-                "start_time": self.get_timestamp()
-            }
+            existing = self.supervisors.get(server_id)
+            if existing is not None and existing.state not in FINISHED_STATES:
+                return self.create_response(True, f"Server already running with PID {existing.process.pid}", {
+                    "server_id": server_id,
+                    "pid": existing.process.pid,
+                    "status": existing.state
+                })
+
+            supervisor = SupervisedProcess(
+                server_id, cmd, cwd=str(server_path_obj.parent),
+                policy=RestartPolicy(mode=restart_policy, max_restarts=max_restarts)
+            )
+            await supervisor.start()
+
+            self.supervisors[server_id] = supervisor
+            self.server_status[server_id] = {"start_time": self.get_timestamp()}
 
-            return self.create_response(True, f"Server started with PID {process.pid}", {
+            return self.create_response(True, f"Server started with PID {supervisor.process.pid}", {
                 "server_id": server_id,
-                "pid": process.pid,
-                "status": "starting"
+                "pid": supervisor.process.pid,
+                "status": supervisor.state
             })
 
         except Exception as e:
@@ -62,21 +85,12 @@ class ServerService(MetaMCPService):
     async def stop_server(self, server_id: str) -> Dict[str, Any]:
         """Stop a running MCP server."""
         try:
-            if server_id not in self.running_servers:
+            supervisor = self.supervisors.pop(server_id, None)
+            if supervisor is None:
                 return self.create_response(False, f"Server not found: {server_id}")
 
-            process = self.running_servers[server_id]
-            process.terminate()
+            await supervisor.stop()
 
-            # Wait for graceful shutdown
-            try:
-                process.wait(timeout=5)
-            except subprocess.TimeoutExpired:
-                process.kill()
-                process.wait()
-
-            # Clean up
-            del self.running_servers[server_id]
             if server_id in self.server_status:
                 self.server_status[server_id]["status"] = "stopped"
                 self.server_status[server_id]["end_time"] = self.get_timestamp()
@@ -86,17 +100,29 @@ class ServerService(MetaMCPService):
         except Exception as e:
             return self.create_response(False, f"Failed to stop server: {str(e)}")
 
+    async def stop_all_servers(self) -> None:
+        """Stop every server started by this service."""
+        for server_id in list(self.supervisors):
+            await self.stop_server(server_id)
+
     async def list_running_servers(self) -> Dict[str, Any]:
-        """List all currently running MCP servers."""
+        """List the MCP servers that are running, starting or being restarted.
+
+        Servers that exited or failed for good are left out; their details
+        remain available from get_server_status.
+        """
         running = []
-        for server_id, process in self.running_servers.items():
+        for server_id, supervisor in self.supervisors.items():
+            if supervisor.state in FINISHED_STATES:
+                continue
             status_info = self.server_status.get(server_id, {})
             running.append({
                 "server_id": server_id,
-                "pid": process.pid,
-                "status": status_info.get("status", "unknown"),
+                "pid": supervisor.process.pid,
+                "status": supervisor.state,
                 "start_time": status_info.get("start_time"),
-                "poll_status": process.poll()  # None if running, else exit code
+                "restarts": supervisor.total_restarts,
+                "poll_status": supervisor.process.returncode  # None if running, else exit code
             })
 
         return self.create_response(True, f"Found {len(running)} running servers", {
@@ -105,24 +131,100 @@ class ServerService(MetaMCPService):
         })
 
     async def get_server_status(self, server_id: str) -> Dict[str, Any]:
-        """Get detailed status of a specific server."""
-        if server_id not in self.running_servers:
+        """Get detailed status of a specific server.
+
+        Includes the supervisor's view: restart history, the latest CPU/RSS/
+        open-FD sample from /proc (None where /proc is unavailable) and the
+        tails of stderr and of non-protocol stdout.
+        """
+        supervisor = self.supervisors.get(server_id)
+        if supervisor is None:
             return self.create_response(False, f"Server not running: {server_id}")
 
-        process = self.running_servers[server_id]
         status_info = self.server_status.get(server_id, {})
+        connection = supervisor.connection
+        supervision = supervisor.status()
+        state = supervision.pop("state")
+        supervision["stderr_tail"] = supervision["stderr_tail"][-STATUS_TAIL_LINES:]
+        supervision["stdout_tail"] = supervision["stdout_tail"][-STATUS_TAIL_LINES:]
 
         return self.create_response(True, f"Server {server_id} status retrieved", {
             "server_id": server_id,
-            "pid": process.pid,
-            "status": status_info.get("status", "unknown"),
+            "status": state,
+            **supervision,
             "start_time": status_info.get("start_time"),
-            "is_alive": process.poll() is None,
-            "exit_code": process.poll()
+            "server_info": status_info.get("server_info"),
+            "requests_sent": connection.requests_sent if connection else 0,
+            "requests_in_flight": connection.in_flight if connection else 0,
         })
 
-    async def execute_tool_on_server(self, server_id: str, tool_name: str, parameters: Dict[str, Any]) -> Dict[str, Any]:
+    async def get_connection(self, server_id: str, timeout: Optional[float] = None) -> JsonRpcConnection:
+        """Return the initialized JSON-RPC connection of a running server.
+
+        After a restart this is the connection to the new process.
+
+        Raises:
+            KeyError: If the server is not running
+            ConnectionError: If the server process has exited
+        """
+        supervisor = self.supervisors.get(server_id)
+        if supervisor is None:
+            raise KeyError(f"Server not running: {server_id}")
+
+        connection = supervisor.connection
+        try:
+            server_info = await connection.initialize(timeout)
+        except (ConnectionError, asyncio.TimeoutError):
+            if supervisor.state == "starting" and not supervisor.is_alive:
+                supervisor.state = "failed"
+            raise
+
+        if supervisor.state == "starting":
+            supervisor.state = "running"
+            self.server_status[server_id]["server_info"] = server_info.get("serverInfo", {})
+        return connection
+
+    async def list_tools_on_server(self, server_id: str, timeout: float = DEFAULT_TOOL_TIMEOUT) -> List[Dict[str, Any]]:
+        """Query a running server for its tools (``tools/list``)."""
+        connection = await self.get_connection(server_id, timeout)
+        return await connection.list_tools(timeout)
+
+    async def execute_tool_on_server(self, server_id: str, tool_name: str, parameters: Dict[str, Any], timeout: float = DEFAULT_TOOL_TIMEOUT) -> Dict[str, Any]:
         """Execute a tool on a running MCP server."""
-        # This is a simplified implementation - in a real system you'd need
-        # to establish MCP protocol communication with the running server
-        return self.create_response(False, "Tool execution not yet implemented - requires MCP protocol client")
\ No newline at end of file
+        start_time = time.perf_counter()
+        try:
+            connection = await self.get_connection(server_id, timeout)
+            result = await connection.call_tool(tool_name, parameters, timeout)
+        except KeyError as e:
+            return self.create_response(False, str(e.args[0]))
+        except asyncio.TimeoutError:
+            return self.create_response(False, f"Tool {tool_name} timed out after {timeout}s")
+        except (JsonRpcError, ConnectionError) as e:
+            return self.create_response(False, f"Tool execution failed: {str(e)}")
+
+        execution_time = round(time.perf_counter() - start_time, 4)
+        data = {
+            "server_id": server_id,
+            "tool_name": tool_name,
+            "result": result,
+            "execution_time": execution_time
+        }
+
+        # Tool-level failures are reported in the result, not as protocol errors
+        if result.get("isError"):
+            return self.create_response(False, f"Tool {tool_name} reported an error", data, [
+                item.get("text", "") for item in result.get("content", []) if item.get("type") == "text"
+            ])
+
+        return self.create_response(True, f"Tool {tool_name} executed successfully", data)
+
+
+_server_service: Optional[ServerService] = None
+
+
+def get_server_service() -> ServerService:
+    """Shared ServerService, so API endpoints and MCP tools see the same servers."""
+    global _server_service
+    if _server_service is None:
+        _server_service = ServerService()
+    return _server_service
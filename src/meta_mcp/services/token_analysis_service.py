@@ -3,6 +3,8 @@ import os
 from pathlib import Path
 
 from meta_mcp.services.base import MetaMCPService
+from meta_mcp.tools.directory_tokens import count_directory_tokens
+from meta_mcp.tools.tokenizer import get_tokenizer
 
 
 class TokenAnalysisService(MetaMCPService):
@@ -13,8 +15,14 @@ class TokenAnalysisService(MetaMCPService):
     helping users understand LLM context limits and optimize content for AI consumption.
     """
 
-    def __init__(self):
-        # Simple token estimation - in production you'd use tiktoken or similar
+    def __init__(self, tokenizer=None):
+        """
+        Args:
+            tokenizer: Token counting engine (default: shared engine from
+                get_tokenizer(), BPE with heuristic fallback)
+        """
+        super().__init__()
+        self.tokenizer = tokenizer or get_tokenizer()
         self.token_counts = {}
 
     async def analyze_file_tokens(self, file_path: str) -> Dict[str, Any]:
@@ -29,8 +37,6 @@ class TokenAnalysisService(MetaMCPService):
             with open(path, 'r', encoding='utf-8', errors='ignore') as f:
                 content = f.read()
 
-            # Simple token estimation (words + punctuation)
-            # In production, use tiktoken for accurate GPT token counting
             tokens = self._estimate_tokens(content)
 
             file_info = {
@@ -40,7 +46,8 @@ class TokenAnalysisService(MetaMCPService):
                 "line_count": len(content.split('\n')),
                 "token_count": tokens,
                 "token_density": tokens / max(1, len(content.split())),
-                "language": self._detect_language(path)
+                "language": self._detect_language(path),
+                "tokenizer": self.tokenizer.name
             }
 
             return self.create_response(True, f"Token analysis completed for {path.name}", file_info)
@@ -48,8 +55,13 @@ class TokenAnalysisService(MetaMCPService):
         except Exception as e:
             return self.create_response(False, f"Token analysis failed: {str(e)}")
 
-    async def analyze_directory_tokens(self, dir_path: str, extensions: Optional[List[str]] = None) -> Dict[str, Any]:
-        """Analyze token usage across all files in a directory."""
+    async def analyze_directory_tokens(self, dir_path: str, extensions: Optional[List[str]] = None,
+                                       max_workers: Optional[int] = None, use_cache: bool = True) -> Dict[str, Any]:
+        """Analyze token usage across all files in a directory.
+
+        The tree is walked once; changed files are tokenized across a process
+        pool and per-file counts are cached on disk by content hash.
+        """
         try:
             path = Path(dir_path)
 
@@ -59,23 +71,26 @@ class TokenAnalysisService(MetaMCPService):
             if extensions is None:
                 extensions = ['.py', '.js', '.ts', '.java', '.cpp', '.c', '.go', '.rs', '.php', '.rb']
 
+            counted, stats = await count_directory_tokens(
+                path, extensions, self.tokenizer.name, max_workers=max_workers, use_cache=use_cache
+            )
+
             total_tokens = 0
             total_size = 0
             file_analyses = []
 
-            for ext in extensions:
-                for file_path in path.rglob(f"*{ext}"):
-                    if file_path.is_file():
-                        try:
-                            result = await self.analyze_file_tokens(str(file_path))
-                            if result.get("success"):
-                                file_data = result.get("data", {})
-                                total_tokens += file_data.get("token_count", 0)
-                                total_size += file_data.get("file_size", 0)
-                                file_analyses.append(file_data)
-                        except Exception:
-                            # Skip files that can't be analyzed
-                            continue
+            for item, counts in counted:
+                total_tokens += counts["token_count"]
+                total_size += counts["file_size"]
+                file_analyses.append({
+                    "file_path": str(path / item.rel_path),
+                    "file_name": item.name,
+                    "file_size": counts["file_size"],
+                    "line_count": counts["line_count"],
+                    "token_count": counts["token_count"],
+                    "token_density": counts["token_count"] / max(1, counts["word_count"]),
+                    "language": self._detect_language(Path(item.name))
+                })
 
             # Sort by token count
             file_analyses.sort(key=lambda x: x.get("token_count", 0), reverse=True)
@@ -88,7 +103,14 @@ class TokenAnalysisService(MetaMCPService):
                 "average_tokens_per_file": total_tokens / max(1, len(file_analyses)),
                 "largest_files": file_analyses[:10],  # Top 10 by token count
                 "extensions_analyzed": extensions,
-                "token_distribution": self._analyze_token_distribution(file_analyses)
+                "token_distribution": self._analyze_token_distribution(file_analyses),
+                "tokenizer": stats["tokenizer"],
+                "cache": {
+                    "hits": stats["cache_hits"],
+                    "misses": stats["cache_misses"],
+                    "files_read": stats["files_read"],
+                    "workers": stats["workers"]
+                }
             }
 
             return self.create_response(True, f"Directory token analysis completed for {path.name}", analysis)
@@ -129,28 +151,8 @@ class TokenAnalysisService(MetaMCPService):
         })
 
     def _estimate_tokens(self, content: str) -> int:
-        """Simple token estimation. In production, use tiktoken."""
-        # Rough estimation: ~4 characters per token for code
-        # More accurate would use tiktoken library
-        char_count = len(content)
-        # Estimate: 1 token per 4 characters for code, adjusted for whitespace
-        lines = content.split('\n')
-        avg_line_length = sum(len(line) for line in lines) / max(1, len(lines))
-
-        # Code tends to have more tokens per character than natural language
-        if avg_line_length > 80:  # Likely code
-            tokens_per_char = 0.3  # ~3-4 chars per token for code
-        else:  # Likely natural language or comments
-            tokens_per_char = 0.25  # ~4 chars per token
-
-        estimated_tokens = int(char_count * tokens_per_char)
-
-        # Adjust for special patterns
-        estimated_tokens += content.count('\n') * 0.5  # Line breaks
-        estimated_tokens += content.count(' ') * 0.2   # Spaces
-        estimated_tokens += content.count('\t') * 0.3  # Tabs
-
-        return max(1, estimated_tokens)
+        """Count tokens with the configured tokenizer engine."""
+        return self.tokenizer.count(content)
 
     def _detect_language(self, file_path: Path) -> str:
         """Detect programming language from file extension."""
@@ -1,9 +1,14 @@
 from typing import Any, Dict, List, Optional
 import asyncio
 import json
+from collections import deque
 from pathlib import Path
 
 from meta_mcp.services.base import MetaMCPService
+from meta_mcp.services.server_service import ServerService, get_server_service
+
+# Executions remembered per server for get_tool_history
+HISTORY_LIMIT = 500
 
 
 class ToolService(MetaMCPService):
@@ -14,25 +19,32 @@ class ToolService(MetaMCPService):
     using the MCP protocol for communication.
     """
 
+    def __init__(self, server_service: Optional[ServerService] = None):
+        super().__init__()
+        self.server_service = server_service or get_server_service()
+        self._history: Dict[str, deque] = {}
+
     async def execute_tool(self, server_id: str, tool_name: str, parameters: Dict[str, Any] = None) -> Dict[str, Any]:
         """Execute a tool on a specific MCP server."""
         try:
-            # This is a placeholder implementation
-            # In a real system, you'd need to:
-            # 1. Connect to the running MCP server
-            # 2. Send the tool execution request via MCP protocol
-            # 3. Handle the response
-
-            # For now, simulate tool execution
-            simulated_result = {
+            parameters = parameters or {}
+            response = await self.server_service.execute_tool_on_server(server_id, tool_name, parameters)
+            data = response.get("data", {})
+
+            execution = {
                 "tool_name": tool_name,
-                "parameters": parameters or {},
-                "result": f"Simulated execution of {tool_name} on {server_id}",
-                "execution_time": 0.1,
-                "status": "success"
+                "parameters": parameters,
+                "result": data.get("result"),
+                "execution_time": data.get("execution_time"),
+                "timestamp": self.get_timestamp(),
+                "status": "success" if response["success"] else "error"
             }
+            self._history.setdefault(server_id, deque(maxlen=HISTORY_LIMIT)).append(execution)
 
-            return self.create_response(True, f"Tool {tool_name} executed successfully", simulated_result)
+            if not response["success"]:
+                return self.create_response(False, response["message"], execution, response.get("errors"))
+
+            return self.create_response(True, f"Tool {tool_name} executed successfully", execution)
 
         except Exception as e:
             return self.create_response(False, f"Tool execution failed: {str(e)}")
@@ -40,34 +52,24 @@ class ToolService(MetaMCPService):
     async def list_server_tools(self, server_id: str) -> Dict[str, Any]:
         """List all tools available on a specific MCP server."""
         try:
-            # This is a placeholder implementation
-            # In a real system, you'd query the server for its tool list
-
-            simulated_tools = [
+            tools = [
                 {
-                    "name": "example_tool",
-                    "description": "An example tool",
-                    "parameters": [
-                        {"name": "text", "type": "string", "required": True},
-                        {"name": "count", "type": "integer", "required": False, "default": 1}
-                    ]
-                },
-                {
-                    "name": "file_operations",
-                    "description": "File system operations",
-                    "parameters": [
-                        {"name": "operation", "type": "string", "required": True},
-                        {"name": "path", "type": "string", "required": True}
-                    ]
+                    "name": tool["name"],
+                    "description": tool.get("description") or "",
+                    "parameters": _schema_parameters(tool.get("inputSchema") or {}),
+                    "input_schema": tool.get("inputSchema") or {}
                 }
+                for tool in await self.server_service.list_tools_on_server(server_id)
             ]
 
-            return self.create_response(True, f"Retrieved {len(simulated_tools)} tools from {server_id}", {
+            return self.create_response(True, f"Retrieved {len(tools)} tools from {server_id}", {
                 "server_id": server_id,
-                "tools": simulated_tools,
-                "count": len(simulated_tools)
+                "tools": tools,
+                "count": len(tools)
             })
 
+        except KeyError as e:
+            return self.create_response(False, f"Failed to list tools: {e.args[0]}")
         except Exception as e:
             return self.create_response(False, f"Failed to list tools: {str(e)}")
 
@@ -117,37 +119,35 @@ class ToolService(MetaMCPService):
     async def get_tool_history(self, server_id: str, tool_name: Optional[str] = None, limit: int = 10) -> Dict[str, Any]:
         """Get execution history for tools on a server."""
         try:
-            # This would normally query a database
-            # For now, return simulated history
-            simulated_history = [
-                {
-                    "tool_name": "example_tool",
-                    "parameters": {"text": "hello", "count": 3},
-                    "result": "hellohellohello",
-                    "execution_time": 0.05,
-                    "timestamp": "2024-01-19T15:30:00Z",
-                    "status": "success"
-                },
-                {
-                    "tool_name": "file_operations",
-                    "parameters": {"operation": "list", "path": "/tmp"},
-                    "result": "Directory listing completed",
-                    "execution_time": 0.12,
-                    "timestamp": "2024-01-19T15:25:00Z",
-                    "status": "success"
-                }
-            ]
+            # Most recent executions first
+            history = list(reversed(self._history.get(server_id, ())))
 
             # Filter by tool name if specified
             if tool_name:
-                simulated_history = [h for h in simulated_history if h["tool_name"] == tool_name]
+                history = [h for h in history if h["tool_name"] == tool_name]
 
-            return self.create_response(True, f"Retrieved {len(simulated_history)} history entries", {
+            return self.create_response(True, f"Retrieved {len(history[:limit])} history entries", {
                 "server_id": server_id,
                 "tool_name": tool_name,
-                "history": simulated_history[:limit],
-                "count": len(simulated_history)
+                "history": history[:limit],
+                "count": len(history)
             })
 
         except Exception as e:
-            return self.create_response(False, f"Failed to get tool history: {str(e)}")
\ No newline at end of file
+            return self.create_response(False, f"Failed to get tool history: {str(e)}")
+
+
+def _schema_parameters(input_schema: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Flatten a tool's JSON Schema into the parameter list used for validation."""
+    required = set(input_schema.get("required", []))
+    parameters = []
+    for name, schema in input_schema.get("properties", {}).items():
+        param = {
+            "name": name,
+            "type": schema.get("type", "any"),
+            "required": name in required
+        }
+        if "default" in schema:
+            param["default"] = schema["default"]
+        parameters.append(param)
+    return parameters
@@ -2,61 +2,74 @@
 MCP Tools Module
 
 This module provides decorators and utilities for creating and managing MCP tools.
+
+Exports are resolved lazily (PEP 562): ``from meta_mcp.tools import tool``
+imports only ``decorators``, not every tool implementation, so importing a
+single submodule (or the MCP server) stays cheap.
 """
 
-# Core decorators and utilities
-from .decorators import (
-    tool,
-    structured_log,
-    validate_input,
-    rate_limited,
-    retry_on_failure,
-    cache_result,
-    timed,
-    ToolMetadata,
-)
+import importlib
+from typing import Any
 
-# Tool discovery and management
-from .discovery import (
-    ToolRegistry,
-    get_tool,
-    get_metadata,
-    list_tools,
-    execute_tool,
-    discover_tools,
-    registry,
-)
+# Exported name -> submodule defining it
+_EXPORTS = {
+    # Core decorators and utilities
+    "tool": "decorators",
+    "structured_log": "decorators",
+    "validate_input": "decorators",
+    "rate_limited": "decorators",
+    "retry_on_failure": "decorators",
+    "cache_result": "decorators",
+    "timed": "decorators",
+    "ToolMetadata": "decorators",
+    # Tool discovery and management
+    "ToolRegistry": "discovery",
+    "get_tool": "discovery",
+    "get_metadata": "discovery",
+    "list_tools": "discovery",
+    "execute_tool": "discovery",
+    "discover_tools": "discovery",
+    "registry": "discovery",
+    # Tool implementations
+    "discover_servers": "server",
+    "get_server_info": "server",
+    "execute_remote_tool": "server",
+    "list_server_tools": "server",
+    "test_server_connection": "server",
+    "generate_id": "utility",
+    "format_text": "utility",
+    "validate_json": "utility",
+    "make_http_request": "utility",
+    "schedule_task": "utility",
+    "cancel_scheduled_task": "utility",
+    "profile_code": "development",
+    "debug_function": "development",
+    "trace_execution": "development",
+    "measure_memory": "development",
+    "convert_data": "data",
+    "filter_data": "data",
+    "transform_data": "data",
+    "FileInfo": "files",
+    "list_directory": "files",
+    "read_file": "files",
+    "write_file": "files",
+    "create_temp_file": "files",
+    "copy_file": "files",
+}
 
-# Tool implementations
-from .server import (
-    discover_servers,
-    get_server_info,
-    execute_remote_tool,
-    list_server_tools,
-    test_server_connection,
-)
 
-from .utility import (
-    generate_id,
-    format_text,
-    validate_json,
-    make_http_request,
-    schedule_task,
-    cancel_scheduled_task,
-)
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
 
-from .development import profile_code, debug_function, trace_execution, measure_memory
 
-from .data import convert_data, filter_data, transform_data
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS))
 
-from .files import (
-    FileInfo,
-    list_directory,
-    read_file,
-    write_file,
-    create_temp_file,
-    copy_file,
-)
 
 __all__ = [
     # Core decorators and utilities
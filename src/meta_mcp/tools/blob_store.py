@@ -0,0 +1,220 @@
+"""Content-addressed blob store and manifests for repository packs.
+
+Generated MCP servers share a lot of identical files (``server_builder``
+templates, LICENSE, CI workflows, ``.cursorrules``). Instead of re-emitting
+those bytes into every pack, ``BlobStore`` keeps each distinct file content
+once, keyed by its hash, and a pack manifest lists every repository's files
+as references to blobs. Packing many repositories, or re-packing one after a
+small change, only writes content the store has not seen yet.
+
+Layout (git-style fan-out, zlib-compressed blobs):
+
+    ~/.mcp-studio/blob-store/objects/ab/cdef0123...
+
+Manifest (JSON):
+
+    {
+      "format": "meta-mcp-pack-manifest",
+      "version": 1,
+      "repositories": [
+        {"name": "...", "path": "...",
+         "files": [{"path": "...", "blob": "<digest>", "size": 123, ...}]}
+      ],
+      "blobs": {"<digest>": {"size": 123, "refs": 2}},
+      "stats": {...}
+    }
+"""
+
+import hashlib
+import json
+import os
+import threading
+import zlib
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+# Store directory (relative to user's home)
+BLOB_STORE_DIR = Path.home() / ".mcp-studio" / "blob-store"
+
+MANIFEST_FORMAT = "meta-mcp-pack-manifest"
+MANIFEST_VERSION = 1
+
+# zlib level for stored blobs; packs are mostly text, so this pays off
+BLOB_COMPRESSION_LEVEL = 6
+
+
+def blob_digest(data: bytes) -> str:
+    """Content address of a blob."""
+    return hashlib.blake2b(data, digest_size=32).hexdigest()
+
+
+class BlobStore:
+    """Blobs on disk, addressed by the hash of their content.
+
+    Writes are atomic (temp file + rename), so concurrent packers can share a
+    store; a blob that already exists is never rewritten.
+
+    Example:
+        ```python
+        store = BlobStore()
+        digest = store.put(b"MIT License ...")
+        store.get(digest)  # b"MIT License ..."
+        ```
+    """
+
+    def __init__(self, root: Optional[Union[str, os.PathLike]] = None):
+        self.root = Path(root) if root is not None else BLOB_STORE_DIR
+        self.objects = self.root / "objects"
+        self.blobs_written = 0
+        self.blobs_reused = 0
+        self.bytes_written = 0
+
+    def path_for(self, digest: str) -> Path:
+        return self.objects / digest[:2] / digest[2:]
+
+    def has(self, digest: str) -> bool:
+        return self.path_for(digest).is_file()
+
+    def put(self, data: bytes) -> str:
+        """Store data (if new) and return its digest."""
+        digest = blob_digest(data)
+        path = self.path_for(digest)
+        if path.is_file():
+            self.blobs_reused += 1
+            return digest
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        packed = zlib.compress(data, BLOB_COMPRESSION_LEVEL)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            with open(tmp, "wb") as f:
+                f.write(packed)
+            os.replace(tmp, path)
+        finally:
+            if tmp.exists():
+                tmp.unlink()
+        self.blobs_written += 1
+        self.bytes_written += len(packed)
+        return digest
+
+    def get(self, digest: str) -> bytes:
+        """Read a blob, verifying its content against the digest.
+
+        Raises:
+            KeyError: If the blob is not in the store
+            ValueError: If the stored blob is corrupt
+        """
+        try:
+            with open(self.path_for(digest), "rb") as f:
+                packed = f.read()
+        except FileNotFoundError:
+            raise KeyError(f"Blob not found: {digest}") from None
+        try:
+            data = zlib.decompress(packed)
+        except zlib.error as e:
+            raise ValueError(f"Corrupt blob {digest}: {e}") from None
+        if blob_digest(data) != digest:
+            raise ValueError(f"Corrupt blob {digest}: content hash mismatch")
+        return data
+
+    def get_text(self, digest: str) -> str:
+        return self.get(digest).decode("utf-8")
+
+    def digests(self) -> Iterable[str]:
+        """Digests of all stored blobs."""
+        if not self.objects.is_dir():
+            return
+        for fan_out in os.scandir(self.objects):
+            if not fan_out.is_dir():
+                continue
+            for entry in os.scandir(fan_out.path):
+                if not entry.name.endswith(".tmp"):
+                    yield fan_out.name + entry.name
+
+    def disk_usage(self) -> int:
+        """Bytes used by stored blobs."""
+        return sum(self.path_for(digest).stat().st_size for digest in self.digests())
+
+    def prune(self, keep: Iterable[str]) -> int:
+        """Delete blobs not in keep (e.g. those referenced by live manifests).
+
+        Returns:
+            Number of blobs deleted
+        """
+        keep = set(keep)
+        removed = 0
+        for digest in list(self.digests()):
+            if digest not in keep:
+                try:
+                    self.path_for(digest).unlink()
+                    removed += 1
+                except OSError as e:
+                    logger.debug(f"Failed to prune blob {digest}: {e}")
+        return removed
+
+
+def build_manifest(
+    repositories: List[Dict[str, Any]], **options: Any
+) -> Dict[str, Any]:
+    """Assemble a pack manifest from per-repository file lists.
+
+    Args:
+        repositories: Dicts with name, path and files, where each file
+            carries at least path, blob and size
+        options: Pack options recorded alongside (e.g. compress)
+
+    Returns:
+        Manifest with the blob table and deduplication stats
+    """
+    blobs: Dict[str, Dict[str, int]] = {}
+    logical_bytes = 0
+    for repo in repositories:
+        for entry in repo["files"]:
+            blob = blobs.setdefault(entry["blob"], {"size": entry["bytes"], "refs": 0})
+            blob["refs"] += 1
+            logical_bytes += entry["bytes"]
+
+    unique_bytes = sum(blob["size"] for blob in blobs.values())
+    return {
+        "format": MANIFEST_FORMAT,
+        "version": MANIFEST_VERSION,
+        "options": options,
+        "repositories": repositories,
+        "blobs": blobs,
+        "stats": {
+            "repositories": len(repositories),
+            "files": sum(len(repo["files"]) for repo in repositories),
+            "unique_blobs": len(blobs),
+            "logical_bytes": logical_bytes,
+            "unique_bytes": unique_bytes,
+            "dedup_ratio": round(1 - unique_bytes / max(1, logical_bytes), 4),
+        },
+    }
+
+
+def load_manifest(path: Union[str, os.PathLike]) -> Dict[str, Any]:
+    """Read and validate a pack manifest.
+
+    Raises:
+        ValueError: If the file is not a manifest this version understands
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        manifest = json.load(f)
+    if manifest.get("format") != MANIFEST_FORMAT:
+        raise ValueError(f"Not a pack manifest: {path}")
+    if manifest.get("version") != MANIFEST_VERSION:
+        raise ValueError(
+            f"Unsupported pack manifest version {manifest.get('version')}: {path}"
+        )
+    return manifest
+
+
+def save_manifest(manifest: Dict[str, Any], path: Union[str, os.PathLike]) -> None:
+    target = Path(path)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    with open(target, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2)
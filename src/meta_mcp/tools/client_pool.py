@@ -0,0 +1,335 @@
+"""Pool of warm stdio server sessions, keyed by server path.
+
+Starting a local MCP server costs a cold interpreter start plus the
+initialize handshake, which dwarfs the tool call itself. The pool keeps one
+connected ``StdioSession`` (see ``jsonrpc_stdio``) per server script and
+hands it to every caller; requests are multiplexed by id, so concurrent
+callers share the session.
+
+- Sessions unused for ``idle_timeout`` seconds are closed by a reaper task.
+- At most ``max_sessions`` server processes run at once; the least recently
+  used idle session is closed to make room, otherwise callers wait.
+- A session idle for longer than ``ping_interval`` is pinged before reuse,
+  and a session whose server died is respawned transparently.
+"""
+
+import asyncio
+import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional
+
+import structlog
+
+from .jsonrpc_stdio import StdioSession
+
+logger = structlog.get_logger(__name__)
+
+DEFAULT_MAX_SESSIONS = 8
+DEFAULT_IDLE_TIMEOUT = 300.0  # Seconds before an unused server is stopped
+DEFAULT_PING_INTERVAL = 30.0  # Seconds of inactivity before reuse is verified
+PING_TIMEOUT = 5.0
+CLOSE_TIMEOUT = 5.0
+
+
+@dataclass
+class _PooledSession:
+    """A session and its bookkeeping."""
+
+    client: StdioSession
+    ready: asyncio.Event = field(default_factory=asyncio.Event)
+    error: Optional[BaseException] = None
+    started_at: float = field(default_factory=time.monotonic)
+    last_used: float = field(default_factory=time.monotonic)
+    last_checked: float = field(default_factory=time.monotonic)
+    users: int = 0
+    calls: int = 0
+
+
+class StdioClientPool:
+    """Keyed pool of connected sessions for local stdio servers.
+
+    Example:
+        ```python
+        async with stdio_client_pool.session("/path/to/server.py") as client:
+            tools = await client.list_tools()
+        ```
+    """
+
+    def __init__(
+        self,
+        max_sessions: int = DEFAULT_MAX_SESSIONS,
+        idle_timeout: float = DEFAULT_IDLE_TIMEOUT,
+        ping_interval: float = DEFAULT_PING_INTERVAL,
+        session_factory: Callable[[str], Any] = StdioSession,
+    ):
+        """
+        Args:
+            max_sessions: Maximum number of server processes kept running
+            idle_timeout: Seconds an unused session is kept alive
+            ping_interval: Seconds of inactivity after which a session is
+                pinged before it is handed out again
+            session_factory: Builds the (unconnected) session for a server path
+        """
+        if max_sessions < 1:
+            raise ValueError("max_sessions must be at least 1")
+        self.max_sessions = max_sessions
+        self.idle_timeout = idle_timeout
+        self.ping_interval = ping_interval
+        self.session_factory = session_factory
+        self.spawned = 0
+        self.reused = 0
+        self.respawned = 0
+        self._sessions: "OrderedDict[str, _PooledSession]" = OrderedDict()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._cond: Optional[asyncio.Condition] = None
+        self._reaper: Optional[asyncio.Task] = None
+
+    @asynccontextmanager
+    async def session(
+        self, server_path: str, timeout: Optional[float] = None
+    ) -> AsyncIterator[StdioSession]:
+        """Borrow a connected session for a server script.
+
+        Args:
+            server_path: Path to the server script
+            timeout: Seconds to wait for a cold server to connect (None = no
+                limit)
+
+        Yields:
+            A connected and initialized ``StdioSession``
+        """
+        key = str(Path(server_path).expanduser().resolve())
+        pooled = await self._acquire(key, timeout)
+        try:
+            yield pooled.client
+        except Exception:
+            if not pooled.client.is_connected():
+                # The server went away mid-call; the next caller respawns it
+                logger.warning(f"Lost connection to {key}, dropping session")
+                await self._discard(key, pooled)
+            raise
+        finally:
+            pooled.calls += 1
+            await self._release(pooled)
+
+    async def close(self, server_path: str) -> bool:
+        """Stop the pooled session of a server, if any.
+
+        Returns:
+            True if a session was closed
+        """
+        key = str(Path(server_path).expanduser().resolve())
+        if self._cond is None:
+            return False
+        async with self._cond:
+            pooled = self._sessions.pop(key, None)
+            self._cond.notify_all()
+        if pooled is None:
+            return False
+        await self._close_client(key, pooled)
+        return True
+
+    async def close_all(self) -> None:
+        """Stop every pooled session and the reaper."""
+        if self._reaper is not None:
+            self._reaper.cancel()
+            self._reaper = None
+        if self._cond is None:
+            return
+        async with self._cond:
+            sessions = list(self._sessions.items())
+            self._sessions.clear()
+            self._cond.notify_all()
+        for key, pooled in sessions:
+            await self._close_client(key, pooled)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Pool counters and per-session state."""
+        now = time.monotonic()
+        return {
+            "max_sessions": self.max_sessions,
+            "idle_timeout": self.idle_timeout,
+            "active_sessions": len(self._sessions),
+            "spawned": self.spawned,
+            "reused": self.reused,
+            "respawned": self.respawned,
+            "sessions": [
+                {
+                    "server_path": key,
+                    "connected": pooled.client.is_connected(),
+                    "users": pooled.users,
+                    "calls": pooled.calls,
+                    "age_s": round(now - pooled.started_at, 1),
+                    "idle_s": round(now - pooled.last_used, 1),
+                }
+                for key, pooled in self._sessions.items()
+            ],
+        }
+
+    def _bind_loop(self) -> None:
+        """Reset the pool when used from a new event loop.
+
+        Sessions are tied to the loop that connected them, so sessions from a
+        previous loop (e.g. an earlier ``asyncio.run``) cannot be reused.
+        """
+        loop = asyncio.get_running_loop()
+        if loop is self._loop:
+            return
+        if self._sessions:
+            logger.debug(f"Dropping {len(self._sessions)} sessions from a closed loop")
+        self._sessions.clear()
+        self._loop = loop
+        self._cond = asyncio.Condition()
+        self._reaper = None
+
+    async def _acquire(self, key: str, timeout: Optional[float]) -> _PooledSession:
+        """Return a healthy session for key, spawning one if needed."""
+        self._bind_loop()
+        while True:
+            async with self._cond:
+                pooled = self._sessions.get(key)
+                spawn = pooled is None
+                if spawn:
+                    evicted = await self._make_room()
+                    pooled = _PooledSession(self.session_factory(key))
+                    self._sessions[key] = pooled
+                else:
+                    evicted = []
+                self._sessions.move_to_end(key)
+                pooled.users += 1
+
+            for evicted_key, evicted_session in evicted:
+                await self._close_client(evicted_key, evicted_session)
+            self._ensure_reaper()
+
+            if spawn:
+                await self._connect(key, pooled, timeout)
+                return pooled
+
+            await pooled.ready.wait()
+            if pooled.error is not None:
+                await self._release(pooled)
+                raise pooled.error
+            if await self._is_healthy(pooled):
+                self.reused += 1
+                return pooled
+
+            logger.info(f"Session for {key} is unhealthy, respawning")
+            self.respawned += 1
+            await self._release(pooled)
+            await self._discard(key, pooled)
+
+    async def _connect(
+        self, key: str, pooled: _PooledSession, timeout: Optional[float]
+    ) -> None:
+        """Start the server process and complete the handshake."""
+        start = time.monotonic()
+        try:
+            await pooled.client.connect(timeout)
+        except BaseException as e:
+            pooled.error = e
+            pooled.ready.set()
+            await self._release(pooled)
+            await self._discard(key, pooled)
+            raise
+
+        self.spawned += 1
+        pooled.last_checked = time.monotonic()
+        pooled.ready.set()
+        logger.debug(f"Spawned session for {key} in {time.monotonic() - start:.3f}s")
+
+    async def _make_room(self) -> List:
+        """Evict idle sessions until a new one fits; called with the lock held.
+
+        Returns:
+            Evicted (key, session) pairs, to be closed once the lock is released
+        """
+        evicted = []
+        while len(self._sessions) >= self.max_sessions:
+            idle_key = next(
+                (
+                    key
+                    for key, pooled in self._sessions.items()
+                    if pooled.users == 0 and pooled.ready.is_set()
+                ),
+                None,
+            )
+            if idle_key is None:
+                # Every session is busy; wait for one to be released
+                await self._cond.wait()
+                continue
+            evicted.append((idle_key, self._sessions.pop(idle_key)))
+        return evicted
+
+    async def _is_healthy(self, pooled: _PooledSession) -> bool:
+        """Check the connection, pinging the server if it has been quiet."""
+        if not pooled.client.is_connected():
+            return False
+        now = time.monotonic()
+        if now - pooled.last_checked < self.ping_interval:
+            return True
+        try:
+            await pooled.client.ping(timeout=PING_TIMEOUT)
+        except Exception as e:
+            logger.debug(f"Session ping failed: {e}")
+            return False
+        pooled.last_checked = time.monotonic()
+        return True
+
+    async def _release(self, pooled: _PooledSession) -> None:
+        """Return a borrowed session to the pool."""
+        async with self._cond:
+            pooled.users -= 1
+            pooled.last_used = pooled.last_checked = time.monotonic()
+            self._cond.notify_all()
+
+    async def _discard(self, key: str, pooled: _PooledSession) -> None:
+        """Remove a broken session so the next caller respawns it."""
+        async with self._cond:
+            if self._sessions.get(key) is pooled:
+                del self._sessions[key]
+            self._cond.notify_all()
+        await self._close_client(key, pooled)
+
+    async def _close_client(self, key: str, pooled: _PooledSession) -> None:
+        """Stop a session's server process, ignoring shutdown errors."""
+        try:
+            await asyncio.wait_for(pooled.client.close(), timeout=CLOSE_TIMEOUT)
+        except BaseException as e:
+            if isinstance(e, asyncio.CancelledError):
+                raise
+            logger.debug(f"Error closing session for {key}: {e}")
+
+    def _ensure_reaper(self) -> None:
+        """Start the idle reaper if it is not running."""
+        if self._reaper is None or self._reaper.done():
+            self._reaper = asyncio.create_task(self._reap_idle())
+
+    async def _reap_idle(self) -> None:
+        """Close sessions that have been idle for longer than idle_timeout."""
+        interval = max(1.0, min(self.idle_timeout, self.ping_interval) / 2)
+        while self._sessions:
+            await asyncio.sleep(interval)
+            now = time.monotonic()
+            async with self._cond:
+                expired = [
+                    (key, pooled)
+                    for key, pooled in self._sessions.items()
+                    if pooled.users == 0
+                    and pooled.ready.is_set()
+                    and now - pooled.last_used > self.idle_timeout
+                ]
+                for key, _ in expired:
+                    del self._sessions[key]
+                if expired:
+                    self._cond.notify_all()
+            for key, pooled in expired:
+                logger.debug(f"Closing idle session for {key}")
+                await self._close_client(key, pooled)
+
+
+# Shared pool used by the server tools
+stdio_client_pool = StdioClientPool()
@@ -0,0 +1,245 @@
+"""Signature-only compression of Python source for repository packs.
+
+``compress_python`` keeps what a reader needs to navigate and call the code,
+copied verbatim from the source: module and class docstrings, imports,
+module/class-level assignments, decorators, and every ``def``/``class``
+header with its type hints and docstring. Function bodies are replaced by
+``...``. Each output line is mapped back to its line in the original file, so
+a model reading the compressed pack can cite real line numbers.
+
+This is a native, in-process counterpart to ``repomix --compress`` for
+Python; other languages are left unchanged.
+"""
+
+import ast
+from dataclasses import dataclass, field
+from typing import List, Optional, Sequence, Tuple
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+# Module/class-level statements longer than this are cut to their first line
+MAX_KEPT_STATEMENT_LINES = 6
+
+
+@dataclass
+class CompressedSource:
+    """Compressed text with its mapping back to the original lines."""
+
+    text: str
+    # Original (1-based) line number of each compressed line
+    line_map: List[int] = field(default_factory=list)
+    original_lines: int = 0
+
+    def runs(self) -> List[Tuple[int, int, int]]:
+        """The line map as (compressed_start, original_start, length) runs."""
+        runs: List[Tuple[int, int, int]] = []
+        for index, original in enumerate(self.line_map, start=1):
+            if runs:
+                start, orig_start, length = runs[-1]
+                if original == orig_start + length and index == start + length:
+                    runs[-1] = (start, orig_start, length + 1)
+                    continue
+            runs.append((index, original, 1))
+        return runs
+
+
+class _Compressor:
+    def __init__(self, source: str):
+        # Line breaks as the parser counts them (not str.splitlines(), which also
+        # splits on form feeds and other separators)
+        self.lines = source.replace("\r\n", "\n").replace("\r", "\n").split("\n")
+        self.out: List[str] = []
+        self.line_map: List[int] = []
+
+    def emit(self, lineno: int, end_lineno: Optional[int] = None) -> None:
+        """Copy original lines lineno..end_lineno (inclusive), each at most once.
+
+        Statements separated by ";" share lines, which are copied only once.
+        """
+        first = lineno if not self.line_map else max(lineno, self.line_map[-1] + 1)
+        for n in range(first, (end_lineno or lineno) + 1):
+            self.out.append(self.lines[n - 1])
+            self.line_map.append(n)
+
+    def emit_ellipsis(self, indent: str, lineno: int) -> None:
+        self.out.append(f"{indent}...")
+        self.line_map.append(lineno)
+
+    def block(self, body: Sequence[ast.stmt]) -> None:
+        """Keep the declarative parts of a module or class body."""
+        for index, node in enumerate(body):
+            if index == 0 and _is_docstring(node):
+                self.emit(node.lineno, node.end_lineno)
+            elif self.inline_body(node):
+                # Compound statement on one line, e.g. "def f(x): return x"
+                self.emit(self.start_of(node), node.end_lineno)
+            elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                self.function(node)
+            elif isinstance(node, ast.ClassDef):
+                self.header(node)
+                self.block(node.body)
+            elif isinstance(node, ast.Try):
+                self.try_statement(node)
+            elif isinstance(node, ast.If) and (
+                _is_type_checking(node)
+                or all(isinstance(n, (ast.Import, ast.ImportFrom)) for n in node.body)
+            ):
+                # Conditional imports: keep the imports, drop any else branch
+                self.header(node)
+                self.block(node.body)
+            elif getattr(node, "body", None):
+                # Other compound statements: header only
+                self.header(node)
+                self.emit_ellipsis(self.indent_of(node.body[0]), node.body[0].lineno)
+            else:
+                self.statement(node)
+
+    def statement(self, node: ast.stmt) -> None:
+        """Keep a simple statement, eliding the value of long ones."""
+        end = node.end_lineno or node.lineno
+        if end - node.lineno < MAX_KEPT_STATEMENT_LINES:
+            self.emit(node.lineno, end)
+            return
+
+        if isinstance(node, (ast.Assign, ast.AnnAssign)) and node.value is not None:
+            target = (
+                node.targets[-1] if isinstance(node, ast.Assign) else node.annotation
+            )
+            line = self.lines[node.lineno - 1]
+            equals = line.find("=", target.end_col_offset)
+            if target.end_lineno == node.lineno and equals != -1:
+                # "TABLE = {" becomes "TABLE = ..."
+                self.out.append(line[: equals + 1] + " ...")
+                self.line_map.append(node.lineno)
+                return
+        self.emit_ellipsis(self.indent_of(node), node.lineno)
+
+    def function(self, node: ast.AST) -> None:
+        body = node.body
+        self.header(node)
+        indent = self.indent_of(body[0])
+        if _is_docstring(body[0]):
+            self.emit(body[0].lineno, body[0].end_lineno)
+            rest = body[1:]
+        else:
+            rest = body
+        if rest:
+            self.emit_ellipsis(indent, rest[0].lineno)
+
+    def try_statement(self, node: ast.Try) -> None:
+        """Keep try/except structure (guarded imports and their fallbacks)."""
+        self.header(node)
+        self.block(node.body)
+        for handler in node.handlers:
+            self.header(handler)
+            self.block(handler.body)
+        for branch, keyword in ((node.orelse, "else"), (node.finalbody, "finally")):
+            if not branch:
+                continue
+            line = branch[0].lineno - 1
+            while (
+                line > node.lineno
+                and _code_part(self.lines[line - 1]).strip() != f"{keyword}:"
+            ):
+                line -= 1
+            self.emit(line)
+            self.block(branch)
+
+    def header(self, node: ast.AST) -> None:
+        """Emit decorators and the compound statement's header lines."""
+        start = self.start_of(node)
+        first = node.body[0]
+        if first.lineno > node.lineno:
+            end = self.header_end(node, first.lineno)
+        else:
+            end = node.lineno
+        self.emit(start, end)
+
+    def inline_body(self, node: ast.AST) -> bool:
+        """Whether a compound statement's body starts on its header line."""
+        body = getattr(node, "body", None)
+        if not body or not isinstance(body[0], ast.stmt):
+            return False
+        first = body[0]
+        return bool(self.lines[first.lineno - 1][: first.col_offset].strip())
+
+    def header_end(self, node: ast.AST, body_lineno: int) -> int:
+        """Last line of a header: the line ending with ':' before the body."""
+        candidates = [node.lineno]
+        children = list(ast.iter_child_nodes(node))
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            # ast.arguments has no position of its own
+            children.extend(ast.walk(node.args))
+        for child in children:
+            if isinstance(child, (ast.stmt, ast.excepthandler)):
+                continue
+            if child in getattr(node, "decorator_list", ()):
+                continue
+            end = getattr(child, "end_lineno", None)
+            if end is not None and end < body_lineno:
+                candidates.append(end)
+        line = max(candidates)
+        while line < body_lineno - 1:
+            if _code_part(self.lines[line - 1]).endswith(":"):
+                return line
+            line += 1
+        return line
+
+    def start_of(self, node: ast.AST) -> int:
+        decorators = getattr(node, "decorator_list", None)
+        if decorators:
+            return min(node.lineno, min(d.lineno for d in decorators))
+        return node.lineno
+
+    def indent_of(self, node: ast.AST) -> str:
+        line = self.lines[node.lineno - 1]
+        return line[: len(line) - len(line.lstrip())]
+
+
+def _is_docstring(node: ast.AST) -> bool:
+    return (
+        isinstance(node, ast.Expr)
+        and isinstance(node.value, ast.Constant)
+        and isinstance(node.value.value, str)
+    )
+
+
+def _is_type_checking(node: ast.If) -> bool:
+    test = node.test
+    return (isinstance(test, ast.Name) and test.id == "TYPE_CHECKING") or (
+        isinstance(test, ast.Attribute) and test.attr == "TYPE_CHECKING"
+    )
+
+
+def _code_part(line: str) -> str:
+    """A line without a trailing comment (good enough for header scanning)."""
+    hash_index = line.find("#")
+    if hash_index != -1 and line.count('"', 0, hash_index) % 2 == 0:
+        line = line[:hash_index]
+    return line.rstrip()
+
+
+def compress_python(source: str) -> Optional[CompressedSource]:
+    """Reduce Python source to its signatures, docstrings and declarations.
+
+    Returns:
+        The compressed source, or None if it does not parse
+    """
+    try:
+        tree = ast.parse(source.lstrip("\ufeff"))
+    except (SyntaxError, ValueError) as e:
+        logger.debug(f"Not compressing unparsable source: {e}")
+        return None
+
+    compressor = _Compressor(source)
+    compressor.block(tree.body)
+    text = "\n".join(compressor.out)
+    if compressor.out and source.endswith("\n"):
+        text += "\n"
+    return CompressedSource(
+        text=text,
+        line_map=compressor.line_map,
+        original_lines=len(compressor.lines),
+    )
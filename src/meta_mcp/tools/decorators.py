@@ -5,19 +5,40 @@ This module provides decorators and utilities for creating MCP tools with proper
 multiline descriptions, parameter validation, error handling, and performance monitoring.
 """
 
+import asyncio
 import functools
 import inspect
-import json
 import time
 import uuid
 from datetime import datetime
-from typing import Any, Callable, Dict, List, Optional, TypeVar, Union, get_type_hints
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    get_type_hints,
+)
 from enum import Enum
 
 import structlog
 from fastmcp import FastMCP
 from pydantic import BaseModel, Field
 
+from .metrics import tool_series
+from .resilience import (
+    RateLimiter,
+    RateLimitExceeded,
+    backoff_delay,
+    current_client,
+)
+from .result_cache import DEFAULT_MAX_ENTRIES, ResultCache, make_key
+
 logger = structlog.get_logger(__name__)
 
 # Type variable for decorated functions
@@ -292,6 +313,9 @@ async def _execute_tool_with_monitoring(
 ) -> Any:
     """Execute a tool with performance monitoring and error handling.
 
+    Every call is recorded in the tool's latency histogram, call counters and
+    in-flight gauge (see ``metrics``).
+
     Args:
         func: Function to execute
         metadata: Tool metadata
@@ -301,8 +325,10 @@ async def _execute_tool_with_monitoring(
     Returns:
         Function result
     """
-    start_time = time.time()
+    start_time = time.perf_counter()
     execution_id = str(uuid.uuid4())
+    series = tool_series(metadata.name)
+    series.in_flight.value += 1
 
     logger.info(
         "Tool execution started",
@@ -317,7 +343,9 @@ async def _execute_tool_with_monitoring(
         # Execute function (already async, just await it)
         result = await func(*args, **kwargs)
 
-        execution_time = time.time() - start_time
+        execution_time = time.perf_counter() - start_time
+        series.duration.observe(execution_time)
+        series.success.value += 1
 
         # Update usage count
         metadata.usage_count += 1
@@ -334,7 +362,9 @@ async def _execute_tool_with_monitoring(
         return result
 
     except Exception as e:
-        execution_time = time.time() - start_time
+        execution_time = time.perf_counter() - start_time
+        series.duration.observe(execution_time)
+        series.error.value += 1
 
         logger.error(
             "Tool execution failed",
@@ -349,6 +379,9 @@ async def _execute_tool_with_monitoring(
         # Re-raise the exception
         raise
 
+    finally:
+        series.in_flight.value -= 1
+
 
 def structured_log(level: str = "info", message: Optional[str] = None):
     """Decorator to add structured logging to tool functions.
@@ -428,143 +461,222 @@ def validate_input(**field_validators):
     return decorator
 
 
-def rate_limited(calls_per_minute: int = 60):
+def rate_limited(
+    calls_per_minute: int = 60,
+    burst: Optional[int] = None,
+    limiter: Optional[RateLimiter] = None,
+    key_func: Optional[Callable[..., Hashable]] = None,
+    max_wait: float = 0.0,
+):
     """Decorator to add rate limiting to tool functions.
 
+    Uses a token bucket per (tool, client), where the client is the caller
+    of the current MCP request (see ``resilience.client_id_var``). Calls over
+    the limit wait up to ``max_wait`` seconds for a token (``asyncio.sleep``
+    for async functions), then fail with ``RateLimitExceeded``.
+
     Args:
-        calls_per_minute: Maximum number of calls per minute
+        calls_per_minute: Maximum sustained number of calls per minute
+        burst: Calls allowed back to back (defaults to calls_per_minute)
+        limiter: Shared ``RateLimiter`` to use instead of a per-tool one
+        key_func: Called with the call's arguments; returns the bucket key
+            (default: the tool name and current client)
+        max_wait: Seconds a call may wait for a token before being rejected
 
     Example:
         ```python
         @rate_limited(calls_per_minute=10)
         @tool()
-        def expensive_operation() -> str:
+        async def expensive_operation() -> str:
             # Function implementation
             pass
         ```
     """
 
     def decorator(func: F) -> F:
-        calls = []
-
-        @functools.wraps(func)
-        def wrapper(*args, **kwargs):
-            now = time.time()
-            # Remove calls older than 1 minute
-            calls[:] = [call_time for call_time in calls if now - call_time < 60]
-
-            if len(calls) >= calls_per_minute:
-                raise RuntimeError(
-                    f"Rate limit exceeded: {calls_per_minute} calls per minute"
-                )
-
-            calls.append(now)
-            return func(*args, **kwargs)
+        bucket_limiter = limiter or RateLimiter.per_minute(calls_per_minute, burst)
+        tool_name = func.__name__
+
+        def bucket_key(args, kwargs) -> Hashable:
+            if key_func is not None:
+                return key_func(*args, **kwargs)
+            return (tool_name, current_client())
+
+        def rejected(wait: float) -> RateLimitExceeded:
+            return RateLimitExceeded(
+                f"Rate limit exceeded: {calls_per_minute} calls per minute "
+                f"(retry in {wait:.1f}s)",
+                retry_after=wait,
+            )
 
+        if inspect.iscoroutinefunction(inspect.unwrap(func)):
+
+            @functools.wraps(func)
+            async def wrapper(*args, **kwargs):
+                key = bucket_key(args, kwargs)
+                deadline = time.monotonic() + max_wait
+                while True:
+                    wait = bucket_limiter.try_acquire(key)
+                    if not wait:
+                        return await func(*args, **kwargs)
+                    if time.monotonic() + wait > deadline:
+                        raise rejected(wait)
+                    await asyncio.sleep(wait)
+
+        else:
+
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                key = bucket_key(args, kwargs)
+                deadline = time.monotonic() + max_wait
+                while True:
+                    wait = bucket_limiter.try_acquire(key)
+                    if not wait:
+                        return func(*args, **kwargs)
+                    if time.monotonic() + wait > deadline:
+                        raise rejected(wait)
+                    time.sleep(wait)
+
+        wrapper.rate_limiter = bucket_limiter
         return wrapper
 
     return decorator
 
 
-def retry_on_failure(max_retries: int = 3, delay: float = 1.0):
+def retry_on_failure(
+    max_retries: int = 3,
+    delay: float = 1.0,
+    backoff: float = 2.0,
+    max_delay: float = 30.0,
+    jitter: float = 0.5,
+    exceptions: Tuple[Type[BaseException], ...] = (Exception,),
+):
     """Decorator to add retry logic to tool functions.
 
+    Retries wait with exponential backoff and jitter. Async functions wait
+    with ``asyncio.sleep``, so retries never stall the event loop; sync
+    functions (which block their thread anyway) use ``time.sleep``.
+
     Args:
         max_retries: Maximum number of retry attempts
-        delay: Delay between retries in seconds
+        delay: Delay before the first retry in seconds
+        backoff: Multiplier applied to the delay for each further retry
+        max_delay: Upper bound on the delay
+        jitter: Fraction of each delay that is randomized (0 disables jitter)
+        exceptions: Exception types that trigger a retry
 
     Example:
         ```python
         @retry_on_failure(max_retries=3, delay=2.0)
         @tool()
-        def unreliable_operation() -> str:
+        async def unreliable_operation() -> str:
             # Function implementation that might fail
             pass
         ```
     """
 
     def decorator(func: F) -> F:
-        @functools.wraps(func)
-        def wrapper(*args, **kwargs):
-            last_exception = None
-
-            for attempt in range(max_retries + 1):
-                try:
-                    return func(*args, **kwargs)
-                except Exception as e:
-                    last_exception = e
-                    if attempt < max_retries:
-                        logger.warning(
-                            f"Tool execution failed, retrying in {delay}s",
-                            tool=func.__name__,
-                            attempt=attempt + 1,
-                            max_retries=max_retries,
-                            error=str(e),
-                        )
-                        time.sleep(delay)
-                    else:
-                        logger.error(
-                            "Tool execution failed after all retries",
-                            tool=func.__name__,
-                            attempts=max_retries + 1,
-                            error=str(e),
-                        )
-
-            # Re-raise the last exception
-            raise last_exception
+        def next_delay(attempt: int, error: BaseException) -> Optional[float]:
+            """Delay before the next attempt, or None when out of retries."""
+            if attempt >= max_retries or isinstance(error, RateLimitExceeded):
+                logger.error(
+                    "Tool execution failed after all retries",
+                    tool=func.__name__,
+                    attempts=attempt + 1,
+                    error=str(error),
+                )
+                return None
+            wait = backoff_delay(attempt, delay, backoff, max_delay, jitter)
+            logger.warning(
+                f"Tool execution failed, retrying in {wait:.2f}s",
+                tool=func.__name__,
+                attempt=attempt + 1,
+                max_retries=max_retries,
+                error=str(error),
+            )
+            return wait
+
+        if inspect.iscoroutinefunction(inspect.unwrap(func)):
+
+            @functools.wraps(func)
+            async def wrapper(*args, **kwargs):
+                attempt = 0
+                while True:
+                    try:
+                        return await func(*args, **kwargs)
+                    except exceptions as e:
+                        wait = next_delay(attempt, e)
+                        if wait is None:
+                            raise
+                    await asyncio.sleep(wait)
+                    attempt += 1
+
+        else:
+
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                attempt = 0
+                while True:
+                    try:
+                        return func(*args, **kwargs)
+                    except exceptions as e:
+                        wait = next_delay(attempt, e)
+                        if wait is None:
+                            raise
+                    time.sleep(wait)
+                    attempt += 1
 
         return wrapper
 
     return decorator
 
 
-def cache_result(ttl_seconds: int = 300):
+def cache_result(ttl_seconds: Optional[float] = 300, max_entries: int = DEFAULT_MAX_ENTRIES):
     """Decorator to cache tool function results.
 
+    Works on sync and async functions (for async ones the awaited result is
+    cached, not the coroutine). Entries expire after ``ttl_seconds`` and the
+    least recently used are evicted beyond ``max_entries``. Concurrent calls
+    with the same arguments share one execution; exceptions are not cached.
+
+    The wrapper exposes its ``ResultCache`` as ``wrapper.cache``, plus
+    ``wrapper.cache_info()`` (hit/miss stats) and ``wrapper.cache_clear()``.
+
     Args:
-        ttl_seconds: Time to live for cached results in seconds
+        ttl_seconds: Time to live for cached results in seconds (None: no expiry)
+        max_entries: Maximum number of cached results
 
     Example:
         ```python
         @cache_result(ttl_seconds=600)  # Cache for 10 minutes
         @tool()
-        def expensive_calculation(data: str) -> str:
+        async def expensive_calculation(data: str) -> str:
             # Expensive operation
             return result
         ```
     """
 
     def decorator(func: F) -> F:
-        cache = {}
+        cache = ResultCache(ttl_seconds=ttl_seconds, max_entries=max_entries)
 
-        @functools.wraps(func)
-        def wrapper(*args, **kwargs):
-            # Create cache key from arguments
-            cache_key = json.dumps(
-                {"args": args, "kwargs": sorted(kwargs.items())},
-                sort_keys=True,
-                default=str,
-            )
+        # Look through sync pass-through wrappers (e.g. @timed) to the real function
+        if inspect.iscoroutinefunction(inspect.unwrap(func)):
 
-            now = time.time()
-
-            # Check if we have a valid cached result
-            if cache_key in cache:
-                result, timestamp = cache[cache_key]
-                if now - timestamp < ttl_seconds:
-                    logger.debug(f"Returning cached result for {func.__name__}")
-                    return result
-                else:
-                    # Remove expired entry
-                    del cache[cache_key]
+            @functools.wraps(func)
+            async def wrapper(*args, **kwargs):
+                return await cache.get_or_load_async(
+                    make_key(args, kwargs), lambda: func(*args, **kwargs)
+                )
 
-            # Execute function and cache result
-            result = func(*args, **kwargs)
-            cache[cache_key] = (result, now)
+        else:
 
-            logger.debug(f"Cached new result for {func.__name__}")
-            return result
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                return cache.get_or_load(make_key(args, kwargs), lambda: func(*args, **kwargs))
 
+        wrapper.cache = cache
+        wrapper.cache_info = cache.stats
+        wrapper.cache_clear = cache.clear
         return wrapper
 
     return decorator
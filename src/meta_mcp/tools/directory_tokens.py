@@ -0,0 +1,188 @@
+"""Parallel, memoized token counting for directory trees.
+
+The tree is walked once, skipping files excluded by the repository's
+``.gitignore`` files. Files whose size and mtime match the per-file cache
+are served without being opened; the rest are read, hashed and tokenized in
+batches across a process pool. Files that were only touched (same content
+hash) keep their cached counts. Re-analyzing a large tree after a few edits
+therefore costs one walk, one stat per file and the changed files.
+"""
+
+import asyncio
+import functools
+import os
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import structlog
+
+from .file_result_cache import UNCHANGED, FileResultCache, content_hash, decode_text
+from .ignore_rules import IgnoreMatcher
+from .process_pool import process_pool
+from .repo_walker import RepoFile, walk_repo
+from .tokenizer import get_tokenizer
+
+logger = structlog.get_logger(__name__)
+
+# Work units sent to a worker process
+BATCH_MAX_FILES = 256
+BATCH_MAX_BYTES = 8 * 1024 * 1024
+
+# Below this many bytes to tokenize, a process pool costs more than it saves
+PARALLEL_MIN_BYTES = 2 * 1024 * 1024
+
+# (path, cached content hash or None)
+_Job = Tuple[str, Optional[str]]
+# (path, size, mtime_ns, content hash, counts or None if the hash matched)
+_JobResult = Tuple[str, int, int, str, Optional[Dict[str, int]]]
+
+
+def count_text(text: str, tokenizer) -> Dict[str, int]:
+    """Token, line, word and character counts for one file's content."""
+    return {
+        "file_size": len(text),
+        "line_count": text.count("\n") + 1,
+        "word_count": len(text.split()),
+        "token_count": tokenizer.count(text),
+    }
+
+
+def _count_batch(jobs: List[_Job], tokenizer_name: str) -> List[Optional[_JobResult]]:
+    """Read, hash and tokenize a batch of files (runs in a worker process)."""
+    tokenizer = get_tokenizer(tokenizer_name)
+    results: List[Optional[_JobResult]] = []
+    for path, known_hash in jobs:
+        try:
+            st = os.stat(path)
+            with open(path, "rb") as f:
+                data = f.read()
+        except OSError as e:
+            logger.debug(f"Failed to read {path}: {e}")
+            results.append(None)
+            continue
+
+        digest = content_hash(data)
+        counts = None
+        if digest != known_hash:
+            counts = count_text(decode_text(data, errors="ignore"), tokenizer)
+        results.append((path, st.st_size, st.st_mtime_ns, digest, counts))
+    return results
+
+
+def _batches(
+    pending: List[Tuple[RepoFile, Optional[str], int]],
+) -> Iterable[List[Tuple[RepoFile, Optional[str], int]]]:
+    """Group pending files into batches bounded by file count and size."""
+    batch, batch_bytes = [], 0
+    for job in pending:
+        batch.append(job)
+        batch_bytes += job[2]
+        if len(batch) >= BATCH_MAX_FILES or batch_bytes >= BATCH_MAX_BYTES:
+            yield batch
+            batch, batch_bytes = [], 0
+    if batch:
+        yield batch
+
+
+async def count_directory_tokens(
+    root: Path,
+    extensions: Iterable[str],
+    tokenizer_name: Optional[str] = None,
+    max_workers: Optional[int] = None,
+    use_cache: bool = True,
+) -> Tuple[List[Tuple[RepoFile, Dict[str, int]]], Dict[str, Any]]:
+    """Count tokens for every file under root with one of the extensions.
+
+    Args:
+        root: Directory to analyze
+        extensions: File extensions to include (e.g. ".py")
+        tokenizer_name: Engine passed to get_tokenizer() in each worker
+            (default: the shared engine)
+        max_workers: Worker processes (default: CPU count, 1 = no pool)
+        use_cache: Reuse and update the on-disk per-file cache
+
+    Returns:
+        ((file, counts) pairs in walk order, stats) where stats has the
+        tokenizer name, cache hits and misses, and the number of files read
+    """
+    tokenizer_name = tokenizer_name or get_tokenizer().name
+    wanted = {ext.lower() for ext in extensions}
+    cache = FileResultCache(
+        str(root), namespace=f"tokens:{tokenizer_name}", load=use_cache
+    )
+
+    def plan():
+        """Walk once, serving stat-matched files from the cache."""
+        found: Dict[str, Dict[str, int]] = {}
+        items: List[RepoFile] = []
+        pending: List[Tuple[RepoFile, Optional[str], int]] = []
+        for item in walk_repo(root, matcher=IgnoreMatcher(root)):
+            if item.suffix not in wanted:
+                continue
+            try:
+                st = os.stat(item.path)
+            except OSError:
+                continue
+            items.append(item)
+            hit, counts = cache.lookup(item, st.st_size, st.st_mtime_ns)
+            if hit:
+                found[item.path] = counts
+            else:
+                pending.append((item, cache.entry_hash(item), st.st_size))
+        return items, found, pending
+
+    items, found, pending = await asyncio.to_thread(plan)
+    by_path = {item.path: item for item, _, _ in pending}
+    pending_bytes = sum(size for _, _, size in pending)
+
+    def record(batch_results: List[Optional[_JobResult]]) -> None:
+        for job_result in batch_results:
+            if job_result is None:
+                continue
+            path, size, mtime_ns, digest, counts = job_result
+            found[path] = cache.store(
+                by_path[path],
+                size,
+                mtime_ns,
+                digest,
+                UNCHANGED if counts is None else counts,
+            )
+
+    batches = [
+        [(item.path, known_hash) for item, known_hash, _ in batch]
+        for batch in _batches(pending)
+    ]
+    workers = min(max_workers or os.cpu_count() or 1, len(batches))
+    if pending_bytes < PARALLEL_MIN_BYTES:
+        workers = min(workers, 1)
+
+    if workers <= 1:
+        for jobs in batches:
+            record(await asyncio.to_thread(_count_batch, jobs, tokenizer_name))
+    else:
+        loop = asyncio.get_running_loop()
+        executor = process_pool(workers, preload=__name__)
+        futures = [
+            loop.run_in_executor(
+                executor, functools.partial(_count_batch, jobs, tokenizer_name)
+            )
+            for jobs in batches
+        ]
+        try:
+            for next_done in asyncio.as_completed(futures):
+                record(await next_done)
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    if use_cache:
+        await asyncio.to_thread(cache.save)
+
+    stats = {
+        "tokenizer": tokenizer_name,
+        "cache_hits": cache.hits,
+        "cache_misses": cache.misses,
+        "files_read": len(pending),
+        "workers": workers,
+    }
+    logger.debug(f"Counted tokens under {root}", **stats)
+    return [(item, found[item.path]) for item in items if item.path in found], stats
@@ -7,11 +7,13 @@ This module provides functionality to discover, register, and manage MCP tools.
 import importlib
 import inspect
 import pkgutil
+from pathlib import Path
 from typing import Any, Dict, List, Optional, TypeVar, Union
 
 import structlog
 
-from meta_mcp.tools.decorators import ToolMetadata, tool
+from meta_mcp.tools.decorators import ToolCategory, ToolMetadata, tool
+from meta_mcp.tools.tool_manifest import build_manifest, iter_manifest_tools
 
 logger = structlog.get_logger(__name__)
 
@@ -20,12 +22,23 @@ T = TypeVar("T")
 
 
 class ToolRegistry:
-    """Registry for MCP tools."""
+    """Registry for MCP tools.
 
-    def __init__(self):
+    Packages are discovered from a static manifest (see ``tool_manifest``):
+    listing tools never imports them, and a tool's module is imported the
+    first time the tool is looked up or executed.
+    """
+
+    def __init__(self, manifest_dir: Optional[Path] = None):
+        """
+        Args:
+            manifest_dir: Directory holding tool manifests
+                (default ~/.mcp-studio/tool-manifest)
+        """
         self._tools: Dict[str, Dict[str, Any]] = {}
         self._tool_metadata: Dict[str, ToolMetadata] = {}
         self._discovered = False
+        self.manifest_dir = manifest_dir
 
     def register(self, func: callable, metadata: Optional[ToolMetadata] = None) -> None:
         """
@@ -39,7 +52,7 @@ class ToolRegistry:
 
         # Get or create metadata
         if metadata is None:
-            metadata = getattr(func, "__mcp_metadata__", None) or ToolMetadata(
+            metadata = _tool_metadata_of(func) or ToolMetadata(
                 name=tool_name, description=func.__doc__ or ""
             )
 
@@ -68,6 +81,7 @@ class ToolRegistry:
         package: Union[str, List[str]],
         recursive: bool = True,
         skip_errors: bool = True,
+        use_manifest: bool = True,
     ) -> None:
         """
         Discover and register tools from Python packages.
@@ -76,6 +90,9 @@ class ToolRegistry:
             package: Package name or list of package names to search for tools
             recursive: Whether to search subpackages recursively
             skip_errors: Whether to skip errors during discovery
+            use_manifest: Read tools from the package's static manifest and
+                defer imports; packages without a source directory (and
+                use_manifest=False) are imported and inspected instead
         """
         if isinstance(package, str):
             packages = [package]
@@ -84,6 +101,12 @@ class ToolRegistry:
 
         for pkg in packages:
             try:
+                if use_manifest:
+                    try:
+                        self._discover_from_manifest(pkg, recursive)
+                        continue
+                    except ImportError:
+                        pass
                 self._discover_package(pkg, recursive, skip_errors)
             except Exception as e:
                 if skip_errors:
@@ -101,6 +124,44 @@ class ToolRegistry:
             extra={"tools_registered": len(self._tools), "packages_searched": packages},
         )
 
+    def _discover_from_manifest(self, package: str, recursive: bool = True) -> None:
+        """Register a package's tools from its manifest without importing them."""
+        manifest = build_manifest(package, recursive, manifest_dir=self.manifest_dir)
+        for entry in iter_manifest_tools(manifest):
+            self._tools[entry["name"]] = {
+                "function": None,  # Imported on first use
+                "module": entry["module"],
+                "attribute": entry["name"],
+                "docstring": entry["description"],
+                "signature": entry["signature"],
+            }
+            self._tool_metadata[entry["name"]] = ToolMetadata(
+                name=entry["tool_name"],
+                description=entry["description"],
+                category=_category(entry.get("category")),
+                version=entry["version"],
+                tags=entry["tags"],
+            )
+        logger.debug(
+            "tool_manifest_loaded",
+            extra={"package": package, "parsed_files": manifest["parsed_files"]},
+        )
+
+    def _resolve(self, name: str) -> Optional[callable]:
+        """The tool's function, importing its module on first use."""
+        tool_info = self._tools.get(name)
+        if tool_info is None:
+            return None
+        if tool_info["function"] is None:
+            module = importlib.import_module(tool_info["module"])
+            func = getattr(module, tool_info["attribute"])
+            tool_info["function"] = func
+            tool_info["signature"] = str(inspect.signature(func))
+            metadata = _tool_metadata_of(func)
+            if metadata is not None:
+                self._tool_metadata[name] = metadata
+        return tool_info["function"]
+
     def _discover_package(
         self, package: str, recursive: bool = True, skip_errors: bool = True
     ) -> None:
@@ -156,18 +217,18 @@ class ToolRegistry:
                 continue
 
             # Check if the object is a function with MCP metadata
-            if inspect.isfunction(obj) and hasattr(obj, "__mcp_metadata__"):
+            if inspect.isfunction(obj) and _tool_metadata_of(obj) is not None:
                 self.register(obj)
 
             # Check if the object is a class with MCP metadata
-            elif inspect.isclass(obj) and hasattr(obj, "__mcp_metadata__"):
+            elif inspect.isclass(obj) and _tool_metadata_of(obj) is not None:
                 # Register the class itself if it's callable
                 if callable(obj):
                     self.register(obj)
 
                 # Register class methods with MCP metadata
                 for method_name, method in inspect.getmembers(obj, inspect.isfunction):
-                    if hasattr(method, "__mcp_metadata__"):
+                    if _tool_metadata_of(method) is not None:
                         self.register(method)
 
     def get_tool(self, name: str) -> Optional[callable]:
@@ -183,7 +244,7 @@ class ToolRegistry:
         if not self._discovered:
             self.discover_tools(["meta_mcp.tools"])
 
-        return self._tools.get(name, {}).get("function")
+        return self._resolve(name)
 
     def get_metadata(self, name: str) -> Optional[ToolMetadata]:
         """
@@ -252,7 +313,7 @@ class ToolRegistry:
         if name not in self._tools:
             raise KeyError(f"Tool not found: {name}")
 
-        tool_func = self._tools[name]["function"]
+        tool_func = self._resolve(name)
 
         # Log the tool execution
         logger.info(
@@ -292,6 +353,21 @@ class ToolRegistry:
             raise
 
 
+def _tool_metadata_of(obj: Any) -> Optional[ToolMetadata]:
+    """Metadata attached by ``@tool`` (or a legacy ``__mcp_metadata__``)."""
+    return getattr(obj, "__mcp_metadata__", None) or getattr(obj, "_mcp_tool_metadata", None)
+
+
+def _category(value: Optional[str]) -> ToolCategory:
+    """Category from a manifest entry ("data" or source text "ToolCategory.DATA")."""
+    if value:
+        member = value.rsplit(".", 1)[-1]
+        for category in ToolCategory:
+            if value == category.value or member == category.name:
+                return category
+    return ToolCategory.UTILITY
+
+
 # Global registry instance
 registry = ToolRegistry()
 
@@ -12,6 +12,8 @@ from pathlib import Path
 from typing import Any, Dict, List
 from fastmcp import FastMCP
 
+from .pattern_set import PatternSet
+
 # Unsafe Unicode patterns that cause logging crashes (using escape sequences)
 UNSAFE_UNICODE_PATTERNS = [
     # Explicitly targeted high-frequency "crasher" emojis (using hex escapes)
@@ -81,6 +83,12 @@ UNICODE_REPLACEMENTS = {
     "\U0001f30a": "Wave",  # Water wave
 }
 
+NON_ASCII_PATTERN = re.compile(r"[^\x00-\x7F]")
+LOGGING_CALL_PATTERN = re.compile(r"(logger\.[a-z_]+|print)\s*\(")
+
+# Prefilter: only lines containing non-ASCII characters are inspected
+NON_ASCII_LINES = PatternSet({"non_ascii": NON_ASCII_PATTERN.pattern})
+
 
 class EmojiBuster:
     """Unicode logging crash prevention and recovery specialist.
@@ -125,12 +133,11 @@ class EmojiBuster:
             try:
                 with open(file_path, "r", encoding="utf-8") as f:
                     content = f.read()
-                    lines = content.split("\n")
 
                 file_issues = []
-                for line_num, line in enumerate(lines, 1):
+                for line_num, line in NON_ASCII_LINES.matching_lines(content):
                     # Use a broader check for ALL non-ASCII (including docstrings/comments)
-                    for match in re.finditer(r"[^\x00-\x7F]", line):
+                    for match in NON_ASCII_PATTERN.finditer(line):
                         file_issues.append(
                             {
                                 "line_number": line_num,
@@ -138,7 +145,7 @@ class EmojiBuster:
                                 "unsafe_match": match.group(),
                                 "hex_match": hex(ord(match.group())),
                                 "risk_level": "critical"
-                                if re.search(r"(logger\.[a-z_]+|print)\s*\(", line)
+                                if LOGGING_CALL_PATTERN.search(line)
                                 else "advisory",
                             }
                         )
@@ -0,0 +1,192 @@
+"""Incremental per-file cache for repository analysis results.
+
+Each repository gets one entry in the scan cache that maps relative paths
+to the analysis result of that file, keyed by size, mtime_ns and a content
+hash. Rescanning a repository only re-reads files whose size or mtime
+changed, and only re-analyzes files whose content hash changed, so an edit
+anywhere in the tree is picked up without throwing the rest of the
+repository's results away.
+"""
+
+import hashlib
+import os
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import structlog
+
+from .repo_walker import RepoFile
+from .scan_cache import load_entry, store_entry
+
+logger = structlog.get_logger(__name__)
+
+# Bump when the shape or meaning of cached per-file results changes
+FILE_CACHE_VERSION = 2
+
+# Passed to FileResultCache.store() when a file's content hash is unchanged
+UNCHANGED = object()
+
+
+def content_hash(data: bytes) -> str:
+    """Hash file content for change detection."""
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def decode_text(data: bytes, errors: str = "strict") -> str:
+    """Decode UTF-8 with universal newlines, like Path.read_text()."""
+    return data.decode("utf-8", errors).replace("\r\n", "\n").replace("\r", "\n")
+
+
+class FileResultCache:
+    """Per-file analysis results for a single repository.
+
+    Example:
+        ```python
+        cache = FileResultCache(repo_path)
+        for item in walk_repo(repo_path):
+            result = cache.get_or_compute(item, lambda text: analyze(item, text))
+        cache.save()
+        ```
+    """
+
+    def __init__(self, repo_path: str, namespace: str = "analysis", load: bool = True):
+        """Load the cache for a repository.
+
+        Args:
+            repo_path: Repository root the cached paths are relative to
+            namespace: Separates result kinds cached for the same repository
+            load: Read persisted entries (False starts empty, e.g. to force a
+                full recompute)
+        """
+        self.repo_path = str(repo_path)
+        digest = hashlib.md5(f"{namespace}:{self.repo_path}".encode()).hexdigest()
+        self.cache_key = f"files_{digest}"
+        self.hits = 0
+        self.misses = 0
+        self._entries: Dict[str, Dict[str, Any]] = self._load() if load else {}
+        self._seen: Dict[str, Dict[str, Any]] = {}
+        self._dirty = False
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        """Read persisted entries, discarding caches from other versions."""
+        entry = load_entry(self.cache_key)
+        if entry is None:
+            return {}
+        _, cached = entry
+        if cached.get("version") != FILE_CACHE_VERSION:
+            return {}
+        if cached.get("repo_path") != self.repo_path:
+            return {}
+        return cached.get("files", {})
+
+    def get_or_compute(
+        self, item: RepoFile, compute: Callable[[str], Any]
+    ) -> Optional[Any]:
+        """Return the cached result for a file, recomputing it if it changed.
+
+        Args:
+            item: File to look up
+            compute: Called with the decoded file content on a cache miss; its
+                return value must be JSON-serializable
+
+        Returns:
+            The (possibly cached) result, or None if the file could not be read
+            or decoded
+        """
+        try:
+            st = os.stat(item.path)
+        except OSError as e:
+            logger.debug(f"Failed to stat {item.path}: {e}")
+            return None
+
+        hit, result = self.lookup(item, st.st_size, st.st_mtime_ns)
+        if hit:
+            return result
+
+        try:
+            with open(item.path, "rb") as f:
+                data = f.read()
+        except OSError as e:
+            logger.debug(f"Failed to read {item.path}: {e}")
+            return None
+
+        digest = content_hash(data)
+        if digest == self.entry_hash(item):
+            # Touched but unchanged: keep the result, refresh the stat key
+            return self.store(item, st.st_size, st.st_mtime_ns, digest, UNCHANGED)
+
+        try:
+            result = compute(decode_text(data))
+        except UnicodeDecodeError as e:
+            logger.debug(f"Failed to decode {item.path}: {e}")
+            result = None
+        return self.store(item, st.st_size, st.st_mtime_ns, digest, result)
+
+    def lookup(self, item: RepoFile, size: int, mtime_ns: int) -> Tuple[bool, Any]:
+        """Return (True, result) if the file's size and mtime match its entry.
+
+        Lets callers that read and hash files elsewhere (e.g. in worker
+        processes) skip unchanged files; record misses with store().
+        """
+        entry = self._entries.get(item.rel_path)
+        if entry is None or entry["size"] != size or entry["mtime_ns"] != mtime_ns:
+            return False, None
+        self.hits += 1
+        self._seen[item.rel_path] = entry
+        return True, entry["result"]
+
+    def entry_hash(self, item: RepoFile) -> Optional[str]:
+        """Content hash of the file's cached entry, if any."""
+        entry = self._entries.get(item.rel_path)
+        return entry["hash"] if entry is not None else None
+
+    def store(
+        self, item: RepoFile, size: int, mtime_ns: int, digest: str, result: Any
+    ) -> Any:
+        """Record a file's result under its current stat key and content hash.
+
+        Args:
+            item: File the result belongs to
+            size: File size at read time
+            mtime_ns: File mtime at read time
+            digest: Content hash (see content_hash())
+            result: JSON-serializable result, or UNCHANGED to keep the cached
+                result of an entry whose hash matched
+
+        Returns:
+            The stored result
+        """
+        if result is UNCHANGED:
+            self.hits += 1
+            result = self._entries[item.rel_path]["result"]
+        else:
+            self.misses += 1
+
+        self._seen[item.rel_path] = {
+            "size": size,
+            "mtime_ns": mtime_ns,
+            "hash": digest,
+            "result": result,
+        }
+        self._dirty = True
+        return result
+
+    def save(self) -> None:
+        """Persist entries seen during this scan, dropping deleted files."""
+        if not self._dirty and len(self._seen) == len(self._entries):
+            return
+
+        store_entry(
+            self.cache_key,
+            "files",
+            self.repo_path,
+            {
+                "version": FILE_CACHE_VERSION,
+                "repo_path": self.repo_path,
+                "files": self._seen,
+            },
+        )
+        logger.debug(
+            f"Saved file cache for {self.repo_path}",
+            hits=self.hits,
+            misses=self.misses,
+        )
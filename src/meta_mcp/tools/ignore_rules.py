@@ -0,0 +1,333 @@
+"""Compiled gitignore-style matching for repository walks.
+
+Patterns follow gitignore semantics: ``*``, ``?``, ``[...]`` and ``**``,
+trailing ``/`` for directories only, a leading or inner ``/`` to anchor a
+pattern to its directory, ``!`` to re-include, and the last matching
+pattern wins. Each pattern file is compiled once into regexes, with a
+combined alternation so the common case (no pattern matches) costs a single
+regex call per ``.gitignore`` in scope.
+
+``IgnoreMatcher`` layers explicit exclude patterns over the repository's
+``.gitignore`` files. ``walk_repo`` consults it while descending, loading a
+nested ``.gitignore`` when it lists that directory and pruning ignored
+directories before they are listed. As in git, a file inside an ignored
+directory cannot be re-included.
+"""
+
+import os
+import re
+from typing import Iterable, List, Optional, Pattern, Sequence, Tuple, Union
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+GITIGNORE_NAME = ".gitignore"
+
+
+def translate_pattern(pattern: str, anchored: bool = False) -> str:
+    """Translate one glob pattern (without ``!`` or trailing ``/``) to regex.
+
+    Args:
+        pattern: Glob in gitignore syntax
+        anchored: Match only from the base directory even when the pattern
+            has no ``/`` (``Path.glob`` semantics); otherwise a slash-free
+            pattern matches at any depth, as in gitignore
+
+    Returns:
+        Regex source matching a whole relative POSIX path
+    """
+    if pattern.startswith("/"):
+        pattern = pattern[1:]
+        anchored = True
+    elif "/" in pattern:
+        # Includes "**/name", whose translation already matches at any depth
+        anchored = True
+
+    parts = []
+    i, n = 0, len(pattern)
+    while i < n:
+        c = pattern[i]
+        if pattern.startswith("**/", i) and (i == 0 or pattern[i - 1] == "/"):
+            parts.append("(?:.*/)?")
+            i += 3
+        elif (
+            pattern.startswith("**", i)
+            and i + 2 == n
+            and (i == 0 or pattern[i - 1] == "/")
+        ):
+            parts.append(".*")
+            i += 2
+        elif c == "*":
+            parts.append("[^/]*")
+            i += 1
+        elif c == "?":
+            parts.append("[^/]")
+            i += 1
+        elif c == "[":
+            bracket = _translate_bracket(pattern, i)
+            if bracket is None:
+                parts.append(re.escape(c))
+                i += 1
+                continue
+            regex, i = bracket
+            parts.append(regex)
+        elif c == "\\" and i + 1 < n:
+            parts.append(re.escape(pattern[i + 1]))
+            i += 2
+        else:
+            parts.append(re.escape(c))
+            i += 1
+
+    body = "".join(parts)
+    return body if anchored else f"(?:.*/)?{body}"
+
+
+# POSIX character classes allowed inside brackets, e.g. "[[:digit:]]"
+_POSIX_CLASSES = {
+    "alnum": "a-zA-Z0-9",
+    "alpha": "a-zA-Z",
+    "blank": " \\t",
+    "cntrl": "\\x00-\\x1f\\x7f",
+    "digit": "0-9",
+    "graph": "!-~",
+    "lower": "a-z",
+    "print": " -~",
+    "punct": re.escape("!\"#$%&'()*+,-./:;<=>?@[\\]^_`{|}~"),
+    "space": " \\t\\n\\r\\f\\v",
+    "upper": "A-Z",
+    "xdigit": "0-9A-Fa-f",
+}
+
+
+def _translate_bracket(pattern: str, start: int) -> Optional[Tuple[str, int]]:
+    """Translate the bracket expression at pattern[start] ("[").
+
+    Returns:
+        (regex, index after the closing "]"), or None if the bracket is not
+        closed (it is then a literal "[")
+    """
+    i, n = start + 1, len(pattern)
+    negated = pattern[i : i + 1] in ("!", "^")
+    if negated:
+        i += 1
+    body = []
+    first = True
+    while i < n:
+        c = pattern[i]
+        if c == "]" and not first:
+            return ("[^" if negated else "[") + "".join(body) + "]", i + 1
+        first = False
+        if pattern.startswith("[:", i):
+            end = pattern.find(":]", i + 2)
+            name = pattern[i + 2 : end] if end != -1 else None
+            if name in _POSIX_CLASSES:
+                body.append(_POSIX_CLASSES[name])
+                i = end + 2
+                continue
+        # Escape what re would read as syntax (nested sets, set operations)
+        body.append(c if c == "-" else re.escape(c))
+        i += 1
+    return None
+
+
+class IgnoreRules:
+    """Patterns from one source (a ``.gitignore`` or a pattern list), compiled.
+
+    Example:
+        ```python
+        rules = IgnoreRules(["*.log", "!keep.log", "build/"])
+        rules.match("logs/app.log", is_dir=False)  # True (ignored)
+        rules.match("keep.log", is_dir=False)  # False (re-included)
+        rules.match("src/app.py", is_dir=False)  # None (no pattern matched)
+        ```
+    """
+
+    def __init__(self, patterns: Iterable[str], base: str = ""):
+        """
+        Args:
+            patterns: Lines in gitignore syntax; blanks and comments are skipped
+            base: POSIX path of the directory the patterns are relative to
+                ("" for the repository root)
+        """
+        self.base = base.strip("/")
+        self._prefix = f"{self.base}/" if self.base else ""
+        # (regex, negated, directories only), in file order
+        self.rules: List[Tuple[Pattern, bool, bool]] = []
+        for line in patterns:
+            rule = self._parse(line)
+            if rule is not None:
+                self.rules.append(rule)
+
+        # Without negations or directory-only rules any match means ignored
+        self._any_match_ignores = not any(
+            negated or dir_only for _, negated, dir_only in self.rules
+        )
+        self._any = re.compile(
+            "|".join(f"(?:{rx.pattern})" for rx, _, _ in self.rules) or r"(?!)",
+            re.DOTALL,
+        )
+
+    @classmethod
+    def from_file(cls, path: Union[str, os.PathLike], base: str = "") -> "IgnoreRules":
+        """Compile a ``.gitignore``-style file (unreadable files give no rules)."""
+        try:
+            with open(path, "r", encoding="utf-8", errors="replace") as f:
+                return cls(f.read().splitlines(), base)
+        except OSError as e:
+            logger.debug(f"Failed to read {path}: {e}")
+            return cls((), base)
+
+    @staticmethod
+    def _parse(line: str) -> Optional[Tuple[Pattern, bool, bool]]:
+        if not line or line.startswith("#"):
+            return None
+        # Trailing spaces are ignored unless escaped
+        stripped = line.rstrip(" ")
+        if stripped.endswith("\\") and len(stripped) < len(line):
+            stripped += " "
+        line = stripped.rstrip("\r\n")
+        if not line:
+            return None
+
+        negated = line.startswith("!")
+        if negated:
+            line = line[1:]
+        elif line.startswith(("\\!", "\\#")):
+            line = line[1:]
+
+        dir_only = line.endswith("/")
+        line = line.rstrip("/")
+        if not line:
+            return None
+        try:
+            rx = re.compile(translate_pattern(line) + r"\Z", re.DOTALL)
+        except re.error as e:  # e.g. a reversed range such as "[z-a]"
+            logger.debug(f"Ignoring invalid pattern {line!r}: {e}")
+            return None
+        return rx, negated, dir_only
+
+    def match(self, rel_path: str, is_dir: bool) -> Optional[bool]:
+        """Whether the last matching pattern ignores rel_path.
+
+        Args:
+            rel_path: POSIX path relative to the repository root
+            is_dir: Whether rel_path is a directory
+
+        Returns:
+            True if ignored, False if re-included by a ``!`` pattern, None if
+            no pattern applies
+        """
+        if self._prefix:
+            if not rel_path.startswith(self._prefix):
+                return None
+            rel_path = rel_path[len(self._prefix) :]
+        if not self._any.match(rel_path):
+            return None
+        if self._any_match_ignores:
+            return True
+        for rx, negated, dir_only in reversed(self.rules):
+            if dir_only and not is_dir:
+                continue
+            if rx.match(rel_path):
+                return not negated
+        return None
+
+    def __bool__(self) -> bool:
+        return bool(self.rules)
+
+
+# .gitignore rules in effect for a directory, deepest first
+Scope = Tuple[IgnoreRules, ...]
+
+
+class IgnoreMatcher:
+    """Explicit exclude patterns layered over a repository's ``.gitignore`` files.
+
+    Explicit patterns take precedence, then the ``.gitignore`` closest to the
+    path, up to the root ``.gitignore`` and ``.git/info/exclude``.
+
+    Example:
+        ```python
+        matcher = IgnoreMatcher(repo_path, ["node_modules/", "*.log"])
+        for item in walk_repo(repo_path, ignore_dirs=(), matcher=matcher):
+            ...
+        matcher.is_ignored("dist/app.js")
+        ```
+    """
+
+    def __init__(
+        self,
+        root: Union[str, os.PathLike],
+        patterns: Sequence[str] = (),
+        use_gitignore: bool = True,
+    ):
+        """
+        Args:
+            root: Repository root
+            patterns: Explicit exclude patterns in gitignore syntax
+            use_gitignore: Honor ``.gitignore`` files and ``.git/info/exclude``
+        """
+        self.root = os.fspath(root)
+        self.explicit = IgnoreRules(patterns)
+        self.use_gitignore = use_gitignore
+        self._scopes: dict = {}
+
+    def root_scope(self) -> Scope:
+        """Rules in effect at the root before its ``.gitignore`` is read."""
+        if not self.use_gitignore:
+            return ()
+        exclude = os.path.join(self.root, ".git", "info", "exclude")
+        if os.path.isfile(exclude):
+            rules = IgnoreRules.from_file(exclude)
+            if rules:
+                return (rules,)
+        return ()
+
+    def enter(self, scope: Scope, rel_dir: str, gitignore_path: str) -> Scope:
+        """Scope for a directory that contains a ``.gitignore``."""
+        if not self.use_gitignore:
+            return scope
+        rules = IgnoreRules.from_file(gitignore_path, rel_dir)
+        return (rules,) + scope if rules else scope
+
+    def ignored(self, rel_path: str, is_dir: bool, scope: Scope = ()) -> bool:
+        """Whether rel_path is excluded, given its directory's scope.
+
+        Ancestors are not checked; walkers prune ignored directories instead.
+        """
+        result = self.explicit.match(rel_path, is_dir)
+        if result is not None:
+            return result
+        for rules in scope:
+            result = rules.match(rel_path, is_dir)
+            if result is not None:
+                return result
+        return False
+
+    def is_ignored(self, rel_path: str, is_dir: bool = False) -> bool:
+        """Whether rel_path or any of its parent directories is excluded."""
+        parts = rel_path.strip("/").split("/")
+        scope = self._scope_for("")
+        for depth in range(1, len(parts)):
+            rel_dir = "/".join(parts[:depth])
+            if self.ignored(rel_dir, True, scope):
+                return True
+            scope = self._scope_for(rel_dir)
+        return self.ignored("/".join(parts), is_dir, scope)
+
+    def _scope_for(self, rel_dir: str) -> Scope:
+        """Scope of a directory for standalone queries, cached per directory."""
+        scope = self._scopes.get(rel_dir)
+        if scope is None:
+            if rel_dir:
+                parent = self._scope_for(rel_dir.rpartition("/")[0])
+            else:
+                parent = self.root_scope()
+            gitignore = os.path.join(self.root, *rel_dir.split("/"), GITIGNORE_NAME)
+            if self.use_gitignore and os.path.isfile(gitignore):
+                scope = self.enter(parent, rel_dir, gitignore)
+            else:
+                scope = parent
+            self._scopes[rel_dir] = scope
+        return scope
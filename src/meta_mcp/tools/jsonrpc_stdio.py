@@ -0,0 +1,524 @@
+"""Multiplexed MCP JSON-RPC over the stdio pipes of a server process.
+
+This is the one JSON-RPC codec used for talking to local servers: smoke and
+load tests, health checks, the client pool and tool execution all go through
+it.
+
+A single reader task owns the process's stdout and resolves pending requests
+by id, so any number of callers can have requests in flight on one pipe.
+Writes are serialized and respect pipe back-pressure.
+
+Framing: the MCP stdio transport is newline-delimited JSON, but some older
+servers speak LSP-style ``Content-Length`` headers. The reader accepts both on
+every message; the writer uses newlines, or headers once the server has
+answered with headers (or when asked to with ``framing="header"``).
+
+Messages are encoded with orjson when it is installed, stdlib json otherwise.
+"""
+
+import asyncio
+import itertools
+import json
+import os
+import sys
+from pathlib import Path
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+import structlog
+
+try:
+    import orjson
+except ImportError:  # Optional fast JSON backend
+    orjson = None
+
+logger = structlog.get_logger(__name__)
+
+MCP_PROTOCOL_VERSION = "2025-06-18"
+CLIENT_INFO = {"name": "meta-mcp", "version": "0.2.1"}
+
+# StreamReader line limit; tool results can be far larger than the 64 KiB default
+STREAM_LIMIT = 16 * 1024 * 1024
+
+METHOD_NOT_FOUND = -32601
+
+# Framing modes
+FRAMING_AUTO = "auto"
+FRAMING_NEWLINE = "newline"
+FRAMING_HEADER = "header"
+FRAMINGS = (FRAMING_AUTO, FRAMING_NEWLINE, FRAMING_HEADER)
+
+_HEADER_PREFIX = b"content-length:"
+
+if orjson is not None:
+    JSON_BACKEND = "orjson"
+
+    def dumps(message: Any) -> bytes:
+        """Encode a message as compact UTF-8 JSON."""
+        try:
+            return orjson.dumps(message, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            # Values orjson rejects (e.g. integers over 64 bits)
+            return json.dumps(
+                message, separators=(",", ":"), ensure_ascii=False
+            ).encode("utf-8")
+
+    loads = orjson.loads
+else:
+    JSON_BACKEND = "json"
+    _encoder = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False)
+
+    def dumps(message: Any) -> bytes:
+        """Encode a message as compact UTF-8 JSON."""
+        return _encoder.encode(message).encode("utf-8")
+
+    loads = json.loads
+
+
+def encode_message(message: Any, framing: str = FRAMING_NEWLINE) -> bytes:
+    """Serialize and frame one message for the wire."""
+    body = dumps(message)
+    if framing == FRAMING_HEADER:
+        return b"Content-Length: %d\r\n\r\n" % len(body) + body
+    return body + b"\n"
+
+
+class MalformedHeaderError(ValueError):
+    """A Content-Length header whose value is not a valid length."""
+
+
+async def read_message(reader: asyncio.StreamReader) -> Optional[Tuple[bytes, str]]:
+    """Read the next message body and the framing it arrived in.
+
+    Blank lines are skipped. Returns None at end of stream.
+
+    Raises:
+        MalformedHeaderError: If a Content-Length value is not a length; the
+            rest of that header block is consumed first
+        ValueError: If a line exceeds the reader's limit
+    """
+    while True:
+        line = await reader.readline()
+        if not line:
+            return None
+        stripped = line.strip()
+        if not stripped:
+            continue
+        if stripped[:15].lower() != _HEADER_PREFIX:
+            return stripped, FRAMING_NEWLINE
+
+        try:
+            length = int(stripped[15:])
+        except ValueError:
+            length = -1
+        # Skip any further headers (e.g. Content-Type) up to the blank line
+        while True:
+            header = await reader.readline()
+            if not header:
+                return None
+            if not header.strip():
+                break
+        if length < 0:
+            raise MalformedHeaderError(f"Malformed header {stripped[:80]!r}")
+        return await reader.readexactly(length), FRAMING_HEADER
+
+
+def server_command(server_file: Path) -> Optional[List[str]]:
+    """Command that runs a server entry point, or None for unsupported types."""
+    if server_file.suffix == ".py":
+        return [sys.executable, str(server_file)]
+    if server_file.suffix == ".js":
+        return ["node", str(server_file)]
+    return None
+
+
+class JsonRpcError(Exception):
+    """Error response returned by the server."""
+
+    def __init__(self, code: int, message: str, data: Any = None):
+        super().__init__(f"JSON-RPC error {code}: {message}")
+        self.code = code
+        self.message = message
+        self.data = data
+
+
+class JsonRpcConnection:
+    """MCP client session over an ``asyncio.subprocess`` process.
+
+    Example:
+        ```python
+        process = await asyncio.create_subprocess_exec(
+            sys.executable, "server.py",
+            stdin=PIPE, stdout=PIPE, limit=STREAM_LIMIT,
+        )
+        connection = JsonRpcConnection(process, name="server.py")
+        await connection.initialize()
+        result = await connection.call_tool("add", {"a": 1, "b": 2})
+        ```
+    """
+
+    def __init__(
+        self,
+        process: asyncio.subprocess.Process,
+        name: str = "",
+        framing: str = FRAMING_AUTO,
+        stray_output: Optional[Deque[str]] = None,
+    ):
+        """
+        Args:
+            process: Server process started with stdin and stdout pipes
+            name: Label used in log messages
+            framing: "newline", "header", or "auto" (newline until the
+                server replies with Content-Length headers)
+            stray_output: Bounded buffer receiving stdout lines that are not
+                JSON-RPC messages (dropped if None)
+        """
+        if framing not in FRAMINGS:
+            raise ValueError(f"Unknown framing: {framing}")
+        self.process = process
+        self.name = name or f"pid {process.pid}"
+        self.framing = framing
+        self.stray_output = stray_output
+        self._write_framing = (
+            FRAMING_HEADER if framing == FRAMING_HEADER else FRAMING_NEWLINE
+        )
+        self.server_info: Optional[Dict[str, Any]] = None
+        self.requests_sent = 0
+        self._ids = itertools.count(1)
+        self._pending: Dict[int, asyncio.Future] = {}
+        self._write_lock = asyncio.Lock()
+        self._init_lock = asyncio.Lock()
+        self._closed_error: Optional[Exception] = None
+        self._reader = asyncio.create_task(self._read_loop())
+
+    @property
+    def closed(self) -> bool:
+        return self._closed_error is not None
+
+    @property
+    def in_flight(self) -> int:
+        return len(self._pending)
+
+    async def request(
+        self,
+        method: str,
+        params: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None,
+    ) -> Any:
+        """Send a request and wait for its result.
+
+        Args:
+            method: JSON-RPC method
+            params: Method parameters
+            timeout: Seconds to wait for the response (None = no limit)
+
+        Returns:
+            The response's result member
+
+        Raises:
+            JsonRpcError: If the server returned an error response
+            ConnectionError: If the server process went away
+            asyncio.TimeoutError: If no response arrived in time; the server
+                is sent a cancellation notification
+        """
+        if self._closed_error is not None:
+            raise self._closed_error
+
+        request_id = next(self._ids)
+        future = asyncio.get_running_loop().create_future()
+        self._pending[request_id] = future
+
+        message = {"jsonrpc": "2.0", "id": request_id, "method": method}
+        if params is not None:
+            message["params"] = params
+
+        try:
+            await self._send(message)
+            self.requests_sent += 1
+            return await asyncio.wait_for(future, timeout=timeout)
+        except asyncio.TimeoutError:
+            if not self.closed:
+                await self.notify(
+                    "notifications/cancelled",
+                    {"requestId": request_id, "reason": "Request timed out"},
+                )
+            raise
+        finally:
+            self._pending.pop(request_id, None)
+
+    async def notify(self, method: str, params: Optional[Dict[str, Any]] = None):
+        """Send a notification (no response expected)."""
+        message = {"jsonrpc": "2.0", "method": method}
+        if params is not None:
+            message["params"] = params
+        await self._send(message)
+
+    async def initialize(self, timeout: Optional[float] = None) -> Dict[str, Any]:
+        """Perform the MCP handshake once; later calls return the cached result."""
+        async with self._init_lock:
+            if self.server_info is None:
+                result = await self.request(
+                    "initialize",
+                    {
+                        "protocolVersion": MCP_PROTOCOL_VERSION,
+                        "capabilities": {},
+                        "clientInfo": CLIENT_INFO,
+                    },
+                    timeout=timeout,
+                )
+                await self.notify("notifications/initialized")
+                self.server_info = result
+        return self.server_info
+
+    async def list_tools(self, timeout: Optional[float] = None) -> List[Dict[str, Any]]:
+        """Return every tool the server exposes, following pagination cursors."""
+        await self.initialize(timeout)
+        tools: List[Dict[str, Any]] = []
+        params: Dict[str, Any] = {}
+        while True:
+            result = await self.request("tools/list", params, timeout=timeout)
+            tools.extend(result.get("tools", []))
+            cursor = result.get("nextCursor")
+            if not cursor:
+                return tools
+            params = {"cursor": cursor}
+
+    async def call_tool(
+        self,
+        name: str,
+        arguments: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """Call a tool and return the raw ``CallToolResult``."""
+        await self.initialize(timeout)
+        return await self.request(
+            "tools/call", {"name": name, "arguments": arguments or {}}, timeout=timeout
+        )
+
+    async def close(self) -> None:
+        """Stop reading and fail every pending request."""
+        self._fail_pending(ConnectionError(f"Connection to {self.name} closed"))
+        self._reader.cancel()
+        try:
+            await self._reader
+        except (asyncio.CancelledError, Exception):
+            pass
+        if self.process.stdin is not None and not self.process.stdin.is_closing():
+            self.process.stdin.close()
+
+    async def _send(self, message: Dict[str, Any]) -> None:
+        """Write one framed message, waiting for the pipe to drain."""
+        data = encode_message(message, self._write_framing)
+        async with self._write_lock:
+            try:
+                self.process.stdin.write(data)
+                await self.process.stdin.drain()
+            except (BrokenPipeError, ConnectionResetError) as e:
+                error = ConnectionError(f"Server {self.name} closed its input: {e}")
+                self._fail_pending(error)
+                raise error from e
+
+    async def _read_loop(self) -> None:
+        """Dispatch every message the server writes until its stdout closes."""
+        stdout = self.process.stdout
+        try:
+            while True:
+                try:
+                    framed = await read_message(stdout)
+                except MalformedHeaderError as e:
+                    logger.warning(f"Dropped a message from {self.name}: {e}")
+                    continue
+                except ValueError:
+                    logger.warning(
+                        f"Dropped a message from {self.name} over {STREAM_LIMIT} bytes"
+                    )
+                    continue
+                if framed is None:
+                    break
+                body, framing = framed
+                if framing == FRAMING_HEADER and self.framing == FRAMING_AUTO:
+                    self._write_framing = FRAMING_HEADER
+                try:
+                    message = loads(body)
+                except ValueError:
+                    # Servers occasionally print to stdout; skip non-protocol lines
+                    if self.stray_output is not None:
+                        self.stray_output.append(body.decode("utf-8", "replace"))
+                    else:
+                        logger.debug(f"Ignoring non-JSON output from {self.name}")
+                    continue
+                if isinstance(message, list):
+                    for item in message:
+                        await self._dispatch(item)
+                else:
+                    await self._dispatch(message)
+        except asyncio.CancelledError:
+            raise
+        except asyncio.IncompleteReadError:
+            pass
+        except Exception as e:
+            logger.warning(f"Reader for {self.name} failed: {e}")
+
+        returncode = self.process.returncode
+        self._fail_pending(
+            ConnectionError(
+                f"Server {self.name} closed its output (exit code {returncode})"
+            )
+        )
+
+    async def _dispatch(self, message: Any) -> None:
+        """Route a response to its waiter, or answer a server-initiated request."""
+        if not isinstance(message, dict):
+            return
+
+        if "id" in message and ("result" in message or "error" in message):
+            future = self._pending.get(message["id"])
+            if future is None or future.done():
+                return
+            if "error" in message:
+                error = message["error"] or {}
+                future.set_exception(
+                    JsonRpcError(
+                        error.get("code", 0),
+                        error.get("message", "Unknown error"),
+                        error.get("data"),
+                    )
+                )
+            else:
+                future.set_result(message["result"])
+        elif "id" in message and "method" in message:
+            # Requests from the server: answer pings, decline everything else
+            if message["method"] == "ping":
+                reply = {"jsonrpc": "2.0", "id": message["id"], "result": {}}
+            else:
+                reply = {
+                    "jsonrpc": "2.0",
+                    "id": message["id"],
+                    "error": {
+                        "code": METHOD_NOT_FOUND,
+                        "message": f"Method not supported: {message['method']}",
+                    },
+                }
+            try:
+                await self._send(reply)
+            except ConnectionError:
+                pass
+        # Notifications (logging, progress, list_changed) are not used
+
+    def _fail_pending(self, error: Exception) -> None:
+        """Mark the connection closed and fail all outstanding requests."""
+        if self._closed_error is None:
+            self._closed_error = error
+        for future in self._pending.values():
+            if not future.done():
+                future.set_exception(error)
+        self._pending.clear()
+
+
+class StdioSession:
+    """A local server process and its JSON-RPC connection.
+
+    Example:
+        ```python
+        session = StdioSession("/path/to/server.py")
+        try:
+            await session.connect(timeout=15)
+            tools = await session.list_tools()
+        finally:
+            await session.close()
+        ```
+    """
+
+    def __init__(self, server_path: str, framing: str = FRAMING_AUTO):
+        """
+        Args:
+            server_path: Server entry point (.py or .js)
+            framing: Message framing, see JsonRpcConnection
+        """
+        self.server_path = Path(server_path)
+        self.framing = framing
+        self.process: Optional[asyncio.subprocess.Process] = None
+        self.connection: Optional[JsonRpcConnection] = None
+
+    async def start(self) -> JsonRpcConnection:
+        """Spawn the server process and attach a connection (no handshake)."""
+        cmd = server_command(self.server_path)
+        if cmd is None:
+            raise ValueError(f"Unsupported server type: {self.server_path.suffix}")
+        self.process = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+            cwd=str(self.server_path.parent),
+            env={**os.environ, "PYTHONUNBUFFERED": "1"},
+            limit=STREAM_LIMIT,
+        )
+        self.connection = JsonRpcConnection(
+            self.process, name=str(self.server_path), framing=self.framing
+        )
+        return self.connection
+
+    async def connect(self, timeout: Optional[float] = None) -> Dict[str, Any]:
+        """Spawn the server (if not started) and complete the MCP handshake.
+
+        Returns:
+            The server's initialize result
+        """
+        if self.connection is None:
+            await self.start()
+        try:
+            return await self.connection.initialize(timeout)
+        except BaseException:
+            await self.close()
+            raise
+
+    def is_connected(self) -> bool:
+        return (
+            self.connection is not None
+            and not self.connection.closed
+            and self.process.returncode is None
+        )
+
+    async def ping(self, timeout: Optional[float] = None) -> None:
+        await self._connected().request("ping", timeout=timeout)
+
+    async def list_tools(self, timeout: Optional[float] = None) -> List[Dict[str, Any]]:
+        return await self._connected().list_tools(timeout)
+
+    async def call_tool(
+        self,
+        name: str,
+        arguments: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """Call a tool and return the raw ``CallToolResult``."""
+        return await self._connected().call_tool(name, arguments, timeout)
+
+    async def close(self) -> None:
+        """Close the connection and stop the server process."""
+        if self.connection is not None:
+            await self.connection.close()
+        process = self.process
+        if process is not None and process.returncode is None:
+            try:
+                process.terminate()
+                await asyncio.wait_for(process.wait(), timeout=2.0)
+            except ProcessLookupError:
+                pass
+            except Exception:
+                process.kill()
+
+    def _connected(self) -> JsonRpcConnection:
+        if self.connection is None:
+            raise ConnectionError(f"Not connected to {self.server_path}")
+        return self.connection
+
+
+def tool_error_text(result: Dict[str, Any]) -> str:
+    """Text of a ``CallToolResult`` flagged with isError."""
+    texts = [
+        item.get("text", "")
+        for item in result.get("content", [])
+        if isinstance(item, dict) and item.get("type") == "text"
+    ]
+    return "\n".join(texts) or "Tool returned an error"
@@ -0,0 +1,332 @@
+"""
+MCP Server Load Test Tool.
+
+Builds on the smoke test: instead of one spawn -> initialize -> call, it
+holds several concurrent stdio sessions against a server and replays a
+weighted mix of ``tools/call`` requests for a fixed duration.
+
+Reported per tool:
+- calls, errors and throughput
+- p50/p95/p99 latency, split into cold (first call of a tool in a session)
+  and warm (every later call)
+
+Results are saved as JSON under ``~/.mcp-studio/load-tests`` so runs can be
+compared over time (see ``compare_load_tests``).
+"""
+
+import asyncio
+import json
+import math
+import random
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+import structlog
+
+from .jsonrpc_stdio import JsonRpcError, StdioSession, server_command
+from .smoke_test import CONNECTION_TIMEOUT, TOOL_CALL_TIMEOUT, pick_smoke_tool
+
+logger = structlog.get_logger(__name__)
+
+# Saved results (relative to user's home)
+LOAD_TEST_DIR = Path.home() / ".mcp-studio" / "load-tests"
+
+DEFAULT_SESSIONS = 4
+DEFAULT_DURATION = 10.0
+
+# A tool regresses when its warm p95 grows, or its throughput drops, by more
+# than this fraction against the baseline run
+REGRESSION_THRESHOLD = 0.10
+
+
+def _percentile(sorted_values: List[float], percent: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    index = max(0, min(len(sorted_values) - 1, math.ceil(percent / 100 * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+def summarize_latencies(latencies: List[float]) -> Dict[str, Any]:
+    """Count, mean and percentiles (ms) of a list of latencies in ms."""
+    if not latencies:
+        return {"count": 0}
+    values = sorted(latencies)
+    return {
+        "count": len(values),
+        "min": round(values[0], 3),
+        "mean": round(sum(values) / len(values), 3),
+        "p50": round(_percentile(values, 50), 3),
+        "p95": round(_percentile(values, 95), 3),
+        "p99": round(_percentile(values, 99), 3),
+        "max": round(values[-1], 3),
+    }
+
+
+def _normalize_mix(tool_mix: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Fill in default arguments and weights of a tool mix."""
+    mix = []
+    for entry in tool_mix:
+        if "tool" not in entry:
+            raise ValueError(f"Tool mix entry without a tool name: {entry}")
+        mix.append({
+            "tool": entry["tool"],
+            "arguments": entry.get("arguments") or {},
+            "weight": float(entry.get("weight", 1.0)),
+        })
+    if not mix or sum(entry["weight"] for entry in mix) <= 0:
+        raise ValueError("Tool mix needs at least one entry with a positive weight")
+    return mix
+
+
+async def _open_session(server_path: str, timeout: float) -> Dict[str, Any]:
+    """Spawn one server process and complete the MCP handshake."""
+    start = time.perf_counter()
+    session = StdioSession(server_path)
+    await session.connect(timeout)
+    return {"session": session, "startup_ms": (time.perf_counter() - start) * 1000}
+
+
+async def _run_session(
+    session: StdioSession,
+    mix: List[Dict[str, Any]],
+    deadline: float,
+    call_timeout: float,
+    rng: random.Random,
+    samples: Dict[str, Dict[str, Any]],
+) -> None:
+    """Call tools from the mix back to back until the deadline.
+
+    One request is in flight per session, so concurrency equals the number
+    of sessions.
+    """
+    weights = [entry["weight"] for entry in mix]
+    called = set()
+    while time.perf_counter() < deadline:
+        entry = rng.choices(mix, weights)[0]
+        tool = entry["tool"]
+        phase = "warm" if tool in called else "cold"
+        called.add(tool)
+
+        failed = False
+        start = time.perf_counter()
+        try:
+            result = await session.call_tool(tool, entry["arguments"], timeout=call_timeout)
+            failed = bool(result.get("isError"))
+        except (JsonRpcError, asyncio.TimeoutError):
+            failed = True
+        except ConnectionError as e:
+            samples[tool]["errors"] += 1
+            samples[tool]["error_messages"].append(str(e))
+            return
+        elapsed = (time.perf_counter() - start) * 1000
+
+        sample = samples[tool]
+        sample[phase].append(elapsed)
+        if failed:
+            sample["errors"] += 1
+
+
+async def load_test_server(
+    server_path: str,
+    sessions: int = DEFAULT_SESSIONS,
+    duration: float = DEFAULT_DURATION,
+    tool_mix: Optional[List[Dict[str, Any]]] = None,
+    timeout: float = CONNECTION_TIMEOUT,
+    call_timeout: float = TOOL_CALL_TIMEOUT,
+    seed: Optional[int] = None,
+    output_path: Optional[str] = None,
+    save: bool = True,
+) -> Dict[str, Any]:
+    """
+    Load test an MCP server over concurrent stdio sessions.
+
+    Args:
+        server_path: Path to the server entry point (e.g., server.py)
+        sessions: Number of concurrent sessions (one server process each)
+        duration: Seconds to replay calls for, after all sessions are up
+        tool_mix: Weighted calls to replay, e.g.
+            ``[{"tool": "add", "arguments": {"a": 1, "b": 2}, "weight": 3}]``;
+            defaults to the smoke test tool with no arguments
+        timeout: Startup (spawn + initialize) timeout per session in seconds
+        call_timeout: Timeout per tool call in seconds
+        seed: Seed for the call mix, for repeatable runs
+        output_path: JSON file to save results to
+        save: Save results (to output_path, or a timestamped file under
+            ~/.mcp-studio/load-tests)
+
+    Returns:
+        Run configuration, session startup latency and per-tool throughput
+        and latency percentiles (cold and warm)
+    """
+    result: Dict[str, Any] = {
+        "server_path": server_path,
+        "success": False,
+        "config": {
+            "sessions": sessions,
+            "duration_s": duration,
+            "call_timeout_s": call_timeout,
+            "seed": seed,
+            "tool_mix": tool_mix,
+        },
+        "errors": [],
+        "timestamp": time.time(),
+    }
+
+    server_file = Path(server_path)
+    if not server_file.exists():
+        result["errors"].append(f"Server file not found: {server_path}")
+        return result
+    if server_command(server_file) is None:
+        result["errors"].append(f"Unsupported server type: {server_file.suffix}")
+        return result
+    if sessions < 1 or duration <= 0:
+        result["errors"].append("sessions must be >= 1 and duration > 0")
+        return result
+
+    opened = await asyncio.gather(
+        *(_open_session(server_path, timeout) for _ in range(sessions)),
+        return_exceptions=True,
+    )
+    live = [s for s in opened if isinstance(s, dict)]
+    for failure in opened:
+        if isinstance(failure, BaseException):
+            result["errors"].append(f"Session startup failed: {failure!r}")
+
+    try:
+        if not live:
+            return result
+
+        if tool_mix is None:
+            tools = await live[0]["session"].list_tools(timeout=timeout)
+            smoke_tool = pick_smoke_tool([t.get("name") for t in tools])
+            if smoke_tool is None:
+                result["errors"].append("No tools found to test")
+                return result
+            tool_mix = [{"tool": smoke_tool}]
+        mix = _normalize_mix(tool_mix)
+        result["config"]["tool_mix"] = mix
+
+        samples = {
+            entry["tool"]: {"cold": [], "warm": [], "errors": 0, "error_messages": []}
+            for entry in mix
+        }
+        rng = random.Random(seed)
+        start = time.perf_counter()
+        deadline = start + duration
+        await asyncio.gather(*(
+            _run_session(s["session"], mix, deadline, call_timeout,
+                         random.Random(rng.random()), samples)
+            for s in live
+        ))
+        elapsed = time.perf_counter() - start
+
+        per_tool = {}
+        for tool, sample in samples.items():
+            latencies = sample["cold"] + sample["warm"]
+            per_tool[tool] = {
+                "calls": len(latencies),
+                "errors": sample["errors"],
+                "throughput_per_s": round(len(latencies) / elapsed, 3),
+                "latency_ms": {
+                    "all": summarize_latencies(latencies),
+                    "cold": summarize_latencies(sample["cold"]),
+                    "warm": summarize_latencies(sample["warm"]),
+                },
+            }
+            result["errors"].extend(sample["error_messages"][:3])
+
+        total_calls = sum(t["calls"] for t in per_tool.values())
+        result.update({
+            "success": total_calls > 0,
+            "sessions_started": len(live),
+            "elapsed_s": round(elapsed, 3),
+            "startup_ms": summarize_latencies([s["startup_ms"] for s in live]),
+            "total_calls": total_calls,
+            "total_errors": sum(t["errors"] for t in per_tool.values()),
+            "throughput_per_s": round(total_calls / elapsed, 3),
+            "tools": per_tool,
+        })
+
+    except Exception as e:
+        result["errors"].append(f"Exception: {str(e)}")
+        logger.error("Load test failed", server_path=server_path, error=str(e))
+    finally:
+        await asyncio.gather(*(s["session"].close() for s in live), return_exceptions=True)
+
+    if save:
+        try:
+            result["results_path"] = str(save_load_test(result, output_path))
+        except OSError as e:
+            result["errors"].append(f"Failed to save results: {e}")
+
+    return result
+
+
+def save_load_test(result: Dict[str, Any], output_path: Optional[str] = None) -> Path:
+    """Write a load test result as JSON and return its path."""
+    if output_path:
+        target = Path(output_path)
+    else:
+        stamp = datetime.fromtimestamp(result["timestamp"], timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+        name = Path(result["server_path"]).parent.name or "server"
+        target = LOAD_TEST_DIR / f"{name}-{stamp}.json"
+    target.parent.mkdir(parents=True, exist_ok=True)
+    with open(target, "w", encoding="utf-8") as f:
+        json.dump(result, f, indent=2)
+    return target
+
+
+def _load_result(run: Union[str, Dict[str, Any]]) -> Dict[str, Any]:
+    if isinstance(run, dict):
+        return run
+    with open(run, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def compare_load_tests(
+    baseline: Union[str, Dict[str, Any]],
+    current: Union[str, Dict[str, Any]],
+    threshold: float = REGRESSION_THRESHOLD,
+) -> Dict[str, Any]:
+    """
+    Compare two load test runs tool by tool.
+
+    Args:
+        baseline: Earlier result (dict or path to its JSON file)
+        current: Newer result (dict or path to its JSON file)
+        threshold: Relative change that counts as a regression
+
+    Returns:
+        Per-tool warm p95 and throughput changes, and the tools that regressed
+    """
+    before = _load_result(baseline).get("tools", {})
+    after = _load_result(current).get("tools", {})
+
+    tools = {}
+    regressions = []
+    for tool in sorted(set(before) & set(after)):
+        old_p95 = before[tool]["latency_ms"]["warm"].get("p95")
+        new_p95 = after[tool]["latency_ms"]["warm"].get("p95")
+        old_rate = before[tool]["throughput_per_s"]
+        new_rate = after[tool]["throughput_per_s"]
+
+        p95_change = (new_p95 - old_p95) / old_p95 if old_p95 and new_p95 is not None else None
+        rate_change = (new_rate - old_rate) / old_rate if old_rate else None
+        tools[tool] = {
+            "warm_p95_ms": [old_p95, new_p95],
+            "warm_p95_change": round(p95_change, 4) if p95_change is not None else None,
+            "throughput_per_s": [old_rate, new_rate],
+            "throughput_change": round(rate_change, 4) if rate_change is not None else None,
+        }
+        if (p95_change is not None and p95_change > threshold) or (
+            rate_change is not None and rate_change < -threshold
+        ):
+            regressions.append(tool)
+
+    return {
+        "threshold": threshold,
+        "tools": tools,
+        "regressions": regressions,
+        "missing_tools": sorted(set(before) - set(after)),
+    }
@@ -7,10 +7,23 @@ sampling support detection, conversational returns validation, and SOTA complian
 Scans MCP repositories and identifies "runts" - repos that need SOTA upgrades.
 """
 
+import asyncio
+import fnmatch
+import functools
+import os
 import re
 import time
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 
 import structlog
 import tomli
@@ -21,13 +34,16 @@ from .runt_analyzer_rules import (
     calculate_sota_score,
 )
 
+from .file_result_cache import FileResultCache
+from .pattern_set import PatternSet
+from .process_pool import process_pool
+from .ignore_rules import IgnoreMatcher
+from .repo_walker import DEFAULT_IGNORE_DIRS, RepoFile, walk_repo
+from .tool_extractor import extract_tools
+
 # from .repo_detail_collector import collect_repo_details  # Module doesn't exist - using basic repo info instead
-from .scan_cache import (
-    get_cached_scan,
-    cache_scan_result,
-    get_cached_repo_status,
-    cache_repo_status,
-)
+from . import scan_cache
+from .scan_cache import get_cached_scan, cache_scan_result
 from .scan_formatter import format_scan_result_markdown, format_repo_status_markdown
 
 logger = structlog.get_logger(__name__)
@@ -101,6 +117,55 @@ LAZY_ERROR_MESSAGES = [
     r'raise\s+Exception\s*\(\s*["\'][^"\']{0,15}["\']\s*\)',  # raise Exception("short msg")
 ]
 
+# Help/status tool detection
+HELP_TOOL_PATTERN = r'(def\s+help|def\s+get_help|"help"|\'help\')\s*\('
+STATUS_TOOL_PATTERN = r'(def\s+status|def\s+get_status|"status"|\'status\')\s*\('
+
+# Per-file quality rules compiled into one single-pass scanner
+QUALITY_PATTERNS = PatternSet(
+    {
+        "help_tool": HELP_TOOL_PATTERN,
+        "status_tool": STATUS_TOOL_PATTERN,
+        "logging": LOGGING_PATTERNS,
+        "print": BAD_STDOUT_PATTERNS,
+        "bare_except": BAD_ERROR_PATTERNS,
+        "lazy_error": LAZY_ERROR_MESSAGES,
+    },
+    category_flags={
+        "help_tool": re.IGNORECASE,
+        "status_tool": re.IGNORECASE,
+        "print": re.MULTILINE,
+        "lazy_error": re.IGNORECASE,
+    },
+)
+
+# Source extensions counted towards LoC
+EXTENSIONS_MAP = {
+    ".py": "python",
+    ".ts": "typescript",
+    ".js": "typescript",
+    ".ps1": "powershell",
+    ".md": "markdown",
+}
+
+# Emoji-led string literals flagged by the docstring standards check
+DOCSTRING_UNICODE_PATTERN = re.compile(r'["\'][\U0001F000-\U0001F999][^"\']*["\']')
+
+# FastMCP 2.13.3 feature markers in source
+SAMPLING_MARKERS = [
+    "from fastmcp.sampling",
+    "import fastmcp.sampling",
+    "@sampling_tool",
+    "SamplingConfig",
+    "sampling_enabled",
+]
+CONVERSATIONAL_MARKERS = [
+    "conversational=True",
+    "ConversationalResponse",
+    "conversational_response",
+    "return_conversational",
+]
+
 # ============================================================================
 # MCP ZOO CLASSIFICATION
 # Not a flea circus - these are proper beasts!
@@ -214,6 +279,7 @@ ZOO_ANIMALS = {
     - Missing CI = runt
 
     Returns categorized list of repos with specific upgrade recommendations.
+    Repos are analyzed concurrently across a process pool (max_workers).
     Results are cached to avoid re-scanning on every request.""",
     category=ToolCategory.DISCOVERY,
     tags=["runt", "analyzer", "sota", "upgrade"],
@@ -226,13 +292,18 @@ def analyze_runts_sync(
     format: str = "json",
     use_cache: bool = True,
     deep_scan: bool = False,
+    max_workers: Optional[int] = None,
 ):
     """Synchronous wrapper for analyze_runts."""
-    import asyncio
-
     return asyncio.run(
         analyze_runts(
-            scan_path, max_depth, include_sota, format, use_cache, deep_scan=deep_scan
+            scan_path,
+            max_depth,
+            include_sota,
+            format,
+            use_cache,
+            deep_scan=deep_scan,
+            max_workers=max_workers,
         )
     )
 
@@ -245,6 +316,7 @@ async def analyze_runts(
     use_cache: bool = True,
     cache_ttl: int = 3600,
     deep_scan: bool = False,
+    max_workers: Optional[int] = None,
 ) -> Union[Dict[str, Any], str]:
     """
     Analyze MCP repositories to identify runts needing upgrades.
@@ -256,6 +328,9 @@ async def analyze_runts(
         format: Output format - "json" or "markdown" (default: "json")
         use_cache: Whether to use cached results (default: True)
         cache_ttl: Cache time-to-live in seconds (default: 3600 = 1 hour)
+        deep_scan: Whether to actively run Ruff and tests in each repo (default: False)
+        max_workers: Worker processes for concurrent repo analysis
+            (default: CPU count, 1 = serial scan in a background thread)
 
     Returns:
         Dictionary with runts, sota repos, and summary statistics, or markdown string if format="markdown"
@@ -274,9 +349,6 @@ async def analyze_runts(
                 return format_scan_result_markdown(cached)
             return cached
 
-    runts: List[Dict[str, Any]] = []
-    sota_repos: List[Dict[str, Any]] = []
-
     path = Path(scan_path).expanduser().resolve()
     if not path.exists():
         error_result = {
@@ -288,41 +360,15 @@ async def analyze_runts(
             return f"# Scan Failed\n\n**Error:** {error_result['error']}\n"
         return error_result
 
-    import asyncio
-
-    for item in path.iterdir():
-        if not item.is_dir() or item.name.startswith("."):
-            continue
-
-        # Small delay to reduce terminal spam and CPU usage
-        await asyncio.sleep(0.1)  # 100ms delay between repos
-
-        repo_info = _analyze_repo(item, deep_scan=deep_scan)
-        if repo_info:
-            if repo_info.get("is_runt"):
-                runts.append(repo_info)
-            elif include_sota:
-                sota_repos.append(repo_info)
+    repo_dirs = _list_repo_dirs(path)
+    repo_results = await _analyze_repos_concurrently(
+        repo_dirs,
+        deep_scan=deep_scan,
+        max_workers=max_workers,
+        use_file_cache=use_cache,
+    )
 
-    # Sort runts by severity (most issues first)
-    runts.sort(key=lambda x: len(x.get("runt_reasons", [])), reverse=True)
-    sota_repos.sort(key=lambda x: x.get("name", ""))
-
-    result = {
-        "success": True,
-        "summary": {
-            "total_mcp_repos": len(runts) + len(sota_repos),
-            "runts": len(runts),
-            "sota": len(sota_repos),
-            "runt_threshold": f"FastMCP < {FASTMCP_RUNT_THRESHOLD}",
-            "portmanteau_threshold": f"> {TOOL_PORTMANTEAU_THRESHOLD} tools",
-            "sota_version": FASTMCP_LATEST,
-        },
-        "runts": runts,
-        "sota_repos": sota_repos if include_sota else [],
-        "scan_path": scan_path,
-        "timestamp": time.time(),
-    }
+    result = _build_scan_result(repo_results, scan_path, include_sota)
 
     # Cache the result
     if use_cache:
@@ -335,6 +381,78 @@ async def analyze_runts(
     return result
 
 
+async def analyze_runts_stream(
+    scan_path: Optional[str] = None,
+    include_sota: bool = True,
+    use_cache: bool = True,
+    deep_scan: bool = False,
+    max_workers: Optional[int] = None,
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Stream runt analysis results repo by repo.
+
+    Yields one {"event": "repo", "data": repo_info} event per MCP repository
+    as soon as its analysis finishes (completion order, not name order), then
+    a final {"event": "summary", "data": {...}} event. Only the running
+    counts are kept in memory, so peak memory does not grow with the number
+    of repositories. A missing scan_path yields a single "error" event.
+
+    Args:
+        scan_path: Directory containing MCP repositories (default: REPOS_DIR)
+        include_sota: Whether to emit SOTA repos as well as runts (default: True)
+        use_cache: Whether to reuse cached per-file results (default: True)
+        deep_scan: Whether to actively run Ruff and tests in each repo (default: False)
+        max_workers: Worker processes for concurrent repo analysis
+
+    Returns:
+        Async iterator of event dictionaries
+    """
+    if scan_path is None:
+        from meta_mcp.app.core.config import DEFAULT_REPOS_PATH
+
+        scan_path = DEFAULT_REPOS_PATH
+
+    path = Path(scan_path).expanduser().resolve()
+    if not path.exists():
+        yield {
+            "event": "error",
+            "data": {
+                "success": False,
+                "error": f"Path does not exist: {scan_path}",
+                "timestamp": time.time(),
+            },
+        }
+        return
+
+    runt_count = 0
+    sota_count = 0
+    async for _, repo_info in _iter_analyzed_repos(
+        _list_repo_dirs(path),
+        deep_scan=deep_scan,
+        max_workers=max_workers,
+        use_file_cache=use_cache,
+    ):
+        if not repo_info:
+            continue
+        if repo_info.get("is_runt"):
+            runt_count += 1
+        elif include_sota:
+            sota_count += 1
+        else:
+            continue
+        yield {"event": "repo", "data": repo_info}
+
+    yield {
+        "event": "summary",
+        "data": {
+            "success": True,
+            "summary": _build_summary(runt_count, sota_count),
+            "scan_path": scan_path,
+            "timestamp": time.time(),
+        },
+    }
+
+
 @tool(
     name="get_repo_status",
     description="""Get detailed SOTA status for a specific MCP repository.
@@ -347,7 +465,8 @@ async def analyze_runts(
     - Detailed repository structure, dependencies, tools, and configuration
     - All information needed for AI to answer questions about the repo without re-analysis
     
-    Results are cached to avoid re-scanning on every request.""",
+    Per-file results are cached and revalidated by content hash, so only
+    changed files are re-analyzed.""",
     category=ToolCategory.DISCOVERY,
     tags=["repo", "status", "sota"],
     estimated_runtime="2-5s",
@@ -365,20 +484,15 @@ async def get_repo_status(
     Args:
         repo_path: Path to the repository
         format: Output format - "json" or "markdown" (default: "json")
-        use_cache: Whether to use cached results (default: True)
-        cache_ttl: Cache time-to-live in seconds (default: 3600 = 1 hour)
+        use_cache: Whether to reuse cached per-file results (default: True).
+            Files are revalidated by size, mtime and content hash on every
+            call, so edits anywhere in the repo are picked up.
+        cache_ttl: Unused; kept for compatibility with existing callers
+        deep_scan: Whether to actively run Ruff and tests (default: False)
 
     Returns:
         Detailed repository status and recommendations, or markdown string if format="markdown"
     """
-    # Check cache first
-    if use_cache:
-        cached = get_cached_repo_status(repo_path, cache_ttl)
-        if cached:
-            if format == "markdown":
-                return format_repo_status_markdown(cached)
-            return cached
-
     path = Path(repo_path).expanduser().resolve()
     if not path.exists():
         error_result = {
@@ -390,7 +504,8 @@ async def get_repo_status(
             return f"# Repository Status Failed\n\n**Error:** {error_result['error']}\n"
         return error_result
 
-    repo_info = _analyze_repo(path, deep_scan=deep_scan)
+    # Run the filesystem-heavy analysis off the event loop
+    repo_info = await asyncio.to_thread(_analyze_repo, path, deep_scan, use_cache)
     if not repo_info:
         error_result = {
             "success": False,
@@ -419,10 +534,6 @@ async def get_repo_status(
         logger.warning(f"Failed to collect basic repo info: {e}")
         repo_info["details"] = None
 
-    # Cache the result
-    if use_cache:
-        cache_repo_status(repo_path, repo_info)
-
     # Return in requested format
     if format == "markdown":
         return format_repo_status_markdown(repo_info)
@@ -430,8 +541,161 @@ async def get_repo_status(
     return repo_info
 
 
-def _analyze_repo(repo_path: Path, deep_scan: bool = False) -> Optional[Dict[str, Any]]:
-    """Analyze a repository for MCP status."""
+def _build_summary(runt_count: int, sota_count: int) -> Dict[str, Any]:
+    """Summary statistics for a workspace scan."""
+    return {
+        "total_mcp_repos": runt_count + sota_count,
+        "runts": runt_count,
+        "sota": sota_count,
+        "runt_threshold": f"FastMCP < {FASTMCP_RUNT_THRESHOLD}",
+        "portmanteau_threshold": f"> {TOOL_PORTMANTEAU_THRESHOLD} tools",
+        "sota_version": FASTMCP_LATEST,
+    }
+
+
+def _build_scan_result(
+    repo_results: Iterable[Optional[Dict[str, Any]]],
+    scan_path: str,
+    include_sota: bool = True,
+) -> Dict[str, Any]:
+    """Split analyzed repos into runts and SOTA repos and add the summary."""
+    runts: List[Dict[str, Any]] = []
+    sota_repos: List[Dict[str, Any]] = []
+
+    for repo_info in repo_results:
+        if repo_info:
+            if repo_info.get("is_runt"):
+                runts.append(repo_info)
+            elif include_sota:
+                sota_repos.append(repo_info)
+
+    # Sort runts by severity (most issues first)
+    runts.sort(key=lambda x: len(x.get("runt_reasons", [])), reverse=True)
+    sota_repos.sort(key=lambda x: x.get("name", ""))
+
+    return {
+        "success": True,
+        "summary": _build_summary(len(runts), len(sota_repos)),
+        "runts": runts,
+        "sota_repos": sota_repos if include_sota else [],
+        "scan_path": scan_path,
+        "timestamp": time.time(),
+    }
+
+
+def _list_repo_dirs(scan_path: Path) -> List[Path]:
+    """List candidate repo directories under scan_path in stable name order."""
+    return sorted(
+        (
+            item
+            for item in scan_path.iterdir()
+            if item.is_dir() and not item.name.startswith(".")
+        ),
+        key=lambda item: item.name,
+    )
+
+
+async def _analyze_repos_concurrently(
+    repo_dirs: List[Path],
+    deep_scan: bool = False,
+    max_workers: Optional[int] = None,
+    use_file_cache: bool = True,
+) -> List[Optional[Dict[str, Any]]]:
+    """Analyze repos off the event loop, fanning out across a process pool.
+
+    Results are returned in the same order as repo_dirs. A repo whose analysis
+    raises is logged and reported as None, like a non-MCP directory.
+    """
+    merged: List[Optional[Dict[str, Any]]] = [None] * len(repo_dirs)
+    async for index, result in _iter_analyzed_repos(
+        repo_dirs, deep_scan, max_workers, use_file_cache
+    ):
+        merged[index] = result
+    return merged
+
+
+async def _iter_analyzed_repos(
+    repo_dirs: List[Path],
+    deep_scan: bool = False,
+    max_workers: Optional[int] = None,
+    use_file_cache: bool = True,
+) -> AsyncIterator[Tuple[int, Optional[Dict[str, Any]]]]:
+    """Yield (index into repo_dirs, result) as each repo analysis finishes.
+
+    A repo whose analysis raises is logged and reported as None. Closing the
+    generator early cancels analyses that have not started yet.
+    """
+    if not repo_dirs:
+        return
+
+    workers = min(max_workers or os.cpu_count() or 1, len(repo_dirs))
+
+    if workers <= 1:
+        # Not worth spawning processes; still keep the event loop free
+        for index, repo_dir in enumerate(repo_dirs):
+            yield index, await asyncio.to_thread(
+                _analyze_repo_safe, repo_dir, deep_scan, use_file_cache
+            )
+        return
+
+    loop = asyncio.get_running_loop()
+    executor = process_pool(
+        workers,
+        preload=__name__,
+        initializer=_init_worker,
+        initargs=(scan_cache.CACHE_DIR,),
+    )
+
+    async def run(index: int, repo_dir: Path):
+        try:
+            return index, await loop.run_in_executor(
+                executor,
+                functools.partial(_analyze_repo, repo_dir, deep_scan, use_file_cache),
+            )
+        except Exception as e:
+            logger.warning(f"Failed to analyze {repo_dir}: {e}")
+            return index, None
+
+    tasks = [
+        asyncio.ensure_future(run(index, repo_dir))
+        for index, repo_dir in enumerate(repo_dirs)
+    ]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            yield await next_done
+    finally:
+        for task in tasks:
+            task.cancel()
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _init_worker(cache_dir: Path) -> None:
+    """Point a pool worker at the parent's scan cache directory."""
+    scan_cache.CACHE_DIR = cache_dir
+
+
+def _analyze_repo_safe(
+    repo_path: Path, deep_scan: bool = False, use_file_cache: bool = True
+) -> Optional[Dict[str, Any]]:
+    """Analyze a repository, logging and swallowing unexpected failures."""
+    try:
+        return _analyze_repo(
+            repo_path, deep_scan=deep_scan, use_file_cache=use_file_cache
+        )
+    except Exception as e:
+        logger.warning(f"Failed to analyze {repo_path}: {e}")
+        return None
+
+
+def _analyze_repo(
+    repo_path: Path, deep_scan: bool = False, use_file_cache: bool = True
+) -> Optional[Dict[str, Any]]:
+    """Analyze a repository for MCP status.
+
+    Per-file results are reused from the incremental file cache unless
+    use_file_cache is False; repo-level rules are always re-evaluated on the
+    merged info.
+    """
     info = {
         "name": repo_path.name,
         "path": str(repo_path),
@@ -510,12 +774,15 @@ def _analyze_repo(repo_path: Path, deep_scan: bool = False) -> Optional[Dict[str
     pyproject_file = repo_path / "pyproject.toml"
 
     fastmcp_version = None
+    pyproject_content = ""
 
     # Extract FastMCP version and other config
     for config_file in [req_file, pyproject_file]:
         if config_file.exists():
             try:
                 content = config_file.read_text(encoding="utf-8")
+                if config_file is pyproject_file:
+                    pyproject_content = content
 
                 # FastMCP version check
                 match = re.search(r"fastmcp.*?(\d+\.\d+\.?\d*)", content, re.IGNORECASE)
@@ -589,11 +856,6 @@ def _analyze_repo(repo_path: Path, deep_scan: bool = False) -> Optional[Dict[str
             break
 
     # Count tools, LoC and check for help/status + docstrings
-    tool_patterns = [
-        (r"@app\.tool\(", "app"),
-        (r"@mcp\.tool\(", "mcp"),
-        (r"@tool\(", "generic"),
-    ]
     tool_count = 0
     proper_docstrings = 0
     print_count = 0
@@ -601,157 +863,63 @@ def _analyze_repo(repo_path: Path, deep_scan: bool = False) -> Optional[Dict[str
     lazy_error_count = 0
     has_logging = False
 
-    # We'll scan the whole repo for LoC, but only src_dirs for tools
-    ignore_dirs = {
-        "node_modules",
-        ".git",
-        "__pycache__",
-        ".venv",
-        "venv",
-        ".pytest_cache",
-        ".ruff_cache",
-        ".mypy_cache",
-        "build",
-        "dist",
-    }
+    # Single pruned walk over the repo (ignored dir names and .gitignore rules):
+    # every check below reuses these entries and the per-file results computed
+    # here instead of re-walking the tree.
+    # Unchanged files are served from the incremental per-file cache.
+    file_cache = FileResultCache(str(repo_path)) if use_file_cache else None
+    repo_files: List[RepoFile] = []
+    py_results: List[Tuple[RepoFile, Dict[str, Any]]] = []
 
-    extensions_map = {
-        ".py": "python",
-        ".ts": "typescript",
-        ".js": "typescript",
-        ".ps1": "powershell",
-        ".md": "markdown",
-    }
+    matcher = IgnoreMatcher(repo_path)
+    for item in walk_repo(repo_path, DEFAULT_IGNORE_DIRS, matcher):
+        repo_files.append(item)
 
-    # Recursive scan for everything
-    for item in repo_path.rglob("*"):
-        if any(part in ignore_dirs for part in item.parts):
+        if item.suffix not in EXTENSIONS_MAP:
             continue
 
-        if item.is_file():
-            ext = item.suffix.lower()
-            if ext in extensions_map:
-                try:
-                    content = item.read_text(encoding="utf-8")
-                    lines = content.splitlines()
-                    line_count = len(lines)
-
-                    category = extensions_map[ext]
-                    info["loc"][category] += line_count
-                    info["loc"]["total"] += line_count
-
-                    # Only look for tools and specific metadata in source files
-                    if ext == ".py":
-                        is_test = "test" in str(item).lower()
-
-                        # Tool metadata discovery (only in non-test files)
-                        if not is_test:
-                            # Search for tools
-                            # Simple approach: find the pattern and the function name right after
-                            for pattern, _ in tool_patterns:
-                                # Look for @tool() followed by def name()
-                                matches = re.finditer(
-                                    pattern + r".*?\n\s*(?:async\s+)?def\s+(\w+)",
-                                    content,
-                                    re.DOTALL,
-                                )
-                                for match in matches:
-                                    tool_name = match.group(1)
-                                    tool_count += 1
-
-                                    # Check for docstring for THIS specific tool
-                                    # We look at the body of the function right after the match
-                                    start_pos = match.end()
-                                    # Find the end of the def line
-                                    def_end = content.find(":", start_pos)
-                                    if def_end != -1:
-                                        # Check if next non-empty line starts with triple quotes
-                                        after_def = content[def_end + 1 :].strip()
-                                        has_docstring = after_def.startswith(
-                                            '"""'
-                                        ) or after_def.startswith("'''")
-
-                                        # Deep check for SOTA docstring (Args/Returns)
-                                        is_sota_doc = False
-                                        if has_docstring:
-                                            # Find the end of docstring
-                                            quote_type = after_def[:3]
-                                            doc_end = after_def.find(quote_type, 3)
-                                            if doc_end != -1:
-                                                doc_text = after_def[3:doc_end]
-                                                if any(
-                                                    kw in doc_text
-                                                    for kw in [
-                                                        "Args:",
-                                                        "Returns:",
-                                                        "Example:",
-                                                        "PORTMANTEAU",
-                                                    ]
-                                                ):
-                                                    is_sota_doc = True
-
-                                        info["tools_metadata"].append(
-                                            {
-                                                "name": tool_name,
-                                                "file": str(
-                                                    item.relative_to(repo_path)
-                                                ),
-                                                "has_docstring": has_docstring,
-                                                "is_sota_doc": is_sota_doc,
-                                            }
-                                        )
-                                        if is_sota_doc:
-                                            proper_docstrings += 1
-
-                            # Check for help tool
-                            if not info["has_help_tool"]:
-                                if re.search(
-                                    r'(def\s+help|def\s+get_help|"help"|\'help\')\s*\(',
-                                    content,
-                                    re.IGNORECASE,
-                                ):
-                                    info["has_help_tool"] = True
-
-                            # Check for status tool
-                            if not info["has_status_tool"]:
-                                if re.search(
-                                    r'(def\s+status|def\s+get_status|"status"|\'status\')\s*\(',
-                                    content,
-                                    re.IGNORECASE,
-                                ):
-                                    info["has_status_tool"] = True
-
-                            # --- Logging, Print and Error Handling Checks ---
-                            content_lower = content.lower()
-
-                            # Check for logging setup (only need to find it once)
-                            if not has_logging:
-                                for pattern in LOGGING_PATTERNS:
-                                    if re.search(pattern, content):
-                                        has_logging = True
-                                        break
-
-                            # Check for print statements in non-test files
-                            if not is_test:
-                                for pattern in BAD_STDOUT_PATTERNS:
-                                    matches = re.findall(pattern, content, re.MULTILINE)
-                                    print_count += len(matches)
-
-                            # Check for bare except clauses
-                            for pattern in BAD_ERROR_PATTERNS:
-                                matches = re.findall(pattern, content)
-                                bare_except_count += len(matches)
-
-                            # Check for lazy/non-informative error messages
-                            if not is_test:
-                                for pattern in LAZY_ERROR_MESSAGES:
-                                    matches = re.findall(
-                                        pattern, content_lower, re.IGNORECASE
-                                    )
-                                    lazy_error_count += len(matches)
-                except Exception as e:
-                    logger.debug(f"Failed to scan {item}: {e}")
-                    pass
+        if file_cache is not None:
+            result = file_cache.get_or_compute(
+                item, functools.partial(_analyze_file, item)
+            )
+        else:
+            try:
+                result = _analyze_file(item, item.read_text(encoding="utf-8"))
+            except Exception as e:
+                logger.debug(f"Failed to scan {item.path}: {e}")
+                result = None
+        if result is None:
+            continue
+
+        info["loc"][result["category"]] += result["lines"]
+        info["loc"]["total"] += result["lines"]
+
+        py = result.get("py")
+        if py is None:
+            continue
+        py_results.append((item, py))
+
+        # Tool metadata discovery (only in non-test files)
+        if not py["is_test"]:
+            tool_count += py["tool_count"]
+            for tool_meta in py["tools"]:
+                info["tools_metadata"].append({**tool_meta, "file": item.rel_path})
+                if tool_meta["is_sota_doc"]:
+                    proper_docstrings += 1
+
+            quality = py["quality"]
+            if quality["help_tool"]:
+                info["has_help_tool"] = True
+            if quality["status_tool"]:
+                info["has_status_tool"] = True
+            if quality["logging"]:
+                has_logging = True
+            bare_except_count += quality["bare_except"]
+            print_count += quality["print"]
+            lazy_error_count += quality["lazy_error"]
+
+    if file_cache is not None:
+        file_cache.save()
 
     info["has_proper_logging"] = has_logging
     info["print_statement_count"] = print_count
@@ -789,83 +957,24 @@ def _analyze_repo(repo_path: Path, deep_scan: bool = False) -> Optional[Dict[str
                 break
 
         # Check pyproject.toml for [tool.ruff]
-        if not info["has_ruff"] and pyproject_file.exists():
-            try:
-                pyproject_content = pyproject_file.read_text(encoding="utf-8")
-                if "[tool.ruff]" in pyproject_content:
-                    info["has_ruff"] = True
-            except Exception:
-                pass
+        if not info["has_ruff"] and "[tool.ruff]" in pyproject_content:
+            info["has_ruff"] = True
 
-    # Check test harness
-    test_file_count = 0
+    # Check test harness (details come from _check_testing_scaffold below)
     for test_dir_name in TEST_DIRS:
-        test_dir = repo_path / test_dir_name
-        if test_dir.exists():
+        if (repo_path / test_dir_name).exists():
             info["has_tests"] = True
 
-            # Check for unit tests
-            unit_dir = test_dir / "unit"
-            if unit_dir.exists() and any(unit_dir.glob("test_*.py")):
-                info["has_unit_tests"] = True
-
-            # Check for integration tests
-            integration_dir = test_dir / "integration"
-            if integration_dir.exists() and any(integration_dir.glob("test_*.py")):
-                info["has_integration_tests"] = True
-
-            # Count test files
-            test_file_count += len(list(test_dir.rglob("test_*.py")))
-            test_file_count += len(list(test_dir.rglob("*_test.py")))
-
-    info["test_file_count"] = test_file_count
-
-    # Check for pytest configuration
-    pytest_ini = repo_path / "pytest.ini"
-    pyproject_pytest = False
-    if pyproject_file.exists():
-        try:
-            pyproject_content = pyproject_file.read_text(encoding="utf-8")
-            if "[tool.pytest" in pyproject_content:
-                pyproject_pytest = True
-        except Exception:
-            pass
-
-    if pytest_ini.exists() or pyproject_pytest:
-        info["has_pytest_config"] = True
-
-    # Check for coverage configuration
-    coveragerc = repo_path / ".coveragerc"
-    pyproject_coverage = False
-    if pyproject_file.exists():
-        try:
-            pyproject_content = pyproject_file.read_text(encoding="utf-8")
-            if "[tool.coverage" in pyproject_content:
-                pyproject_coverage = True
-        except Exception:
-            pass
-
-    if coveragerc.exists() or pyproject_coverage:
-        info["has_coverage_config"] = True
-
-    # NEW: FastMCP 2.13.3 Feature Validation
-    pyproject_content = ""
-    if pyproject_file.exists():
-        try:
-            pyproject_content = pyproject_file.read_text(encoding="utf-8")
-        except Exception:
-            pyproject_content = ""
-
     # Check for FastMCP 2.13.3 specific features
-    fastmcp_features = _check_fastmcp_2133_features(repo_path, pyproject_content)
+    fastmcp_features = _check_fastmcp_2133_features(pyproject_content, py_results)
     info.update(fastmcp_features)
 
     # Check docstring standards
-    docstring_analysis = _check_docstring_standards(repo_path)
+    docstring_analysis = _check_docstring_standards(py_results)
     info.update(docstring_analysis)
 
     # Check testing scaffold
-    testing_analysis = _check_testing_scaffold(repo_path)
+    testing_analysis = _check_testing_scaffold(repo_path, repo_files, pyproject_content)
     info.update(testing_analysis)
 
     # Check CI/CD implementation
@@ -873,7 +982,7 @@ def _analyze_repo(repo_path: Path, deep_scan: bool = False) -> Optional[Dict[str
     info.update(cicd_analysis)
 
     # Check Zed extension support
-    zed_analysis = _check_zed_extension_support(repo_path)
+    zed_analysis = _check_zed_extension_support(repo_files)
     info.update(zed_analysis)
 
     # Evaluate using rule-based system
@@ -899,6 +1008,65 @@ def _analyze_repo(repo_path: Path, deep_scan: bool = False) -> Optional[Dict[str
     return info
 
 
+def _analyze_file(item: RepoFile, content: str) -> Dict[str, Any]:
+    """Analyze a single source file.
+
+    The result only depends on the file's path and content, so it can be
+    cached per file and merged into the repo info by _analyze_repo.
+    """
+    result: Dict[str, Any] = {
+        "category": EXTENSIONS_MAP[item.suffix],
+        "lines": len(content.splitlines()),
+    }
+    if item.suffix != ".py":
+        return result
+
+    py: Dict[str, Any] = {
+        "is_test": "test" in item.path.lower(),
+        "tool_count": 0,
+        "tools": [],
+        "quality": None,
+        "has_sampling": any(m in content for m in SAMPLING_MARKERS),
+        "has_conversational": any(m in content for m in CONVERSATIONAL_MARKERS),
+        "docstrings": None,
+    }
+    result["py"] = py
+
+    # Decorated tool functions, parsed once per file content
+    tools = extract_tools(content)
+
+    # Tool metadata discovery (only in non-test files)
+    if not py["is_test"]:
+        py["tool_count"] = len(tools)
+        py["tools"] = [
+            {
+                "name": t.name,
+                "line": t.lineno,
+                "has_docstring": t.has_docstring,
+                "is_sota_doc": t.is_sota_doc,
+                "has_args_section": t.args_section is not None,
+                "has_returns_section": t.returns_section is not None,
+            }
+            for t in tools
+        ]
+
+        # Help/status, logging, print and error handling checks
+        py["quality"] = QUALITY_PATTERNS.counts(content)
+
+    # Docstring standards (hidden directories are skipped)
+    if not any(part.startswith(".") for part in item.parts):
+        py["docstrings"] = {
+            "unicode_matches": DOCSTRING_UNICODE_PATTERN.findall(content),
+            "tools": len(tools),
+            "documented": sum(1 for t in tools if t.has_docstring),
+            "with_args": sum(1 for t in tools if t.args_section is not None),
+            "with_returns": sum(1 for t in tools if t.returns_section is not None),
+            "with_examples": sum(1 for t in tools if t.has_examples),
+        }
+
+    return result
+
+
 def _run_active_tools(repo_path: Path) -> Dict[str, Any]:
     """Actively execute Ruff and tests on the repository."""
     import subprocess
@@ -1048,7 +1216,7 @@ def _calculate_sota_score(info: Dict[str, Any]) -> int:
 
 
 def _check_fastmcp_2133_features(
-    repo_path: Path, pyproject_content: str
+    pyproject_content: str, py_results: List[Tuple[RepoFile, Dict[str, Any]]]
 ) -> Dict[str, Any]:
     """Check for FastMCP 2.13.3 specific features and compliance."""
     features = {
@@ -1073,50 +1241,22 @@ def _check_fastmcp_2133_features(
                 features["sampling_version_compliant"] = True
                 features["has_sampling_support"] = True
 
-    # Check source code for sampling implementation
-    try:
-        for py_file in repo_path.rglob("*.py"):
-            if py_file.is_file():
-                content = py_file.read_text(encoding="utf-8")
-
-                # Look for sampling-related imports and usage
-                if any(
-                    pattern in content
-                    for pattern in [
-                        "from fastmcp.sampling",
-                        "import fastmcp.sampling",
-                        "@sampling_tool",
-                        "SamplingConfig",
-                        "sampling_enabled",
-                    ]
-                ):
-                    features["has_sampling_support"] = True
-                    features["sampling_implementation"] = str(
-                        py_file.relative_to(repo_path)
-                    )
-
-                # Look for conversational return patterns
-                if any(
-                    pattern in content
-                    for pattern in [
-                        "conversational=True",
-                        "ConversationalResponse",
-                        "conversational_response",
-                        "return_conversational",
-                    ]
-                ):
-                    features["has_conversational_returns"] = True
-                    features["conversational_implementation"] = str(
-                        py_file.relative_to(repo_path)
-                    )
-
-    except Exception:
-        pass  # File read errors shouldn't stop analysis
+    # Check source code for sampling implementation and conversational returns
+    for py_file, py in py_results:
+        if py["has_sampling"]:
+            features["has_sampling_support"] = True
+            features["sampling_implementation"] = py_file.rel_path
+
+        if py["has_conversational"]:
+            features["has_conversational_returns"] = True
+            features["conversational_implementation"] = py_file.rel_path
 
     return features
 
 
-def _check_docstring_standards(repo_path: Path) -> Dict[str, Any]:
+def _check_docstring_standards(
+    py_results: List[Tuple[RepoFile, Dict[str, Any]]],
+) -> Dict[str, Any]:
     """Check if docstrings meet current FastMCP standards."""
     docstring_info = {
         "has_proper_docstrings": False,
@@ -1131,69 +1271,38 @@ def _check_docstring_standards(repo_path: Path) -> Dict[str, Any]:
     tool_count = 0
     tools_with_proper_docs = 0
 
-    try:
-        for py_file in repo_path.rglob("*.py"):
-            if py_file.is_file() and not any(
-                part.startswith(".") for part in py_file.parts
-            ):
-                content = py_file.read_text(encoding="utf-8")
-
-                # Check for Unicode characters in docstrings
-                unicode_matches = re.findall(
-                    r'["\'][\U0001F000-\U0001F999][^"\']*["\']', content
-                )
-                if unicode_matches:
-                    docstring_info["unicode_issues_found"].extend(
-                        [f"{py_file.name}: {match}" for match in unicode_matches]
-                    )
-                    docstring_info["ascii_only_docstrings"] = False
-
-                # Find tool functions
-                tool_matches = re.finditer(
-                    r"@tool.*?\n\s*(?:async\s+)?def\s+(\w+)", content, re.DOTALL
-                )
-
-                for match in tool_matches:
-                    tool_count += 1
-
-                    # Extract docstring for this tool
-                    start_pos = match.end()
-                    def_end = content.find(":", start_pos)
-                    if def_end != -1:
-                        after_def = content[def_end + 1 :].strip()
-                        if after_def.startswith('"""') or after_def.startswith("'''"):
-                            quote_type = after_def[:3]
-                            doc_end = after_def.find(quote_type, 3)
-                            if doc_end != -1:
-                                doc_text = after_def[3:doc_end]
-                                tools_with_proper_docs += 1
-
-                                # Check docstring components
-                                if "Args:" in doc_text:
-                                    docstring_info["tools_with_args"] += 1
-                                if "Returns:" in doc_text:
-                                    docstring_info["tools_with_returns"] += 1
-                                if any(
-                                    example in doc_text
-                                    for example in ["Example:", "Examples:", ">>>"]
-                                ):
-                                    docstring_info["tools_with_examples"] += 1
-
-        if tool_count > 0:
-            docstring_info["docstring_coverage"] = (
-                tools_with_proper_docs / tool_count
-            ) * 100
-            docstring_info["has_proper_docstrings"] = (
-                docstring_info["docstring_coverage"] >= 80
-            )
+    for py_file, py in py_results:
+        docstrings = py["docstrings"]
+        if docstrings is None:
+            continue
 
-    except Exception:
-        pass
+        # Unicode characters in docstrings
+        if docstrings["unicode_matches"]:
+            docstring_info["unicode_issues_found"].extend(
+                [f"{py_file.name}: {match}" for match in docstrings["unicode_matches"]]
+            )
+            docstring_info["ascii_only_docstrings"] = False
+
+        tool_count += docstrings["tools"]
+        tools_with_proper_docs += docstrings["documented"]
+        docstring_info["tools_with_args"] += docstrings["with_args"]
+        docstring_info["tools_with_returns"] += docstrings["with_returns"]
+        docstring_info["tools_with_examples"] += docstrings["with_examples"]
+
+    if tool_count > 0:
+        docstring_info["docstring_coverage"] = (
+            tools_with_proper_docs / tool_count
+        ) * 100
+        docstring_info["has_proper_docstrings"] = (
+            docstring_info["docstring_coverage"] >= 80
+        )
 
     return docstring_info
 
 
-def _check_testing_scaffold(repo_path: Path) -> Dict[str, Any]:
+def _check_testing_scaffold(
+    repo_path: Path, repo_files: List[RepoFile], pyproject_content: str
+) -> Dict[str, Any]:
     """Check if proper testing scaffold is in place."""
     testing_info = {
         "has_test_directory": False,
@@ -1207,52 +1316,40 @@ def _check_testing_scaffold(repo_path: Path) -> Dict[str, Any]:
     }
 
     # Check for test directories
-    for test_dir in ["tests", "test"]:
+    for test_dir in TEST_DIRS:
         test_path = repo_path / test_dir
         if test_path.exists() and test_path.is_dir():
             testing_info["has_test_directory"] = True
 
             # Check for specific test types
-            unit_dir = test_path / "unit"
-            integration_dir = test_path / "integration"
-
-            if unit_dir.exists():
+            if (test_path / "unit").exists():
                 testing_info["has_unit_tests"] = True
-            if integration_dir.exists():
+            if (test_path / "integration").exists():
                 testing_info["has_integration_tests"] = True
 
-            # Count test files
-            test_files = list(test_path.rglob("test_*.py")) + list(
-                test_path.rglob("*_test.py")
-            )
-            testing_info["test_file_count"] = len(test_files)
+    # Count test files from the shared walk
+    if testing_info["has_test_directory"]:
+        test_file_count = 0
+        for f in repo_files:
+            if f.parts[0] in TEST_DIRS:
+                if fnmatch.fnmatch(f.name, "test_*.py"):
+                    test_file_count += 1
+                if fnmatch.fnmatch(f.name, "*_test.py"):
+                    test_file_count += 1
+        testing_info["test_file_count"] = test_file_count
 
     # Check for pytest configuration
-    pytest_ini = repo_path / "pytest.ini"
-    pyproject_file = repo_path / "pyproject.toml"
-
-    if pytest_ini.exists():
+    if (repo_path / "pytest.ini").exists():
         testing_info["has_pytest_config"] = True
 
-    if pyproject_file.exists():
-        try:
-            pyproject_content = pyproject_file.read_text(encoding="utf-8")
-            if "[tool.pytest" in pyproject_content or "[pytest" in pyproject_content:
-                testing_info["has_pytest_config"] = True
-        except Exception:
-            pass
+    if "[tool.pytest" in pyproject_content or "[pytest" in pyproject_content:
+        testing_info["has_pytest_config"] = True
 
     # Check for coverage configuration
-    coveragerc = repo_path / ".coveragerc"
-    if pyproject_file.exists():
-        try:
-            pyproject_content = pyproject_file.read_text(encoding="utf-8")
-            if "[tool.coverage" in pyproject_content:
-                testing_info["has_coverage_config"] = True
-        except Exception:
-            pass
+    if "[tool.coverage" in pyproject_content:
+        testing_info["has_coverage_config"] = True
 
-    if coveragerc.exists():
+    if (repo_path / ".coveragerc").exists():
         testing_info["has_coverage_config"] = True
 
     return testing_info
@@ -1299,7 +1396,7 @@ def _check_cicd_implementation(repo_path: Path) -> Dict[str, Any]:
     return cicd_info
 
 
-def _check_zed_extension_support(repo_path: Path) -> Dict[str, Any]:
+def _check_zed_extension_support(repo_files: List[RepoFile]) -> Dict[str, Any]:
     """Check for Zed extension implementation."""
     zed_info = {
         "has_zed_extension": False,
@@ -1316,24 +1413,25 @@ def _check_zed_extension_support(repo_path: Path) -> Dict[str, Any]:
         "package.json",  # Sometimes used for Zed extensions
     ]
 
+    # Look for main extension script
+    script_patterns = ["main.py", "index.js", "extension.py", "zed.py"]
+
+    files_by_name: Dict[str, List[str]] = {}
+    for f in repo_files:
+        files_by_name.setdefault(f.name, []).append(f.rel_path)
+
     for pattern in extension_patterns:
-        matches = list(repo_path.rglob(pattern))
+        matches = files_by_name.get(pattern)
         if matches:
             zed_info["has_zed_extension"] = True
             zed_info["has_manifest"] = True
-            zed_info["extension_files"].extend(
-                [str(m.relative_to(repo_path)) for m in matches]
-            )
+            zed_info["extension_files"].extend(matches)
 
-    # Look for main extension script
-    script_patterns = ["main.py", "index.js", "extension.py", "zed.py"]
     for pattern in script_patterns:
-        matches = list(repo_path.rglob(pattern))
+        matches = files_by_name.get(pattern)
         if matches:
             zed_info["has_main_script"] = True
-            zed_info["extension_files"].extend(
-                [str(m.relative_to(repo_path)) for m in matches]
-            )
+            zed_info["extension_files"].extend(matches)
 
     return zed_info
 
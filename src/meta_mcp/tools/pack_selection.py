@@ -0,0 +1,431 @@
+"""Importance-ranked file selection for token-limited repository packs.
+
+Each file is scored from three signals:
+
+- import-graph centrality: PageRank over the repository's internal Python
+  and JavaScript/TypeScript imports, so modules many others depend on rank
+  high
+- entry-point proximity: import distance from entry points (``main.py``,
+  ``__main__.py``, ``index.ts``, ``[project.scripts]`` targets, ...)
+- recent git churn: recency-weighted number of recent commits touching
+  the file
+
+Project manifests and READMEs always score highest, and tests are damped.
+The token budget is then spent by solving a 0/1 knapsack over the scores,
+so a budget carries the most valuable context rather than whatever comes
+first in directory order.
+"""
+
+import ast
+import math
+import posixpath
+import re
+import subprocess
+from collections import deque
+from pathlib import PurePosixPath
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+import structlog
+
+try:
+    import tomllib
+except ImportError:  # Python 3.10
+    tomllib = None
+
+logger = structlog.get_logger(__name__)
+
+# Files that describe the project; always ranked first
+MANIFEST_NAMES = {
+    "readme.md",
+    "readme.rst",
+    "readme.txt",
+    "readme",
+    "pyproject.toml",
+    "setup.py",
+    "setup.cfg",
+    "package.json",
+    "cargo.toml",
+    "go.mod",
+}
+
+ENTRY_POINT_NAMES = {
+    "__main__.py",
+    "main.py",
+    "app.py",
+    "server.py",
+    "cli.py",
+    "manage.py",
+    "wsgi.py",
+    "asgi.py",
+    "index.js",
+    "index.ts",
+    "main.js",
+    "main.ts",
+    "app.js",
+    "app.ts",
+    "server.js",
+    "server.ts",
+}
+
+JS_EXTENSIONS = (".ts", ".tsx", ".js", ".jsx", ".mjs", ".cjs")
+JS_IMPORT_PATTERN = re.compile(
+    r"""(?:\bfrom\s*|\bimport\s*\(?\s*|\brequire\s*\(\s*)['"](\.{1,2}/[^'"]+)['"]"""
+)
+
+# Weights of the normalized signals in a file's score
+CENTRALITY_WEIGHT = 0.45
+PROXIMITY_WEIGHT = 0.35
+CHURN_WEIGHT = 0.2
+BASE_SCORE = 0.05
+TEST_FILE_FACTOR = 0.5
+
+# Commits inspected for churn, and the commit age (by position) at which a
+# commit counts half
+CHURN_MAX_COMMITS = 500
+CHURN_HALF_LIFE = 100
+
+# Capacity resolution of the knapsack table
+KNAPSACK_BINS = 2048
+
+
+def _posix(path: str) -> str:
+    return PurePosixPath(path.replace("\\", "/")).as_posix()
+
+
+def _is_test_file(path: str) -> bool:
+    parts = path.lower().split("/")
+    name = parts[-1]
+    return (
+        any(part in ("test", "tests", "__tests__") for part in parts[:-1])
+        or name.startswith("test_")
+        or name.endswith(("_test.py", ".test.ts", ".test.js", ".spec.ts", ".spec.js"))
+    )
+
+
+def _python_module_names(paths: Set[str]) -> Dict[str, str]:
+    """Map importable dotted module names to the Python files defining them.
+
+    A module is named from the top of its package chain (directories with an
+    ``__init__.py``), and also from the repository root so that imports of
+    ``src.pkg.mod`` and script-style imports resolve.
+    """
+    modules: Dict[str, str] = {}
+    for path in sorted(paths):
+        if not path.endswith(".py"):
+            continue
+        parts = path[:-3].split("/")
+        if parts[-1] == "__init__":
+            parts = parts[:-1]
+            if not parts:
+                continue
+
+        # Climb while the parent directory is a package
+        top = len(parts) - 1
+        while top > 0 and "/".join(parts[:top]) + "/__init__.py" in paths:
+            top -= 1
+        package_name = ".".join(parts[top:])
+        modules.setdefault(package_name, path)
+        modules.setdefault(".".join(parts), path)
+    return modules
+
+
+def _python_imports(
+    path: str, content: str, modules: Dict[str, str], own_name: str
+) -> Set[str]:
+    try:
+        tree = ast.parse(content)
+    except (SyntaxError, ValueError):
+        return set()
+
+    # Dotted name of this file's package, for relative imports
+    package = own_name if path.endswith("__init__.py") else own_name.rpartition(".")[0]
+
+    targets: Set[str] = set()
+
+    def resolve(name: str) -> None:
+        while name:
+            target = modules.get(name)
+            if target is not None:
+                if target != path:
+                    targets.add(target)
+                return
+            name = name.rpartition(".")[0]
+
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            for alias in node.names:
+                resolve(alias.name)
+        elif isinstance(node, ast.ImportFrom):
+            base = node.module or ""
+            if node.level:
+                anchor = package.split(".") if package else []
+                if node.level > 1:
+                    anchor = anchor[: len(anchor) - (node.level - 1)]
+                base = ".".join(anchor + ([base] if base else []))
+            for alias in node.names:
+                # "from pkg import module" imports a submodule when one exists
+                if base and f"{base}.{alias.name}" in modules:
+                    resolve(f"{base}.{alias.name}")
+                else:
+                    resolve(base)
+    return targets
+
+
+def _js_imports(path: str, content: str, paths: Set[str]) -> Set[str]:
+    targets: Set[str] = set()
+    directory = posixpath.dirname(path)
+    for spec in JS_IMPORT_PATTERN.findall(content):
+        base = posixpath.normpath(posixpath.join(directory, spec))
+        candidates = [base] + [base + ext for ext in JS_EXTENSIONS]
+        candidates += [f"{base}/index{ext}" for ext in JS_EXTENSIONS]
+        for candidate in candidates:
+            if candidate in paths and candidate != path:
+                targets.add(candidate)
+                break
+    return targets
+
+
+def build_import_graph(files_data: Sequence[Dict[str, Any]]) -> Dict[str, Set[str]]:
+    """Internal import edges between packed files (importer -> imported)."""
+    contents = {_posix(f["path"]): f["content"] for f in files_data}
+    paths = set(contents)
+    modules = _python_module_names(paths)
+    names: Dict[str, str] = {}
+    for name, path in modules.items():
+        names.setdefault(path, name)
+
+    graph: Dict[str, Set[str]] = {}
+    for path, content in contents.items():
+        if path.endswith(".py"):
+            graph[path] = _python_imports(path, content, modules, names.get(path, ""))
+        elif path.endswith(JS_EXTENSIONS):
+            graph[path] = _js_imports(path, content, paths)
+        else:
+            graph[path] = set()
+    return graph
+
+
+def pagerank(
+    graph: Dict[str, Set[str]], damping: float = 0.85, iterations: int = 50
+) -> Dict[str, float]:
+    """PageRank of every node; rank flows from importers to imported files."""
+    nodes = list(graph)
+    if not nodes:
+        return {}
+    n = len(nodes)
+    rank = {node: 1.0 / n for node in nodes}
+    for _ in range(iterations):
+        dangling = sum(rank[node] for node in nodes if not graph[node])
+        base = (1.0 - damping) / n + damping * dangling / n
+        new_rank = {node: base for node in nodes}
+        for node in nodes:
+            targets = graph[node]
+            if targets:
+                share = damping * rank[node] / len(targets)
+                for target in targets:
+                    new_rank[target] += share
+        delta = sum(abs(new_rank[node] - rank[node]) for node in nodes)
+        rank = new_rank
+        if delta < 1e-9:
+            break
+    return rank
+
+
+def find_entry_points(
+    files_data: Sequence[Dict[str, Any]], graph: Dict[str, Set[str]]
+) -> Set[str]:
+    """Files a reader would start from: well-known names and declared scripts."""
+    paths = set(graph)
+    entries = {p for p in paths if p.rsplit("/", 1)[-1].lower() in ENTRY_POINT_NAMES}
+
+    if tomllib is not None:
+        pyproject = next(
+            (f["content"] for f in files_data if _posix(f["path"]) == "pyproject.toml"),
+            None,
+        )
+        if pyproject:
+            try:
+                scripts = tomllib.loads(pyproject).get("project", {}).get("scripts", {})
+            except (tomllib.TOMLDecodeError, AttributeError):
+                scripts = {}
+            modules = _python_module_names(paths)
+            for target in scripts.values():
+                module = str(target).split(":", 1)[0].strip()
+                if module in modules:
+                    entries.add(modules[module])
+    return entries
+
+
+def entry_point_distances(
+    graph: Dict[str, Set[str]], entries: Iterable[str]
+) -> Dict[str, int]:
+    """Import hops from the nearest entry point (unreachable files omitted)."""
+    distances = {entry: 0 for entry in entries if entry in graph}
+    queue = deque(distances)
+    while queue:
+        node = queue.popleft()
+        for target in graph.get(node, ()):
+            if target not in distances:
+                distances[target] = distances[node] + 1
+                queue.append(target)
+    return distances
+
+
+def git_churn(repo_path: str, timeout: float = 10.0) -> Dict[str, float]:
+    """Recency-weighted count of recent commits touching each file.
+
+    Paths are relative to repo_path. Returns an empty mapping when repo_path
+    is not in a git work tree or git is unavailable.
+    """
+    try:
+        result = subprocess.run(
+            [
+                "git",
+                "log",
+                f"-n{CHURN_MAX_COMMITS}",
+                "--no-merges",
+                "--name-only",
+                "--relative",
+                "--format=%x00",
+            ],
+            cwd=repo_path,
+            capture_output=True,
+            text=True,
+            encoding="utf-8",
+            errors="replace",
+            timeout=timeout,
+        )
+    except (OSError, subprocess.SubprocessError) as e:
+        logger.debug(f"git churn unavailable for {repo_path}: {e}")
+        return {}
+    if result.returncode != 0:
+        return {}
+
+    churn: Dict[str, float] = {}
+    for age, commit in enumerate(result.stdout.split("\x00")[1:]):
+        weight = CHURN_HALF_LIFE / (CHURN_HALF_LIFE + age)
+        for line in commit.splitlines():
+            line = line.strip()
+            if line:
+                churn[line] = churn.get(line, 0.0) + weight
+    return churn
+
+
+def score_files(
+    files_data: Sequence[Dict[str, Any]],
+    churn: Optional[Dict[str, float]] = None,
+) -> Dict[str, Dict[str, float]]:
+    """Importance score and its components for each file, keyed by posix path."""
+    graph = build_import_graph(files_data)
+    ranks = pagerank(graph)
+    distances = entry_point_distances(graph, find_entry_points(files_data, graph))
+    churn = churn or {}
+
+    max_rank = max(ranks.values(), default=0.0) or 1.0
+    max_churn = math.log1p(max(churn.values(), default=0.0)) or 1.0
+
+    scores: Dict[str, Dict[str, float]] = {}
+    for path in graph:
+        centrality = ranks.get(path, 0.0) / max_rank
+        distance = distances.get(path)
+        proximity = 0.0 if distance is None else 1.0 / (1 + distance)
+        recent = math.log1p(churn.get(path, 0.0)) / max_churn
+
+        if path.rsplit("/", 1)[-1].lower() in MANIFEST_NAMES and "/" not in path:
+            score = 1.0
+        else:
+            score = (
+                BASE_SCORE
+                + CENTRALITY_WEIGHT * centrality
+                + PROXIMITY_WEIGHT * proximity
+                + CHURN_WEIGHT * recent
+            )
+            if _is_test_file(path):
+                score *= TEST_FILE_FACTOR
+
+        scores[path] = {
+            "score": round(score, 4),
+            "centrality": round(centrality, 4),
+            "proximity": round(proximity, 4),
+            "churn": round(recent, 4),
+        }
+    return scores
+
+
+def knapsack_select(
+    values: Sequence[float], weights: Sequence[int], capacity: int
+) -> List[int]:
+    """Indices of items maximizing total value within capacity (0/1 knapsack).
+
+    Weights are scaled to at most KNAPSACK_BINS capacity units and rounded up,
+    so the selection never exceeds capacity; capacity lost to rounding is
+    then filled greedily by value density.
+    """
+    if capacity <= 0:
+        return []
+    unit = max(1, math.ceil(capacity / KNAPSACK_BINS))
+    bins = capacity // unit
+
+    candidates = [i for i, w in enumerate(weights) if w <= capacity and values[i] > 0]
+    best = [0.0] * (bins + 1)
+    keep: List[Tuple[int, int, bytes]] = []
+    for i in candidates:
+        w = max(1, math.ceil(weights[i] / unit))
+        if w > bins:
+            continue
+        v = values[i]
+        # best[c] for c >= w may improve by taking item i on top of best[c - w]
+        with_item = [b + v for b in best[: bins + 1 - w]]
+        taken = bytes(t > b for t, b in zip(with_item, best[w:]))
+        best[w:] = [t if k else b for t, b, k in zip(with_item, best[w:], taken)]
+        keep.append((i, w, taken))
+
+    selected: List[int] = []
+    c = bins
+    for i, w, taken in reversed(keep):
+        if c >= w and taken[c - w]:
+            selected.append(i)
+            c -= w
+
+    used = sum(weights[i] for i in selected)
+    chosen = set(selected)
+    rest = sorted(
+        (i for i in candidates if i not in chosen),
+        key=lambda i: values[i] / max(1, weights[i]),
+        reverse=True,
+    )
+    for i in rest:
+        if used + weights[i] <= capacity:
+            selected.append(i)
+            used += weights[i]
+    return sorted(selected)
+
+
+def select_files(
+    files_data: Sequence[Dict[str, Any]],
+    token_counts: Sequence[int],
+    max_tokens: int,
+    churn: Optional[Dict[str, float]] = None,
+) -> Tuple[List[int], Dict[str, Dict[str, float]]]:
+    """Pick the files that carry the most importance within max_tokens.
+
+    A file's value is its score times the square root of its token count:
+    larger files carry more context, with diminishing returns, so one big
+    module does not crowd out several central small ones.
+
+    Args:
+        files_data: Collected files (``path`` and ``content``)
+        token_counts: Tokens each file costs in the pack, aligned with
+            files_data
+        max_tokens: Token budget
+        churn: Per-path git churn from ``git_churn`` (optional)
+
+    Returns:
+        (indices of selected files in files_data order, scores by posix path)
+    """
+    scores = score_files(files_data, churn)
+    values = [
+        scores[_posix(f["path"])]["score"] * math.sqrt(max(1, tokens))
+        for f, tokens in zip(files_data, token_counts)
+    ]
+    return knapsack_select(values, list(token_counts), max_tokens), scores
@@ -0,0 +1,152 @@
+"""Precompiled multi-category pattern engine for text-rule scanners.
+
+Rule lists in this project are kept as raw regex strings grouped by category
+(logging patterns, bad stdout patterns, Linux-isms in PowerShell, ...).
+PatternSet compiles such a mapping once and offers two kinds of queries:
+
+- ``counts`` returns per-category match counts using the individually
+  precompiled patterns, which lets ``re`` use its literal-prefix search.
+- ``search``, ``finditer`` and ``matching_lines`` use a single alternation
+  with one named group per category, so a whole file is checked in one pass.
+  Line-oriented scanners use ``matching_lines`` as a prefilter and only run
+  their detailed per-line rules on the lines it yields.
+"""
+
+import re
+from typing import (
+    Dict,
+    Hashable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Pattern,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+# Flags that may be scoped to a single category via (?flags:...)
+_SCOPED_FLAGS = {
+    re.IGNORECASE: "i",
+    re.MULTILINE: "m",
+    re.DOTALL: "s",
+}
+
+
+class PatternSet:
+    """A set of regex categories compiled once for repeated scanning.
+
+    Example:
+        ```python
+        rules = PatternSet(
+            {"print": [r"^\\s*print\\s*\\("], "bare_except": [r"except\\s*:"]},
+            category_flags={"print": re.MULTILINE},
+        )
+        rules.counts(source)  # {"print": 2, "bare_except": 0}
+        ```
+    """
+
+    def __init__(
+        self,
+        categories: Mapping[Hashable, Union[str, Sequence[str]]],
+        flags: int = 0,
+        category_flags: Optional[Mapping[Hashable, int]] = None,
+    ):
+        """Compile the categories.
+
+        Args:
+            categories: Category key -> pattern or list of patterns. Patterns
+                must not define named groups of their own.
+            flags: Flags applied to every category
+            category_flags: Extra per-category flags (IGNORECASE, MULTILINE
+                or DOTALL only)
+        """
+        category_flags = category_flags or {}
+        self.keys: List[Hashable] = list(categories)
+        self._patterns: Dict[Hashable, List[Pattern]] = {}
+        self._group_keys: Dict[str, Hashable] = {}
+
+        alternatives = []
+        for index, key in enumerate(self.keys):
+            patterns = categories[key]
+            if isinstance(patterns, str):
+                patterns = [patterns]
+
+            scoped = category_flags.get(key, 0)
+            unsupported = scoped & ~(re.IGNORECASE | re.MULTILINE | re.DOTALL)
+            if unsupported:
+                raise ValueError(
+                    f"Unsupported per-category flags for {key!r}: {unsupported}"
+                )
+
+            self._patterns[key] = [re.compile(p, flags | scoped) for p in patterns]
+            if not patterns:
+                continue
+
+            group_name = f"c{index}"
+            self._group_keys[group_name] = key
+            body = "|".join(patterns)
+            inline = "".join(c for f, c in _SCOPED_FLAGS.items() if scoped & f)
+            if inline:
+                body = f"(?{inline}:{body})"
+            alternatives.append(f"(?P<{group_name}>{body})")
+
+        # A set with no patterns never matches
+        self.regex = re.compile("|".join(alternatives) or r"(?!)", flags)
+
+    def counts(self, text: str) -> Dict[Hashable, int]:
+        """Count matches per category.
+
+        Each pattern is counted independently, so a span matched by two
+        patterns counts for both (same as calling ``re.findall`` per pattern).
+        """
+        return {
+            key: sum(len(rx.findall(text)) for rx in patterns)
+            for key, patterns in self._patterns.items()
+        }
+
+    def finditer(self, text: str) -> Iterator[Tuple[Hashable, "re.Match[str]"]]:
+        """Yield (category, match) for each leftmost, non-overlapping match."""
+        group_keys = self._group_keys
+        for match in self.regex.finditer(text):
+            yield group_keys[match.lastgroup], match
+
+    def search(self, text: str) -> Optional[Tuple[Hashable, "re.Match[str]"]]:
+        """Return the first (category, match) in text, or None."""
+        match = self.regex.search(text)
+        if match is None:
+            return None
+        return self._group_keys[match.lastgroup], match
+
+    def matching_lines(self, text: str) -> Iterator[Tuple[int, str]]:
+        """Yield (line_number, line) for lines that contain at least one match.
+
+        Line numbers are 1-based and lines are split on "\\n", matching
+        ``text.split("\\n")``. A match that spans lines is reported on the line
+        where it starts.
+        """
+        regex = self.regex
+        pos = 0
+        line_no = 1
+        line_start = 0
+        length = len(text)
+
+        while pos <= length:
+            match = regex.search(text, pos)
+            if match is None:
+                return
+
+            start = match.start()
+            line_no += text.count("\n", line_start, start)
+            line_start = text.rfind("\n", 0, start) + 1
+            line_end = text.find("\n", start)
+            if line_end == -1:
+                line_end = length
+
+            yield line_no, text[line_start:line_end]
+
+            # Continue scanning from the next line
+            pos = line_end + 1
+            line_no += 1
+            line_start = pos
@@ -13,6 +13,8 @@ from typing import Any, Dict
 import structlog
 from fastmcp import FastMCP
 
+from .pattern_set import PatternSet
+
 logger = structlog.get_logger(__name__)
 
 # Common PowerShell syntax errors that LLMs suggest in PowerShell
@@ -217,6 +219,21 @@ SAFE_POWERSHELL_PATTERNS = {
     r"rsync\s+.*": "Copy-Item -Recurse",  # Native rsync
 }
 
+# Precompiled once; the combined set prefilters lines that need checking
+COMPILED_SYNTAX_ERRORS = [
+    re.compile(p, re.IGNORECASE) for p in POWERSHELL_SYNTAX_ERRORS
+]
+COMPILED_CMDLET_PATTERNS = [
+    re.compile(p, re.IGNORECASE) for p in POWERSHELL_CMDLET_PATTERNS
+]
+POWERSHELL_ISSUE_LINES = PatternSet(
+    {
+        "syntax_error": POWERSHELL_SYNTAX_ERRORS,
+        "cmdlet_pattern": POWERSHELL_CMDLET_PATTERNS,
+    },
+    flags=re.IGNORECASE,
+)
+
 
 class PowerShellSyntaxValidator:
     """PowerShell syntax validation and correction specialist."""
@@ -251,13 +268,12 @@ class PowerShellSyntaxValidator:
             try:
                 with open(file_path, "r", encoding="utf-8") as f:
                     content = f.read()
-                    lines = content.split("\n")
 
                 file_issues = []
-                for line_num, line in enumerate(lines, 1):
+                for line_num, line in POWERSHELL_ISSUE_LINES.matching_lines(content):
                     # Check for Linux command patterns
-                    for pattern in POWERSHELL_SYNTAX_ERRORS:
-                        matches = re.finditer(pattern, line, re.IGNORECASE)
+                    for compiled in COMPILED_SYNTAX_ERRORS:
+                        matches = compiled.finditer(line)
                         for match in matches:
                             # Determine issue type
                             if any(
@@ -308,8 +324,8 @@ class PowerShellSyntaxValidator:
                             )
 
                     # Check for PowerShell cmdlet usage patterns (NATIVE POWERSHELL BEST PRACTICE!)
-                    for pattern in POWERSHELL_CMDLET_PATTERNS:
-                        matches = re.finditer(pattern, line, re.IGNORECASE)
+                    for compiled in COMPILED_CMDLET_PATTERNS:
+                        matches = compiled.finditer(line)
                         for match in matches:
                             file_issues.append(
                                 {
@@ -320,15 +336,15 @@ class PowerShellSyntaxValidator:
                                 }
                             )
 
-                    if file_issues:
-                        files_with_issues += 1
-                        syntax_issues.append(
-                            {
-                                "file": str(file_path.relative_to(repo_path)),
-                                "issues": file_issues,
-                                "issue_count": len(file_issues),
-                            }
-                        )
+                if file_issues:
+                    files_with_issues += 1
+                    syntax_issues.append(
+                        {
+                            "file": str(file_path.relative_to(repo_path)),
+                            "issues": file_issues,
+                            "issue_count": len(file_issues),
+                        }
+                    )
 
             except Exception as e:
                 syntax_issues.append(
@@ -0,0 +1,56 @@
+"""Process pools for CPU-bound scans.
+
+The API server runs several threads (uvicorn, the repo watcher,
+``asyncio.to_thread`` workers). Forking such a process copies every lock
+another thread happens to hold, such as ``scan_cache._lock``, into the child
+in its locked state, and a worker that then takes that lock hangs forever.
+
+Workers are therefore started by a ``forkserver``: a single-threaded process
+started once, which forks each worker from a clean state. The modules whose
+functions run in the pool are preloaded into it, so a worker costs a fork
+rather than an interpreter start and imports. Where ``forkserver`` is not
+available (Windows, for one) workers are spawned as fresh interpreters.
+"""
+
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Optional, Set, Tuple
+
+# Start method for worker processes; "fork" is unsafe in a threaded server
+START_METHOD = (
+    "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+)
+
+_preload: Set[str] = set()
+
+
+def process_pool(
+    max_workers: int,
+    preload: str,
+    initializer: Optional[Callable[..., Any]] = None,
+    initargs: Tuple[Any, ...] = (),
+) -> ProcessPoolExecutor:
+    """A process pool whose workers do not inherit the parent's thread state.
+
+    Workers do not see changes the parent made to module state after import
+    either; pass what they need through initializer.
+
+    Args:
+        max_workers: Worker processes
+        preload: Module defining the functions submitted to the pool; it is
+            imported into the fork server (when that has not started yet)
+        initializer: Called with initargs in each worker before any task
+
+    Functions submitted to the pool must be module-level functions, and their
+    arguments picklable.
+    """
+    context = multiprocessing.get_context(START_METHOD)
+    if START_METHOD == "forkserver" and preload not in _preload:
+        _preload.add(preload)
+        context.set_forkserver_preload(sorted(_preload))
+    return ProcessPoolExecutor(
+        max_workers=max_workers,
+        mp_context=context,
+        initializer=initializer,
+        initargs=initargs,
+    )
@@ -0,0 +1,319 @@
+"""Asyncio supervisor for MCP server processes.
+
+``SupervisedProcess`` owns one server process and everything needed to keep
+it healthy without ever blocking the event loop:
+
+- stdout belongs to the process's ``JsonRpcConnection``; anything on it that
+  is not protocol traffic, and everything on stderr, is drained continuously
+  into bounded ring buffers, so a chatty server never stalls on a full pipe.
+- CPU, RSS, thread count and open file descriptors are sampled from
+  ``/proc`` (Linux) at a fixed interval, with a short history.
+- When the process exits on its own, a ``RestartPolicy`` decides whether to
+  respawn it, after an exponential backoff.
+"""
+
+import asyncio
+import os
+import time
+from collections import deque
+from dataclasses import asdict, dataclass
+from typing import Any, Deque, Dict, List, Optional
+
+import structlog
+
+from .jsonrpc_stdio import STREAM_LIMIT, JsonRpcConnection
+
+logger = structlog.get_logger(__name__)
+
+# Lines of output kept per stream
+OUTPUT_TAIL_LINES = 200
+# Seconds between resource samples, and samples kept
+SAMPLE_INTERVAL = 5.0
+SAMPLE_HISTORY = 60
+STOP_TIMEOUT = 5.0
+
+PROC_ROOT = "/proc"
+try:
+    CLOCK_TICKS = os.sysconf("SC_CLK_TCK")
+except (AttributeError, ValueError, OSError):  # Not a POSIX system
+    CLOCK_TICKS = 100
+
+RESTART_MODES = ("never", "on-failure", "always")
+
+
+@dataclass
+class RestartPolicy:
+    """When and how fast to respawn a server that exited on its own.
+
+    Attributes:
+        mode: "never", "on-failure" (non-zero exit codes) or "always"
+        max_restarts: Consecutive restarts before giving up
+        backoff_initial: Seconds to wait before the first restart
+        backoff_factor: Multiplier applied to the wait for each further restart
+        backoff_max: Upper bound on the wait
+        reset_after: Seconds a process must stay up for the consecutive
+            restart count to reset
+    """
+
+    mode: str = "on-failure"
+    max_restarts: int = 5
+    backoff_initial: float = 1.0
+    backoff_factor: float = 2.0
+    backoff_max: float = 30.0
+    reset_after: float = 60.0
+
+    def __post_init__(self):
+        if self.mode not in RESTART_MODES:
+            raise ValueError(f"Unknown restart policy: {self.mode}")
+
+    def should_restart(self, exit_code: Optional[int], restarts: int) -> bool:
+        if self.mode == "never" or restarts >= self.max_restarts:
+            return False
+        return self.mode == "always" or exit_code != 0
+
+    def delay(self, restarts: int) -> float:
+        """Backoff before restart number restarts + 1."""
+        return min(self.backoff_max, self.backoff_initial * self.backoff_factor ** restarts)
+
+
+def sample_process(pid: int) -> Optional[Dict[str, Any]]:
+    """Read a process's CPU time, memory, threads and open FDs from /proc.
+
+    Returns:
+        The raw sample, or None if /proc is unavailable or the process is gone
+    """
+    base = os.path.join(PROC_ROOT, str(pid))
+    try:
+        with open(os.path.join(base, "stat"), "rb") as f:
+            stat = f.read()
+        # The command name may contain spaces and parentheses; fields
+        # resume after the last ')'
+        fields = stat[stat.rindex(b")") + 2:].split()
+        rss_kb = 0
+        with open(os.path.join(base, "status"), "rb") as f:
+            for line in f:
+                if line.startswith(b"VmRSS:"):
+                    rss_kb = int(line.split()[1])
+                    break
+        try:
+            open_fds: Optional[int] = len(os.listdir(os.path.join(base, "fd")))
+        except PermissionError:
+            open_fds = None
+    except (OSError, ValueError, IndexError):
+        return None
+
+    return {
+        "time": time.monotonic(),
+        "cpu_seconds": (int(fields[11]) + int(fields[12])) / CLOCK_TICKS,
+        "rss_bytes": rss_kb * 1024,
+        "threads": int(fields[17]),
+        "open_fds": open_fds,
+    }
+
+
+class SupervisedProcess:
+    """One supervised server process with its JSON-RPC connection.
+
+    Example:
+        ```python
+        supervisor = SupervisedProcess("echo", [sys.executable, "server.py"], cwd=".")
+        await supervisor.start()
+        result = await supervisor.connection.call_tool("add", {"a": 1, "b": 2})
+        await supervisor.stop()
+        ```
+    """
+
+    def __init__(
+        self,
+        name: str,
+        cmd: List[str],
+        cwd: Optional[str] = None,
+        policy: Optional[RestartPolicy] = None,
+        sample_interval: float = SAMPLE_INTERVAL,
+        tail_lines: int = OUTPUT_TAIL_LINES,
+    ):
+        """
+        Args:
+            name: Label used in logs and for the connection
+            cmd: Command line of the server
+            cwd: Working directory of the server
+            policy: Restart policy (default: restart on failure)
+            sample_interval: Seconds between resource samples
+            tail_lines: Lines kept per output ring buffer
+        """
+        self.name = name
+        self.cmd = cmd
+        self.cwd = cwd
+        self.policy = policy or RestartPolicy()
+        self.sample_interval = sample_interval
+        self.process: Optional[asyncio.subprocess.Process] = None
+        self.connection: Optional[JsonRpcConnection] = None
+        self.state = "created"
+        self.restarts = 0
+        self.total_restarts = 0
+        self.started_at: Optional[float] = None
+        self.next_restart_at: Optional[float] = None
+        self.exits: Deque[Dict[str, Any]] = deque(maxlen=10)
+        self.stderr_tail: Deque[str] = deque(maxlen=tail_lines)
+        self.stdout_tail: Deque[str] = deque(maxlen=tail_lines)
+        self.samples: Deque[Dict[str, Any]] = deque(maxlen=SAMPLE_HISTORY)
+        self.peak_rss_bytes = 0
+        self._last_raw: Optional[Dict[str, Any]] = None
+        self._stopping = False
+        self._drain_task: Optional[asyncio.Task] = None
+        self._supervise_task: Optional[asyncio.Task] = None
+        self._sample_task: Optional[asyncio.Task] = None
+
+    @property
+    def is_alive(self) -> bool:
+        return self.process is not None and self.process.returncode is None
+
+    async def start(self) -> None:
+        """Spawn the process and begin supervising it."""
+        await self._spawn()
+        self._supervise_task = asyncio.create_task(self._supervise())
+        if self.sample_interval > 0:
+            self._sample_task = asyncio.create_task(self._sample_loop())
+
+    async def stop(self, timeout: float = STOP_TIMEOUT) -> None:
+        """Stop supervising and shut the process down (terminate, then kill)."""
+        self._stopping = True
+        for task in (self._supervise_task, self._sample_task):
+            if task is not None:
+                task.cancel()
+        if self.connection is not None:
+            await self.connection.close()
+
+        process = self.process
+        if process is not None and process.returncode is None:
+            try:
+                process.terminate()
+                await asyncio.wait_for(process.wait(), timeout=timeout)
+            except ProcessLookupError:
+                pass
+            except asyncio.TimeoutError:
+                process.kill()
+                await process.wait()
+
+        if self._drain_task is not None:
+            self._drain_task.cancel()
+        self.state = "stopped"
+
+    def status(self) -> Dict[str, Any]:
+        """Process state, restart history, output tails and resource usage."""
+        process = self.process
+        now = time.monotonic()
+        return {
+            "state": self.state,
+            "pid": process.pid if process else None,
+            "is_alive": self.is_alive,
+            "exit_code": process.returncode if process else None,
+            "uptime_s": round(now - self.started_at, 1) if self.started_at and self.is_alive else None,
+            "restart_policy": asdict(self.policy),
+            "restarts": self.restarts,
+            "total_restarts": self.total_restarts,
+            "next_restart_in_s": (
+                round(max(0.0, self.next_restart_at - now), 1) if self.next_restart_at else None
+            ),
+            "recent_exits": list(self.exits),
+            "resources": self.samples[-1] if self.samples else None,
+            "peak_rss_bytes": self.peak_rss_bytes or None,
+            "resource_history": list(self.samples),
+            "stderr_tail": list(self.stderr_tail),
+            "stdout_tail": list(self.stdout_tail),
+        }
+
+    async def _spawn(self) -> None:
+        self.process = await asyncio.create_subprocess_exec(
+            *self.cmd,
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            cwd=self.cwd,
+            limit=STREAM_LIMIT,
+        )
+        self.connection = JsonRpcConnection(
+            self.process, name=self.name, stray_output=self.stdout_tail
+        )
+        self._drain_task = asyncio.create_task(self._drain(self.process.stderr, self.stderr_tail))
+        self.started_at = time.monotonic()
+        self.next_restart_at = None
+        self._last_raw = None
+        self.state = "starting"
+
+    async def _drain(self, stream: asyncio.StreamReader, tail: Deque[str]) -> None:
+        """Keep reading a pipe so the server never blocks on a full buffer."""
+        while True:
+            try:
+                line = await stream.readline()
+            except ValueError:
+                # Overlong line; the stream has already discarded it
+                continue
+            if not line:
+                return
+            tail.append(line.decode("utf-8", "replace").rstrip())
+
+    async def _supervise(self) -> None:
+        """Wait for the process to exit and apply the restart policy."""
+        while True:
+            exit_code = await self.process.wait()
+            uptime = time.monotonic() - self.started_at
+            self.exits.append({
+                "exit_code": exit_code,
+                "uptime_s": round(uptime, 1),
+                "timestamp": time.time(),
+            })
+            if self._stopping:
+                return
+
+            if uptime >= self.policy.reset_after:
+                self.restarts = 0
+            if not self.policy.should_restart(exit_code, self.restarts):
+                self.state = "exited" if exit_code == 0 else "failed"
+                logger.info(f"Server {self.name} exited with code {exit_code}")
+                return
+
+            delay = self.policy.delay(self.restarts)
+            self.state = "backoff"
+            self.next_restart_at = time.monotonic() + delay
+            logger.warning(
+                f"Server {self.name} exited with code {exit_code}, "
+                f"restarting in {delay:.1f}s"
+            )
+            await asyncio.sleep(delay)
+
+            self.restarts += 1
+            self.total_restarts += 1
+            try:
+                await self._spawn()
+            except Exception as e:
+                self.state = "failed"
+                logger.error(f"Failed to restart server {self.name}: {e}")
+                return
+
+    async def _sample_loop(self) -> None:
+        while True:
+            if self.is_alive:
+                self._record_sample(sample_process(self.process.pid))
+            await asyncio.sleep(self.sample_interval)
+
+    def _record_sample(self, raw: Optional[Dict[str, Any]]) -> None:
+        """Turn a raw /proc reading into a sample with CPU percent."""
+        if raw is None:
+            return
+        cpu_percent = None
+        previous = self._last_raw
+        if previous is not None and raw["time"] > previous["time"]:
+            cpu_percent = round(
+                100 * (raw["cpu_seconds"] - previous["cpu_seconds"]) / (raw["time"] - previous["time"]), 1
+            )
+        self._last_raw = raw
+        self.peak_rss_bytes = max(self.peak_rss_bytes, raw["rss_bytes"])
+        self.samples.append({
+            "timestamp": time.time(),
+            "cpu_percent": cpu_percent,
+            "cpu_seconds": round(raw["cpu_seconds"], 2),
+            "rss_bytes": raw["rss_bytes"],
+            "threads": raw["threads"],
+            "open_fds": raw["open_fds"],
+        })
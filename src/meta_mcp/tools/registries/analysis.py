@@ -1,29 +1,28 @@
 from typing import Any, Dict, List, Optional, Union
 from fastmcp import FastMCP
-from meta_mcp.services.analysis_service import AnalysisService
-from meta_mcp.tools.repomix_analyzer import RepomixAnalysisService
+from meta_mcp.registry import lazy_service
 # Import the renamed MCP repo analyzer
 
 
 def register_analysis_tools(mcp: FastMCP):
     """Register analysis tool suite with FastMCP."""
 
-    service = AnalysisService()
-    repomix_service = RepomixAnalysisService()
+    service = lazy_service("meta_mcp.services.analysis_service", "AnalysisService")
+    repomix_service = lazy_service("meta_mcp.tools.repomix_analyzer", "RepomixAnalysisService")
 
     @mcp.tool(name="analyze_runts")
     async def analyze_runts_tool(
         scan_path: Optional[str] = None, format: str = "json"
     ) -> Union[Dict[str, Any], str]:
         """Analyze path for MCP repositories and identify runts needing upgrades."""
-        return await service.analyze_repositories(scan_path=scan_path, format=format)
+        return await service().analyze_repositories(scan_path=scan_path, format=format)
 
     @mcp.tool(name="get_repo_status")
     async def get_repo_status_tool(
         repo_path: str, format: str = "json"
     ) -> Union[Dict[str, Any], str]:
         """Get detailed SOTA status for a specific MCP repository."""
-        return await service.analyze_single_repo(repo_path, format=format)
+        return await service().analyze_single_repo(repo_path, format=format)
 
     @mcp.tool(name="analyze_with_repomix")
     async def analyze_with_repomix_tool(
@@ -49,7 +48,7 @@ def register_analysis_tools(mcp: FastMCP):
         Returns:
             Comprehensive analysis results with repository insights and recommendations
         """
-        return await repomix_service.analyze_with_repomix(
+        return await repomix_service().analyze_with_repomix(
             repo_path=repo_path,
             analysis_type=analysis_type,
             include_patterns=include_patterns,
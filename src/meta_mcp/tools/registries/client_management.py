@@ -1,12 +1,12 @@
 from typing import Any, Dict, List
 from fastmcp import FastMCP
-from meta_mcp.services.client_settings_manager import ClientSettingsManager
+from meta_mcp.registry import lazy_service
 
 
 def register_client_management_tools(mcp: FastMCP):
     """Register client management tool suite with FastMCP."""
 
-    service = ClientSettingsManager()
+    service = lazy_service("meta_mcp.services.client_settings_manager", "ClientSettingsManager")
 
     @mcp.tool(name="read_client_config")
     async def read_client_config(client_name: str) -> Dict[str, Any]:
@@ -18,7 +18,7 @@ def register_client_management_tools(mcp: FastMCP):
         Returns:
             Client configuration and MCP servers
         """
-        return await service.read_client_config(client_name)
+        return await service().read_client_config(client_name)
 
     @mcp.tool(name="update_client_config")
     async def update_client_config(client_name: str, updates: Dict[str, Any], backup: bool = True) -> Dict[str, Any]:
@@ -32,7 +32,7 @@ def register_client_management_tools(mcp: FastMCP):
         Returns:
             Update status and backup information
         """
-        return await service.update_client_config(client_name, updates, backup)
+        return await service().update_client_config(client_name, updates, backup)
 
     @mcp.tool(name="add_server_to_client")
     async def add_server_to_client(client_name: str, server_name: str, server_config: Dict[str, Any]) -> Dict[str, Any]:
@@ -46,7 +46,7 @@ def register_client_management_tools(mcp: FastMCP):
         Returns:
             Server addition status
         """
-        return await service.add_server_to_client(client_name, server_name, server_config)
+        return await service().add_server_to_client(client_name, server_name, server_config)
 
     @mcp.tool(name="remove_server_from_client")
     async def remove_server_from_client(client_name: str, server_name: str) -> Dict[str, Any]:
@@ -59,7 +59,7 @@ def register_client_management_tools(mcp: FastMCP):
         Returns:
             Server removal status
         """
-        return await service.remove_server_from_client(client_name, server_name)
+        return await service().remove_server_from_client(client_name, server_name)
 
     @mcp.tool(name="validate_client_config")
     async def validate_client_config(client_name: str) -> Dict[str, Any]:
@@ -71,7 +71,7 @@ def register_client_management_tools(mcp: FastMCP):
         Returns:
             Validation results with errors and warnings
         """
-        return await service.validate_client_config(client_name)
+        return await service().validate_client_config(client_name)
 
     @mcp.tool(name="list_client_configs")
     async def list_client_configs() -> Dict[str, Any]:
@@ -80,4 +80,4 @@ def register_client_management_tools(mcp: FastMCP):
         Returns:
             List of client configurations with status
         """
-        return await service.list_client_configs()
\ No newline at end of file
+        return await service().list_client_configs()
\ No newline at end of file
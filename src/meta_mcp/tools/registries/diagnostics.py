@@ -1,12 +1,12 @@
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 from fastmcp import FastMCP, Context
-from meta_mcp.services.diagnostics_service import DiagnosticsService
+from meta_mcp.registry import lazy_service
 
 
 def register_diagnostics_tools(mcp: FastMCP):
     """Register diagnostic tool suite with FastMCP."""
 
-    service = DiagnosticsService()
+    service = lazy_service("meta_mcp.services.diagnostics_service", "DiagnosticsService")
 
     @mcp.tool(name="emojibuster")
     async def emojibuster(
@@ -19,11 +19,11 @@ def register_diagnostics_tools(mcp: FastMCP):
     ) -> Dict[str, Any]:
         """SOTA EmojiBuster for Unicode crash prevention."""
         if operation == "fix" and not auto_fix:
-            return service.create_response(
+            return service().create_response(
                 False, "Auto-fix requires confirmation. Set auto_fix=True."
             )
 
-        return await service.run_emojibuster(
+        return await service().run_emojibuster(
             operation, repo_path, scan_mode=scan_mode, backup=backup
         )
 
@@ -35,6 +35,38 @@ def register_diagnostics_tools(mcp: FastMCP):
         include_aliases: bool = True,
     ) -> Dict[str, Any]:
         """PowerShell management and validation tool."""
-        return await service.run_powershell_tools(
+        return await service().run_powershell_tools(
             operation, repo_path, scan_mode=scan_mode, include_aliases=include_aliases
         )
+
+    @mcp.tool(name="load_test_server")
+    async def load_test_server(
+        server_path: str,
+        sessions: int = 4,
+        duration: float = 10.0,
+        tool_mix: Optional[List[Dict[str, Any]]] = None,
+        seed: Optional[int] = None,
+        output_path: Optional[str] = None,
+        baseline_path: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Load test an MCP server and report per-tool latency percentiles.
+
+        Args:
+            server_path: Path to the server entry point (e.g., server.py)
+            sessions: Concurrent stdio sessions to hold open
+            duration: Seconds to replay tool calls for
+            tool_mix: Weighted calls, e.g. [{"tool": "add", "arguments": {...}, "weight": 2}];
+                defaults to the smoke test tool
+            seed: Seed for the call mix, for repeatable runs
+            output_path: JSON file for the results (default ~/.mcp-studio/load-tests)
+            baseline_path: Earlier results file to flag regressions against
+        """
+        return await service().run_load_test(
+            server_path,
+            sessions=sessions,
+            duration=duration,
+            tool_mix=tool_mix,
+            seed=seed,
+            output_path=output_path,
+            baseline_path=baseline_path,
+        )
@@ -1,17 +1,18 @@
 from typing import Any, Dict, List, Optional
 from fastmcp import FastMCP
-from meta_mcp.services.repo_packing_service import RepoPackingService
+from meta_mcp.registry import lazy_service
 
 
 def register_repo_packing_tools(mcp: FastMCP):
     """Register repository packing tool suite with FastMCP."""
 
-    service = RepoPackingService()
+    service = lazy_service("meta_mcp.services.repo_packing_service", "RepoPackingService")
 
     @mcp.tool(name="pack_repository")
     async def pack_repository(repo_path: str, output_format: str = "xml",
                             include_patterns: Optional[List[str]] = None,
-                            exclude_patterns: Optional[List[str]] = None) -> Dict[str, Any]:
+                            exclude_patterns: Optional[List[str]] = None,
+                            compress: bool = False) -> Dict[str, Any]:
         """Pack repository contents into a single AI-friendly file.
 
         Inspired by repomix, this creates a consolidated view of repository
@@ -22,14 +23,17 @@ def register_repo_packing_tools(mcp: FastMCP):
             output_format: Output format - "xml", "markdown", "json", or "plain"
             include_patterns: Glob patterns for files to include
             exclude_patterns: Glob patterns for files to exclude
+            compress: Reduce Python files to signatures, docstrings and
+                declarations (no Node/repomix needed), with a line map back
+                to the original line numbers
 
         Returns:
             Packed repository content with metadata and token analysis
         """
-        return await service.pack_repository(repo_path, output_format, include_patterns, exclude_patterns)
+        return await service().pack_repository(repo_path, output_format, include_patterns, exclude_patterns, compress)
 
     @mcp.tool(name="pack_repository_for_ai")
-    async def pack_repository_for_ai(repo_path: str, max_tokens: int = 100000) -> Dict[str, Any]:
+    async def pack_repository_for_ai(repo_path: str, max_tokens: int = 100000, compress: bool = False) -> Dict[str, Any]:
         """Pack repository optimized for AI consumption with token limits.
 
         Automatically optimizes file selection and content to fit within
@@ -38,8 +42,78 @@ def register_repo_packing_tools(mcp: FastMCP):
         Args:
             repo_path: Path to the repository to pack
             max_tokens: Maximum token count for the packed output
+            compress: Pack Python files as signatures only before selecting
 
         Returns:
             AI-optimized repository package with token analysis and compression info
         """
-        return await service.pack_for_ai_consumption(repo_path, max_tokens)
\ No newline at end of file
+        return await service().pack_for_ai_consumption(repo_path, max_tokens, compress)
+
+    @mcp.tool(name="pack_repository_to_file")
+    async def pack_repository_to_file(repo_path: str, output_path: str, output_format: str = "xml",
+                                      include_patterns: Optional[List[str]] = None,
+                                      exclude_patterns: Optional[List[str]] = None,
+                                      compress: bool = False) -> Dict[str, Any]:
+        """Pack repository contents straight into a file.
+
+        Files are streamed through the formatter to disk one at a time, so
+        memory stays flat for repositories of any size.
+
+        Args:
+            repo_path: Path to the repository to pack
+            output_path: File to write the packed repository to
+            output_format: Output format - "xml", "markdown", "json", or "plain"
+            include_patterns: Glob patterns for files to include
+            exclude_patterns: Glob patterns for files to exclude
+            compress: Reduce Python files to signatures only
+
+        Returns:
+            Output path, bytes written, file count and token count
+        """
+        return await service().write_pack(repo_path, output_path, output_format, include_patterns, exclude_patterns,
+                                        compress=compress)
+
+    @mcp.tool(name="pack_repositories_to_store")
+    async def pack_repositories_to_store(repo_paths: List[str], manifest_path: Optional[str] = None,
+                                         include_patterns: Optional[List[str]] = None,
+                                         exclude_patterns: Optional[List[str]] = None,
+                                         compress: bool = False,
+                                         store_path: Optional[str] = None) -> Dict[str, Any]:
+        """Pack repositories into a content-addressed blob store.
+
+        Identical files across repositories (templates, LICENSE, CI workflows)
+        are stored once; the manifest references them by hash. Re-packing
+        only writes content the store has not seen.
+
+        Args:
+            repo_paths: Repositories to pack into one manifest
+            manifest_path: File to write the manifest to (returned inline if omitted)
+            include_patterns: Glob patterns for files to include
+            exclude_patterns: Glob patterns for files to exclude
+            compress: Store Python files as signatures only
+            store_path: Blob store directory (default ~/.mcp-studio/blob-store)
+
+        Returns:
+            Manifest (or its path) with deduplication and reuse statistics
+        """
+        return await service().pack_to_store(repo_paths, manifest_path, include_patterns, exclude_patterns,
+                                           compress, store_path)
+
+    @mcp.tool(name="unpack_manifest")
+    async def unpack_manifest(manifest_path: str, output_format: str = "xml",
+                              repository: Optional[str] = None,
+                              output_path: Optional[str] = None,
+                              store_path: Optional[str] = None) -> Dict[str, Any]:
+        """Render one repository of a pack manifest from the blob store.
+
+        Args:
+            manifest_path: Manifest written by pack_repositories_to_store
+            output_format: Output format - "xml", "markdown", "json", or "plain"
+            repository: Name or path of the repository (default: the first)
+            output_path: Write the pack to this file instead of returning it
+            store_path: Blob store directory (default ~/.mcp-studio/blob-store)
+
+        Returns:
+            Packed repository content, or the output path and bytes written
+        """
+        return await service().unpack_manifest(manifest_path, output_format, repository, output_path, store_path)
@@ -1,12 +1,12 @@
 from typing import Any, Dict
 from fastmcp import FastMCP
-from meta_mcp.services.repo_scanner_service import RepoScannerService
+from meta_mcp.registry import lazy_service
 
 
 def register_repository_analysis_tools(mcp: FastMCP):
     """Register repository analysis tool suite with FastMCP."""
 
-    service = RepoScannerService()
+    service = lazy_service("meta_mcp.services.repo_scanner_service", "RepoScannerService")
 
     @mcp.tool(name="scan_repository_deep")
     async def scan_repository_deep(repo_path: str, deep_analysis: bool = False) -> Dict[str, Any]:
@@ -22,4 +22,4 @@ def register_repository_analysis_tools(mcp: FastMCP):
         Returns:
             Comprehensive repository analysis report
         """
-        return await service.scan_repository(repo_path, deep_analysis)
\ No newline at end of file
+        return await service().scan_repository(repo_path, deep_analysis)
\ No newline at end of file
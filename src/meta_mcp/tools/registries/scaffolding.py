@@ -1,5 +1,5 @@
 from fastmcp import FastMCP, Context
-from meta_mcp.services.scaffolding_service import ScaffoldingService
+from meta_mcp.registry import lazy_service
 from meta_mcp.models.scaffolding import FullstackAppConfig, LandingPageConfig
 from typing import Dict, Any
 
@@ -7,21 +7,21 @@ from typing import Dict, Any
 def register_scaffolding_tools(mcp: FastMCP):
     """Register scaffolding tool suite with FastMCP."""
 
-    service = ScaffoldingService()
+    service = lazy_service("meta_mcp.services.scaffolding_service", "ScaffoldingService")
 
     @mcp.tool(name="create_fullstack_app")
     async def create_fullstack_app(
         config: FullstackAppConfig, ctx: Context
     ) -> Dict[str, Any]:
         """Create a fullstack FastAPI + React application via interactive elicitation."""
-        return await service.create_fullstack_app(config, ctx)
+        return await service().create_fullstack_app(config, ctx)
 
     @mcp.tool(name="create_landing_page")
     async def create_landing_page(
         config: LandingPageConfig, ctx: Context
     ) -> Dict[str, Any]:
         """Create a stunning, responsive landing page via interactive elicitation."""
-        return await service.create_landing_page(config, ctx)
+        return await service().create_landing_page(config, ctx)
 
     @mcp.tool(name="create_mcp_server")
     async def create_mcp_server(
@@ -43,7 +43,7 @@ def register_scaffolding_tools(mcp: FastMCP):
         include_prompts: bool = True,
     ) -> Dict[str, Any]:
         """Scaffold a new SOTA-compliant MCP server repository."""
-        return await service.create_mcp_server(
+        return await service().create_mcp_server(
             name=name,
             description=description,
             author=author,
@@ -65,14 +65,14 @@ def register_scaffolding_tools(mcp: FastMCP):
     @mcp.tool(name="create_webshop")
     async def create_webshop(config: Any, ctx: Context) -> Dict[str, Any]:
         """Create a fullstack webshop application via interactive elicitation."""
-        return await service.create_webshop(config, ctx)
+        return await service().create_webshop(config, ctx)
 
     @mcp.tool(name="create_game")
     async def create_game(config: Any, ctx: Context) -> Dict[str, Any]:
         """Create a browser-based game via interactive elicitation."""
-        return await service.create_game(config, ctx)
+        return await service().create_game(config, ctx)
 
     @mcp.tool(name="create_wisdom_tree")
     async def create_wisdom_tree(config: Any, ctx: Context) -> Dict[str, Any]:
         """Create an interactive wisdom tree via interactive elicitation."""
-        return await service.create_wisdom_tree(config, ctx)
+        return await service().create_wisdom_tree(config, ctx)
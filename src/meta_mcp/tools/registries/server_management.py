@@ -1,25 +1,30 @@
 from typing import Any, Dict, List, Optional
 from fastmcp import FastMCP
-from meta_mcp.services.server_service import ServerService
+from meta_mcp.registry import lazy_service
 
 
 def register_server_management_tools(mcp: FastMCP):
     """Register server management tool suite with FastMCP."""
 
-    service = ServerService()
+    service = lazy_service("meta_mcp.services.server_service", "get_server_service")
 
     @mcp.tool(name="start_mcp_server")
-    async def start_mcp_server(server_path: str, server_type: str = "python") -> Dict[str, Any]:
+    async def start_mcp_server(server_path: str, server_type: str = "python",
+                               restart_policy: str = "on-failure",
+                               max_restarts: int = 5) -> Dict[str, Any]:
         """Start an MCP server process.
 
         Args:
             server_path: Path to the MCP server file
             server_type: Type of server (python, node, etc.)
+            restart_policy: Respawn the server when it exits on its own:
+                "never", "on-failure" or "always" (with exponential backoff)
+            max_restarts: Consecutive restarts before giving up
 
         Returns:
             Server startup status and information
         """
-        return await service.start_server(server_path, server_type)
+        return await service().start_server(server_path, server_type, restart_policy, max_restarts)
 
     @mcp.tool(name="stop_mcp_server")
     async def stop_mcp_server(server_id: str) -> Dict[str, Any]:
@@ -31,7 +36,7 @@ def register_server_management_tools(mcp: FastMCP):
         Returns:
             Server shutdown status
         """
-        return await service.stop_server(server_id)
+        return await service().stop_server(server_id)
 
     @mcp.tool(name="list_running_servers")
     async def list_running_servers() -> Dict[str, Any]:
@@ -40,7 +45,7 @@ def register_server_management_tools(mcp: FastMCP):
         Returns:
             List of running servers with their status
         """
-        return await service.list_running_servers()
+        return await service().list_running_servers()
 
     @mcp.tool(name="get_server_status")
     async def get_server_status(server_id: str) -> Dict[str, Any]:
@@ -52,4 +57,4 @@ def register_server_management_tools(mcp: FastMCP):
         Returns:
             Detailed server status information
         """
-        return await service.get_server_status(server_id)
\ No newline at end of file
+        return await service().get_server_status(server_id)
\ No newline at end of file
@@ -1,12 +1,12 @@
 from typing import Any, Dict, List, Optional
 from fastmcp import FastMCP
-from meta_mcp.services.token_analysis_service import TokenAnalysisService
+from meta_mcp.registry import lazy_service
 
 
 def register_token_analysis_tools(mcp: FastMCP):
     """Register token analysis tool suite with FastMCP."""
 
-    service = TokenAnalysisService()
+    service = lazy_service("meta_mcp.services.token_analysis_service", "TokenAnalysisService")
 
     @mcp.tool(name="analyze_file_tokens")
     async def analyze_file_tokens(file_path: str) -> Dict[str, Any]:
@@ -18,7 +18,7 @@ def register_token_analysis_tools(mcp: FastMCP):
         Returns:
             Token analysis including count, language detection, and metrics
         """
-        return await service.analyze_file_tokens(file_path)
+        return await service().analyze_file_tokens(file_path)
 
     @mcp.tool(name="analyze_directory_tokens")
     async def analyze_directory_tokens(dir_path: str, extensions: Optional[List[str]] = None) -> Dict[str, Any]:
@@ -31,7 +31,7 @@ def register_token_analysis_tools(mcp: FastMCP):
         Returns:
             Comprehensive token analysis with distribution statistics
         """
-        return await service.analyze_directory_tokens(dir_path, extensions)
+        return await service().analyze_directory_tokens(dir_path, extensions)
 
     @mcp.tool(name="estimate_context_limits")
     async def estimate_context_limits(token_count: int) -> Dict[str, Any]:
@@ -43,4 +43,4 @@ def register_token_analysis_tools(mcp: FastMCP):
         Returns:
             Compatibility analysis across major LLM models with recommendations
         """
-        return await service.estimate_context_limits(token_count)
\ No newline at end of file
+        return await service().estimate_context_limits(token_count)
\ No newline at end of file
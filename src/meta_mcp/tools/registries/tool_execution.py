@@ -1,12 +1,12 @@
 from typing import Any, Dict, List, Optional
 from fastmcp import FastMCP
-from meta_mcp.services.tool_service import ToolService
+from meta_mcp.registry import lazy_service
 
 
 def register_tool_execution_tools(mcp: FastMCP):
     """Register tool execution tool suite with FastMCP."""
 
-    service = ToolService()
+    service = lazy_service("meta_mcp.services.tool_service", "ToolService")
 
     @mcp.tool(name="execute_server_tool")
     async def execute_server_tool(server_id: str, tool_name: str, parameters: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
@@ -20,7 +20,7 @@ def register_tool_execution_tools(mcp: FastMCP):
         Returns:
             Tool execution result
         """
-        return await service.execute_tool(server_id, tool_name, parameters or {})
+        return await service().execute_tool(server_id, tool_name, parameters or {})
 
     @mcp.tool(name="list_server_tools")
     async def list_server_tools(server_id: str) -> Dict[str, Any]:
@@ -32,7 +32,7 @@ def register_tool_execution_tools(mcp: FastMCP):
         Returns:
             List of available tools with their descriptions
         """
-        return await service.list_server_tools(server_id)
+        return await service().list_server_tools(server_id)
 
     @mcp.tool(name="validate_tool_parameters")
     async def validate_tool_parameters(server_id: str, tool_name: str, parameters: Dict[str, Any]) -> Dict[str, Any]:
@@ -46,7 +46,7 @@ def register_tool_execution_tools(mcp: FastMCP):
         Returns:
             Validation result with any errors
         """
-        return await service.validate_tool_parameters(server_id, tool_name, parameters)
+        return await service().validate_tool_parameters(server_id, tool_name, parameters)
 
     @mcp.tool(name="get_tool_execution_history")
     async def get_tool_execution_history(server_id: str, tool_name: Optional[str] = None, limit: int = 10) -> Dict[str, Any]:
@@ -60,4 +60,4 @@ def register_tool_execution_tools(mcp: FastMCP):
         Returns:
             Tool execution history
         """
-        return await service.get_tool_history(server_id, tool_name, limit)
\ No newline at end of file
+        return await service().get_tool_history(server_id, tool_name, limit)
\ No newline at end of file
@@ -0,0 +1,120 @@
+"""Single-pass repository file walker.
+
+Walks a repository tree with ``os.scandir`` and prunes ignored directories
+before descending into them, so vendored trees such as ``node_modules`` or
+``.venv`` are never listed. Analyzers consume the yielded entries in one
+pass instead of each running their own ``rglob`` over the same tree.
+"""
+
+import os
+from dataclasses import dataclass
+from typing import AbstractSet, Iterator, Optional, Tuple, Union
+
+import structlog
+
+from .ignore_rules import GITIGNORE_NAME, IgnoreMatcher
+
+logger = structlog.get_logger(__name__)
+
+# Directories that never contain first-party source worth analyzing
+DEFAULT_IGNORE_DIRS = frozenset(
+    {
+        "node_modules",
+        ".git",
+        "__pycache__",
+        ".venv",
+        "venv",
+        ".pytest_cache",
+        ".ruff_cache",
+        ".mypy_cache",
+        "build",
+        "dist",
+    }
+)
+
+
+@dataclass(frozen=True)
+class RepoFile:
+    """A regular file found while walking a repository."""
+
+    path: str  # Absolute (or root-joined) filesystem path
+    rel_path: str  # POSIX-style path relative to the walk root
+    name: str
+
+    @property
+    def suffix(self) -> str:
+        """Lower-cased file extension including the dot."""
+        return os.path.splitext(self.name)[1].lower()
+
+    @property
+    def parts(self) -> Tuple[str, ...]:
+        """Relative path components."""
+        return tuple(self.rel_path.split("/"))
+
+    def read_text(self, encoding: str = "utf-8", errors: str = "strict") -> str:
+        """Read the file content as text."""
+        with open(self.path, "r", encoding=encoding, errors=errors) as f:
+            return f.read()
+
+
+def walk_repo(
+    root: Union[str, os.PathLike],
+    ignore_dirs: AbstractSet[str] = DEFAULT_IGNORE_DIRS,
+    matcher: Optional[IgnoreMatcher] = None,
+) -> Iterator[RepoFile]:
+    """Yield every regular file under ``root``, pruning ignored directories.
+
+    Directories whose name is in ``ignore_dirs`` are skipped without being
+    listed. Symlinked directories are not followed. Each directory's files are
+    yielded in name order before descending into its subdirectories, which are
+    visited depth-first in name order; callers needing fully path-sorted
+    output should sort the results.
+
+    Args:
+        root: Directory to walk
+        ignore_dirs: Directory names to prune (default: DEFAULT_IGNORE_DIRS)
+        matcher: Gitignore-style rules; excluded files are skipped and
+            excluded directories pruned, and each directory's ``.gitignore``
+            is applied below it
+
+    Returns:
+        Iterator of RepoFile entries
+    """
+    scope = matcher.root_scope() if matcher is not None else ()
+    stack = [(os.fspath(root), "", scope)]
+
+    while stack:
+        dir_path, rel_dir, scope = stack.pop()
+        try:
+            with os.scandir(dir_path) as it:
+                entries = sorted(it, key=lambda e: e.name)
+        except OSError as e:
+            logger.debug(f"Failed to list {dir_path}: {e}")
+            continue
+
+        if matcher is not None:
+            gitignore = next((e for e in entries if e.name == GITIGNORE_NAME), None)
+            if gitignore is not None:
+                scope = matcher.enter(scope, rel_dir, gitignore.path)
+
+        subdirs = []
+        for entry in entries:
+            rel_path = f"{rel_dir}/{entry.name}" if rel_dir else entry.name
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in ignore_dirs and not (
+                        matcher is not None and matcher.ignored(rel_path, True, scope)
+                    ):
+                        subdirs.append((entry.path, rel_path, scope))
+                    continue
+                if not entry.is_file():
+                    continue
+            except OSError:
+                continue
+            if matcher is not None and matcher.ignored(rel_path, False, scope):
+                continue
+
+            yield RepoFile(path=entry.path, rel_path=rel_path, name=entry.name)
+
+        # Reverse so the stack pops subdirectories in name order
+        stack.extend(reversed(subdirs))
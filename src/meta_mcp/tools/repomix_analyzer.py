@@ -5,7 +5,9 @@ Integration with repomix MCP server for repository analysis and optimization.
 Provides tools to analyze codebases using repomix capabilities.
 """
 
+import asyncio
 import os
+import shutil
 from typing import Any, Dict, List, Optional
 from pathlib import Path
 
@@ -24,12 +26,21 @@ class RepomixAnalysisService(MetaMCPService):
     and optimization recommendations.
     """
 
-    def __init__(self):
-        super().__init__()
-        self.repomix_available = self._check_repomix_availability()
+    # Whether repomix is installed; None until probe_repomix() has run
+    repomix_available: Optional[bool] = None
+
+    async def probe_repomix(self) -> bool:
+        """Whether repomix is installed, probed once (in a worker thread)."""
+        if self.repomix_available is None:
+            self.repomix_available = await asyncio.to_thread(
+                self._check_repomix_availability
+            )
+        return self.repomix_available
 
     def _check_repomix_availability(self) -> bool:
         """Check if repomix is available in the system."""
+        if shutil.which("repomix") is None:
+            return False
         try:
             import subprocess
 
@@ -65,11 +76,12 @@ class RepomixAnalysisService(MetaMCPService):
         Returns:
             Analysis results with repository insights
         """
-        if not self.repomix_available:
+        if not await self.probe_repomix():
             return {
                 "success": False,
                 "error": "Repomix is not available. Install with: npm install -g repomix",
                 "install_command": "npm install -g repomix",
+                "alternative": "pack_repository(compress=True) packs Python files as signatures without Node",
             }
 
         try:
@@ -0,0 +1,149 @@
+"""Rate limiting and retry primitives for ``@rate_limited`` and ``@retry_on_failure``.
+
+- ``TokenBucket`` / ``RateLimiter``: token buckets refilled lazily from the
+  monotonic clock, so admitting a call is O(1) whatever the call rate. A
+  ``RateLimiter`` holds one bucket per key, (tool, client) for the decorator,
+  and can be shared between tools.
+- ``backoff_delay``: exponential backoff with jitter, so clients retrying
+  after the same failure do not retry in lockstep.
+- ``client_id_var``: the client a tool call is made for. It is set per MCP
+  call by ``ClientContextMiddleware`` and read when keying rate limits.
+
+Async callers wait with ``asyncio.sleep`` and never block the event loop.
+"""
+
+import random
+import threading
+import time
+from collections import OrderedDict
+from contextvars import ContextVar
+from typing import Any, Callable, Hashable, Optional
+
+from fastmcp.server.middleware import Middleware
+
+DEFAULT_CLIENT = "local"
+MAX_BUCKETS = 10_000
+
+client_id_var: ContextVar[str] = ContextVar("meta_mcp_client_id", default=DEFAULT_CLIENT)
+
+
+class RateLimitExceeded(RuntimeError):
+    """A call was rejected because its token bucket is empty."""
+
+    def __init__(self, message: str, retry_after: float):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class TokenBucket:
+    """Holds up to ``capacity`` tokens, refilled at ``rate`` tokens per second."""
+
+    __slots__ = ("rate", "capacity", "tokens", "updated")
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+
+    def try_acquire(self, tokens: float = 1.0) -> float:
+        """Take tokens if available.
+
+        Returns:
+            0.0 if the tokens were taken, otherwise seconds until they will be
+        """
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        if self.tokens >= tokens:
+            self.tokens -= tokens
+            return 0.0
+        return (tokens - self.tokens) / self.rate
+
+
+class RateLimiter:
+    """Token buckets keyed by an arbitrary hashable (e.g. ``(tool, client)``).
+
+    Buckets are created full on first use; beyond ``max_keys`` the least
+    recently used bucket is dropped.
+
+    Example:
+        ```python
+        limiter = RateLimiter(rate=0.5, capacity=10)  # 30/min, bursts of 10
+        wait = limiter.try_acquire(("execute_remote_tool", "client-a"))
+        ```
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None, max_keys: int = MAX_BUCKETS):
+        """
+        Args:
+            rate: Tokens added per second
+            capacity: Bucket size, i.e. the largest burst (default: one second of rate, min 1)
+            max_keys: Buckets kept before the least recently used is dropped
+        """
+        if rate <= 0:
+            raise ValueError("rate must be > 0")
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self.max_keys = max_keys
+        self._buckets: "OrderedDict[Hashable, TokenBucket]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def per_minute(cls, calls: int, burst: Optional[int] = None) -> "RateLimiter":
+        """Limiter allowing ``calls`` per minute, in bursts of up to ``burst``."""
+        return cls(rate=calls / 60.0, capacity=burst if burst is not None else calls)
+
+    def try_acquire(self, key: Hashable, tokens: float = 1.0) -> float:
+        """Take tokens from key's bucket; returns 0.0 or the seconds to wait."""
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = self._buckets[key] = TokenBucket(self.rate, self.capacity)
+                if len(self._buckets) > self.max_keys:
+                    self._buckets.popitem(last=False)
+            else:
+                self._buckets.move_to_end(key)
+            return bucket.try_acquire(tokens)
+
+
+def backoff_delay(
+    attempt: int,
+    initial: float = 1.0,
+    factor: float = 2.0,
+    max_delay: float = 30.0,
+    jitter: float = 0.5,
+) -> float:
+    """Delay before retry number attempt + 1.
+
+    Exponential (``initial * factor ** attempt``, capped at max_delay), then
+    reduced by a random fraction of up to ``jitter``.
+    """
+    delay = min(max_delay, initial * factor ** attempt)
+    return delay * (1.0 - jitter * random.random())
+
+
+def current_client() -> str:
+    return client_id_var.get()
+
+
+class ClientContextMiddleware(Middleware):
+    """FastMCP middleware exposing the calling client to tools.
+
+    Sets ``client_id_var`` to the client id the client sent, or else its
+    session id, for the duration of each ``tools/call``.
+    """
+
+    async def on_call_tool(self, context: Any, call_next: Callable) -> Any:
+        client = None
+        ctx = context.fastmcp_context
+        if ctx is not None:
+            try:
+                client = ctx.client_id or ctx.session_id
+            except Exception:  # No request context (e.g. in-process calls)
+                client = None
+        token = client_id_var.set(client or DEFAULT_CLIENT)
+        try:
+            return await call_next(context)
+        finally:
+            client_id_var.reset(token)
@@ -0,0 +1,198 @@
+"""Bounded in-memory cache for tool results, used by ``@cache_result``.
+
+Entries expire after a TTL and the least recently used entries are evicted
+beyond ``max_entries``. Concurrent identical calls are collapsed into one
+execution (single-flight): the first caller runs the function, later callers
+with the same arguments wait for its result instead of starting their own.
+Failures are never cached; every waiter sees the exception and the next call
+runs again.
+
+Async callers share an ``asyncio`` task per key, so a waiter that is
+cancelled does not cancel the work the others are waiting for. Sync callers
+on different threads share a per-key lock.
+"""
+
+import asyncio
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+DEFAULT_TTL = 300
+DEFAULT_MAX_ENTRIES = 256
+
+_MISSING = object()
+
+
+def _typed(value: Any) -> Any:
+    """value tagged with its type, so equal values of different types differ."""
+    if type(value) is tuple:
+        return (tuple, tuple(_typed(item) for item in value))
+    return (type(value), value)
+
+
+def make_key(args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> Hashable:
+    """Cache key for a call's arguments.
+
+    Arguments are keyed with their types, since 1, 1.0 and True are equal
+    (and hash alike) but may give different results. Hashable arguments are
+    used as they are; anything else (lists, dicts) falls back to a canonical
+    JSON rendering.
+    """
+    key: Hashable = (
+        tuple(_typed(arg) for arg in args),
+        tuple((name, _typed(value)) for name, value in sorted(kwargs.items())),
+    )
+    try:
+        hash(key)
+    except TypeError:
+        key = json.dumps(
+            {
+                "args": [[type(arg).__qualname__, arg] for arg in args],
+                "kwargs": [
+                    [name, type(value).__qualname__, value]
+                    for name, value in sorted(kwargs.items())
+                ],
+            },
+            sort_keys=True,
+            default=str,
+        )
+    return key
+
+
+class ResultCache:
+    """LRU + TTL cache with single-flight loading and hit/miss statistics.
+
+    Example:
+        ```python
+        cache = ResultCache(ttl_seconds=60, max_entries=128)
+        result = await cache.get_or_load_async(key, lambda: scan(path))
+        cache.stats()  # {"hits": ..., "misses": ..., "hit_rate": ...}
+        ```
+    """
+
+    def __init__(self, ttl_seconds: Optional[float] = DEFAULT_TTL,
+                 max_entries: int = DEFAULT_MAX_ENTRIES):
+        """
+        Args:
+            ttl_seconds: Seconds an entry stays valid (None: until evicted)
+            max_entries: Entries kept before the least recently used is evicted
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries must be >= 1")
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        # key -> (value, stored_at); most recently used last
+        self._entries: "OrderedDict[Hashable, Tuple[Any, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._tasks: Dict[Hashable, asyncio.Task] = {}
+        self._key_locks: Dict[Hashable, threading.Lock] = {}
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Cached value for key (refreshing its LRU position), or default."""
+        value = self._lookup(key)
+        return default if value is _MISSING else value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            self._entries[key] = (value, time.monotonic())
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else None,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "size": len(self._entries),
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl_seconds,
+        }
+
+    async def get_or_load_async(self, key: Hashable,
+                                loader: Callable[[], Awaitable[Any]]) -> Any:
+        """Cached value for key, or the result of ``await loader()``.
+
+        Calls for a key that is already loading join that load (counted as
+        hits, and as ``coalesced``) instead of starting another.
+        """
+        value = self._lookup(key, count=False)
+        if value is not _MISSING:
+            self.hits += 1
+            return value
+
+        task = self._tasks.get(key)
+        if task is None:
+            self.misses += 1
+            task = asyncio.ensure_future(loader())
+            self._tasks[key] = task
+            task.add_done_callback(lambda t: self._finish(key, t))
+        else:
+            self.hits += 1
+            self.coalesced += 1
+        return await asyncio.shield(task)
+
+    def get_or_load(self, key: Hashable, loader: Callable[[], Any]) -> Any:
+        """Cached value for key, or the result of ``loader()`` (sync callers)."""
+        value = self._lookup(key, count=False)
+        if value is not _MISSING:
+            self.hits += 1
+            return value
+
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+        with key_lock:
+            # Another thread may have loaded it while we waited
+            value = self._lookup(key, count=False)
+            if value is not _MISSING:
+                self.hits += 1
+                self.coalesced += 1
+                return value
+            self.misses += 1
+            try:
+                value = loader()
+                self.set(key, value)
+                return value
+            finally:
+                with self._lock:
+                    self._key_locks.pop(key, None)
+
+    def _lookup(self, key: Hashable, count: bool = True) -> Any:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                value, stored_at = entry
+                if self.ttl_seconds is None or time.monotonic() - stored_at < self.ttl_seconds:
+                    self._entries.move_to_end(key)
+                    if count:
+                        self.hits += 1
+                    return value
+                del self._entries[key]
+                self.expirations += 1
+            if count:
+                self.misses += 1
+            return _MISSING
+
+    def _finish(self, key: Hashable, task: asyncio.Task) -> None:
+        self._tasks.pop(key, None)
+        if not task.cancelled() and task.exception() is None:
+            self.set(key, task.result())
@@ -1,184 +1,246 @@
 """Cache management for repository scan results.
 
-Provides file-based persistence for scan results to avoid re-scanning
-repositories on every request. Uses JSON files with timestamp-based
-invalidation.
+Provides persistence for scan results to avoid re-scanning repositories on
+every request. All entries live in a single SQLite database (WAL mode) with
+indexed timestamp and path columns, so lookups and statistics never touch
+more than a few rows. Values are stored as zlib-compressed compact JSON, and
+the database is kept under MAX_CACHE_BYTES by evicting least recently used
+entries.
 """
 
+import hashlib
 import json
+import os
+import sqlite3
+import threading
 import time
+import zlib
 from pathlib import Path
-from typing import Any, Dict, Optional
-import hashlib
+from typing import Any, Dict, Optional, Tuple
+
 import structlog
 
 logger = structlog.get_logger(__name__)
 
 # Cache directory (relative to user's home or temp)
 CACHE_DIR = Path.home() / ".mcp-studio" / "scan-cache"
+CACHE_DB_NAME = "scan-cache.db"
 CACHE_TTL = 3600  # 1 hour default TTL
+MAX_CACHE_BYTES = 64 * 1024 * 1024  # Evict LRU entries beyond this payload size
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    kind TEXT NOT NULL,
+    path TEXT NOT NULL,
+    cache_timestamp REAL NOT NULL,
+    accessed_at REAL NOT NULL,
+    size INTEGER NOT NULL,
+    payload BLOB NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_entries_path ON entries (kind, path);
+CREATE INDEX IF NOT EXISTS idx_entries_timestamp ON entries (cache_timestamp);
+CREATE INDEX IF NOT EXISTS idx_entries_accessed ON entries (accessed_at);
+
+-- Running totals maintained by triggers so stats are O(1)
+CREATE TABLE IF NOT EXISTS totals (
+    id INTEGER PRIMARY KEY CHECK (id = 1),
+    entries INTEGER NOT NULL,
+    bytes INTEGER NOT NULL
+);
+INSERT OR IGNORE INTO totals (id, entries, bytes) VALUES (1, 0, 0);
+
+CREATE TRIGGER IF NOT EXISTS entries_insert AFTER INSERT ON entries BEGIN
+    UPDATE totals SET entries = entries + 1, bytes = bytes + NEW.size;
+END;
+CREATE TRIGGER IF NOT EXISTS entries_delete AFTER DELETE ON entries BEGIN
+    UPDATE totals SET entries = entries - 1, bytes = bytes - OLD.size;
+END;
+CREATE TRIGGER IF NOT EXISTS entries_update AFTER UPDATE OF size ON entries BEGIN
+    UPDATE totals SET bytes = bytes - OLD.size + NEW.size;
+END;
+"""
+
+_lock = threading.Lock()
+_conn: Optional[sqlite3.Connection] = None
+_conn_key: Optional[Tuple[int, str]] = None
 
 
 def _get_cache_key(scan_path: str, max_depth: int = 1) -> str:
     """Generate cache key for scan path."""
     key = f"{scan_path}:{max_depth}"
-    return hashlib.md5(key.encode()).hexdigest()
+    return "scan_" + hashlib.md5(key.encode()).hexdigest()
 
 
-def _get_repo_cache_key(repo_path: str) -> str:
-    """Generate cache key for single repo."""
-    return hashlib.md5(repo_path.encode()).hexdigest()
+def _db_path() -> Path:
+    """Path of the cache database."""
+    return CACHE_DIR / CACHE_DB_NAME
 
 
-def get_cached_scan(
-    scan_path: str, max_depth: int = 1, ttl: int = CACHE_TTL
-) -> Optional[Dict[str, Any]]:
-    """Get cached scan result if still valid.
-
-    Args:
-        scan_path: Path that was scanned
-        max_depth: Scan depth used
-        ttl: Time-to-live in seconds (default: 1 hour)
+def _connect() -> sqlite3.Connection:
+    """Return this process's connection, creating the database on first use.
 
-    Returns:
-        Cached result if valid, None otherwise
+    Must be called with _lock held. Connections are not shared across forked
+    worker processes.
     """
+    global _conn, _conn_key
+
+    key = (os.getpid(), str(_db_path()))
+    if _conn is not None and _conn_key == key:
+        return _conn
+
     CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(
+        key[1], timeout=30, isolation_level=None, check_same_thread=False
+    )
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.executescript(_SCHEMA)
+    _remove_legacy_json_files()
 
-    cache_key = _get_cache_key(scan_path, max_depth)
-    cache_file = CACHE_DIR / f"scan_{cache_key}.json"
+    _conn, _conn_key = conn, key
+    return conn
 
-    if not cache_file.exists():
-        return None
 
-    try:
-        with open(cache_file, "r", encoding="utf-8") as f:
-            cached = json.load(f)
+def _remove_legacy_json_files() -> None:
+    """Delete JSON files left behind by the previous one-file-per-key cache."""
+    for legacy_file in CACHE_DIR.glob("*.json"):
+        try:
+            legacy_file.unlink()
+        except OSError:
+            pass
 
-        # Check if cache is still valid
-        cache_time = cached.get("cache_timestamp", 0)
-        if time.time() - cache_time > ttl:
-            logger.debug(f"Cache expired for {scan_path}")
-            return None
 
-        # Check if scan path still exists and hasn't changed
-        scan_path_obj = Path(scan_path).expanduser().resolve()
-        if not scan_path_obj.exists():
-            return None
+def _encode(value: Any) -> bytes:
+    """Serialize a value as zlib-compressed compact JSON."""
+    return zlib.compress(
+        json.dumps(value, separators=(",", ":")).encode("utf-8"), level=1
+    )
 
-        logger.debug(f"Using cached scan result for {scan_path}")
-        return cached.get("result")
 
-    except Exception as e:
-        logger.warning(f"Failed to read cache: {e}")
-        return None
+def _decode(payload: bytes) -> Any:
+    """Deserialize a value written by _encode."""
+    return json.loads(zlib.decompress(payload))
 
 
-def cache_scan_result(scan_path: str, max_depth: int, result: Dict[str, Any]) -> None:
-    """Cache scan result.
+def load_entry(key: str) -> Optional[Tuple[float, Any]]:
+    """Load a cache entry and mark it as recently used.
 
     Args:
-        scan_path: Path that was scanned
-        max_depth: Scan depth used
-        result: Scan result to cache
+        key: Entry key
+
+    Returns:
+        (cache_timestamp, value) tuple, or None if missing or unreadable
     """
-    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    try:
+        with _lock:
+            conn = _connect()
+            row = conn.execute(
+                "SELECT cache_timestamp, payload FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            conn.execute(
+                "UPDATE entries SET accessed_at = ? WHERE key = ?", (time.time(), key)
+            )
+        return row[0], _decode(row[1])
+    except Exception as e:
+        logger.warning(f"Failed to read cache entry {key}: {e}")
+        return None
 
-    cache_key = _get_cache_key(scan_path, max_depth)
-    cache_file = CACHE_DIR / f"scan_{cache_key}.json"
 
+def store_entry(key: str, kind: str, path: str, value: Any) -> None:
+    """Store a cache entry, evicting least recently used entries if needed.
+
+    Args:
+        key: Entry key
+        kind: Entry kind ("scan", "repo", "files", ...), used by clear_cache
+        path: Scanned path the entry belongs to
+        value: JSON-serializable value
+    """
     try:
-        cache_data = {
-            "scan_path": scan_path,
-            "max_depth": max_depth,
-            "cache_timestamp": time.time(),
-            "result": result,
-        }
+        payload = _encode(value)
+        now = time.time()
+        with _lock:
+            conn = _connect()
+            # An upsert rather than INSERT OR REPLACE: REPLACE deletes the old
+            # row without firing entries_delete, which would leave its size
+            # counted in totals. The update fires entries_update instead.
+            conn.execute(
+                "INSERT INTO entries "
+                "(key, kind, path, cache_timestamp, accessed_at, size, payload) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT(key) DO UPDATE SET "
+                "kind = excluded.kind, path = excluded.path, "
+                "cache_timestamp = excluded.cache_timestamp, "
+                "accessed_at = excluded.accessed_at, size = excluded.size, "
+                "payload = excluded.payload",
+                (key, kind, path, now, now, len(payload), payload),
+            )
+            _evict(conn)
+    except Exception as e:
+        logger.warning(f"Failed to write cache entry {key}: {e}")
 
-        with open(cache_file, "w", encoding="utf-8") as f:
-            json.dump(cache_data, f, indent=2)
 
-        logger.debug(f"Cached scan result for {scan_path}")
+def _evict(conn: sqlite3.Connection) -> None:
+    """Drop least recently used entries until the cache fits MAX_CACHE_BYTES."""
+    (total_bytes,) = conn.execute("SELECT bytes FROM totals").fetchone()
+    excess = total_bytes - MAX_CACHE_BYTES
+    if excess <= 0:
+        return
 
-    except Exception as e:
-        logger.warning(f"Failed to cache scan result: {e}")
+    victims = []
+    for key, size in conn.execute("SELECT key, size FROM entries ORDER BY accessed_at"):
+        victims.append((key,))
+        excess -= size
+        if excess <= 0:
+            break
 
+    conn.executemany("DELETE FROM entries WHERE key = ?", victims)
+    logger.debug(f"Evicted {len(victims)} cache entries")
 
-def get_cached_repo_status(
-    repo_path: str, ttl: int = CACHE_TTL
+
+def get_cached_scan(
+    scan_path: str, max_depth: int = 1, ttl: int = CACHE_TTL
 ) -> Optional[Dict[str, Any]]:
-    """Get cached repo status if still valid.
+    """Get cached scan result if still valid.
 
     Args:
-        repo_path: Path to repository
+        scan_path: Path that was scanned
+        max_depth: Scan depth used
         ttl: Time-to-live in seconds (default: 1 hour)
 
     Returns:
         Cached result if valid, None otherwise
     """
-    CACHE_DIR.mkdir(parents=True, exist_ok=True)
-
-    cache_key = _get_repo_cache_key(repo_path)
-    cache_file = CACHE_DIR / f"repo_{cache_key}.json"
-
-    if not cache_file.exists():
+    cached = load_entry(_get_cache_key(scan_path, max_depth))
+    if cached is None:
         return None
 
-    try:
-        with open(cache_file, "r", encoding="utf-8") as f:
-            cached = json.load(f)
-
-        # Check if cache is still valid
-        cache_time = cached.get("cache_timestamp", 0)
-        if time.time() - cache_time > ttl:
-            logger.debug(f"Cache expired for {repo_path}")
-            return None
-
-        # Check if repo still exists
-        repo_path_obj = Path(repo_path).expanduser().resolve()
-        if not repo_path_obj.exists():
-            return None
-
-        # Check if repo has been modified (simple check - could be enhanced)
-        repo_mtime = repo_path_obj.stat().st_mtime
-        if repo_mtime > cache_time:
-            logger.debug(f"Repo modified, cache invalid for {repo_path}")
-            return None
-
-        logger.debug(f"Using cached repo status for {repo_path}")
-        return cached.get("result")
+    # Check if cache is still valid
+    cache_time, result = cached
+    if time.time() - cache_time > ttl:
+        logger.debug(f"Cache expired for {scan_path}")
+        return None
 
-    except Exception as e:
-        logger.warning(f"Failed to read repo cache: {e}")
+    # Check if scan path still exists
+    if not Path(scan_path).expanduser().resolve().exists():
         return None
 
+    logger.debug(f"Using cached scan result for {scan_path}")
+    return result
 
-def cache_repo_status(repo_path: str, result: Dict[str, Any]) -> None:
-    """Cache repo status result.
+
+def cache_scan_result(scan_path: str, max_depth: int, result: Dict[str, Any]) -> None:
+    """Cache scan result.
 
     Args:
-        repo_path: Path to repository
-        result: Repo status result to cache
+        scan_path: Path that was scanned
+        max_depth: Scan depth used
+        result: Scan result to cache
     """
-    CACHE_DIR.mkdir(parents=True, exist_ok=True)
-
-    cache_key = _get_repo_cache_key(repo_path)
-    cache_file = CACHE_DIR / f"repo_{cache_key}.json"
-
-    try:
-        cache_data = {
-            "repo_path": repo_path,
-            "cache_timestamp": time.time(),
-            "result": result,
-        }
-
-        with open(cache_file, "w", encoding="utf-8") as f:
-            json.dump(cache_data, f, indent=2)
-
-        logger.debug(f"Cached repo status for {repo_path}")
-
-    except Exception as e:
-        logger.warning(f"Failed to cache repo status: {e}")
+    store_entry(_get_cache_key(scan_path, max_depth), "scan", scan_path, result)
+    logger.debug(f"Cached scan result for {scan_path}")
 
 
 def clear_cache(
@@ -187,34 +249,37 @@ def clear_cache(
     """Clear cache entries.
 
     Args:
-        scan_path: Clear cache for specific scan path (None = all scans)
-        repo_path: Clear cache for specific repo (None = all repos)
+        scan_path: Clear cached scans of a specific path, at any depth
+            (None = all scans)
+        repo_path: Clear cached per-file results for a specific repo
+            (None = all repos)
 
     Returns:
-        Number of cache files deleted
+        Number of cache entries deleted
     """
-    if not CACHE_DIR.exists():
+    if not _db_path().exists():
         return 0
 
-    deleted = 0
-
-    if scan_path:
-        cache_key = _get_cache_key(scan_path)
-        cache_file = CACHE_DIR / f"scan_{cache_key}.json"
-        if cache_file.exists():
-            cache_file.unlink()
-            deleted += 1
-    elif repo_path:
-        cache_key = _get_repo_cache_key(repo_path)
-        cache_file = CACHE_DIR / f"repo_{cache_key}.json"
-        if cache_file.exists():
-            cache_file.unlink()
-            deleted += 1
-    else:
-        # Clear all
-        for cache_file in CACHE_DIR.glob("*.json"):
-            cache_file.unlink()
-            deleted += 1
+    try:
+        with _lock:
+            conn = _connect()
+            if scan_path:
+                cursor = conn.execute(
+                    "DELETE FROM entries WHERE kind = 'scan' AND path = ?",
+                    (scan_path,),
+                )
+            elif repo_path:
+                cursor = conn.execute(
+                    "DELETE FROM entries WHERE kind != 'scan' AND path = ?",
+                    (repo_path,),
+                )
+            else:
+                # Clear all
+                cursor = conn.execute("DELETE FROM entries")
+            deleted = cursor.rowcount
+    except Exception as e:
+        logger.warning(f"Failed to clear cache: {e}")
+        return 0
 
     logger.info(f"Cleared {deleted} cache entries")
     return deleted
@@ -226,31 +291,39 @@ def get_cache_stats() -> Dict[str, Any]:
     Returns:
         Dictionary with cache statistics
     """
-    if not CACHE_DIR.exists():
-        return {
-            "cache_dir": str(CACHE_DIR),
-            "total_files": 0,
-            "total_size": 0,
-            "oldest_cache": None,
-            "newest_cache": None,
-        }
-
-    cache_files = list(CACHE_DIR.glob("*.json"))
-    total_size = sum(f.stat().st_size for f in cache_files)
-
-    cache_times = []
-    for cache_file in cache_files:
-        try:
-            with open(cache_file, "r", encoding="utf-8") as f:
-                cached = json.load(f)
-                cache_times.append(cached.get("cache_timestamp", 0))
-        except Exception:
-            pass
-
-    return {
+    stats = {
         "cache_dir": str(CACHE_DIR),
-        "total_files": len(cache_files),
-        "total_size": total_size,
-        "oldest_cache": min(cache_times) if cache_times else None,
-        "newest_cache": max(cache_times) if cache_times else None,
+        "cache_db": str(_db_path()),
+        "total_files": 0,
+        "total_size": 0,
+        "max_size": MAX_CACHE_BYTES,
+        "oldest_cache": None,
+        "newest_cache": None,
     }
+    if not _db_path().exists():
+        return stats
+
+    try:
+        with _lock:
+            conn = _connect()
+            entries, total_bytes = conn.execute(
+                "SELECT entries, bytes FROM totals"
+            ).fetchone()
+            # Separate queries so SQLite answers each from the timestamp index
+            (oldest,) = conn.execute(
+                "SELECT MIN(cache_timestamp) FROM entries"
+            ).fetchone()
+            (newest,) = conn.execute(
+                "SELECT MAX(cache_timestamp) FROM entries"
+            ).fetchone()
+    except Exception as e:
+        logger.warning(f"Failed to read cache stats: {e}")
+        return stats
+
+    stats.update(
+        total_files=entries,
+        total_size=total_bytes,
+        oldest_cache=oldest,
+        newest_cache=newest,
+    )
+    return stats
@@ -7,7 +7,6 @@ with MCP servers using FastMCP 2.11 integration.
 
 import asyncio
 import json
-import os
 import subprocess
 import sys
 import time
@@ -16,8 +15,6 @@ from typing import Any, Dict, List, Optional
 
 import aiohttp
 import structlog
-from fastmcp import Client
-from fastmcp.client.transports import StdioTransport
 
 # from meta_mcp.services.config import settings  # Removed - settings doesn't exist
 from .decorators import (
@@ -30,6 +27,8 @@ from .decorators import (
     tool,
     validate_input,
 )
+from .client_pool import stdio_client_pool
+from .jsonrpc_stdio import StdioSession, tool_error_text
 
 logger = structlog.get_logger(__name__)
 
@@ -306,21 +305,16 @@ async def test_server_connection(
             if not server_path_obj.exists():
                 raise FileNotFoundError(f"Server file not found: {server_path}")
 
-            # Create transport and test connection
-            transport = StdioTransport(
-                command="python", args=[str(server_path_obj)], env=dict(os.environ)
-            )
-
-            async with Client(transport) as client:
-                await client.initialize()
+            # Spawn a fresh server (not a pooled one) to test the connection
+            client = StdioSession(str(server_path_obj))
+            try:
+                await client.connect(timeout)
                 test_results["connection_successful"] = True
 
                 # Test ping if requested
                 if test_ping:
                     ping_start = time.time()
-                    tools = (
-                        await client.list_tools()
-                    )  # Use list_tools as ping equivalent
+                    await client.ping(timeout)
                     ping_time = (time.time() - ping_start) * 1000
                     test_results["metrics"]["ping_time_ms"] = round(ping_time, 2)
                     test_results["tests_performed"].append("ping")
@@ -339,13 +333,18 @@ async def test_server_connection(
 
                     # Store tool summary
                     test_results["tools_summary"] = [
-                        {"name": tool.name, "description": tool.description[:100]}
+                        {
+                            "name": tool["name"],
+                            "description": (tool.get("description") or "")[:100],
+                        }
                         for tool in tools[:10]  # Limit to first 10 tools
                     ]
 
                 # Deep testing if requested
                 if deep_test:
                     await _perform_deep_connection_test(client, test_results)
+            finally:
+                await client.close()
 
         connection_time = (time.time() - connection_start) * 1000
         test_results["metrics"]["connection_time_ms"] = round(connection_time, 2)
@@ -842,16 +841,10 @@ async def _get_local_server_info(
     if not server_path_obj.exists():
         raise FileNotFoundError(f"Server file not found: {server_path}")
 
-    # Create transport and connect
-    transport = StdioTransport(
-        command="python", args=[str(server_path_obj)], env=dict(os.environ)
-    )
-
     server_info = {}
 
-    async with Client(transport) as client:
-        await client.initialize()
-
+    # Reuse a warm session from the pool instead of spawning a new server
+    async with stdio_client_pool.session(str(server_path_obj), timeout) as client:
         # Get basic info
         server_info["name"] = server_path_obj.stem
         server_info["version"] = "1.0.0"  # Default version
@@ -861,9 +854,9 @@ async def _get_local_server_info(
             tools = await client.list_tools()
             server_info["tools"] = [
                 {
-                    "name": tool.name,
-                    "description": tool.description,
-                    "input_schema": tool.inputSchema,
+                    "name": tool["name"],
+                    "description": tool.get("description"),
+                    "input_schema": tool.get("inputSchema"),
                 }
                 for tool in tools
             ]
@@ -913,7 +906,9 @@ async def _get_remote_server_info(
     return server_info
 
 
-async def _perform_deep_connection_test(client: Client, test_results: Dict[str, Any]):
+async def _perform_deep_connection_test(
+    client: StdioSession, test_results: Dict[str, Any]
+):
     """Perform deep connection testing."""
     try:
         # Test multiple tool calls
@@ -923,10 +918,10 @@ async def _perform_deep_connection_test(client: Client, test_results: Dict[str,
             for tool in tools[:3]:  # Test up to 3 tools
                 try:
                     # This would need to be adapted based on the specific tool
-                    test_results["tests_performed"].append(f"tool_test_{tool.name}")
+                    test_results["tests_performed"].append(f"tool_test_{tool['name']}")
                 except Exception as e:
                     test_results["warnings"].append(
-                        f"Tool {tool.name} test failed: {str(e)}"
+                        f"Tool {tool['name']} test failed: {str(e)}"
                     )
 
         test_results["tests_performed"].append("deep_test")
@@ -948,27 +943,20 @@ async def _execute_stdio_tool(
     if not server_path_obj.exists():
         raise FileNotFoundError(f"Server file not found: {server_path}")
 
-    # Create transport and connect
-    transport = StdioTransport(
-        command="python", args=[str(server_path_obj)], env=dict(os.environ)
-    )
-
-    async with Client(transport) as client:
-        await client.initialize()
-
+    async with stdio_client_pool.session(str(server_path_obj), timeout) as client:
         # Validate tool exists if requested
         if validate_params:
-            tools = await client.list_tools()
-            tool_names = [tool.name for tool in tools]
+            tools = await client.list_tools(timeout)
+            tool_names = [tool["name"] for tool in tools]
             if tool_name not in tool_names:
                 raise ValueError(
                     f"Tool '{tool_name}' not found. Available tools: {tool_names}"
                 )
 
         # Execute the tool
-        result = await asyncio.wait_for(
-            client.call_tool(tool_name, **parameters), timeout=timeout
-        )
+        result = await client.call_tool(tool_name, parameters, timeout=timeout)
+        if result.get("isError"):
+            raise RuntimeError(tool_error_text(result))
 
         return result
 
@@ -995,21 +983,15 @@ async def _list_local_tools(server_path: str, timeout: float) -> List[Dict[str,
     if not server_path_obj.exists():
         raise FileNotFoundError(f"Server file not found: {server_path}")
 
-    # Create transport and connect
-    transport = StdioTransport(
-        command="python", args=[str(server_path_obj)], env=dict(os.environ)
-    )
-
-    async with Client(transport) as client:
-        await client.initialize()
-        tools = await client.list_tools()
+    async with stdio_client_pool.session(str(server_path_obj), timeout) as client:
+        tools = await client.list_tools(timeout)
 
         return [
             {
-                "name": tool.name,
-                "description": tool.description,
-                "inputSchema": tool.inputSchema,
-                "category": getattr(tool, "category", "utility"),
+                "name": tool["name"],
+                "description": tool.get("description"),
+                "inputSchema": tool.get("inputSchema"),
+                "category": tool.get("category", "utility"),
             }
             for tool in tools
         ]
@@ -1206,6 +1188,10 @@ async def restart_server(
             # For now, we'll just clear any cached connections
             restart_result["steps_completed"].append("stop_process")
 
+        # Stop the pooled session so the next call starts a fresh server
+        if await stdio_client_pool.close(server_path):
+            restart_result["steps_completed"].append("close_pooled_session")
+
         # Step 3: Wait a moment for cleanup
         await asyncio.sleep(1.0)
         restart_result["steps_completed"].append("cleanup_wait")
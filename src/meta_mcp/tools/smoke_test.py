@@ -2,7 +2,7 @@
 MCP Server Smoke Test Tool.
 
 Bare minimum connectivity test for MCP servers:
-1. Connect over stdio
+1. Connect over stdio (JSON-RPC via ``jsonrpc_stdio``)
 2. Call help/status tool
 3. Verify non-empty response
 
@@ -10,15 +10,14 @@ No LLM required - just validates the server is alive and responding.
 """
 
 import asyncio
-import json
-import os
-import sys
 import time
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 import structlog
 
+from .jsonrpc_stdio import JsonRpcError, StdioSession, server_command
+
 logger = structlog.get_logger(__name__)
 
 # Timeout for connection and tool calls
@@ -29,6 +28,14 @@ TOOL_CALL_TIMEOUT = 5.0
 SMOKE_TEST_TOOLS = ["help", "status", "get_help", "get_status", "info", "health"]
 
 
+def pick_smoke_tool(tool_names: List[str]) -> Optional[str]:
+    """The preferred help/status tool, else the first tool listed."""
+    for preferred_tool in SMOKE_TEST_TOOLS:
+        if preferred_tool in tool_names:
+            return preferred_tool
+    return tool_names[0] if tool_names else None
+
+
 async def smoke_test_server(
     server_path: str,
     timeout: float = CONNECTION_TIMEOUT,
@@ -67,119 +74,67 @@ async def smoke_test_server(
         result["errors"].append(f"Server file not found: {server_path}")
         return result
 
-    process = None
+    if server_command(server_file) is None:
+        result["errors"].append(f"Unsupported server type: {server_file.suffix}")
+        return result
+
+    session = StdioSession(server_path)
     try:
         # Step 1: Spawn server process
         start_time = time.time()
-
-        # Determine how to run the server
-        if server_file.suffix == ".py":
-            cmd = [sys.executable, str(server_file)]
-        elif server_file.suffix == ".js":
-            cmd = ["node", str(server_file)]
-        else:
-            result["errors"].append(f"Unsupported server type: {server_file.suffix}")
-            return result
-
-        process = await asyncio.create_subprocess_exec(
-            *cmd,
-            stdin=asyncio.subprocess.PIPE,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-            cwd=str(server_file.parent),
-            env={**os.environ, "PYTHONUNBUFFERED": "1"},
-        )
+        connection = await session.start()
 
         spawn_time = (time.time() - start_time) * 1000
         result["latency_ms"]["spawn"] = round(spawn_time, 2)
         result["steps_completed"].append("spawn_process")
 
-        # Step 2: Send initialize request
-        init_request = {
-            "jsonrpc": "2.0",
-            "id": 1,
-            "method": "initialize",
-            "params": {
-                "protocolVersion": "2024-11-05",
-                "capabilities": {},
-                "clientInfo": {"name": "mcp-studio-smoke-test", "version": "1.0.0"},
-            },
-        }
-
+        # Step 2: Initialize
         start_time = time.time()
-        response = await _send_request(process, init_request, timeout)
-        init_time = (time.time() - start_time) * 1000
-        result["latency_ms"]["initialize"] = round(init_time, 2)
-
-        if not response or "error" in response:
-            result["errors"].append(
-                f"Initialize failed: {response.get('error', 'no response')}"
-            )
+        try:
+            await connection.initialize(timeout)
+        except JsonRpcError as e:
+            result["errors"].append(f"Initialize failed: {e.message}")
             return result
+        finally:
+            init_time = (time.time() - start_time) * 1000
+            result["latency_ms"]["initialize"] = round(init_time, 2)
 
         result["steps_completed"].append("initialize")
 
         # Step 3: List tools
-        list_tools_request = {
-            "jsonrpc": "2.0",
-            "id": 2,
-            "method": "tools/list",
-            "params": {},
-        }
-
         start_time = time.time()
-        response = await _send_request(process, list_tools_request, timeout)
-        list_time = (time.time() - start_time) * 1000
-        result["latency_ms"]["list_tools"] = round(list_time, 2)
-
-        if not response or "error" in response:
-            result["errors"].append(
-                f"List tools failed: {response.get('error', 'no response')}"
-            )
+        try:
+            tools = await connection.list_tools(timeout)
+        except JsonRpcError as e:
+            result["errors"].append(f"List tools failed: {e.message}")
             return result
+        finally:
+            list_time = (time.time() - start_time) * 1000
+            result["latency_ms"]["list_tools"] = round(list_time, 2)
 
-        tools = response.get("result", {}).get("tools", [])
         result["tools_found"] = [t.get("name") for t in tools]
         result["steps_completed"].append("list_tools")
 
         # Step 4: Find and call a smoke test tool
-        smoke_tool = None
-        for preferred_tool in SMOKE_TEST_TOOLS:
-            if preferred_tool in result["tools_found"]:
-                smoke_tool = preferred_tool
-                break
-
-        if not smoke_tool and result["tools_found"]:
-            # Fall back to first available tool
-            smoke_tool = result["tools_found"][0]
+        smoke_tool = pick_smoke_tool(result["tools_found"])
 
         if smoke_tool:
-            call_request = {
-                "jsonrpc": "2.0",
-                "id": 3,
-                "method": "tools/call",
-                "params": {
-                    "name": smoke_tool,
-                    "arguments": {},
-                },
-            }
-
             start_time = time.time()
-            response = await _send_request(process, call_request, TOOL_CALL_TIMEOUT)
+            try:
+                response = await connection.call_tool(smoke_tool, {}, TOOL_CALL_TIMEOUT)
+            except (JsonRpcError, asyncio.TimeoutError) as e:
+                response = None
+                result["errors"].append(f"Tool call failed: {e}")
             call_time = (time.time() - start_time) * 1000
             result["latency_ms"]["tool_call"] = round(call_time, 2)
 
-            if response and "result" in response:
+            if response is not None:
                 result["smoke_tool_called"] = smoke_tool
-                content = response.get("result", {}).get("content", [])
+                content = response.get("content", [])
                 if content:
                     text = str(content[0].get("text", ""))
                     result["smoke_response_length"] = len(text)
                 result["steps_completed"].append("tool_call")
-            else:
-                result["errors"].append(
-                    f"Tool call failed: {response.get('error', 'no response')}"
-                )
         else:
             result["errors"].append("No tools found to test")
 
@@ -203,70 +158,11 @@ async def smoke_test_server(
         result["errors"].append(f"Exception: {str(e)}")
         logger.error("Smoke test failed", server_path=server_path, error=str(e))
     finally:
-        if process:
-            try:
-                process.terminate()
-                await asyncio.wait_for(process.wait(), timeout=2.0)
-            except Exception:
-                process.kill()
+        await session.close()
 
     return result
 
 
-async def _send_request(
-    process: asyncio.subprocess.Process,
-    request: Dict[str, Any],
-    timeout: float,
-) -> Optional[Dict[str, Any]]:
-    """Send a JSON-RPC request and wait for response."""
-    try:
-        # Send request
-        request_str = json.dumps(request)
-        message = f"Content-Length: {len(request_str)}\r\n\r\n{request_str}"
-        process.stdin.write(message.encode())
-        await process.stdin.drain()
-
-        # Read response with timeout
-        response_data = await asyncio.wait_for(
-            _read_response(process.stdout),
-            timeout=timeout,
-        )
-
-        if response_data:
-            return json.loads(response_data)
-        return None
-
-    except asyncio.TimeoutError:
-        raise
-    except Exception as e:
-        logger.error("Request failed", error=str(e))
-        return None
-
-
-async def _read_response(stdout: asyncio.StreamReader) -> Optional[str]:
-    """Read a JSON-RPC response from stdout."""
-    # Read headers
-    headers = {}
-    while True:
-        line = await stdout.readline()
-        if not line:
-            return None
-        line = line.decode().strip()
-        if not line:
-            break
-        if ":" in line:
-            key, value = line.split(":", 1)
-            headers[key.strip().lower()] = value.strip()
-
-    # Read body
-    content_length = int(headers.get("content-length", 0))
-    if content_length > 0:
-        body = await stdout.read(content_length)
-        return body.decode()
-
-    return None
-
-
 async def smoke_test_all_servers(
     scan_path: str = "D:/Dev/repos",
     max_concurrent: int = 3,
@@ -0,0 +1,317 @@
+"""Offline token counting engines.
+
+Two interchangeable engines count tokens for source files and packed
+repositories:
+
+- ``BPETokenizer`` applies a byte-level BPE merge table bundled with the
+  package (trained on Python, JavaScript/TypeScript and Markdown). Text is
+  split with a cl100k-style pre-tokenizer and counts are memoized per
+  pre-token, so repetitive code is counted at several MB/s without any
+  network access or third-party tokenizer library.
+- ``HeuristicTokenizer`` estimates from character, space and tab counts.
+  It is much faster but far less accurate, and is used as a fallback when
+  the merge table cannot be loaded.
+
+Use ``get_tokenizer()`` to obtain the shared engine.
+"""
+
+import gzip
+import heapq
+import os
+import re
+from collections import Counter, defaultdict
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+MERGES_PATH = Path(__file__).resolve().parent.parent / "data" / "code_bpe_merges.txt.gz"
+MERGES_HEADER = "#version: meta-mcp-code-bpe 1"
+
+# cl100k-style pre-tokenizer, expressed with stdlib ``re`` classes:
+# [^\W\d_] is a letter, \d a digit and (?:[^\s\w]|_) punctuation
+PRETOKENIZE_PATTERN = re.compile(
+    r"'(?i:[sdmt]|ll|ve|re)"
+    r"|(?:[^\r\n\w]|_)?[^\W\d_]+"
+    r"|\d{1,3}"
+    r"| ?(?:[^\s\w]|_)+[\r\n]*"
+    r"|\s*[\r\n]+"
+    r"|\s+(?!\S)"
+    r"|\s+"
+)
+
+# Pre-tokens whose counts are memoized per engine
+WORD_CACHE_SIZE = 200_000
+
+
+@lru_cache(maxsize=1)
+def _byte_symbols() -> Tuple[str, ...]:
+    """Printable stand-ins for the 256 byte values (GPT-2 ``bytes_to_unicode``).
+
+    Lets a merge table of arbitrary byte sequences be stored as
+    whitespace-separated text.
+    """
+    printable = (
+        list(range(ord("!"), ord("~") + 1))
+        + list(range(ord("¡"), ord("¬") + 1))
+        + list(range(ord("®"), ord("ÿ") + 1))
+    )
+    symbols = {b: chr(b) for b in printable}
+    extra = 0
+    for b in range(256):
+        if b not in symbols:
+            symbols[b] = chr(256 + extra)
+            extra += 1
+    return tuple(symbols[b] for b in range(256))
+
+
+@lru_cache(maxsize=1)
+def _symbol_bytes() -> Dict[str, int]:
+    return {symbol: b for b, symbol in enumerate(_byte_symbols())}
+
+
+def _to_symbols(token: bytes) -> str:
+    table = _byte_symbols()
+    return "".join(table[b] for b in token)
+
+
+def _from_symbols(text: str) -> bytes:
+    decode = _symbol_bytes()
+    return bytes(decode[c] for c in text)
+
+
+class HeuristicTokenizer:
+    """Fast character-based token estimate."""
+
+    name = "heuristic"
+
+    def count(self, text: str) -> int:
+        """Estimate the number of tokens in text."""
+        # Rough estimation: ~4 characters per token for code
+        char_count = len(text)
+        lines = text.split("\n")
+        avg_line_length = sum(len(line) for line in lines) / max(1, len(lines))
+
+        # Code tends to have more tokens per character than natural language
+        if avg_line_length > 80:  # Likely code
+            tokens_per_char = 0.3  # ~3-4 chars per token for code
+        else:  # Likely natural language or comments
+            tokens_per_char = 0.25  # ~4 chars per token
+
+        estimated_tokens = char_count * tokens_per_char
+
+        # Adjust for special patterns
+        estimated_tokens += text.count("\n") * 0.5  # Line breaks
+        estimated_tokens += text.count(" ") * 0.2  # Spaces
+        estimated_tokens += text.count("\t") * 0.3  # Tabs
+
+        return max(1, int(estimated_tokens))
+
+    def count_batch(self, texts: Iterable[str]) -> List[int]:
+        """Estimate token counts for many texts."""
+        return [self.count(text) for text in texts]
+
+
+class BPETokenizer:
+    """Byte-level BPE tokenizer driven by a merge table.
+
+    Example:
+        ```python
+        tokenizer = BPETokenizer.from_file(MERGES_PATH)
+        counts = tokenizer.count_batch(file_contents)
+        ```
+    """
+
+    name = "bpe"
+
+    def __init__(self, merges: Sequence[Tuple[bytes, bytes]]):
+        """
+        Args:
+            merges: Merge rules in priority order; merged tokens get ids
+                after the 256 byte tokens, in that order
+        """
+        self.ranks: Dict[bytes, int] = {bytes([b]): b for b in range(256)}
+        for left, right in merges:
+            self.ranks.setdefault(left + right, len(self.ranks))
+        self._word_counts: Dict[str, int] = {}
+
+    @property
+    def vocab_size(self) -> int:
+        return len(self.ranks)
+
+    @classmethod
+    def from_file(cls, path: Path = MERGES_PATH) -> "BPETokenizer":
+        """Load a merge table written by ``save_merges``."""
+        opener = gzip.open if str(path).endswith(".gz") else open
+        merges = []
+        with opener(path, "rt", encoding="utf-8") as f:
+            for line in f:
+                line = line.rstrip("\n")
+                if not line or line.startswith("#"):
+                    continue
+                left, right = line.split(" ")
+                merges.append((_from_symbols(left), _from_symbols(right)))
+        return cls(merges)
+
+    def encode(self, text: str) -> List[int]:
+        """Encode text to token ids."""
+        ids = []
+        for word in PRETOKENIZE_PATTERN.findall(text):
+            ids.extend(self.ranks[part] for part in self._merge(word.encode("utf-8")))
+        return ids
+
+    def count(self, text: str) -> int:
+        """Count the tokens in text."""
+        cache = self._word_counts
+        total = 0
+        for word in PRETOKENIZE_PATTERN.findall(text):
+            n = cache.get(word)
+            if n is None:
+                n = len(self._merge(word.encode("utf-8")))
+                if len(cache) >= WORD_CACHE_SIZE:
+                    cache.clear()
+                cache[word] = n
+            total += n
+        return total
+
+    def count_batch(self, texts: Iterable[str]) -> List[int]:
+        """Count tokens for many texts, sharing the pre-token memo."""
+        return [self.count(text) for text in texts]
+
+    def _merge(self, data: bytes) -> List[bytes]:
+        """Apply merges to one pre-token, lowest rank first."""
+        parts = [data[i : i + 1] for i in range(len(data))]
+        ranks = self.ranks
+        while len(parts) > 1:
+            best_rank = None
+            best_index = 0
+            for i in range(len(parts) - 1):
+                rank = ranks.get(parts[i] + parts[i + 1])
+                if rank is not None and (best_rank is None or rank < best_rank):
+                    best_rank, best_index = rank, i
+            if best_rank is None:
+                break
+            parts[best_index : best_index + 2] = [
+                parts[best_index] + parts[best_index + 1]
+            ]
+        return parts
+
+
+def train_merges(texts: Iterable[str], num_merges: int) -> List[Tuple[bytes, bytes]]:
+    """Learn byte-level BPE merges from a corpus.
+
+    Pair counts are updated incrementally, so training cost scales with the
+    number of pre-tokens touched by each merge rather than the corpus size.
+
+    Args:
+        texts: Training corpus
+        num_merges: Number of merges to learn
+
+    Returns:
+        Merge rules in priority order
+    """
+    word_freq: Counter = Counter()
+    for text in texts:
+        word_freq.update(PRETOKENIZE_PATTERN.findall(text))
+
+    words: List[List[bytes]] = []
+    freqs: List[int] = []
+    for word, freq in word_freq.items():
+        data = word.encode("utf-8")
+        if len(data) > 1:
+            words.append([data[i : i + 1] for i in range(len(data))])
+            freqs.append(freq)
+
+    pair_counts: Dict[Tuple[bytes, bytes], int] = defaultdict(int)
+    pair_words: Dict[Tuple[bytes, bytes], set] = defaultdict(set)
+    for index, symbols in enumerate(words):
+        for pair in zip(symbols, symbols[1:]):
+            pair_counts[pair] += freqs[index]
+            pair_words[pair].add(index)
+
+    heap = [(-count, pair) for pair, count in pair_counts.items()]
+    heapq.heapify(heap)
+
+    merges: List[Tuple[bytes, bytes]] = []
+    while heap and len(merges) < num_merges:
+        neg_count, pair = heapq.heappop(heap)
+        count = pair_counts.get(pair, 0)
+        if count <= 0:
+            continue
+        if -neg_count != count:
+            # Stale heap entry; requeue with the current count
+            heapq.heappush(heap, (-count, pair))
+            continue
+
+        merges.append(pair)
+        merged = pair[0] + pair[1]
+        changed = set()
+        for index in pair_words.pop(pair, ()):
+            symbols = words[index]
+            freq = freqs[index]
+            for old in zip(symbols, symbols[1:]):
+                pair_counts[old] -= freq
+
+            new_symbols = []
+            i = 0
+            while i < len(symbols):
+                if i < len(symbols) - 1 and (symbols[i], symbols[i + 1]) == pair:
+                    new_symbols.append(merged)
+                    i += 2
+                else:
+                    new_symbols.append(symbols[i])
+                    i += 1
+            words[index] = new_symbols
+
+            for new in zip(new_symbols, new_symbols[1:]):
+                pair_counts[new] += freq
+                pair_words[new].add(index)
+                changed.add(new)
+
+        pair_counts.pop(pair, None)
+        for new in changed:
+            if pair_counts[new] > 0:
+                heapq.heappush(heap, (-pair_counts[new], new))
+
+    return merges
+
+
+def save_merges(merges: Sequence[Tuple[bytes, bytes]], path: Path) -> None:
+    """Write a merge table readable by ``BPETokenizer.from_file``."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    opener = gzip.open if str(path).endswith(".gz") else open
+    with opener(path, "wt", encoding="utf-8") as f:
+        f.write(MERGES_HEADER + "\n")
+        for left, right in merges:
+            f.write(f"{_to_symbols(left)} {_to_symbols(right)}\n")
+
+
+@lru_cache(maxsize=None)
+def get_tokenizer(name: Optional[str] = None):
+    """Return the shared tokenizer engine.
+
+    Args:
+        name: "bpe", "heuristic" or "auto" (default: META_MCP_TOKENIZER
+            environment variable, else "auto"). "auto" uses the bundled BPE
+            merge table and falls back to the heuristic if it cannot be
+            loaded.
+
+    Returns:
+        A tokenizer with ``name``, ``count`` and ``count_batch``
+    """
+    name = (name or os.getenv("META_MCP_TOKENIZER") or "auto").lower()
+    if name == "heuristic":
+        return HeuristicTokenizer()
+    if name not in ("auto", "bpe"):
+        raise ValueError(f"Unknown tokenizer: {name}")
+
+    try:
+        return BPETokenizer.from_file(MERGES_PATH)
+    except (OSError, ValueError, KeyError) as e:
+        if name == "bpe":
+            raise
+        logger.warning(f"BPE merge table unavailable, using heuristic tokenizer: {e}")
+        return HeuristicTokenizer()
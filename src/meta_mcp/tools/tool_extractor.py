@@ -0,0 +1,221 @@
+"""AST-based discovery of MCP tool functions in Python source.
+
+Parses a module once and returns every function decorated as an MCP tool
+(``@app.tool``, ``@mcp.tool`` or ``@tool``, with or without call arguments)
+together with its docstring and Google-style Args/Returns sections. Results
+are cached by content hash, so analyzers scanning the same file share one
+parse.
+"""
+
+import ast
+import hashlib
+import re
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Optional, Tuple
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+# Decorator receivers recognised as MCP tool registrations (@app.tool, @mcp.tool)
+TOOL_DECORATOR_RECEIVERS = frozenset({"app", "mcp"})
+
+# Keywords that mark a docstring as SOTA-style documentation
+SOTA_DOC_KEYWORDS = ("Args:", "Returns:", "Example:", "PORTMANTEAU")
+EXAMPLE_KEYWORDS = ("Example:", "Examples:", ">>>")
+
+# Cheap textual prefilter for modules that might define tools
+_TOOL_DECORATOR_HINT = re.compile(r"@\s*(?:(?:app|mcp)\s*\.\s*)?tool\b")
+
+_CACHE_SIZE = 2048
+_cache: "OrderedDict[str, Tuple[ExtractedTool, ...]]" = OrderedDict()
+
+
+@dataclass(frozen=True)
+class ExtractedTool:
+    """A tool function found in a module."""
+
+    name: str
+    decorator: str  # "app", "mcp" or "generic"
+    lineno: int
+    is_async: bool
+    docstring: Optional[str]
+    args_section: Optional[str]
+    returns_section: Optional[str]
+    # Literal keyword arguments of the decorator call, e.g. (("name", "add"),);
+    # non-literal values (ToolCategory.DATA) are kept as their source text
+    options: Tuple[Tuple[str, Any], ...] = ()
+    signature: Optional[str] = None
+    toplevel: bool = False  # Defined at module level (importable by name)
+
+    @property
+    def has_docstring(self) -> bool:
+        return self.docstring is not None
+
+    @property
+    def is_sota_doc(self) -> bool:
+        """Docstring documents arguments, return value, examples or a portmanteau."""
+        return self.docstring is not None and any(
+            kw in self.docstring for kw in SOTA_DOC_KEYWORDS
+        )
+
+    @property
+    def has_examples(self) -> bool:
+        return self.docstring is not None and any(
+            kw in self.docstring for kw in EXAMPLE_KEYWORDS
+        )
+
+
+def extract_tools(source: str) -> Tuple[ExtractedTool, ...]:
+    """Return the tool functions defined in a module's source.
+
+    Results are cached by content hash. Source that does not parse yields
+    no tools.
+
+    Args:
+        source: Python module source
+
+    Returns:
+        Tools in source order
+    """
+    key = hashlib.blake2b(source.encode("utf-8", "surrogatepass"), digest_size=16)
+    digest = key.hexdigest()
+
+    cached = _cache.get(digest)
+    if cached is not None:
+        _cache.move_to_end(digest)
+        return cached
+
+    # Only parse modules that can contain a tool decorator at all
+    tools = _extract(source) if _TOOL_DECORATOR_HINT.search(source) else ()
+    _cache[digest] = tools
+    if len(_cache) > _CACHE_SIZE:
+        _cache.popitem(last=False)
+    return tools
+
+
+def _extract(source: str) -> Tuple[ExtractedTool, ...]:
+    """Parse source and collect decorated tool functions."""
+    try:
+        tree = ast.parse(source)
+    except (SyntaxError, ValueError) as e:
+        logger.debug(f"Skipping tool extraction, source does not parse: {e}")
+        return ()
+
+    toplevel = {id(node) for node in tree.body}
+    tools = []
+    for node in _iter_functions(tree):
+        decorator = _tool_decorator_kind(node)
+        if decorator is None:
+            continue
+
+        docstring = ast.get_docstring(node)
+        tools.append(
+            ExtractedTool(
+                name=node.name,
+                decorator=decorator,
+                lineno=node.lineno,
+                is_async=isinstance(node, ast.AsyncFunctionDef),
+                docstring=docstring,
+                args_section=_docstring_section(docstring, "Args"),
+                returns_section=_docstring_section(docstring, "Returns"),
+                options=_decorator_options(node),
+                signature=_signature(node),
+                toplevel=id(node) in toplevel,
+            )
+        )
+
+    tools.sort(key=lambda t: t.lineno)
+    return tuple(tools)
+
+
+def _iter_functions(tree: ast.AST):
+    """Yield every function definition, descending only into statement bodies.
+
+    Tools are often registered inside ``register_*_tools(app)`` functions or
+    class bodies, so nested definitions are included; expressions are never
+    visited.
+    """
+    stack = [tree]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            yield node
+        for field in ("body", "orelse", "finalbody", "handlers", "cases"):
+            children = getattr(node, field, None)
+            if children:
+                stack.extend(children)
+
+
+def _tool_decorator_kind(node: ast.AST) -> Optional[str]:
+    """Classify a function's tool decorator, or None if it is not a tool."""
+    for decorator in node.decorator_list:
+        target = decorator.func if isinstance(decorator, ast.Call) else decorator
+        kind = _tool_decorator_kind_of(target)
+        if kind is not None:
+            return kind
+    return None
+
+
+def _tool_decorator_kind_of(target: ast.AST) -> Optional[str]:
+    if isinstance(target, ast.Name) and target.id == "tool":
+        return "generic"
+    if (
+        isinstance(target, ast.Attribute)
+        and target.attr == "tool"
+        and isinstance(target.value, ast.Name)
+        and target.value.id in TOOL_DECORATOR_RECEIVERS
+    ):
+        return target.value.id
+    return None
+
+
+def _decorator_options(node: ast.AST) -> Tuple[Tuple[str, Any], ...]:
+    """Keyword arguments of the tool decorator call, as literals where possible."""
+    for decorator in node.decorator_list:
+        if not isinstance(decorator, ast.Call) or _tool_decorator_kind_of(decorator.func) is None:
+            continue
+        options = []
+        for keyword in decorator.keywords:
+            if keyword.arg is None:  # **kwargs
+                continue
+            try:
+                value = ast.literal_eval(keyword.value)
+            except (ValueError, TypeError, SyntaxError, MemoryError, RecursionError):
+                # Not a literal, or one that cannot be built (e.g. {[1]})
+                value = ast.unparse(keyword.value)
+            options.append((keyword.arg, value))
+        return tuple(options)
+    return ()
+
+
+def _signature(node: ast.AST) -> str:
+    """Source form of a function's signature, e.g. ``(a: int, b: int = 1) -> int``."""
+    signature = f"({ast.unparse(node.args)})"
+    if node.returns is not None:
+        signature += f" -> {ast.unparse(node.returns)}"
+    return signature
+
+
+def _docstring_section(docstring: Optional[str], name: str) -> Optional[str]:
+    """Extract a Google-style section ("Args:", "Returns:") body from a docstring."""
+    if not docstring:
+        return None
+
+    lines = docstring.splitlines()
+    header = f"{name}:"
+    for index, line in enumerate(lines):
+        if line.strip() != header:
+            continue
+
+        indent = len(line) - len(line.lstrip())
+        body = []
+        for body_line in lines[index + 1 :]:
+            stripped = body_line.strip()
+            # The section ends at the next line indented no deeper than the header
+            if stripped and len(body_line) - len(body_line.lstrip()) <= indent:
+                break
+            body.append(stripped)
+        return "\n".join(body).strip() or None
+    return None
@@ -0,0 +1,214 @@
+"""Static manifest of the ``@tool`` functions in a package.
+
+Tool metadata (name, description, version, tags, category, signature) is
+read from source with ``ast`` (see ``tool_extractor``), never by importing
+the modules, and persisted as JSON under ``~/.mcp-studio/tool-manifest``.
+Each source file's entry is keyed by its mtime and size, so rebuilding the
+manifest only re-parses files that changed since the last build.
+
+``ToolRegistry`` lists tools from the manifest and imports a module only
+when one of its tools is executed.
+
+The manifest can also be built ahead of time (e.g. at install or in CI):
+
+    python -m meta_mcp.tools.tool_manifest meta_mcp.tools
+"""
+
+import importlib.util
+import json
+import os
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import structlog
+
+from .decorators import clean_docstring
+from .tool_extractor import extract_tools
+
+logger = structlog.get_logger(__name__)
+
+# Manifest directory (relative to user's home)
+MANIFEST_DIR = Path.home() / ".mcp-studio" / "tool-manifest"
+
+# Bump when the shape of manifest entries changes
+MANIFEST_VERSION = 1
+
+
+def package_dirs(package: str) -> List[Path]:
+    """Source directories of a package, located without importing it.
+
+    Raises:
+        ImportError: If the package cannot be found or is not a directory
+            package (e.g. a single module or a zip import)
+    """
+    try:
+        spec = importlib.util.find_spec(package)
+    except ValueError as e:  # e.g. "__main__", which has no spec
+        raise ImportError(str(e)) from e
+    if spec is None or not spec.submodule_search_locations:
+        raise ImportError(f"No source package found for {package}")
+    return [Path(location) for location in spec.submodule_search_locations]
+
+
+def _iter_sources(root: Path, package: str, recursive: bool):
+    """Yield (module name, path) for each module, like ``pkgutil.iter_modules``."""
+    try:
+        entries = sorted(os.scandir(root), key=lambda e: e.name)
+    except OSError:
+        return
+    for entry in entries:
+        if entry.is_file() and entry.name.endswith(".py") and entry.name != "__init__.py":
+            yield f"{package}.{entry.name[:-3]}", Path(entry.path)
+        elif (
+            recursive
+            and entry.is_dir()
+            and entry.name.isidentifier()
+            and os.path.isfile(os.path.join(entry.path, "__init__.py"))
+        ):
+            subpackage = f"{package}.{entry.name}"
+            yield subpackage, Path(entry.path) / "__init__.py"
+            yield from _iter_sources(Path(entry.path), subpackage, recursive)
+
+
+def _manifest_tools(source: str, module: str) -> List[Dict[str, Any]]:
+    """Manifest entries for the module-level ``@tool`` functions in source."""
+    tools = []
+    for found in extract_tools(source):
+        # Only @tool functions defined at module level can be imported by name;
+        # @mcp.tool registrations belong to a server instance
+        if found.decorator != "generic" or not found.toplevel:
+            continue
+        options = dict(found.options)
+        tags = options.get("tags")
+        tools.append({
+            "name": found.name,
+            "tool_name": options.get("name") if isinstance(options.get("name"), str) else found.name,
+            "module": module,
+            "description": (
+                options["description"] if isinstance(options.get("description"), str)
+                else clean_docstring(found.docstring or "")
+            ),
+            "version": options.get("version") if isinstance(options.get("version"), str) else "1.0.0",
+            "tags": list(tags) if isinstance(tags, (list, tuple)) else [],
+            "category": options.get("category"),
+            "signature": found.signature,
+            "is_async": found.is_async,
+            "lineno": found.lineno,
+        })
+    return tools
+
+
+def manifest_path_for(package: str, manifest_dir: Optional[Path] = None) -> Path:
+    return Path(manifest_dir or MANIFEST_DIR) / f"{package}.json"
+
+
+def load_manifest_file(path: Path) -> Optional[Dict[str, Any]]:
+    """A saved manifest, or None if missing, unreadable or from another version."""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(manifest, dict) or manifest.get("version") != MANIFEST_VERSION:
+        return None
+    return manifest
+
+
+def build_manifest(
+    package: str,
+    recursive: bool = True,
+    manifest_dir: Optional[Path] = None,
+    save: bool = True,
+) -> Dict[str, Any]:
+    """
+    Build (or refresh) the tool manifest of a package.
+
+    Files whose mtime and size match the saved manifest keep their entries;
+    only new or changed files are parsed.
+
+    Args:
+        package: Package to scan, e.g. "meta_mcp.tools"
+        recursive: Include subpackages
+        manifest_dir: Directory holding manifests (default ~/.mcp-studio/tool-manifest)
+        save: Write the manifest back when anything changed
+
+    Returns:
+        Manifest with per-file entries and the number of files re-parsed
+
+    Raises:
+        ImportError: If the package has no source directory
+    """
+    path = manifest_path_for(package, manifest_dir)
+    previous = load_manifest_file(path)
+    previous_files = previous["files"] if previous and previous.get("recursive") == recursive else {}
+
+    files: Dict[str, Dict[str, Any]] = {}
+    parsed = 0
+    for root in package_dirs(package):
+        for module, source_path in _iter_sources(root, package, recursive):
+            try:
+                stat = source_path.stat()
+            except OSError:
+                continue
+            key = str(source_path)
+            cached = previous_files.get(key)
+            if cached and cached["mtime_ns"] == stat.st_mtime_ns and cached["size"] == stat.st_size:
+                files[key] = cached
+                continue
+            try:
+                source = source_path.read_text(encoding="utf-8")
+            except (OSError, UnicodeDecodeError) as e:
+                logger.debug(f"Skipping {source_path}: {e}")
+                continue
+            parsed += 1
+            files[key] = {
+                "module": module,
+                "mtime_ns": stat.st_mtime_ns,
+                "size": stat.st_size,
+                "tools": _manifest_tools(source, module),
+            }
+
+    manifest = {
+        "version": MANIFEST_VERSION,
+        "package": package,
+        "recursive": recursive,
+        "files": files,
+    }
+    if save and (parsed or files.keys() != previous_files.keys()):
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(".tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(manifest, f, separators=(",", ":"))
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Failed to save tool manifest {path}: {e}")
+
+    manifest["parsed_files"] = parsed
+    return manifest
+
+
+def iter_manifest_tools(manifest: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """All tool entries of a manifest, in module then source order."""
+    tools: List[Tuple[str, int, Dict[str, Any]]] = []
+    for entry in manifest["files"].values():
+        for found in entry["tools"]:
+            tools.append((found["module"], found["lineno"], found))
+    return [found for _, _, found in sorted(tools, key=lambda t: (t[0], t[1]))]
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    packages = (argv if argv is not None else sys.argv[1:]) or ["meta_mcp.tools"]
+    for package in packages:
+        manifest = build_manifest(package)
+        print(
+            f"{package}: {len(iter_manifest_tools(manifest))} tools in "
+            f"{len(manifest['files'])} files ({manifest['parsed_files']} parsed) -> "
+            f"{manifest_path_for(package)}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,51 @@
+import pytest
+
+from meta_mcp.services.repo_packing_service import RepoPackingService
+from meta_mcp.tools import scan_cache
+from meta_mcp.tools.blob_store import BlobStore
+
+
+def _make_repo(root, name, extra):
+    repo = root / name
+    (repo / ".github").mkdir(parents=True)
+    (repo / "LICENSE").write_text("MIT License\n" * 20, encoding="utf-8")
+    (repo / ".github" / "ci.yml").write_text("on: push\n", encoding="utf-8")
+    (repo / "server.py").write_text(extra, encoding="utf-8")
+    return repo
+
+
+def test_blob_store_roundtrip_and_dedup(tmp_path):
+    store = BlobStore(tmp_path / "store")
+    digest = store.put(b"shared")
+    assert store.put(b"shared") == digest
+    assert store.get(digest) == b"shared"
+    assert (store.blobs_written, store.blobs_reused) == (1, 1)
+    assert list(store.digests()) == [digest]
+    with pytest.raises(KeyError):
+        store.get("00" * 32)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("output_format", ["xml", "json"])
+async def test_shared_files_stored_once_and_unpack_matches(tmp_path, monkeypatch, output_format):
+    monkeypatch.setattr(scan_cache, "CACHE_DIR", tmp_path / "cache")
+    repo_a = _make_repo(tmp_path, "a", "print('a')\n")
+    repo_b = _make_repo(tmp_path, "b", "print('b')\n")
+    store_path = str(tmp_path / "store")
+    manifest_path = str(tmp_path / "pack.json")
+
+    service = RepoPackingService()
+    result = await service.pack_to_store([str(repo_a), str(repo_b)], manifest_path, store_path=store_path)
+    stats = result["data"]["stats"]
+    assert stats["files"] == 6
+    assert stats["unique_blobs"] == 4
+    assert stats["blobs_written"] == 4
+
+    unpacked = await service.unpack_manifest(manifest_path, output_format, repository="b", store_path=store_path)
+    packed = await service.pack_repository(str(repo_b), output_format)
+    assert unpacked["data"]["packed_content"] == packed["data"]["packed_content"]
+
+    # Unchanged re-pack reads nothing and writes no new blobs
+    again = await service.pack_to_store([str(repo_a), str(repo_b)], manifest_path, store_path=store_path)
+    assert again["data"]["stats"]["files_read"] == 0
+    assert again["data"]["stats"]["blobs_written"] == 0
@@ -0,0 +1,67 @@
+import pytest
+from meta_mcp.tools.client_pool import StdioClientPool
+
+SERVER_SOURCE = """
+from fastmcp import FastMCP
+
+mcp = FastMCP("echo")
+
+
+@mcp.tool
+def add(a: int, b: int) -> int:
+    return a + b
+
+
+if __name__ == "__main__":
+    mcp.run(show_banner=False)
+"""
+
+
+@pytest.fixture
+def server_path(tmp_path):
+    path = tmp_path / "echo_server.py"
+    path.write_text(SERVER_SOURCE, encoding="utf-8")
+    return str(path)
+
+
+@pytest.mark.asyncio
+async def test_sessions_are_reused_and_respawned(server_path):
+    pool = StdioClientPool()
+    try:
+        for b in range(3):
+            async with pool.session(server_path, timeout=30) as client:
+                result = await client.call_tool("add", {"a": 1, "b": b})
+                assert result["structuredContent"]["result"] == 1 + b
+        assert pool.spawned == 1
+        assert pool.reused == 2
+
+        # Simulate the server dying between calls
+        async with pool.session(server_path) as client:
+            await client.close()
+
+        async with pool.session(server_path, timeout=30) as client:
+            result = await client.call_tool("add", {"a": 2, "b": 2})
+            assert result["structuredContent"]["result"] == 4
+        assert pool.spawned == 2
+        assert pool.respawned == 1
+    finally:
+        await pool.close_all()
+
+
+@pytest.mark.asyncio
+async def test_idle_sessions_are_evicted_at_capacity(server_path, tmp_path):
+    other_path = tmp_path / "other_server.py"
+    other_path.write_text(SERVER_SOURCE, encoding="utf-8")
+
+    pool = StdioClientPool(max_sessions=1)
+    try:
+        async with pool.session(server_path, timeout=30) as client:
+            await client.list_tools()
+        async with pool.session(str(other_path), timeout=30) as client:
+            await client.list_tools()
+
+        stats = pool.get_stats()
+        assert stats["active_sessions"] == 1
+        assert stats["sessions"][0]["server_path"] == str(other_path)
+    finally:
+        await pool.close_all()
@@ -0,0 +1,68 @@
+import ast
+
+import pytest
+from meta_mcp.services.repo_packing_service import RepoPackingService
+from meta_mcp.tools.code_compressor import compress_python
+
+SOURCE = '''"""Module docstring."""
+import os
+
+LIMIT = 10
+
+
+@decorator
+def add(a: int,
+        b: int = 2) -> int:
+    """Add two numbers."""
+    total = a + b
+    return total
+
+
+class Thing(Base):
+    """A thing."""
+
+    size: int = 3
+
+    async def run(self, x):
+        for i in range(x):
+            yield i
+'''
+
+
+def test_compressed_source_parses_and_keeps_signatures():
+    compressed = compress_python(SOURCE)
+    ast.parse(compressed.text)
+
+    assert "def add(a: int," in compressed.text
+    assert '"""Add two numbers."""' in compressed.text
+    assert "class Thing(Base):" in compressed.text
+    assert "size: int = 3" in compressed.text
+    assert "total = a + b" not in compressed.text
+    assert "yield i" not in compressed.text
+
+
+def test_line_map_points_to_original_lines():
+    compressed = compress_python(SOURCE)
+    original = SOURCE.split("\n")
+    packed = compressed.text.split("\n")
+    for packed_line, original_line in zip(packed, compressed.line_map):
+        if packed_line.strip() != "...":
+            assert packed_line == original[original_line - 1]
+    assert compressed.original_lines == len(original)
+
+
+def test_unparsable_source_is_left_alone():
+    assert compress_python("def broken(:\n") is None
+
+
+@pytest.mark.asyncio
+async def test_compressed_pack_reports_reduction(tmp_path):
+    (tmp_path / "mod.py").write_text(SOURCE, encoding="utf-8")
+    (tmp_path / "notes.md").write_text("# Notes\n", encoding="utf-8")
+
+    result = await RepoPackingService().pack_repository(str(tmp_path), compress=True)
+    data = result["data"]
+    assert data["compression"]["files_compressed"] == 1
+    assert "mod.py" in data["compression"]["line_index"]
+    assert "total = a + b" not in data["packed_content"]
+    assert "# Notes" in data["packed_content"]
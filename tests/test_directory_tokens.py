@@ -0,0 +1,61 @@
+import os
+
+import pytest
+from meta_mcp.tools import scan_cache
+from meta_mcp.tools.directory_tokens import count_directory_tokens
+
+
+@pytest.mark.asyncio
+async def test_only_changed_files_are_tokenized(tmp_path, monkeypatch):
+    monkeypatch.setattr(scan_cache, "CACHE_DIR", tmp_path / "cache")
+    repo = tmp_path / "repo"
+    (repo / "pkg").mkdir(parents=True)
+    (repo / "node_modules").mkdir()
+    (repo / "a.py").write_text("import os\n", encoding="utf-8")
+    (repo / "pkg" / "b.py").write_text("x = 1\n", encoding="utf-8")
+    (repo / "notes.md").write_text("# skipped\n", encoding="utf-8")
+    (repo / "node_modules" / "c.js").write_text("ignored()\n", encoding="utf-8")
+
+    counted, stats = await count_directory_tokens(repo, [".py", ".js"])
+    assert [item.rel_path for item, _ in counted] == ["a.py", "pkg/b.py"]
+    assert stats["files_read"] == 2
+    first = dict((item.rel_path, counts) for item, counts in counted)
+    assert first["a.py"]["line_count"] == 2
+    assert first["a.py"]["token_count"] > 0
+
+    # Unchanged tree: nothing is read
+    _, stats = await count_directory_tokens(repo, [".py", ".js"])
+    assert stats["files_read"] == 0
+    assert stats["cache_hits"] == 2
+
+    # Touched but identical content keeps its counts; edits are recounted
+    st = os.stat(repo / "a.py")
+    os.utime(repo / "a.py", ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+    (repo / "pkg" / "b.py").write_text("x = 1\ny = 2\n", encoding="utf-8")
+    counted, stats = await count_directory_tokens(repo, [".py", ".js"])
+    assert stats["files_read"] == 2
+    assert stats["cache_misses"] == 1
+    recounted = dict((item.rel_path, counts) for item, counts in counted)
+    assert recounted["a.py"] == first["a.py"]
+    assert recounted["pkg/b.py"]["line_count"] == 3
+
+
+@pytest.mark.asyncio
+async def test_pool_counts_match_serial_counts(tmp_path, monkeypatch):
+    from meta_mcp.tools import directory_tokens
+
+    monkeypatch.setattr(scan_cache, "CACHE_DIR", tmp_path / "cache")
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    for i in range(6):
+        (repo / f"m{i}.py").write_text(f"def f{i}(x):\n    return x * {i}\n" * (i + 1))
+
+    serial, _ = await count_directory_tokens(repo, [".py"], max_workers=1, use_cache=False)
+    monkeypatch.setattr(directory_tokens, "PARALLEL_MIN_BYTES", 0)
+    monkeypatch.setattr(directory_tokens, "BATCH_MAX_FILES", 2)
+    pooled, stats = await count_directory_tokens(repo, [".py"], max_workers=2, use_cache=False)
+
+    assert stats["workers"] == 2
+    assert [(item.rel_path, counts) for item, counts in pooled] == [
+        (item.rel_path, counts) for item, counts in serial
+    ]
@@ -0,0 +1,45 @@
+import os
+
+from meta_mcp.tools import scan_cache
+from meta_mcp.tools.file_result_cache import FileResultCache
+from meta_mcp.tools.repo_walker import walk_repo
+
+
+def _scan(repo, calls):
+    cache = FileResultCache(str(repo))
+    results = {}
+    for item in walk_repo(repo):
+
+        def compute(text, rel_path=item.rel_path):
+            calls.append(rel_path)
+            return {"lines": len(text.splitlines())}
+
+        results[item.rel_path] = cache.get_or_compute(item, compute)
+    cache.save()
+    return results
+
+
+def test_only_changed_files_are_recomputed(tmp_path, monkeypatch):
+    monkeypatch.setattr(scan_cache, "CACHE_DIR", tmp_path / "cache")
+    repo = tmp_path / "repo"
+    (repo / "pkg").mkdir(parents=True)
+    (repo / "a.py").write_text("a = 1\n", encoding="utf-8")
+    (repo / "pkg" / "b.py").write_text("b = 1\n", encoding="utf-8")
+
+    calls = []
+    _scan(repo, calls)
+    assert sorted(calls) == ["a.py", "pkg/b.py"]
+
+    # Unchanged tree: everything comes from the cache
+    calls.clear()
+    _scan(repo, calls)
+    assert calls == []
+
+    # Edit in a subdirectory is detected; a touch without changes is not
+    (repo / "pkg" / "b.py").write_text("b = 1\nc = 2\n", encoding="utf-8")
+    st = os.stat(repo / "a.py")
+    os.utime(repo / "a.py", ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+    calls.clear()
+    results = _scan(repo, calls)
+    assert calls == ["pkg/b.py"]
+    assert results["pkg/b.py"] == {"lines": 2}
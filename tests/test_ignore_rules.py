@@ -0,0 +1,74 @@
+from meta_mcp.tools.ignore_rules import IgnoreMatcher, IgnoreRules
+from meta_mcp.tools.repo_walker import walk_repo
+
+
+def test_rules_follow_gitignore_semantics():
+    rules = IgnoreRules(["*.log", "!keep.log", "/build/", "docs/**/*.tmp", "# note"])
+
+    assert rules.match("a/b/app.log", is_dir=False) is True
+    assert rules.match("a/keep.log", is_dir=False) is False
+    assert rules.match("build", is_dir=True) is True
+    assert rules.match("build", is_dir=False) is None
+    assert rules.match("src/build", is_dir=True) is None
+    assert rules.match("docs/x/y/z.tmp", is_dir=False) is True
+    assert rules.match("src/app.py", is_dir=False) is None
+
+
+def test_walk_applies_nested_gitignores_and_prunes(tmp_path):
+    files = [
+        "app.py",
+        "debug.log",
+        "logs/keep.txt",
+        "logs/drop.txt",
+        "pkg/gen/out.py",
+        "pkg/mod.py",
+        "pkg/data.csv",
+        "vendor/lib.js",
+    ]
+    for rel in files:
+        (tmp_path / rel).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / rel).write_text("", encoding="utf-8")
+    (tmp_path / ".gitignore").write_text(
+        "*.log\nlogs/*\n!logs/keep.txt\nvendor/\n!vendor/lib.js\n", encoding="utf-8"
+    )
+    (tmp_path / "pkg" / ".gitignore").write_text("gen/\n*.csv\n", encoding="utf-8")
+
+    matcher = IgnoreMatcher(tmp_path, ["*.md"])
+    rel_paths = [f.rel_path for f in walk_repo(tmp_path, matcher=matcher)]
+
+    # vendor/ is pruned, so its negation cannot re-include lib.js (as in git)
+    assert rel_paths == [
+        ".gitignore",
+        "app.py",
+        "logs/keep.txt",
+        "pkg/.gitignore",
+        "pkg/mod.py",
+    ]
+    assert matcher.is_ignored("pkg/gen/out.py")
+    assert matcher.is_ignored("vendor/lib.js")
+    assert matcher.is_ignored("README.md")
+    assert not matcher.is_ignored("logs/keep.txt")
+
+
+def test_bracket_classes_and_invalid_patterns(tmp_path):
+    import warnings
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        rules = IgnoreRules(["[z-a].txt", "log[[:digit:]].txt", "x[!a-c].py", "*.log"])
+
+    # The invalid range is dropped; the remaining rules still apply
+    assert len(rules.rules) == 3
+    assert rules.match("log7.txt", is_dir=False) is True
+    assert rules.match("loga.txt", is_dir=False) is None
+    assert rules.match("log[.txt", is_dir=False) is None
+    assert rules.match("xd.py", is_dir=False) is True
+    assert rules.match("xb.py", is_dir=False) is None
+    assert rules.match("z.txt", is_dir=False) is None
+
+    (tmp_path / ".gitignore").write_text("[z-a]\n*.log\n", encoding="utf-8")
+    (tmp_path / "app.log").write_text("", encoding="utf-8")
+    (tmp_path / "app.py").write_text("", encoding="utf-8")
+    matcher = IgnoreMatcher(tmp_path)
+    rel_paths = [f.rel_path for f in walk_repo(tmp_path, matcher=matcher)]
+    assert "app.py" in rel_paths and "app.log" not in rel_paths
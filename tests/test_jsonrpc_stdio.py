@@ -0,0 +1,117 @@
+import asyncio
+import sys
+
+import pytest
+from meta_mcp.tools.jsonrpc_stdio import (
+    FRAMING_HEADER,
+    FRAMING_NEWLINE,
+    STREAM_LIMIT,
+    JsonRpcConnection,
+    MalformedHeaderError,
+    encode_message,
+    read_message,
+)
+from meta_mcp.tools.smoke_test import smoke_test_server
+
+# Answers every request with its params, framed with Content-Length headers
+HEADER_SERVER = r"""
+import json
+import sys
+
+stdin, stdout = sys.stdin.buffer, sys.stdout.buffer
+while True:
+    line = stdin.readline()
+    if not line:
+        break
+    line = line.strip()
+    if not line:
+        continue
+    if line.lower().startswith(b"content-length:"):
+        length = int(line.split(b":")[1])
+        stdin.readline()
+        line = stdin.read(length)
+    message = json.loads(line)
+    if "id" not in message:
+        continue
+    body = json.dumps({"jsonrpc": "2.0", "id": message["id"], "result": message.get("params")})
+    stdout.write(b"Content-Length: %d\r\n\r\n" % len(body) + body.encode())
+    stdout.flush()
+"""
+
+ECHO_SERVER = """
+from fastmcp import FastMCP
+
+mcp = FastMCP("echo")
+
+
+@mcp.tool
+def status() -> str:
+    return "ok"
+
+
+if __name__ == "__main__":
+    mcp.run(show_banner=False)
+"""
+
+
+@pytest.mark.asyncio
+async def test_read_message_accepts_both_framings():
+    reader = asyncio.StreamReader()
+    reader.feed_data(
+        encode_message({"a": 1}, FRAMING_NEWLINE)
+        + b"\n"
+        + encode_message({"b": "é"}, FRAMING_HEADER)
+    )
+    reader.feed_eof()
+    assert await read_message(reader) == (b'{"a":1}', FRAMING_NEWLINE)
+    body, framing = await read_message(reader)
+    assert framing == FRAMING_HEADER
+    assert body.decode("utf-8") == '{"b":"é"}'
+    assert await read_message(reader) is None
+
+
+@pytest.mark.asyncio
+async def test_read_message_reports_malformed_content_length():
+    reader = asyncio.StreamReader()
+    reader.feed_data(
+        b"Content-Length: twelve\r\nContent-Type: json\r\n\r\n"
+        + encode_message({"a": 1}, FRAMING_NEWLINE)
+    )
+    reader.feed_eof()
+    with pytest.raises(MalformedHeaderError, match="twelve"):
+        await read_message(reader)
+    # The header block is consumed, so reading resumes at the next message
+    assert await read_message(reader) == (b'{"a":1}', FRAMING_NEWLINE)
+
+
+@pytest.mark.asyncio
+async def test_pipelined_requests_over_header_framing(tmp_path):
+    script = tmp_path / "header_server.py"
+    script.write_text(HEADER_SERVER, encoding="utf-8")
+    process = await asyncio.create_subprocess_exec(
+        sys.executable,
+        str(script),
+        stdin=asyncio.subprocess.PIPE,
+        stdout=asyncio.subprocess.PIPE,
+        limit=STREAM_LIMIT,
+    )
+    connection = JsonRpcConnection(process, framing=FRAMING_HEADER)
+    try:
+        results = await asyncio.gather(
+            *(connection.request("echo", {"n": i}, timeout=10) for i in range(50))
+        )
+        assert results == [{"n": i} for i in range(50)]
+    finally:
+        await connection.close()
+        process.kill()
+        await process.wait()
+
+
+@pytest.mark.asyncio
+async def test_smoke_test_uses_codec(tmp_path):
+    server_path = tmp_path / "echo_server.py"
+    server_path.write_text(ECHO_SERVER, encoding="utf-8")
+    result = await smoke_test_server(str(server_path), timeout=30)
+    assert result["success"], result["errors"]
+    assert result["smoke_tool_called"] == "status"
+    assert result["smoke_response_length"] == 2
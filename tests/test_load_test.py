@@ -0,0 +1,91 @@
+import json
+
+import pytest
+from meta_mcp.tools.load_test import (
+    _percentile,
+    compare_load_tests,
+    load_test_server,
+    summarize_latencies,
+)
+
+SERVER_SOURCE = """
+from fastmcp import FastMCP
+
+mcp = FastMCP("echo")
+
+
+@mcp.tool
+def add(a: int, b: int) -> int:
+    return a + b
+
+
+@mcp.tool
+def status() -> str:
+    return "ok"
+
+
+if __name__ == "__main__":
+    mcp.run(show_banner=False)
+"""
+
+
+@pytest.mark.asyncio
+async def test_load_test_reports_per_tool_latency(tmp_path):
+    server_path = tmp_path / "echo_server.py"
+    server_path.write_text(SERVER_SOURCE, encoding="utf-8")
+    output_path = tmp_path / "run.json"
+
+    result = await load_test_server(
+        str(server_path),
+        sessions=2,
+        duration=3.0,
+        tool_mix=[
+            {"tool": "add", "arguments": {"a": 1, "b": 2}, "weight": 3},
+            {"tool": "status"},
+        ],
+        seed=7,
+        output_path=str(output_path),
+    )
+    assert result["success"], result["errors"]
+    assert result["sessions_started"] == 2
+    add = result["tools"]["add"]
+    assert add["errors"] == 0
+    # First call per session is cold, every later one warm
+    assert add["latency_ms"]["cold"]["count"] <= 2
+    assert add["latency_ms"]["warm"]["count"] > 0
+    assert (
+        add["latency_ms"]["cold"]["count"] + add["latency_ms"]["warm"]["count"]
+        == add["calls"]
+    )
+    warm = add["latency_ms"]["warm"]
+    assert warm["p50"] <= warm["p95"] <= warm["p99"] <= warm["max"]
+
+    saved = json.loads(output_path.read_text(encoding="utf-8"))
+    assert saved["total_calls"] == result["total_calls"]
+    assert compare_load_tests(str(output_path), result)["regressions"] == []
+
+
+def test_compare_flags_slower_tools():
+    def run(p95, rate):
+        return {
+            "tools": {
+                "add": {
+                    "throughput_per_s": rate,
+                    "latency_ms": {"warm": {"p95": p95}},
+                }
+            }
+        }
+
+    assert compare_load_tests(run(10.0, 100.0), run(10.5, 98.0))["regressions"] == []
+    assert compare_load_tests(run(10.0, 100.0), run(15.0, 100.0))["regressions"] == ["add"]
+    assert compare_load_tests(run(10.0, 100.0), run(10.0, 50.0))["regressions"] == ["add"]
+
+
+def test_percentiles_use_nearest_rank():
+    assert _percentile([1, 2, 3, 4, 5], 50) == 3
+    assert _percentile(list(range(1, 151)), 99) == 149
+    assert _percentile(list(range(1, 101)), 95) == 95
+    assert _percentile([7], 99) == 7
+
+    summary = summarize_latencies([5, 1, 4, 2, 3])
+    assert (summary["p50"], summary["p95"], summary["p99"]) == (3, 5, 5)
@@ -0,0 +1,180 @@
+import asyncio
+import json
+import tempfile
+import threading
+from pathlib import Path
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from meta_mcp.tools import scan_cache
+from meta_mcp.tools.mcp_repo_analyzer import (
+    _analyze_repos_concurrently,
+    _list_repo_dirs,
+    analyze_runts,
+    analyze_runts_stream,
+)
+
+SERVER = '''
+import structlog
+from fastmcp import FastMCP
+
+logger = structlog.get_logger(__name__)
+mcp = FastMCP("{name}")
+
+{tools}
+'''
+
+TOOL = '''
+@mcp.tool()
+def {name}(value: str) -> str:
+    """Return the value.
+
+    Args:
+        value: Input text
+
+    Returns:
+        The same text
+    """
+    return value
+'''
+
+
+def make_workspace(root, repos):
+    for name, (fastmcp_version, tool_names) in repos.items():
+        repo = root / name
+        (repo / "src").mkdir(parents=True)
+        (repo / "pyproject.toml").write_text(
+            f'[project]\nname = "{name}"\ndependencies = ["fastmcp>={fastmcp_version}"]\n',
+            encoding="utf-8",
+        )
+        (repo / "requirements.txt").write_text(f"fastmcp>={fastmcp_version}\n", encoding="utf-8")
+        tools = "".join(TOOL.format(name=tool) for tool in tool_names)
+        (repo / "src" / "server.py").write_text(
+            SERVER.format(name=name, tools=tools), encoding="utf-8"
+        )
+    (root / "notes").mkdir()  # Not an MCP repo
+    (root / "notes" / "todo.txt").write_text("nothing here\n", encoding="utf-8")
+
+
+REPOS = {
+    "old-mcp": ("2.10.0", ["help", "status"]),
+    "echo-mcp": ("2.13.3", ["echo"]),
+    "big-mcp": ("2.13.3", [f"tool_{i}" for i in range(17)]),
+    "docs-mcp": ("2.12.0", ["search", "fetch", "status"]),
+}
+
+
+def comparable(result):
+    result = dict(result)
+    result.pop("timestamp")
+    return result
+
+
+@pytest.fixture
+def workspace():
+    # Not under pytest's tmp_path: files whose path contains "test" are
+    # analyzed as test code
+    with tempfile.TemporaryDirectory(prefix="repos-") as root:
+        yield Path(root)
+
+
+@pytest.mark.asyncio
+async def test_parallel_scan_matches_serial_scan(workspace):
+    make_workspace(workspace, REPOS)
+
+    serial = await analyze_runts(str(workspace), use_cache=False, max_workers=1)
+    parallel = await analyze_runts(str(workspace), use_cache=False, max_workers=3)
+
+    assert serial["success"] and serial["summary"]["total_mcp_repos"] == 4
+    assert comparable(parallel) == comparable(serial)
+    repos = serial["runts"] + serial["sota_repos"]
+    tool_counts = {repo["name"]: repo["tool_count"] for repo in repos}
+    assert tool_counts == {"old-mcp": 2, "echo-mcp": 1, "big-mcp": 17, "docs-mcp": 3}
+
+
+@pytest.mark.asyncio
+async def test_stream_yields_each_repo_then_summary(workspace, tmp_path, monkeypatch):
+    monkeypatch.setattr(scan_cache, "CACHE_DIR", tmp_path)
+    make_workspace(workspace, REPOS)
+
+    events = [event async for event in analyze_runts_stream(str(workspace), max_workers=2)]
+
+    *repos, summary = events
+    assert {event["event"] for event in repos} == {"repo"}
+    assert sorted(event["data"]["name"] for event in repos) == sorted(REPOS)
+    assert summary["event"] == "summary"
+    assert summary["data"]["summary"]["total_mcp_repos"] == len(REPOS)
+
+    missing = [event async for event in analyze_runts_stream(str(workspace / "nope"))]
+    assert [event["event"] for event in missing] == ["error"]
+
+
+def test_stream_endpoint_ndjson_and_sse(workspace, tmp_path, monkeypatch):
+    from meta_mcp.api_router import router
+
+    monkeypatch.setattr(scan_cache, "CACHE_DIR", tmp_path)
+    make_workspace(workspace, REPOS)
+    app = FastAPI()
+    app.include_router(router)
+    client = TestClient(app)
+    url = "/api/v1/analysis/runt-analyzer/stream"
+    body = {"repo_path": str(workspace), "max_workers": 2}
+
+    response = client.post(url, json=body)
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    records = [json.loads(line) for line in response.text.splitlines()]
+    assert [r["event"] for r in records] == ["repo"] * len(REPOS) + ["summary"]
+    assert sorted(r["data"]["name"] for r in records[:-1]) == sorted(REPOS)
+    assert records[-1]["data"]["summary"]["total_mcp_repos"] == len(REPOS)
+
+    response = client.post(url, json={**body, "stream_format": "sse"})
+    assert response.headers["content-type"].startswith("text/event-stream")
+    frames = response.text.split("\n\n")
+    assert frames[-1] == ""  # Every frame ends with a blank line
+    parsed = []
+    for frame in frames[:-1]:
+        event_line, data_line = frame.split("\n")
+        assert event_line.startswith("event: ") and data_line.startswith("data: ")
+        parsed.append((event_line[len("event: "):], json.loads(data_line[len("data: "):])))
+    assert [event for event, _ in parsed] == ["repo"] * len(REPOS) + ["summary"]
+    assert parsed[-1][1]["summary"]["total_mcp_repos"] == len(REPOS)
+
+    response = client.post(url, json={**body, "stream_format": "xml"})
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_parallel_scan_while_another_thread_holds_cache_lock(
+    workspace, tmp_path, monkeypatch
+):
+    # Worker processes use the per-file cache, which takes scan_cache._lock
+    monkeypatch.setattr(scan_cache, "CACHE_DIR", tmp_path)
+    make_workspace(workspace, REPOS)
+
+    locked, release = threading.Event(), threading.Event()
+
+    def hold_lock():
+        with scan_cache._lock:
+            locked.set()
+            release.wait(60)
+
+    holder = threading.Thread(target=hold_lock)
+    holder.start()
+    try:
+        assert locked.wait(5)
+        results = await asyncio.wait_for(
+            _analyze_repos_concurrently(
+                _list_repo_dirs(workspace), max_workers=2, use_file_cache=True
+            ),
+            timeout=60,
+        )
+    finally:
+        release.set()
+        holder.join()
+
+    tool_counts = {r["name"]: r["tool_count"] for r in results if r}
+    assert tool_counts == {"old-mcp": 2, "echo-mcp": 1, "big-mcp": 17, "docs-mcp": 3}
+    # The workers cached their per-file results where this process would
+    assert scan_cache.get_cache_stats()["total_files"] == len(REPOS)
@@ -0,0 +1,70 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from meta_mcp.tools.decorators import tool
+from meta_mcp.tools.metrics import (
+    TOOL_CALLS,
+    TOOL_DURATION,
+    MetricsMiddleware,
+    MetricsRegistry,
+    metrics_registry,
+)
+
+
+def test_histogram_renders_cumulative_buckets():
+    registry = MetricsRegistry()
+    latency = registry.histogram("latency_seconds", "Latency.", ["tool"], buckets=[0.1, 1.0])
+    series = latency.labels("pack")
+    for value in (0.05, 0.1, 0.5, 3.0):
+        series.observe(value)
+
+    text = registry.render()
+    assert 'latency_seconds_bucket{tool="pack",le="0.1"} 2' in text
+    assert 'latency_seconds_bucket{tool="pack",le="1"} 3' in text
+    assert 'latency_seconds_bucket{tool="pack",le="+Inf"} 4' in text
+    assert 'latency_seconds_count{tool="pack"} 4' in text
+    assert series.quantile(0.5) == pytest.approx(0.1)
+
+    with pytest.raises(ValueError):
+        latency.labels("pack", "extra")
+    with pytest.raises(ValueError):
+        registry.counter("latency_seconds", "Clash.")
+
+
+@pytest.mark.asyncio
+async def test_tool_wrapper_records_calls_and_errors():
+    @tool(name="metrics_test_tool")
+    async def metrics_test_tool(fail: bool = False):
+        if fail:
+            raise RuntimeError("boom")
+        return "ok"
+
+    await metrics_test_tool()
+    with pytest.raises(RuntimeError):
+        await metrics_test_tool(fail=True)
+
+    assert TOOL_CALLS.labels("metrics_test_tool", "success").value == 1
+    assert TOOL_CALLS.labels("metrics_test_tool", "error").value == 1
+    assert TOOL_DURATION.labels("metrics_test_tool").count == 2
+
+
+def test_http_middleware_labels_by_route_template():
+    app = FastAPI()
+    app.add_middleware(MetricsMiddleware)
+
+    @app.get("/servers/{server_id}/status")
+    async def status(server_id: str):
+        return {"server_id": server_id}
+
+    client = TestClient(app)
+    for server_id in ("a", "b", "c"):
+        assert client.get(f"/servers/{server_id}/status").status_code == 200
+    assert client.get("/missing").status_code == 404
+
+    text = metrics_registry.render()
+    assert (
+        'meta_mcp_http_requests_total{method="GET",route="/servers/{server_id}/status",status="200"} 3'
+        in text
+    )
+    assert 'route="unmatched",status="404"' in text
+    assert "meta_mcp_http_requests_in_flight 0" in text
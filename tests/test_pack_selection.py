@@ -0,0 +1,48 @@
+import itertools
+
+from meta_mcp.tools.pack_selection import (
+    build_import_graph,
+    knapsack_select,
+    score_files,
+)
+
+
+def test_knapsack_matches_brute_force():
+    values = [6.0, 10.0, 12.0, 7.0, 3.0, 9.0]
+    weights = [10, 20, 30, 15, 5, 25]
+    capacity = 50
+
+    best = max(
+        (
+            combo
+            for r in range(len(values) + 1)
+            for combo in itertools.combinations(range(len(values)), r)
+            if sum(weights[i] for i in combo) <= capacity
+        ),
+        key=lambda combo: sum(values[i] for i in combo),
+    )
+    selected = knapsack_select(values, weights, capacity)
+    assert sum(weights[i] for i in selected) <= capacity
+    assert sum(values[i] for i in selected) == sum(values[i] for i in best)
+
+
+def test_central_and_entry_files_rank_above_leaves():
+    files = [
+        {"path": "README.md", "content": "# demo\n"},
+        {"path": "src/app/__init__.py", "content": ""},
+        {"path": "src/app/main.py", "content": "from app import core\n"},
+        {"path": "src/app/core.py", "content": "from .util import helper\n"},
+        {"path": "src/app/api.py", "content": "from app.core import run\n"},
+        {"path": "src/app/util.py", "content": "def helper(): pass\n"},
+        {"path": "src/app/unused.py", "content": "x = 1\n"},
+        {"path": "tests/test_core.py", "content": "from app import core\n"},
+    ]
+    graph = build_import_graph(files)
+    assert graph["src/app/main.py"] == {"src/app/core.py"}
+    assert graph["src/app/core.py"] == {"src/app/util.py"}
+
+    scores = score_files(files)
+    assert scores["README.md"]["score"] == 1.0
+    assert scores["src/app/core.py"]["score"] > scores["src/app/unused.py"]["score"]
+    assert scores["src/app/main.py"]["proximity"] == 1.0
+    assert scores["tests/test_core.py"]["score"] < scores["src/app/api.py"]["score"]
@@ -0,0 +1,26 @@
+import re
+
+from meta_mcp.tools.pattern_set import PatternSet
+
+
+def test_pattern_set_counts_and_lines():
+    rules = PatternSet(
+        {"print": r"^\s*print\s*\(", "shout": ["ERROR", "FATAL"]},
+        category_flags={"print": re.MULTILINE, "shout": re.IGNORECASE},
+    )
+    text = "print('a')\nx = 1\nlog('error')\n  print('b')"
+
+    assert rules.counts(text) == {"print": 2, "shout": 1}
+    assert list(rules.matching_lines(text)) == [
+        (1, "print('a')"),
+        (3, "log('error')"),
+        (4, "  print('b')"),
+    ]
+    assert [key for key, _ in rules.finditer(text)] == ["print", "shout", "print"]
+
+
+def test_pattern_set_empty_never_matches():
+    rules = PatternSet({})
+
+    assert rules.search("anything") is None
+    assert list(rules.matching_lines("anything")) == []
@@ -0,0 +1,79 @@
+import asyncio
+import os
+import sys
+
+import pytest
+from meta_mcp.tools.process_supervisor import (
+    RestartPolicy,
+    SupervisedProcess,
+    sample_process,
+)
+
+# Writes far more to stderr than a pipe buffer holds, prints a stray stdout
+# line, then exits with the code given on the command line
+CHATTY_SCRIPT = """
+import sys
+
+for _ in range(1024):
+    sys.stderr.write("x" * 1023 + "\\n")
+sys.stderr.write("done\\n")
+print("not json", flush=True)
+sys.exit(int(sys.argv[1]))
+"""
+
+
+async def _wait_for(predicate, timeout=10.0):
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not predicate():
+        assert asyncio.get_running_loop().time() < deadline
+        await asyncio.sleep(0.05)
+
+
+@pytest.mark.asyncio
+async def test_failing_process_is_restarted_then_given_up(tmp_path):
+    script = tmp_path / "chatty.py"
+    script.write_text(CHATTY_SCRIPT, encoding="utf-8")
+    policy = RestartPolicy(max_restarts=2, backoff_initial=0.05)
+    supervisor = SupervisedProcess(
+        "chatty", [sys.executable, str(script), "3"], policy=policy, tail_lines=5
+    )
+    await supervisor.start()
+    try:
+        await _wait_for(
+            lambda: supervisor.state == "failed" and len(supervisor.stdout_tail) == 3
+        )
+        status = supervisor.status()
+        assert status["total_restarts"] == 2
+        assert [e["exit_code"] for e in status["recent_exits"]] == [3, 3, 3]
+        # 1 MiB of stderr per run was drained; buffers span restarts and
+        # keep only their tail
+        assert len(status["stderr_tail"]) == 5
+        assert status["stdout_tail"] == ["not json"] * 3
+    finally:
+        await supervisor.stop()
+
+
+@pytest.mark.asyncio
+async def test_clean_exit_is_not_restarted_on_failure_policy(tmp_path):
+    script = tmp_path / "chatty.py"
+    script.write_text(CHATTY_SCRIPT, encoding="utf-8")
+    supervisor = SupervisedProcess("chatty", [sys.executable, str(script), "0"])
+    await supervisor.start()
+    await _wait_for(lambda: supervisor.state == "exited")
+    assert supervisor.total_restarts == 0
+    await supervisor.stop()
+
+
+def test_restart_backoff_is_capped():
+    policy = RestartPolicy(backoff_initial=1.0, backoff_factor=2.0, backoff_max=5.0)
+    assert [policy.delay(n) for n in range(5)] == [1.0, 2.0, 4.0, 5.0, 5.0]
+    with pytest.raises(ValueError):
+        RestartPolicy(mode="sometimes")
+
+
+@pytest.mark.skipif(not os.path.isdir("/proc/self"), reason="requires /proc")
+def test_sample_process_reads_proc():
+    sample = sample_process(os.getpid())
+    assert sample["rss_bytes"] > 0
+    assert sample["threads"] >= 1
+    assert sample["open_fds"] >= 3
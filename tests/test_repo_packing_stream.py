@@ -0,0 +1,83 @@
+import pytest
+from meta_mcp.services.repo_packing_service import RepoPackingService
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("output_format", ["xml", "markdown", "json", "plain"])
+async def test_streamed_pack_matches_in_memory_pack(tmp_path, output_format):
+    repo = tmp_path / "repo"
+    (repo / "pkg").mkdir(parents=True)
+    (repo / "pkg" / "a.py").write_text("print('a')\n" * 50, encoding="utf-8")
+    (repo / "pkg" / "b.md").write_text("# B\n\nnotes\n", encoding="utf-8")
+    (repo / "README.md").write_text("# Repo\n", encoding="utf-8")
+
+    service = RepoPackingService()
+    packed = await service.pack_repository(str(repo), output_format)
+    chunks = [
+        chunk
+        async for chunk in service.stream_pack(str(repo), output_format, chunk_size=64)
+    ]
+    assert len(chunks) > 1
+    assert b"".join(chunks).decode("utf-8") == packed["data"]["packed_content"]
+
+    result = await service.write_pack(str(repo), str(tmp_path / "out"), output_format)
+    assert result["data"]["total_files"] == 3
+    assert result["data"]["total_tokens"] == packed["data"]["total_tokens"]
+    assert (tmp_path / "out").read_text(encoding="utf-8") == packed["data"][
+        "packed_content"
+    ]
+
+
+@pytest.mark.asyncio
+async def test_cancelled_stream_releases_worker_threads(tmp_path, monkeypatch):
+    import asyncio
+    import queue
+    import threading
+    import types
+
+    from meta_mcp.services import repo_packing_service
+
+    pending_gets = []
+
+    class TrackingQueue(queue.Queue):
+        def get(self, *args, **kwargs):
+            pending_gets.append(1)
+            try:
+                return super().get(*args, **kwargs)
+            finally:
+                pending_gets.pop()
+
+    monkeypatch.setattr(
+        repo_packing_service, "queue",
+        types.SimpleNamespace(Queue=TrackingQueue, Full=queue.Full),
+    )
+
+    release = threading.Event()
+
+    def slow_chunks(*args, **kwargs):
+        yield b"first"
+        release.wait(5)
+        yield b"second"
+
+    service = RepoPackingService()
+    monkeypatch.setattr(service, "_pack_chunks", slow_chunks)
+    first_chunk = asyncio.Event()
+
+    async def consume():
+        async for _ in service.stream_pack(str(tmp_path)):
+            first_chunk.set()
+
+    task = asyncio.create_task(consume())
+    await asyncio.wait_for(first_chunk.wait(), 5)
+    await asyncio.sleep(0.05)  # The consumer is now waiting in chunks.get()
+    task.cancel()
+    await asyncio.sleep(0.05)  # The stream is now waiting for its producer
+    release.set()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    for _ in range(100):
+        if not pending_gets:
+            break
+        await asyncio.sleep(0.02)
+    assert not pending_gets
@@ -0,0 +1,26 @@
+from meta_mcp.tools.repo_walker import walk_repo
+
+
+def test_walk_repo_prunes_ignored_dirs(tmp_path):
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src" / "server.py").write_text("x = 1", encoding="utf-8")
+    (tmp_path / "node_modules" / "pkg").mkdir(parents=True)
+    (tmp_path / "node_modules" / "pkg" / "index.js").write_text("", encoding="utf-8")
+    (tmp_path / "README.md").write_text("# repo", encoding="utf-8")
+
+    rel_paths = [f.rel_path for f in walk_repo(tmp_path)]
+
+    assert rel_paths == ["README.md", "src/server.py"]
+
+
+def test_walk_repo_custom_ignore(tmp_path):
+    (tmp_path / "keep").mkdir()
+    (tmp_path / "keep" / "a.py").write_text("", encoding="utf-8")
+    (tmp_path / "skip").mkdir()
+    (tmp_path / "skip" / "b.py").write_text("", encoding="utf-8")
+
+    files = list(walk_repo(tmp_path, ignore_dirs={"skip"}))
+
+    assert [f.rel_path for f in files] == ["keep/a.py"]
+    assert files[0].suffix == ".py"
+    assert files[0].parts == ("keep", "a.py")
@@ -0,0 +1,68 @@
+import asyncio
+import tempfile
+from pathlib import Path
+
+import pytest
+from meta_mcp.services.repo_watcher_service import RepoWatcherService
+from meta_mcp.tools import scan_cache
+
+TOOL = '''
+@mcp.tool()
+def {name}(value: str) -> str:
+    """Return the value."""
+    return value
+'''
+
+
+def write_server(repo, tool_names):
+    tools = "".join(TOOL.format(name=name) for name in tool_names)
+    (repo / "server.py").write_text(
+        f'from fastmcp import FastMCP\n\nmcp = FastMCP("demo")\n{tools}', encoding="utf-8"
+    )
+
+
+async def wait_for(predicate, timeout=10.0):
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not predicate():
+        assert asyncio.get_running_loop().time() < deadline, "timed out"
+        await asyncio.sleep(0.05)
+
+
+def cached_tool_count(root):
+    cached = scan_cache.get_cached_scan(str(root), 1)
+    if not cached:
+        return None
+    repos = cached["runts"] + cached["sota_repos"]
+    return repos[0]["tool_count"] if repos else None
+
+
+@pytest.fixture
+def root():
+    # Not under pytest's tmp_path: files whose path contains "test" are
+    # analyzed as test code
+    with tempfile.TemporaryDirectory(prefix="repos-") as path:
+        yield Path(path)
+
+
+@pytest.mark.asyncio
+async def test_file_change_updates_cached_scan(root, tmp_path, monkeypatch):
+    monkeypatch.setattr(scan_cache, "CACHE_DIR", tmp_path / "cache")
+    repo = root / "demo-mcp"
+    repo.mkdir()
+    (repo / "requirements.txt").write_text("fastmcp>=2.13.3\n", encoding="utf-8")
+    write_server(repo, ["echo"])
+
+    watcher = RepoWatcherService(str(root), debounce_ms=50)
+    assert await watcher.start()
+    try:
+        await wait_for(lambda: cached_tool_count(root) == 1)
+        assert watcher.covers(str(root))
+
+        # Give awatch a moment to start before changing files
+        await asyncio.sleep(0.5)
+        write_server(repo, ["echo", "reverse", "upper"])
+
+        await wait_for(lambda: cached_tool_count(root) == 3)
+        assert watcher.get_scan_result()["summary"]["total_mcp_repos"] == 1
+    finally:
+        await watcher.stop()
@@ -0,0 +1,25 @@
+import threading
+
+import pytest
+from meta_mcp.tools.repomix_analyzer import RepomixAnalysisService
+
+
+@pytest.mark.asyncio
+async def test_repomix_probe_runs_once_off_the_event_loop(tmp_path, monkeypatch):
+    probes = []
+
+    def check():
+        probes.append(threading.current_thread())
+        return False
+
+    service = RepomixAnalysisService()
+    monkeypatch.setattr(service, "_check_repomix_availability", check)
+
+    for _ in range(2):
+        result = await service.analyze_with_repomix(str(tmp_path))
+        assert result["success"] is False
+        assert "npm install -g repomix" in result["install_command"]
+
+    assert len(probes) == 1
+    assert probes[0] is not threading.main_thread()
+    assert service.repomix_available is False
@@ -0,0 +1,157 @@
+import asyncio
+import time
+
+import pytest
+from fastmcp import Client, FastMCP
+from meta_mcp.tools.decorators import rate_limited, retry_on_failure
+from meta_mcp.tools.resilience import (
+    ClientContextMiddleware,
+    RateLimiter,
+    RateLimitExceeded,
+    TokenBucket,
+    backoff_delay,
+    client_id_var,
+    current_client,
+)
+
+
+def test_token_bucket_refills_over_time():
+    bucket = TokenBucket(rate=100.0, capacity=2)
+    assert bucket.try_acquire() == 0.0
+    assert bucket.try_acquire() == 0.0
+    wait = bucket.try_acquire()
+    assert 0 < wait <= 0.01
+    time.sleep(wait + 0.005)
+    assert bucket.try_acquire() == 0.0
+
+
+def test_limiter_keys_are_independent_and_bounded():
+    limiter = RateLimiter(rate=0.001, capacity=1, max_keys=2)
+    assert limiter.try_acquire("a") == 0.0
+    assert limiter.try_acquire("a") > 0
+    assert limiter.try_acquire("b") == 0.0
+    limiter.try_acquire("c")  # Drops "a", the least recently used bucket
+    assert limiter.try_acquire("a") == 0.0
+
+
+def test_backoff_delay_grows_and_is_capped():
+    assert backoff_delay(0, initial=1.0, jitter=0) == 1.0
+    assert backoff_delay(3, initial=1.0, jitter=0) == 8.0
+    assert backoff_delay(10, initial=1.0, max_delay=30.0, jitter=0) == 30.0
+    for _ in range(100):
+        assert 2.0 <= backoff_delay(2, initial=1.0, jitter=0.5) <= 4.0
+
+
+@pytest.mark.asyncio
+async def test_rate_limit_is_per_client():
+    @rate_limited(calls_per_minute=2)
+    async def ping():
+        return "pong"
+
+    assert await ping() == "pong"
+    assert await ping() == "pong"
+    with pytest.raises(RateLimitExceeded) as excinfo:
+        await ping()
+    assert excinfo.value.retry_after > 0
+
+    token = client_id_var.set("other-client")
+    try:
+        assert await ping() == "pong"
+    finally:
+        client_id_var.reset(token)
+
+
+@pytest.mark.asyncio
+async def test_rate_limit_can_wait_for_a_token():
+    @rate_limited(limiter=RateLimiter(rate=50.0, capacity=1), max_wait=1.0)
+    async def ping():
+        return "pong"
+
+    start = time.perf_counter()
+    assert [await ping() for _ in range(3)] == ["pong"] * 3
+    assert time.perf_counter() - start >= 0.03
+
+
+def test_rate_limit_on_sync_function():
+    @rate_limited(calls_per_minute=1)
+    def ping():
+        return "pong"
+
+    assert ping() == "pong"
+    with pytest.raises(RateLimitExceeded):
+        ping()
+
+
+@pytest.mark.asyncio
+async def test_async_retry_does_not_block_the_event_loop():
+    attempts = 0
+
+    @retry_on_failure(max_retries=2, delay=0.05, jitter=0)
+    async def flaky():
+        nonlocal attempts
+        attempts += 1
+        if attempts < 3:
+            raise ConnectionError("down")
+        return "ok"
+
+    ticks = 0
+
+    async def ticker():
+        nonlocal ticks
+        while True:
+            ticks += 1
+            await asyncio.sleep(0.01)
+
+    task = asyncio.create_task(ticker())
+    try:
+        assert await flaky() == "ok"
+    finally:
+        task.cancel()
+    assert attempts == 3
+    # The loop kept running during the 0.05s + 0.1s backoff
+    assert ticks >= 8
+
+
+@pytest.mark.asyncio
+async def test_retry_gives_up_and_respects_exception_filter():
+    calls = 0
+
+    @retry_on_failure(max_retries=3, delay=0.001, exceptions=(ConnectionError,))
+    async def broken():
+        nonlocal calls
+        calls += 1
+        raise ValueError("not retryable")
+
+    with pytest.raises(ValueError):
+        await broken()
+    assert calls == 1
+
+
+def test_sync_retry():
+    calls = 0
+
+    @retry_on_failure(max_retries=1, delay=0.001)
+    def flaky():
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            raise OSError("once")
+        return calls
+
+    assert flaky() == 2
+
+
+@pytest.mark.asyncio
+async def test_client_middleware_sets_client_per_session():
+    mcp = FastMCP("clients")
+    mcp.add_middleware(ClientContextMiddleware())
+
+    @mcp.tool
+    def who() -> str:
+        return current_client()
+
+    async with Client(mcp) as first, Client(mcp) as second:
+        a = (await first.call_tool("who", {})).data
+        b = (await second.call_tool("who", {})).data
+    assert a != b
+    assert current_client() == "local"
@@ -0,0 +1,128 @@
+import asyncio
+import threading
+import time
+
+import pytest
+from meta_mcp.tools.decorators import cache_result
+from meta_mcp.tools.result_cache import ResultCache, make_key
+
+
+def test_lru_eviction_and_ttl():
+    cache = ResultCache(ttl_seconds=0.05, max_entries=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1  # "b" is now least recently used
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1 and cache.get("c") == 3
+
+    time.sleep(0.06)
+    assert cache.get("a") is None
+    stats = cache.stats()
+    assert stats["evictions"] == 1
+    assert stats["expirations"] == 1
+    assert stats["size"] == 1
+
+
+def test_make_key_handles_unhashable_arguments():
+    assert make_key((1, "x"), {}) == make_key((1, "x"), {})
+    assert make_key((), {"b": 2, "a": 1}) == make_key((), {"a": 1, "b": 2})
+    assert make_key(([1, 2],), {"opts": {"k": 1}}) == make_key(([1, 2],), {"opts": {"k": 1}})
+
+
+def test_equal_arguments_of_different_types_are_cached_apart():
+    calls = []
+
+    @cache_result(ttl_seconds=60)
+    def f(x):
+        calls.append(x)
+        return repr(x)
+
+    assert [f(1), f(True), f(1.0), f(1)] == ["1", "True", "1.0", "1"]
+    assert [f(x=(1,)), f(x=(True,)), f([1]), f([True])] == ["(1,)", "(True,)", "[1]", "[True]"]
+    assert len(calls) == 7
+
+
+@pytest.mark.asyncio
+async def test_async_results_are_cached_and_concurrent_calls_coalesce():
+    calls = 0
+
+    @cache_result(ttl_seconds=60)
+    async def scan(path: str):
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.05)
+        return {"path": path}
+
+    results = await asyncio.gather(*(scan("/repo") for _ in range(10)))
+    assert calls == 1
+    assert all(r == {"path": "/repo"} for r in results)
+
+    assert await scan("/repo") == {"path": "/repo"}
+    assert calls == 1
+    await scan("/other")
+    assert calls == 2
+
+    info = scan.cache_info()
+    assert info["misses"] == 2
+    assert info["coalesced"] == 9
+    assert info["hits"] == 10
+
+
+@pytest.mark.asyncio
+async def test_async_failures_are_not_cached():
+    calls = 0
+
+    @cache_result()
+    async def flaky():
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            raise RuntimeError("boom")
+        return "ok"
+
+    with pytest.raises(RuntimeError):
+        await flaky()
+    assert await flaky() == "ok"
+    assert calls == 2
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_does_not_cancel_shared_call():
+    started = asyncio.Event()
+
+    @cache_result()
+    async def slow():
+        started.set()
+        await asyncio.sleep(0.05)
+        return 42
+
+    first = asyncio.create_task(slow())
+    await started.wait()
+    second = asyncio.create_task(slow())
+    await asyncio.sleep(0)
+    first.cancel()
+    assert await second == 42
+
+
+def test_sync_function_single_flight_across_threads():
+    calls = 0
+
+    @cache_result(max_entries=4)
+    def load(key):
+        nonlocal calls
+        calls += 1
+        time.sleep(0.05)
+        return key * 2
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(load(21))) for _ in range(5)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert results == [42] * 5
+    assert calls == 1
+    load.cache_clear()
+    assert load(21) == 42 and calls == 2
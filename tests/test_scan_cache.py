@@ -0,0 +1,53 @@
+from meta_mcp.tools import scan_cache
+
+
+def test_scan_cache_roundtrip_and_clear(tmp_path, monkeypatch):
+    monkeypatch.setattr(scan_cache, "CACHE_DIR", tmp_path)
+    result = {"success": True, "runts": [{"name": "repo"}]}
+
+    scan_cache.cache_scan_result(str(tmp_path), 1, result)
+    scan_cache.store_entry("files_a", "files", "/repos/a", {"files": {}})
+
+    assert scan_cache.get_cached_scan(str(tmp_path), 1) == result
+    assert scan_cache.get_cached_scan(str(tmp_path), 1, ttl=-1) is None
+    assert scan_cache.get_cache_stats()["total_files"] == 2
+
+    assert scan_cache.clear_cache(repo_path="/repos/a") == 1
+    assert scan_cache.get_cache_stats()["total_files"] == 1
+
+
+def test_scan_cache_evicts_least_recently_used(tmp_path, monkeypatch):
+    monkeypatch.setattr(scan_cache, "CACHE_DIR", tmp_path)
+    scan_cache.store_entry("first", "repo", "/a", {"n": 1})
+    entry_size = scan_cache.get_cache_stats()["total_size"]
+    monkeypatch.setattr(scan_cache, "MAX_CACHE_BYTES", entry_size * 2)
+
+    scan_cache.store_entry("second", "repo", "/b", {"n": 2})
+    scan_cache.load_entry("first")  # "second" is now least recently used
+    scan_cache.store_entry("third", "repo", "/c", {"n": 3})
+
+    assert scan_cache.load_entry("second") is None
+    assert scan_cache.load_entry("first")[1] == {"n": 1}
+    assert scan_cache.get_cache_stats()["total_size"] <= entry_size * 2
+
+
+def test_scan_cache_overwrite_keeps_totals_exact(tmp_path, monkeypatch):
+    monkeypatch.setattr(scan_cache, "CACHE_DIR", tmp_path)
+    for n in range(5):
+        scan_cache.store_entry("k", "repo", "/a", {"n": n, "pad": "x" * n})
+    stats = scan_cache.get_cache_stats()
+    assert stats["total_files"] == 1
+
+    with scan_cache._lock:
+        conn = scan_cache._connect()
+        (actual_size,) = conn.execute("SELECT SUM(size) FROM entries").fetchone()
+    assert stats["total_size"] == actual_size
+
+    # Rewrites must not inflate totals enough to evict a fresh entry
+    monkeypatch.setattr(scan_cache, "MAX_CACHE_BYTES", actual_size * 3)
+    for _ in range(10):
+        scan_cache.store_entry("k", "repo", "/a", {"n": 4, "pad": "xxxx"})
+    scan_cache.store_entry("other", "repo", "/b", {"n": 0})
+
+    assert scan_cache.load_entry("other")[1] == {"n": 0}
+    assert scan_cache.load_entry("k")[1] == {"n": 4, "pad": "xxxx"}
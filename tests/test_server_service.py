@@ -0,0 +1,117 @@
+import asyncio
+
+import pytest
+from meta_mcp.services.server_service import ServerService
+from meta_mcp.services.tool_service import ToolService
+
+SERVER_SOURCE = """
+from fastmcp import FastMCP
+
+mcp = FastMCP("echo")
+
+
+@mcp.tool
+def add(a: int, b: int) -> int:
+    return a + b
+
+
+if __name__ == "__main__":
+    mcp.run(show_banner=False)
+"""
+
+
+@pytest.mark.asyncio
+async def test_tools_execute_over_started_server(tmp_path):
+    server_path = tmp_path / "echo_server.py"
+    server_path.write_text(SERVER_SOURCE, encoding="utf-8")
+
+    servers = ServerService()
+    tools = ToolService(servers)
+    started = await servers.start_server(str(server_path))
+    server_id = started["data"]["server_id"]
+    try:
+        listed = await tools.list_server_tools(server_id)
+        assert [t["name"] for t in listed["data"]["tools"]] == ["add"]
+        assert listed["data"]["tools"][0]["parameters"][0] == {
+            "name": "a",
+            "type": "integer",
+            "required": True,
+        }
+
+        # Concurrent calls are multiplexed over the one stdio pipe
+        results = await asyncio.gather(
+            *(tools.execute_tool(server_id, "add", {"a": i, "b": 1}) for i in range(20))
+        )
+        assert [
+            r["data"]["result"]["structuredContent"]["result"] for r in results
+        ] == [i + 1 for i in range(20)]
+
+        failed = await tools.execute_tool(server_id, "add", {"a": "x", "b": 1})
+        assert failed["success"] is False
+
+        history = await tools.get_tool_history(server_id, "add", limit=5)
+        assert history["data"]["count"] == 21
+        assert history["data"]["history"][0]["status"] == "error"
+
+        status = await servers.get_server_status(server_id)
+        assert status["data"]["status"] == "running"
+        assert status["data"]["restart_policy"]["mode"] == "on-failure"
+        assert status["data"]["total_restarts"] == 0
+    finally:
+        await servers.stop_server(server_id)
+
+    stopped = await tools.execute_tool(server_id, "add", {"a": 1, "b": 1})
+    assert stopped["success"] is False
+
+
+@pytest.mark.asyncio
+async def test_running_servers_exclude_exited_ones(tmp_path):
+    server_path = tmp_path / "echo_server.py"
+    server_path.write_text(SERVER_SOURCE, encoding="utf-8")
+    crash_path = tmp_path / "crash_server.py"
+    crash_path.write_text("import sys\nsys.exit(3)\n", encoding="utf-8")
+
+    servers = ServerService()
+    server_id = (await servers.start_server(str(server_path)))["data"]["server_id"]
+    crash_id = (await servers.start_server(str(crash_path), restart_policy="never"))[
+        "data"
+    ]["server_id"]
+    try:
+        for _ in range(100):
+            if servers.supervisors[crash_id].state == "failed":
+                break
+            await asyncio.sleep(0.05)
+
+        listed = await servers.list_running_servers()
+        assert [s["server_id"] for s in listed["data"]["servers"]] == [server_id]
+        assert listed["data"]["count"] == 1
+
+        crashed = await servers.get_server_status(crash_id)
+        assert crashed["data"]["status"] == "failed"
+        assert crashed["data"]["exit_code"] == 3
+    finally:
+        await servers.stop_all_servers()
+
+
+def test_tools_route_accepts_path_server_ids(tmp_path):
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+    from meta_mcp.api_router import router
+
+    server_path = tmp_path / "echo_server.py"
+    server_path.write_text(SERVER_SOURCE, encoding="utf-8")
+    app = FastAPI()
+    app.include_router(router)
+
+    with TestClient(app) as client:
+        started = client.post(
+            "/api/v1/servers/start", params={"server_path": str(server_path)}
+        )
+        server_id = started.json()["data"]["server_id"]
+        assert server_id == f"python:{server_path}"
+        try:
+            response = client.get(f"/api/v1/servers/{server_id}/tools")
+            assert response.status_code == 200
+            assert [t["name"] for t in response.json()["data"]["tools"]] == ["add"]
+        finally:
+            client.post("/api/v1/servers/stop", params={"server_id": server_id})
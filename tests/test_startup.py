@@ -0,0 +1,49 @@
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+SRC = Path(__file__).resolve().parent.parent / "src"
+
+PROBE = """
+import asyncio, json, sys
+from fastmcp import Client
+import meta_mcp.mcp_server as server
+
+def loaded():
+    return sorted(m for m in sys.modules
+                  if m.startswith("meta_mcp.services") or m in ("aiohttp", "meta_mcp.tools.server"))
+
+at_startup = loaded()
+
+async def main():
+    async with Client(server.app) as client:
+        tools = await client.list_tools()
+        result = await client.call_tool("estimate_context_limits", {"token_count": 1000})
+    return [t.name for t in tools], result.data
+
+tools, result = asyncio.run(main())
+print(json.dumps({"at_startup": at_startup, "after_call": loaded(), "tools": tools,
+                  "result_ok": bool(result)}))
+"""
+
+
+def test_server_startup_defers_tool_implementations():
+    proc = subprocess.run(
+        [sys.executable, "-c", PROBE],
+        capture_output=True,
+        text=True,
+        env={"PYTHONPATH": str(SRC), "PATH": ""},
+        timeout=120,
+    )
+    assert proc.returncode == 0, proc.stderr[-2000:]
+    report = json.loads(proc.stdout.strip().splitlines()[-1])
+
+    # Schemas for every suite are registered up front...
+    assert {"analyze_runts", "pack_repository", "start_mcp_server",
+            "estimate_context_limits", "load_test_server"} <= set(report["tools"])
+    # ...but no service (or aiohttp) is imported until a tool needs it
+    assert report["at_startup"] == []
+    assert "meta_mcp.services.token_analysis_service" in report["after_call"]
+    assert "meta_mcp.services.repo_packing_service" not in report["after_call"]
+    assert report["result_ok"]
@@ -0,0 +1,59 @@
+import json
+from pathlib import Path
+
+from meta_mcp.tools.tokenizer import (
+    BPETokenizer,
+    HeuristicTokenizer,
+    get_tokenizer,
+    save_merges,
+    train_merges,
+)
+
+CORPUS = [
+    "def analyze(path):\n    return analyze_repo(path)\n",
+    "def analyze_file(path):\n    return analyze(path) + 1\n",
+] * 10
+
+
+def test_trained_merges_round_trip(tmp_path):
+    merges = train_merges(CORPUS, 50)
+    assert 0 < len(merges) <= 50
+
+    table = tmp_path / "merges.txt.gz"
+    save_merges(merges, table)
+    tokenizer = BPETokenizer.from_file(table)
+
+    assert tokenizer.ranks == BPETokenizer(merges).ranks
+    text = CORPUS[0]
+    assert tokenizer.count(text) == len(tokenizer.encode(text))
+    # Merges compress the training text well below one token per byte
+    assert tokenizer.count(text) < len(text.encode("utf-8")) / 2
+
+
+def test_batch_counts_match_single_counts():
+    tokenizer = get_tokenizer("bpe")
+    texts = ["import os\n", "print('héllo wörld')\n", "", "\t\tx = [1, 2, 3]\n"]
+    assert tokenizer.count_batch(texts) == [tokenizer.count(t) for t in texts]
+    assert tokenizer.count("") == 0
+
+
+def test_heuristic_engine():
+    tokenizer = get_tokenizer("heuristic")
+    assert isinstance(tokenizer, HeuristicTokenizer)
+    assert tokenizer.count("") == 1
+    assert isinstance(tokenizer.count("x = 1\n" * 100), int)
+
+
+def test_bpe_counts_track_cl100k_fixture():
+    # Sample texts with counts from tiktoken's cl100k_base encoding
+    fixture = Path(__file__).parent / "data" / "cl100k_counts.json"
+    samples = json.loads(fixture.read_text(encoding="utf-8"))["samples"]
+    tokenizer = get_tokenizer("bpe")
+
+    counts = tokenizer.count_batch([sample["text"] for sample in samples])
+    expected = [sample["cl100k_tokens"] for sample in samples]
+
+    # Within 3% over the whole fixture, and 15% for any single sample
+    assert abs(sum(counts) - sum(expected)) <= 0.03 * sum(expected)
+    for sample, count, reference in zip(samples, counts, expected):
+        assert abs(count - reference) <= 0.15 * reference, sample["source"]
@@ -0,0 +1,53 @@
+from meta_mcp.tools.tool_extractor import extract_tools
+
+SOURCE = '''
+def register_tools(mcp):
+    @mcp.tool()
+    async def search(query: str):
+        """Search things.
+
+        Args:
+            query: Text to look for
+
+        Returns:
+            Matching items
+        """
+
+    @mcp.tool
+    def ping():
+        return "pong"
+
+    @other.tool()
+    def ignored():
+        pass
+
+
+text = "@tool() def fake(): pass"
+'''
+
+
+def test_extract_tools_finds_decorated_functions():
+    tools = extract_tools(SOURCE)
+
+    assert [t.name for t in tools] == ["search", "ping"]
+    search, ping = tools
+    assert search.is_async and search.decorator == "mcp"
+    assert search.args_section == "query: Text to look for"
+    assert search.returns_section == "Matching items"
+    assert search.is_sota_doc
+    assert not ping.has_docstring
+
+
+def test_extract_tools_tolerates_invalid_source():
+    assert extract_tools("@tool()\ndef broken(:\n") == ()
+
+
+def test_extract_tools_keeps_unevaluable_options_as_source():
+    source = (
+        "@mcp.tool(tags={[1]}, name=NAME, version='2.0')\n"
+        "def odd():\n"
+        "    pass\n"
+    )
+    (odd,) = extract_tools(source)
+
+    assert dict(odd.options) == {"tags": "{[1]}", "name": "NAME", "version": "2.0"}
@@ -0,0 +1,100 @@
+import os
+import sys
+
+import pytest
+from meta_mcp.tools.decorators import ToolCategory
+from meta_mcp.tools.discovery import ToolRegistry
+from meta_mcp.tools.tool_manifest import build_manifest, iter_manifest_tools
+
+TOOLS_SOURCE = '''
+import not_installed_dependency  # Only needed when the tool runs
+
+from meta_mcp.tools.decorators import ToolCategory, tool
+
+
+@tool(name="shout", description="Upper-case text", tags=["text"], category=ToolCategory.DATA)
+async def shout(text: str, times: int = 1) -> str:
+    return text.upper() * times
+'''
+
+SUB_SOURCE = '''
+from meta_mcp.tools.decorators import tool
+
+
+@tool(version="2.0.0")
+async def whisper(text: str) -> str:
+    """Lower-case text."""
+    return text.lower()
+
+
+def register(mcp):
+    @mcp.tool(name="server_bound")
+    async def server_bound() -> str:
+        return "not importable by name"
+'''
+
+
+@pytest.fixture
+def package(tmp_path, monkeypatch):
+    root = tmp_path / "manifest_pkg"
+    (root / "sub").mkdir(parents=True)
+    (root / "__init__.py").write_text("", encoding="utf-8")
+    (root / "text_tools.py").write_text(TOOLS_SOURCE, encoding="utf-8")
+    (root / "sub" / "__init__.py").write_text("", encoding="utf-8")
+    (root / "sub" / "quiet.py").write_text(SUB_SOURCE, encoding="utf-8")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield root
+    for name in [m for m in sys.modules if m.startswith("manifest_pkg")]:
+        del sys.modules[name]
+
+
+def test_listing_tools_does_not_import_them(package, tmp_path):
+    registry = ToolRegistry(manifest_dir=tmp_path / "manifests")
+    registry.discover_tools("manifest_pkg")
+
+    tools = {t["name"]: t for t in registry.list_tools()}
+    assert set(tools) == {"shout", "whisper"}
+    assert tools["shout"]["module"] == "manifest_pkg.text_tools"
+    assert tools["shout"]["tags"] == ["text"]
+    assert tools["whisper"]["description"] == "Lower-case text."
+    assert tools["whisper"]["version"] == "2.0.0"
+    assert "times: int" in tools["shout"]["signature"]
+    assert registry.get_metadata("shout").category == ToolCategory.DATA
+
+    assert "manifest_pkg.text_tools" not in sys.modules
+    assert "manifest_pkg.sub.quiet" not in sys.modules
+
+
+@pytest.mark.asyncio
+async def test_tool_module_is_imported_on_execution(package, tmp_path):
+    registry = ToolRegistry(manifest_dir=tmp_path / "manifests")
+    registry.discover_tools("manifest_pkg")
+
+    assert await registry.execute_tool("whisper", "HeLLo") == "hello"
+    assert "manifest_pkg.sub.quiet" in sys.modules
+    assert "manifest_pkg.text_tools" not in sys.modules
+
+    # The missing dependency only matters once the tool actually runs
+    with pytest.raises(ImportError):
+        registry.execute_tool("shout", "hi")
+
+
+def test_manifest_only_reparses_changed_files(package, tmp_path):
+    manifest_dir = tmp_path / "manifests"
+    first = build_manifest("manifest_pkg", manifest_dir=manifest_dir)
+    assert first["parsed_files"] == 3  # Submodules and subpackage __init__, like pkgutil
+    assert build_manifest("manifest_pkg", manifest_dir=manifest_dir)["parsed_files"] == 0
+
+    quiet = package / "sub" / "quiet.py"
+    quiet.write_text(SUB_SOURCE + '''
+
+@tool()
+async def murmur() -> str:
+    return "..."
+''', encoding="utf-8")
+    stat = quiet.stat()
+    os.utime(quiet, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    refreshed = build_manifest("manifest_pkg", manifest_dir=manifest_dir)
+    assert refreshed["parsed_files"] == 1
+    assert [t["name"] for t in iter_manifest_tools(refreshed)] == ["whisper", "murmur", "shout"]